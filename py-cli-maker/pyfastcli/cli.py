@@ -1,25 +1,117 @@
 """Point d'entrée principal de la CLI pyfastcli."""
 
+from typing import Optional
+
 import click
 
-from pyfastcli.commands import (
-    make_domaine,
-    make_domaine_ddd,
-    make_model,
-    make_package,
-    make_url,
-)
+from pyfastcli.registry import LazyGroup
 
+# Choix des options globales, recopiés ici pour ne pas importer au démarrage
+# pyfastcli.profiling (PROFILE_FORMATS) et pyfastcli.content_store
+# (LINK_MODES)
+PROFILE_FORMAT_CHOICES = ["prof", "collapsed"]
+LINK_MODE_CHOICES = ["auto", "reflink", "hardlink", "copy"]
 
-@click.group()
-def cli():
+
+# Les commandes (intégrées et plugins) sont importées à la demande, voir
+# pyfastcli.registry. Les modules des options globales (profilage, métriques,
+# cache de rendu, magasin de contenu) ne sont importés que si l'option est
+# utilisée.
+@click.group(cls=LazyGroup)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile la commande et affiche la répartition du temps par phase",
+)
+@click.option(
+    "--profile-output",
+    default=None,
+    help="Fichier de profil (défaut : pyfastcli.prof ou pyfastcli.collapsed)",
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(PROFILE_FORMAT_CHOICES),
+    default="prof",
+    help="prof (cProfile/pstats) ou collapsed (échantillonnage pyinstrument s'il "
+    "est installé, flamegraph)",
+)
+@click.option(
+    "--metrics-json",
+    "metrics_output",
+    default=None,
+    metavar="PATH",
+    help="Écrit un rapport JSON (fichiers, octets, durées, cache) ; '-' pour stderr",
+)
+@click.option(
+    "--render-cache",
+    is_flag=True,
+    default=False,
+    envvar="PYFASTCLI_RENDER_CACHE",
+    help="Réutilise les rendus des exécutions précédentes (~/.cache/pyfastcli)",
+)
+@click.option(
+    "--cache-dir",
+    default=None,
+    envvar="PYFASTCLI_RENDER_CACHE_DIR",
+    help="Dossier du cache de rendu (défaut : ~/.cache/pyfastcli/render)",
+)
+@click.option(
+    "--cache-max-size",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Taille maximale du cache de rendu (Mo), éviction LRU au-delà",
+)
+@click.option(
+    "--content-store",
+    "use_content_store",
+    is_flag=True,
+    default=False,
+    envvar="PYFASTCLI_CONTENT_STORE",
+    help="Matérialise les fichiers identiques depuis un magasin de contenu",
+)
+@click.option(
+    "--store-dir",
+    default=None,
+    envvar="PYFASTCLI_STORE_DIR",
+    help="Dossier du magasin de contenu (défaut : ~/.cache/pyfastcli/store)",
+)
+@click.option(
+    "--link-mode",
+    type=click.Choice(LINK_MODE_CHOICES),
+    default="auto",
+    show_default=True,
+    help="reflink, lien physique ou copie (auto : reflink, sinon copie)",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    profile: bool,
+    profile_output: Optional[str],
+    profile_format: str,
+    metrics_output: Optional[str],
+    render_cache: bool,
+    cache_dir: Optional[str],
+    cache_max_size: int,
+    use_content_store: bool,
+    store_dir: Optional[str],
+    link_mode: str,
+):
     """CLI de génération de code (type make:xxx)."""
-    pass
+    if metrics_output:
+        from pyfastcli.metrics import metrics_session
+
+        ctx.with_resource(metrics_session(metrics_output, ctx.invoked_subcommand))
+    if profile or profile_output:
+        from pyfastcli.profiling import profile_session
+
+        ctx.with_resource(profile_session(profile_output, profile_format))
+    if render_cache or cache_dir:
+        from pyfastcli.render_cache import cache_session
 
+        ctx.with_resource(cache_session(cache_dir, cache_max_size * 1024 * 1024))
+    if use_content_store or store_dir:
+        from pyfastcli.content_store import content_store
 
-# Enregistrement des commandes modulaires
-cli.add_command(make_url)
-cli.add_command(make_package)
-cli.add_command(make_domaine)
-cli.add_command(make_domaine_ddd)
-cli.add_command(make_model)
+        ctx.with_resource(content_store(store_dir, link_mode))
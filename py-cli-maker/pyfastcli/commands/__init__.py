@@ -1,15 +1,34 @@
-"""Commandes CLI modulaires pour pyfastcli."""
-
-from pyfastcli.commands.domaine_command import make_domaine
-from pyfastcli.commands.domaine_ddd_command import make_domaine_ddd
-from pyfastcli.commands.model_command import make_model
-from pyfastcli.commands.package_command import make_package
-from pyfastcli.commands.url_command import make_url
-
-__all__ = [
-    "make_url",
-    "make_package",
-    "make_domaine",
-    "make_domaine_ddd",
-    "make_model",
-]
+"""Commandes CLI modulaires pour pyfastcli.
+
+Les commandes sont importées à la demande (PEP 562) pour ne pas ralentir le
+démarrage de la CLI.
+"""
+
+import importlib
+from typing import Any
+
+# Nom exporté -> module qui le définit
+_EXPORTS = {
+    "make_url": "pyfastcli.commands.url_command",
+    "make_package": "pyfastcli.commands.package_command",
+    "make_domaine": "pyfastcli.commands.domaine_command",
+    "make_domaine_ddd": "pyfastcli.commands.domaine_ddd_command",
+    "make_model": "pyfastcli.commands.model_command",
+    "make_workspace": "pyfastcli.commands.workspace_command",
+    "fanout": "pyfastcli.commands.fanout_command",
+    "completion": "pyfastcli.commands.completion_command",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,99 @@
+"""Commande completion pour installer la complétion shell de pyfastcli."""
+
+import click
+from click.shell_completion import BashComplete, get_completion_class
+
+# Shells pris en charge par la complétion click
+COMPLETION_SHELLS = ["bash", "zsh", "fish"]
+
+
+class ColonBashComplete(BashComplete):
+    """
+    Script bash de click, adapté aux valeurs contenant ':' (make:url,
+    nom:Type:to=app.Model).
+
+    Bash coupe les mots sur ':' (COMP_WORDBREAKS) : la fonction de
+    complétion recolle les morceaux contigus de COMP_LINE avant d'appeler
+    pyfastcli, puis retire des propositions la partie du mot courant déjà
+    saisie jusqu'au dernier ':' (comme __ltrim_colon_completions de
+    bash-completion). COMP_WORDBREAKS n'est pas modifié, les autres
+    commandes du shell ne sont pas affectées.
+    """
+
+    source_template = r"""%(complete_func)s() {
+    local IFS=$'\n'
+    local response line=$COMP_LINE pos=0 start i cword=0 cur colon_prefix
+    local -a words=()
+
+    # Recolle les mots coupés sur ':' (aucun blanc entre eux dans la ligne)
+    for ((i = 0; i < ${#COMP_WORDS[@]}; i++)); do
+        start=$pos
+        while [[ ${line:pos:1} == [[:space:]] ]]; do
+            ((pos++))
+        done
+        if ((i > 0 && pos == start)); then
+            words[${#words[@]}-1]+=${COMP_WORDS[i]}
+        else
+            words+=("${COMP_WORDS[i]}")
+        fi
+        ((pos += ${#COMP_WORDS[i]}))
+        if ((i == COMP_CWORD)); then
+            cword=$((${#words[@]} - 1))
+        fi
+    done
+    cur=${words[cword]}
+    colon_prefix=${cur%%"${cur##*:}"}
+
+    response=$(env COMP_WORDS="${words[*]}" COMP_CWORD=$cword \
+%(complete_var)s=bash_complete $1)
+
+    for completion in $response; do
+        IFS=',' read type value <<< "$completion"
+
+        if [[ $type == 'dir' ]]; then
+            COMPREPLY=()
+            compopt -o dirnames
+        elif [[ $type == 'file' ]]; then
+            COMPREPLY=()
+            compopt -o default
+        elif [[ $type == 'plain' ]]; then
+            COMPREPLY+=("${value#"$colon_prefix"}")
+        fi
+    done
+
+    return 0
+}
+
+%(complete_func)s_setup() {
+    complete -o nosort -F %(complete_func)s %(prog_name)s
+}
+
+%(complete_func)s_setup;
+"""
+
+
+@click.command("completion")
+@click.argument("shell", type=click.Choice(COMPLETION_SHELLS))
+@click.pass_context
+def completion(ctx: click.Context, shell: str):
+    """
+    Affiche le script de complétion shell (bash, zsh ou fish).
+
+    Complète les commandes, les apps Django existantes (--app-name), les
+    types de champs et les modèles liés (--field nom:ForeignKey:to=...).
+
+    Exemple d'utilisation:
+
+    \b
+        eval "$(pyfastcli completion bash)"    # ~/.bashrc
+        eval "$(pyfastcli completion zsh)"     # ~/.zshrc
+        pyfastcli completion fish > ~/.config/fish/completions/pyfastcli.fish
+    """
+    root = ctx.find_root()
+    prog_name = root.info_name or "pyfastcli"
+    complete_var = f"_{prog_name.replace('-', '_').upper()}_COMPLETE"
+    if shell == "bash":
+        completion_class = ColonBashComplete
+    else:
+        completion_class = get_completion_class(shell)
+    click.echo(completion_class(root.command, {}, prog_name, complete_var).source())
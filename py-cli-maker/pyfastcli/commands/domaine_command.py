@@ -4,6 +4,7 @@ from pathlib import Path
 
 import click
 
+from pyfastcli.completion import complete_field_spec
 from pyfastcli.generators.domaine_generator import generate_domaine_structure
 
 
@@ -38,6 +39,43 @@ from pyfastcli.generators.domaine_generator import generate_domaine_structure
     default=True,
     help="Inclure selectors.py (recommandé)",
 )
+@click.option(
+    "--export/--no-export",
+    "include_export",
+    default=False,
+    help="Inclure une vue d'export CSV/NDJSON en streaming (route export/)",
+)
+@click.option(
+    "--session-count",
+    "include_session_count",
+    is_flag=True,
+    default=False,
+    help="Compteur dénormalisé sessions_count sur le modèle principal, "
+    "maintenu avec des expressions F() par services.py (incompatible avec "
+    "--no-services)",
+)
+@click.option(
+    "--base-template",
+    default=None,
+    help="Template de base étendu par les templates générés (blocs title et "
+    "content), ex: base.html",
+)
+@click.option(
+    "--cache-fragments",
+    is_flag=True,
+    default=False,
+    help="Mettre en cache ({% cache %}) les lignes de la liste et le détail, "
+    "clé incluant updated_at",
+)
+@click.option(
+    "--field",
+    "-f",
+    "field_specs",
+    multiple=True,
+    shell_complete=complete_field_spec,
+    help="Champ du modèle principal nom:Type[:options] (comme make:model), "
+    "utilisé aussi par les projections de liste",
+)
 @click.option(
     "--description",
     "-d",
@@ -50,6 +88,11 @@ def make_domaine(
     output_dir,
     include_services,
     include_selectors,
+    include_export,
+    include_session_count,
+    base_template,
+    cache_fragments,
+    field_specs,
     description,
 ):
     """
@@ -62,10 +105,14 @@ def make_domaine(
     - forms.py (formulaires liés à la pratique)
     - services.py (logique métier réutilisable, optionnel)
     - selectors.py (requêtes complexes sur les modèles, optionnel)
+    - exports.py (export CSV/NDJSON en streaming, avec --export)
     - templates/pratique/ (liste.html, detail.html, formulaire.html)
 
     Exemple d'utilisation:
         pyfastcli make:domaine --app-name pratique --model-name Pratique
+        pyfastcli make:domaine -a blog -m Article \\
+            -f titre:CharField:max_length=200 -f corps:TextField
+        pyfastcli make:domaine -a pratique -m Pratique --session-count
     """
     try:
         # Validation du dossier de sortie
@@ -94,7 +141,12 @@ def make_domaine(
             output_dir=str(output_path),
             include_services=include_services,
             include_selectors=include_selectors,
+            include_export=include_export,
+            include_session_count=include_session_count,
+            base_template=base_template,
+            cache_fragments=cache_fragments,
             description=description,
+            fields=list(field_specs),
         )
 
         click.echo(
@@ -113,6 +165,8 @@ def make_domaine(
             click.echo("    ├── services.py")
         if include_selectors:
             click.echo("    ├── selectors.py")
+        if include_export:
+            click.echo("    ├── exports.py")
         click.echo("    └── templates/")
         click.echo(f"        └── {app_name}/")
         click.echo("            ├── liste.html")
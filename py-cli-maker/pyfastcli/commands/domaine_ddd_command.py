@@ -4,6 +4,7 @@ from pathlib import Path
 
 import click
 
+from pyfastcli.completion import complete_field_spec
 from pyfastcli.generators.ddd_domaine_generator import (
     generate_ddd_domaine_structure,
 )
@@ -35,6 +36,63 @@ from pyfastcli.generators.ddd_domaine_generator import (
     default=True,
     help="Inclure serializers.py pour DRF (recommandé)",
 )
+@click.option(
+    "--export/--no-export",
+    "include_export",
+    default=False,
+    help="Inclure une vue d'export CSV/NDJSON en streaming (route export/)",
+)
+@click.option(
+    "--async",
+    "include_async",
+    is_flag=True,
+    default=False,
+    help="Ajouter les variantes async (aobtenir_par_id, acreer_...) au "
+    "repository et aux services",
+)
+@click.option(
+    "--optimistic-locking",
+    is_flag=True,
+    default=False,
+    help="Verrou optimiste : champ version et modification en un seul UPDATE "
+    "conditionné par la version",
+)
+@click.option(
+    "--skip-locked",
+    is_flag=True,
+    default=False,
+    help="Ajouter modifier_<app>_si_libre (select_for_update(skip_locked=True))",
+)
+@click.option(
+    "--session-count",
+    "include_session_count",
+    is_flag=True,
+    default=False,
+    help="Compteur dénormalisé sessions_count sur le modèle principal, "
+    "maintenu avec des expressions F()",
+)
+@click.option(
+    "--base-template",
+    default=None,
+    help="Template de base étendu par les templates générés (blocs title et "
+    "content), ex: base.html",
+)
+@click.option(
+    "--cache-fragments",
+    is_flag=True,
+    default=False,
+    help="Mettre en cache ({% cache %}) les lignes de la liste et le détail, "
+    "clé incluant updated_at",
+)
+@click.option(
+    "--field",
+    "-f",
+    "field_specs",
+    multiple=True,
+    shell_complete=complete_field_spec,
+    help="Champ du modèle principal nom:Type[:options] (comme make:model), "
+    "utilisé aussi par les projections de liste",
+)
 @click.option(
     "--description",
     "-d",
@@ -46,6 +104,14 @@ def make_domaine_ddd(
     model_name,
     output_dir,
     include_serializers,
+    include_export,
+    include_async,
+    optimistic_locking,
+    skip_locked,
+    include_session_count,
+    base_template,
+    cache_fragments,
+    field_specs,
     description,
 ):
     """
@@ -54,18 +120,24 @@ def make_domaine_ddd(
 
     Crée tous les fichiers recommandés pour un domaine Django organisé en couches :
     - domain/models.py (entités métier, logique métier pure)
-    - domain/services.py (règles métier complexes)
+    - domain/services.py (règles métier complexes, variantes async avec --async)
     - domain/value_objects.py (objets de valeur immutables)
     - infrastructure/repositories.py (accès DB, querysets personnalisés)
     - presentation/views.py (Django views)
     - presentation/forms.py (formulaires)
     - presentation/serializers.py (DRF serializers, optionnel)
+    - presentation/exports.py (export CSV/NDJSON en streaming, avec --export)
     - presentation/urls.py (routes)
     - presentation/templates/pratique/ (templates HTML)
     - tests/ (test_models.py, test_services.py, test_views.py)
 
     Exemple d'utilisation:
         pyfastcli make:domaine-ddd --app-name pratique --model-name Pratique
+        pyfastcli make:domaine-ddd -a blog -m Article \\
+            -f titre:CharField:max_length=200 -f corps:TextField
+        pyfastcli make:domaine-ddd -a pratique -m Pratique --async
+        pyfastcli make:domaine-ddd -a pratique -m Pratique --optimistic-locking
+        pyfastcli make:domaine-ddd -a pratique -m Pratique --session-count
     """
     try:
         # Validation du dossier de sortie
@@ -93,7 +165,15 @@ def make_domaine_ddd(
             model_name=model_name,
             output_dir=str(output_path),
             include_serializers=include_serializers,
+            include_export=include_export,
+            include_async=include_async,
+            optimistic_locking=optimistic_locking,
+            skip_locked=skip_locked,
+            include_session_count=include_session_count,
+            base_template=base_template,
+            cache_fragments=cache_fragments,
             description=description,
+            fields=list(field_specs),
         )
 
         click.echo(
@@ -115,6 +195,8 @@ def make_domaine_ddd(
         click.echo("    │   ├── forms.py")
         if include_serializers:
             click.echo("    │   ├── serializers.py")
+        if include_export:
+            click.echo("    │   ├── exports.py")
         click.echo("    │   └── urls.py")
         click.echo(f"    ├── templates/{app_name}/")
         click.echo("    │   ├── liste.html")
@@ -0,0 +1,148 @@
+"""Commande fanout pour générer une spécification sur plusieurs projets."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+
+from pyfastcli.content_store import get_content_store
+from pyfastcli.generators.batch_generator import run_project, validate_batch_spec
+from pyfastcli.generators.spec_loader import load_spec_file
+from pyfastcli.instrumentation import count
+from pyfastcli.render_cache import get_render_cache
+
+
+def _read_projects_file(projects_file: Path) -> List[str]:
+    """
+    Lit la liste des projets (un chemin par ligne, # pour les commentaires).
+
+    Les chemins relatifs sont résolus depuis le dossier du fichier.
+    """
+    projects = []
+    for line in projects_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        project_path = Path(line).expanduser()
+        if not project_path.is_absolute():
+            project_path = projects_file.parent / project_path
+        projects.append(str(project_path.resolve()))
+    return projects
+
+
+@click.command("fanout")
+@click.option(
+    "--projects",
+    "-p",
+    "projects_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Fichier listant les projets cibles (un chemin par ligne)",
+)
+@click.option(
+    "--spec",
+    "-s",
+    "spec_file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Spécification de lot (JSON ou TOML) à appliquer à chaque projet",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Nombre de processus (défaut : nombre de CPU)",
+)
+def fanout(projects_file: str, spec_file: str, workers: Optional[int]):
+    """
+    Applique une spécification de lot à plusieurs projets en parallèle.
+
+    Chaque projet est généré dans un processus séparé : une erreur sur un
+    projet n'interrompt pas les autres. Un résumé des durées par projet et
+    des erreurs est affiché à la fin.
+
+    Exemple de spécification (spec.toml):
+
+    \b
+        [[steps]]
+        generator = "domaine"
+        app_name = "pratique"
+        model_name = "Pratique"
+
+    Exemple d'utilisation:
+        pyfastcli fanout --projects projects.txt --spec spec.toml
+    """
+    try:
+        spec = load_spec_file(spec_file)
+        validate_batch_spec(spec)
+        projects = _read_projects_file(Path(projects_file))
+    except ValueError as e:
+        click.echo(click.style(f"❌ Erreur de validation : {e}", fg="red"), err=True)
+        raise click.Abort()
+
+    if not projects:
+        click.echo(click.style("❌ Aucun projet dans la liste.", fg="red"), err=True)
+        raise click.Abort()
+
+    click.echo(
+        click.style(f"🚀 Génération sur {len(projects)} projet(s)...", fg="cyan")
+    )
+    # Les processus de travail partagent le cache de rendu et le magasin de
+    # contenu actifs (sur disque)
+    options: Dict[str, Any] = {}
+    cache = get_render_cache()
+    if cache is not None:
+        options.update(cache_dir=str(cache.directory), cache_max_bytes=cache.max_bytes)
+    store = get_content_store()
+    if store is not None:
+        options.update(store_dir=str(store.directory), link_mode=store.mode)
+
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_project, spec, project, **options)
+            for project in projects
+        ]
+        with click.progressbar(length=len(futures), label="Projets") as bar:
+            for future in as_completed(futures):
+                result = future.result()
+                if cache is not None:
+                    cache.hits += result["cache"]["hits"]
+                    cache.misses += result["cache"]["misses"]
+                    count("cache_hits", result["cache"]["hits"])
+                    count("cache_misses", result["cache"]["misses"])
+                results.append(result)
+                bar.update(1)
+    total_duration = time.perf_counter() - start
+
+    # Résumé par projet, dans l'ordre du fichier
+    order = {project: i for i, project in enumerate(projects)}
+    results.sort(key=lambda result: order[result["project"]])
+    click.echo("\n📊 Résumé :")
+    for result in results:
+        status = (
+            click.style("✅", fg="green")
+            if result["error"] is None
+            else click.style("❌", fg="red")
+        )
+        click.echo(
+            f"  {status} {result['project']} "
+            f"({len(result['files'])} élément(s), {result['duration']:.2f}s)"
+        )
+
+    errors = [result for result in results if result["error"] is not None]
+    click.echo(
+        f"\n{len(results) - len(errors)}/{len(results)} projet(s) générés "
+        f"en {total_duration:.2f}s"
+    )
+    if errors:
+        click.echo(click.style("\n❌ Erreurs :", fg="red"), err=True)
+        for result in errors:
+            click.echo(f"  - {result['project']} : {result['error']}", err=True)
+            for path in result["files"]:
+                click.echo(f"      déjà écrit : {path}", err=True)
+        raise click.Abort()
@@ -1,15 +1,22 @@
 """Commande make:model pour générer des modèles Django interactivement."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 
+from pyfastcli.completion import complete_app_name, complete_field_spec
 from pyfastcli.generators.model_generator import (
     DJANGO_FIELD_TYPES,
     discover_existing_models,
     generate_model_file,
+    generate_models_batch,
+    meta_field_options,
+    models_from_spec,
+    parse_field_spec,
+    parse_fields_json,
 )
+from pyfastcli.generators.spec_loader import load_spec_file
 
 
 def _prompt_field_type() -> str:
@@ -150,27 +157,142 @@ def _prompt_field_options(field_type: str) -> str:
     return ", ".join(options)
 
 
+def _prompt_index_options(field: Dict[str, str]) -> Dict[str, str]:
+    """
+    Demande les index et contraintes d'un champ.
+
+    db_index et unique sont ajoutés aux options du champ ; l'unicité
+    conditionnelle, l'index partiel et l'index GIN sont émis dans la Meta.
+
+    Returns:
+        Champ complété (options et META_FIELD_OPTIONS)
+    """
+    field_type = field["type"]
+    if field_type == "ManyToManyField" or not click.confirm(
+        "Ajouter des index ou contraintes ?", default=False
+    ):
+        return field
+
+    options = [field["options"]] if field["options"] else []
+    if click.confirm("Indexer le champ (db_index=True) ?", default=False):
+        options.append("db_index=True")
+    if click.confirm("Valeur unique (unique=True) ?", default=False):
+        options.append("unique=True")
+    return dict(
+        field,
+        options=", ".join(options),
+        **_prompt_meta_options(field["name"], field_type),
+    )
+
+
+def _prompt_meta_options(field_name: str, field_type: str) -> Dict[str, str]:
+    """Demande les index et contraintes du champ émis dans la Meta du modèle."""
+    values: Dict[str, str] = {}
+    if click.confirm(
+        "Unicité conditionnelle (UniqueConstraint avec condition) ?", default=False
+    ):
+        values["unique_if"] = click.prompt(
+            "Condition (arguments de models.Q, ex: actif=True)", type=str
+        )
+    if click.confirm("Index partiel (Index avec condition) ?", default=False):
+        values["index_if"] = click.prompt(
+            "Condition (arguments de models.Q, ex: actif=True)", type=str
+        )
+    if field_type == "JSONField" and click.confirm(
+        "Index GIN (PostgreSQL, requêtes sur les clés JSON) ?", default=False
+    ):
+        values["gin_index"] = "True"
+
+    try:
+        return meta_field_options(field_name, field_type, values)
+    except ValueError as e:
+        click.echo(click.style(f"❌ {e}", fg="red"))
+        return _prompt_meta_options(field_name, field_type)
+
+
+def _prompt_fields(existing_models: List[tuple]) -> List[Dict[str, str]]:
+    """Demande interactivement les champs d'un modèle."""
+    fields: List[Dict[str, str]] = []
+    click.echo(click.style("\n📝 Définition des champs du modèle", fg="cyan"))
+
+    while True:
+        click.echo(f"\n--- Champ {len(fields) + 1} ---")
+        field_name = click.prompt("Nom du champ (ou 'fin' pour terminer)", type=str)
+
+        if field_name.lower() in ["fin", "end", "stop", "q", "quit"]:
+            break
+
+        if not field_name.strip():
+            click.echo(
+                click.style("❌ Le nom du champ ne peut pas être vide", fg="red")
+            )
+            continue
+
+        # Demande si c'est une relation
+        is_relation = click.confirm(
+            "Est-ce une relation vers un autre modèle ?", default=False
+        )
+
+        if is_relation:
+            field_type = _prompt_relation_type()
+            related_model = _prompt_related_model(existing_models)
+            field_options = _prompt_field_options(field_type)
+            field_dict: Dict[str, str] = {
+                "name": field_name,
+                "type": field_type,
+                "options": field_options,
+            }
+            if related_model:
+                field_dict["related_model"] = related_model
+            fields.append(_prompt_index_options(field_dict))
+        else:
+            field_type = _prompt_field_type()
+            field_options = _prompt_field_options(field_type)
+            fields.append(
+                _prompt_index_options(
+                    {
+                        "name": field_name,
+                        "type": field_type,
+                        "options": field_options,
+                    }
+                )
+            )
+
+    return fields
+
+
+def _discover_models(output_path: Path) -> List[tuple]:
+    """Découvre (une seule fois) les modèles existants du projet."""
+    click.echo(click.style("🔍 Recherche des modèles existants...", fg="cyan"))
+    existing_models = discover_existing_models(output_path)
+    if existing_models:
+        click.echo(
+            click.style(f"✅ {len(existing_models)} modèle(s) trouvé(s)", fg="green")
+        )
+    else:
+        click.echo(click.style("ℹ️  Aucun modèle existant trouvé", fg="yellow"))
+    return existing_models
+
+
 @click.command("make:model")
 @click.option(
     "--app-name",
     "-a",
     default=None,
+    shell_complete=complete_app_name,
     help="Nom de l'app Django (ex: pratique)",
-    prompt="Nom de l'app Django (ex: pratique)",
 )
 @click.option(
     "--model-name",
     "-m",
     default=None,
     help="Nom du modèle (ex: Pratique)",
-    prompt="Nom du modèle (ex: Pratique)",
 )
 @click.option(
     "--output-dir",
     "-o",
-    default=".",
+    default=None,
     help="Dossier de sortie (chemin du projet Django)",
-    prompt="Dossier de sortie (chemin du projet Django)",
 )
 @click.option(
     "--no-timestamps",
@@ -178,7 +300,42 @@ def _prompt_field_options(field_type: str) -> str:
     default=False,
     help="Ne pas ajouter created_at et updated_at",
 )
-def make_model(app_name: str, model_name: str, output_dir: str, no_timestamps: bool):
+@click.option(
+    "--from-spec",
+    "spec_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Fichier de spécification (JSON ou TOML) décrivant plusieurs modèles",
+)
+@click.option(
+    "--multiple",
+    is_flag=True,
+    default=False,
+    help="Définir plusieurs modèles à la suite (écriture en une seule passe)",
+)
+@click.option(
+    "--field",
+    "-f",
+    "field_specs",
+    multiple=True,
+    shell_complete=complete_field_spec,
+    help="Champ non interactif nom:Type[:options] (ex: titre:CharField:db_index)",
+)
+@click.option(
+    "--fields-json",
+    default=None,
+    help="Liste JSON de champs (en ligne ou chemin d'un fichier .json)",
+)
+def make_model(
+    app_name: Optional[str],
+    model_name: Optional[str],
+    output_dir: Optional[str],
+    no_timestamps: bool,
+    spec_file: Optional[str],
+    multiple: bool,
+    field_specs: Tuple[str, ...],
+    fields_json: Optional[str],
+):
     """
     Génère un modèle Django avec des champs définis interactivement.
 
@@ -188,91 +345,122 @@ def make_model(app_name: str, model_name: str, output_dir: str, no_timestamps: b
     - Détecte les modèles existants pour les relations
     - Génère le code du modèle
 
+    Plusieurs modèles peuvent être générés en une seule passe avec
+    --multiple (mode interactif) ou --from-spec (fichier JSON/TOML).
+    Les champs peuvent être fournis sans interaction avec --field
+    (répétable) ou --fields-json.
+
     Exemple d'utilisation:
         pyfastcli make:model --app-name pratique --model-name Pratique
+        pyfastcli make:model -a blog -m Article \\
+            -f titre:CharField:max_length=200,db_index \\
+            -f slug:SlugField:unique_if=publie=True \\
+            -f auteur:ForeignKey:to=users.User,related_name=articles
+        pyfastcli make:model --from-spec models.toml --output-dir .
     """
-    try:
-        output_path = Path(output_dir).resolve()
+    has_fields = bool(field_specs or fields_json)
+    if has_fields and (spec_file or multiple):
+        raise click.UsageError(
+            "--field/--fields-json ne peuvent pas être combinés "
+            "avec --from-spec ou --multiple"
+        )
 
-        # Découvre les modèles existants
-        click.echo(click.style("🔍 Recherche des modèles existants...", fg="cyan"))
-        existing_models = discover_existing_models(output_path)
-        if existing_models:
-            click.echo(
-                click.style(
-                    f"✅ {len(existing_models)} modèle(s) trouvé(s)", fg="green"
-                )
+    try:
+        if spec_file:
+            spec = load_spec_file(spec_file)
+            models = models_from_spec(spec, default_app_name=app_name)
+            output_path = Path(output_dir or spec.get("output_dir", ".")).resolve()
+            # L'option explicite --no-timestamps prime sur la spécification
+            add_timestamps = not no_timestamps and bool(
+                spec.get("add_timestamps", True)
             )
         else:
-            click.echo(click.style("ℹ️  Aucun modèle existant trouvé", fg="yellow"))
-
-        # Collecte les champs
-        fields: List[Dict[str, str]] = []
-        click.echo(click.style("\n📝 Définition des champs du modèle", fg="cyan"))
-
-        while True:
-            click.echo(f"\n--- Champ {len(fields) + 1} ---")
-            field_name = click.prompt("Nom du champ (ou 'fin' pour terminer)", type=str)
-
-            if field_name.lower() in ["fin", "end", "stop", "q", "quit"]:
-                break
-
-            if not field_name.strip():
-                click.echo(
-                    click.style("❌ Le nom du champ ne peut pas être vide", fg="red")
+            if app_name is None:
+                app_name = click.prompt("Nom de l'app Django (ex: pratique)", type=str)
+            if model_name is None:
+                model_name = click.prompt("Nom du modèle (ex: Pratique)", type=str)
+            if output_dir is None:
+                output_dir = (
+                    "."
+                    if has_fields
+                    else click.prompt(
+                        "Dossier de sortie (chemin du projet Django)", default="."
+                    )
                 )
-                continue
-
-            # Demande si c'est une relation
-            is_relation = click.confirm(
-                "Est-ce une relation vers un autre modèle ?", default=False
-            )
-
-            if is_relation:
-                field_type = _prompt_relation_type()
-                related_model = _prompt_related_model(existing_models)
-                field_options = _prompt_field_options(field_type)
-                field_dict: Dict[str, str] = {
-                    "name": field_name,
-                    "type": field_type,
-                    "options": field_options,
-                }
-                if related_model:
-                    field_dict["related_model"] = related_model
-                fields.append(field_dict)
-            else:
-                field_type = _prompt_field_type()
-                field_options = _prompt_field_options(field_type)
-                fields.append(
-                    {
-                        "name": field_name,
-                        "type": field_type,
-                        "options": field_options,
-                    }
+            output_path = Path(output_dir).resolve()
+            add_timestamps = not no_timestamps
+
+        if has_fields:
+            # Champs validés d'emblée, sans prompt ni scan du projet
+            fields = [parse_field_spec(field_spec) for field_spec in field_specs]
+            if fields_json:
+                fields += parse_fields_json(fields_json)
+            models = [
+                {"app_name": app_name, "model_name": model_name, "fields": fields}
+            ]
+        elif not spec_file:
+            # Découvre les modèles existants (un seul scan pour tout le lot)
+            existing_models = _discover_models(output_path)
+
+            models = []
+            while True:
+                if multiple:
+                    click.echo(
+                        click.style(f"\n🧩 Modèle {app_name}.{model_name}", fg="cyan")
+                    )
+                fields = _prompt_fields(existing_models)
+                if not fields:
+                    click.echo(click.style("❌ Aucun champ défini. Abandon.", fg="red"))
+                    raise click.Abort()
+                models.append(
+                    {"app_name": app_name, "model_name": model_name, "fields": fields}
                 )
+                # Les modèles du lot deviennent disponibles pour les relations
+                existing_models = existing_models + [(app_name, model_name)]
 
-        if not fields:
-            click.echo(click.style("❌ Aucun champ défini. Abandon.", fg="red"))
-            raise click.Abort()
+                if not multiple or not click.confirm(
+                    "\nAjouter un autre modèle ?", default=False
+                ):
+                    break
+                model_name = click.prompt("Nom du modèle suivant", type=str)
 
-        # Génère le modèle
+        # Génère le(s) modèle(s)
         click.echo(click.style("\n⚙️  Génération du modèle...", fg="cyan"))
-        models_file = generate_model_file(
-            app_name=app_name,
-            model_name=model_name,
-            fields=fields,
-            output_dir=str(output_path),
-            add_timestamps=not no_timestamps,
-        )
+        if len(models) == 1 and not spec_file:
+            models_files = [
+                generate_model_file(
+                    app_name=models[0]["app_name"],
+                    model_name=models[0]["model_name"],
+                    fields=models[0]["fields"],
+                    output_dir=str(output_path),
+                    add_timestamps=add_timestamps,
+                )
+            ]
+        else:
+            models_files = generate_models_batch(
+                models=models,
+                output_dir=str(output_path),
+                add_timestamps=add_timestamps,
+            )
 
-        click.echo(
-            click.style(f"✅ Modèle généré avec succès : {models_file}", fg="green")
-        )
+        for models_file in models_files:
+            click.echo(
+                click.style(f"✅ Modèle généré avec succès : {models_file}", fg="green")
+            )
+        if len(models) > 1:
+            click.echo(
+                f"   {len(models)} modèle(s) écrit(s) dans "
+                f"{len(models_files)} fichier(s)"
+            )
+
+        apps = " ".join(sorted({Path(f).parent.name for f in models_files}))
         click.echo(click.style("\n💡 Prochaines étapes :", fg="yellow"))
-        click.echo(f"  1. Vérifiez le modèle dans {models_file}")
-        click.echo(f"  2. Exécutez: python manage.py makemigrations {app_name}")
+        click.echo(f"  1. Vérifiez le modèle dans {', '.join(models_files)}")
+        click.echo(f"  2. Exécutez: python manage.py makemigrations {apps}")
         click.echo("  3. Appliquez: python manage.py migrate")
 
+    except click.Abort:
+        raise
     except ValueError as e:
         click.echo(click.style(f"❌ Erreur de validation : {e}", fg="red"), err=True)
         raise click.Abort()
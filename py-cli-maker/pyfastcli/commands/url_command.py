@@ -5,6 +5,40 @@ from pathlib import Path
 import click
 
 from pyfastcli.generators.ninja_routes import generate_ninja_route_file
+from pyfastcli.generators.route_index import RouteIndex, parse_routes
+from pyfastcli.generators.route_registry import (
+    is_lazy_registry,
+    update_route_registry,
+)
+
+
+def _echo_route_table(route_index: RouteIndex):
+    """Affiche la table des routes du projet et les conflits détectés."""
+    routes = route_index.routes
+    if not routes:
+        click.echo(click.style("ℹ️  Aucune route trouvée dans le projet", fg="yellow"))
+        return
+
+    rows = [("MÉTHODE", "CHEMIN", "FONCTION", "EMPLACEMENT")] + [
+        (route.method, route.full_path, route.function, route.location)
+        for route in routes
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+    for row in rows:
+        click.echo(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+            + f"  {row[3]}"
+        )
+
+    click.echo(click.style(f"\n✅ {len(routes)} route(s)", fg="green"))
+    for existing, duplicate in route_index.conflicts():
+        click.echo(
+            click.style(
+                f"⚠️  Conflit : {duplicate.method} {duplicate.full_path} "
+                f"({duplicate.location}) masqué par {existing.location}",
+                fg="yellow",
+            )
+        )
 
 
 @click.command("make:url")
@@ -66,17 +100,93 @@ from pyfastcli.generators.ninja_routes import generate_ninja_route_file
     default=None,
     help="Description de l'endpoint",
 )
+@click.option(
+    "--project-dir",
+    "-P",
+    default=".",
+    help="Racine du projet Django (détection des conflits de routes)",
+)
+@click.option(
+    "--registry/--no-registry",
+    default=True,
+    help="Met à jour le registre des routes (__init__.py du dossier de sortie)",
+)
+@click.option(
+    "--lazy-registry",
+    is_flag=True,
+    default=False,
+    help="Registre paresseux : chaque module de routes est importé à la "
+    "première requête sur son préfixe (démarrage de Django plus rapide)",
+)
+@click.option(
+    "--conditional",
+    "conditional_model",
+    default=None,
+    metavar="APP.MODELE",
+    help="GET conditionnel : 304 si la collection du modèle n'a pas changé "
+    "(ETag / Last-Modified calculés depuis max(updated_at) et le nombre de "
+    "lignes)",
+)
+@click.option(
+    "--throttle",
+    default=None,
+    metavar="N/UNITÉ",
+    help="Débit maximal par client, ex: 100/min (429 au-delà ; compteur "
+    "atomique dans le cache Django, seau à jetons en mémoire sinon)",
+)
+@click.option(
+    "--list-routes",
+    is_flag=True,
+    default=False,
+    help="Affiche la table des routes du projet et quitte",
+)
 def make_url(
-    module_name, function_name, url_path, http_method, tag, output_dir, description
+    module_name,
+    function_name,
+    url_path,
+    http_method,
+    tag,
+    output_dir,
+    description,
+    project_dir,
+    registry,
+    lazy_registry,
+    conditional_model,
+    throttle,
+    list_routes,
 ):
     """
     Génère un fichier .py contenant une route Django Ninja.
 
+    La route est refusée si la même méthode et le même chemin sont déjà
+    déclarés dans le projet (index des routes mis en cache, seuls les
+    fichiers modifiés sont réanalysés). Un chemin déjà servi par un module
+    du dossier de sortie avec une autre méthode est déclaré sur le router
+    de ce module (GET et POST /orders sur un même router).
+
     Exemple d'utilisation:
         pyfastcli make:url --function-name get_orders \\
             --url-path /orders --http-method get
+        pyfastcli make:url --function-name get_orders \\
+            --url-path /orders --conditional orders.Order
+        pyfastcli make:url --function-name get_orders \\
+            --url-path /orders --throttle 100/min
+        pyfastcli make:url --list-routes
+
+    Le module est ajouté au registre __init__.py du dossier de sortie, qui
+    enregistre toutes les routes générées en un appel : register_routes(api).
+    Avec --lazy-registry, lazy_urlpatterns(api) n'importe chaque module qu'à
+    la première requête sur son préfixe (le mode est ensuite conservé).
+    Avec --conditional, l'utilitaire cache_http.py est généré une fois dans
+    le dossier de sortie et partagé par les routes conditionnelles ; de même
+    pour limite_http.py avec --throttle.
     """
     try:
+        route_index = RouteIndex.load(project_dir)
+        if list_routes:
+            _echo_route_table(route_index)
+            return
+
         # Validation du dossier de sortie
         output_path = Path(output_dir)
         if not output_path.is_absolute():
@@ -102,11 +212,57 @@ def make_url(
             tag=tag,
             output_dir=str(output_path),
             description=description,
+            route_index=route_index,
+            conditional_model=conditional_model,
+            throttle=throttle,
         )
+        route_index.save()
+
+        registry_path = None
+        if registry:
+            registry_path = update_route_registry(
+                Path(file_path).parent,
+                Path(file_path).stem,
+                lazy=True if lazy_registry else None,
+            )
 
         click.echo(
             click.style(f"✅ Fichier généré avec succès : {file_path}", fg="green")
         )
+        if registry_path:
+            click.echo(
+                click.style(
+                    f"🔗 Route ajoutée au registre : {registry_path}", fg="green"
+                )
+            )
+            click.echo("\nExemple d'utilisation dans votre fichier urls.py:")
+            package = Path(file_path).parent.name
+            if is_lazy_registry(Path(registry_path)):
+                click.echo(f"  from {package} import lazy_urlpatterns")
+                click.echo('  path("api/", include(lazy_urlpatterns(api)))')
+            else:
+                click.echo(f"  from {package} import register_routes")
+                click.echo("  register_routes(api)")
+            return
+
+        if registry:
+            click.echo(
+                click.style(
+                    "ℹ️  __init__.py existant non généré : registre non modifié",
+                    fg="yellow",
+                )
+            )
+        source = Path(file_path).read_text(encoding="utf-8")
+        shared = [route.router for route in parse_routes(source, Path(file_path).name)]
+        if shared and shared[0]:
+            click.echo(
+                click.style(
+                    f"💡 Route déclarée sur le router de {shared[0]} (même "
+                    "chemin) : elle est servie dès que ce router est inclus.",
+                    fg="yellow",
+                )
+            )
+            return
         click.echo(
             click.style(
                 "💡 N'oublie pas d'inclure ce router dans tes urls Ninja.", fg="yellow"
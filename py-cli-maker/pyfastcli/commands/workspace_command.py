@@ -0,0 +1,174 @@
+"""Commande make:workspace pour générer un workspace de packages Python."""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import click
+
+from pyfastcli.generators.spec_loader import load_spec_file
+from pyfastcli.generators.workspace_generator import generate_workspace_structure
+
+
+@click.command("make:workspace")
+@click.option(
+    "--spec",
+    "-s",
+    "spec_file",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Spécification du workspace (JSON ou TOML)",
+)
+@click.option("--name", "-n", default=None, help="Nom du workspace (ex: platform)")
+@click.option(
+    "--package",
+    "-p",
+    "package_names",
+    multiple=True,
+    help="Package membre (répétable, ex: -p core-lib -p api-client)",
+)
+@click.option("--description", "-d", default=None, help="Description du workspace")
+@click.option("--author-name", "-a", default=None, help="Nom de l'auteur")
+@click.option("--author-email", "-e", default=None, help="Email de l'auteur")
+@click.option(
+    "--python-version", default=None, help="Version Python minimale (défaut : 3.8)"
+)
+@click.option(
+    "--license",
+    "-l",
+    "license_type",
+    default=None,
+    type=click.Choice(
+        ["MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause"], case_sensitive=False
+    ),
+    help="Type de licence (défaut : MIT)",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    default=".",
+    help="Dossier de sortie où créer le workspace",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Nombre de threads d'écriture des packages (défaut : automatique)",
+)
+def make_workspace(
+    spec_file: Optional[str],
+    name: Optional[str],
+    package_names: Tuple[str, ...],
+    description: Optional[str],
+    author_name: Optional[str],
+    author_email: Optional[str],
+    python_version: Optional[str],
+    license_type: Optional[str],
+    output_dir: str,
+    workers: Optional[int],
+):
+    """
+    Génère un workspace uv/pip avec plusieurs packages Python en une passe.
+
+    Crée à la racine la configuration partagée (pyproject.toml avec
+    [tool.uv.workspace], outils de qualité, groupe dev), un Makefile
+    (lock, sync, test...), requirements-dev.txt pour pip et .python-version ;
+    chaque package est généré dans packages/<nom> comme avec make:package.
+    Les options de la ligne de commande priment sur la spécification.
+
+    Exemple de spécification (workspace.toml):
+
+    \b
+        name = "platform"
+        author_name = "Jane Doe"
+        author_email = "jane@example.com"
+        [[packages]]
+        name = "core-lib"
+        [[packages]]
+        name = "api-client"
+        dependencies = ["core-lib"]
+
+    Exemple d'utilisation:
+        pyfastcli make:workspace --spec workspace.toml
+        pyfastcli make:workspace -n platform -p core-lib -p api-client
+    """
+    try:
+        spec: Dict[str, Any] = load_spec_file(spec_file) if spec_file else {}
+        overrides = {
+            "name": name,
+            "description": description,
+            "author_name": author_name,
+            "author_email": author_email,
+            "python_version": python_version,
+            "license": license_type,
+        }
+        spec.update({key: value for key, value in overrides.items() if value})
+        if package_names:
+            spec["packages"] = list(package_names)
+
+        # Informations obligatoires absentes de la spécification
+        for key, label in [
+            ("name", "Nom du workspace"),
+            ("author_name", "Nom de l'auteur"),
+            ("author_email", "Email de l'auteur"),
+        ]:
+            if not spec.get(key):
+                spec[key] = click.prompt(label, type=str)
+        if not spec.get("packages"):
+            names = click.prompt("Packages (séparés par des virgules)", type=str)
+            spec["packages"] = [n.strip() for n in names.split(",") if n.strip()]
+
+        output_path = Path(output_dir)
+        if not output_path.is_absolute():
+            output_path = Path.cwd() / output_path
+
+        workspace_dir = generate_workspace_structure(
+            workspace_name=str(spec["name"]),
+            packages=spec["packages"],
+            output_dir=str(output_path),
+            author_name=str(spec["author_name"]),
+            author_email=str(spec["author_email"]),
+            version=str(spec.get("version", "0.1.0")),
+            description=spec.get("description"),
+            python_version=str(spec.get("python_version", "3.8")),
+            license_type=str(spec.get("license", "MIT")),
+            dev_dependencies=spec.get("dev_dependencies"),
+            workers=workers,
+        )
+
+        members = sorted(p.name for p in (Path(workspace_dir) / "packages").iterdir())
+        click.echo(
+            click.style(
+                f"✅ Workspace créé avec succès dans : {workspace_dir}", fg="green"
+            )
+        )
+        click.echo("\n📁 Structure créée :")
+        click.echo(f"  {workspace_dir}/")
+        click.echo("    ├── pyproject.toml  ([tool.uv.workspace])")
+        click.echo("    ├── Makefile")
+        click.echo("    ├── requirements-dev.txt")
+        click.echo("    └── packages/")
+        for i, member in enumerate(members):
+            branch = "└──" if i == len(members) - 1 else "├──"
+            click.echo(f"        {branch} {member}/")
+
+        click.echo(click.style("\n💡 Prochaines étapes :", fg="yellow"))
+        click.echo(f"  1. cd {workspace_dir}")
+        click.echo("  2. uv lock && uv sync --all-packages")
+        click.echo("     (ou : pip install -r requirements-dev.txt)")
+        click.echo("  3. make test")
+
+    except click.Abort:
+        raise
+    except ValueError as e:
+        click.echo(click.style(f"❌ Erreur de validation : {e}", fg="red"), err=True)
+        raise click.Abort()
+    except FileExistsError as e:
+        click.echo(click.style(f"❌ Erreur : {e}", fg="red"), err=True)
+        raise click.Abort()
+    except OSError as e:
+        click.echo(click.style(f"❌ Erreur d'écriture : {e}", fg="red"), err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo(click.style(f"❌ Erreur inattendue : {e}", fg="red"), err=True)
+        raise click.Abort()
@@ -0,0 +1,155 @@
+"""Complétion shell (bash, zsh, fish) des options des commandes make:*.
+
+Les apps et modèles du projet Django sont servis par un index persistant
+(``<cache pyfastcli>/projects/<empreinte du chemin>.json``) : seuls les
+fichiers models.py modifiés depuis la dernière complétion sont relus, au
+lieu de réanalyser tout le projet à chaque appui sur Tab.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+import click
+from click.shell_completion import CompletionItem
+
+from pyfastcli.generators.model_generator import (
+    DJANGO_FIELD_TYPES,
+    RELATION_FIELD_TYPES,
+    parse_model_names,
+)
+from pyfastcli.render_cache import default_cache_dir
+
+# Version du format de l'index de projet
+PROJECT_INDEX_VERSION = 1
+
+
+def project_index_path(project_path: Path) -> Path:
+    """Fichier de l'index persistant d'un projet."""
+    digest = hashlib.sha256(str(project_path).encode("utf-8")).hexdigest()[:16]
+    return default_cache_dir() / "projects" / f"{digest}.json"
+
+
+def _write_index(path: Path, data: Dict[str, Any]):
+    """Écrit l'index (écriture atomique, erreurs ignorées)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(data, tmp_file, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except OSError:
+        # L'index est une optimisation : un échec d'écriture n'est pas fatal
+        pass
+
+
+def project_models(project_path) -> Dict[str, List[str]]:
+    """
+    Apps Django du projet et leurs modèles, via l'index persistant.
+
+    Une app est un sous-dossier contenant models.py ou apps.py. L'index est
+    mis à jour de façon incrémentale : un models.py n'est relu que si sa date
+    de modification a changé.
+
+    Args:
+        project_path: Chemin du projet Django
+
+    Returns:
+        Dictionnaire app -> noms des modèles, trié par app
+    """
+    project_path = Path(project_path).resolve()
+    path = project_index_path(project_path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        cached = data["apps"] if data["version"] == PROJECT_INDEX_VERSION else {}
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = {}
+    if not isinstance(cached, dict):
+        cached = {}
+
+    apps: Dict[str, Dict[str, Any]] = {}
+    changed = False
+    try:
+        entries = list(os.scandir(project_path))
+    except OSError:
+        return {}
+    for entry in entries:
+        if entry.name.startswith(".") or not entry.is_dir():
+            continue
+        models_file = os.path.join(entry.path, "models.py")
+        try:
+            mtime = os.stat(models_file).st_mtime_ns
+        except OSError:
+            if os.path.exists(os.path.join(entry.path, "apps.py")):
+                apps[entry.name] = {"mtime_ns": None, "models": []}
+            continue
+
+        previous = cached.get(entry.name)
+        if previous and previous.get("mtime_ns") == mtime:
+            apps[entry.name] = previous
+            continue
+        try:
+            content = Path(models_file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        apps[entry.name] = {"mtime_ns": mtime, "models": parse_model_names(content)}
+        changed = True
+
+    if changed or set(apps) != set(cached):
+        _write_index(path, {"version": PROJECT_INDEX_VERSION, "apps": apps})
+    return {app: apps[app]["models"] for app in sorted(apps)}
+
+
+def _project_path(ctx: click.Context) -> Path:
+    """Projet ciblé par la commande en cours de complétion (--output-dir)."""
+    return Path(ctx.params.get("output_dir") or ".")
+
+
+def complete_app_name(
+    ctx: click.Context, param: click.Parameter, incomplete: str
+) -> List[CompletionItem]:
+    """Complète un nom d'app Django existante du projet."""
+    return [
+        CompletionItem(app, help=", ".join(models))
+        for app, models in project_models(_project_path(ctx)).items()
+        if app.startswith(incomplete)
+    ]
+
+
+def complete_field_spec(
+    ctx: click.Context, param: click.Parameter, incomplete: str
+) -> List[CompletionItem]:
+    """
+    Complète une définition de champ nom:Type[:options].
+
+    Propose les types de DJANGO_FIELD_TYPES après 'nom:', puis les modèles
+    existants du projet pour l'option to= des champs de relation.
+    """
+    parts = incomplete.split(":")
+    if len(parts) == 2:
+        name, prefix = parts
+        return [
+            CompletionItem(f"{name}:{field_type}", help=definition)
+            for field_type, definition in DJANGO_FIELD_TYPES.items()
+            if field_type.lower().startswith(prefix.lower())
+        ]
+
+    if len(parts) == 3 and parts[1] in RELATION_FIELD_TYPES:
+        name, field_type, options = parts
+        head, separator, current = options.rpartition(",")
+        if not "to=".startswith(current) and not current.startswith("to="):
+            return []
+        target = current[3:]
+        prefix = f"{name}:{field_type}:{head}{separator}to="
+        return [
+            CompletionItem(f"{prefix}{app}.{model}")
+            for app, models in project_models(_project_path(ctx)).items()
+            for model in models
+            if f"{app}.{model}".startswith(target)
+        ]
+
+    # Nom du champ : saisie libre
+    return []
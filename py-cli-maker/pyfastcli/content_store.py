@@ -0,0 +1,159 @@
+"""Magasin de contenu pour matérialiser les fichiers identiques sans les réécrire.
+
+Chaque contenu distinct est écrit une seule fois dans le magasin
+(``objects/<sha[:2]>/<sha>``). Les fichiers générés en sont ensuite des
+clones : reflink (``FICLONE``, copie en écriture différée sur btrfs, XFS...),
+sinon simple copie si le système de fichiers ne le prend pas en charge (ou
+si le magasin est sur un autre volume). Les liens physiques ne sont utilisés
+que sur demande explicite (mode 'hardlink') : un fichier modifié sur place
+modifierait aussi l'objet du magasin et toutes ses autres copies.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set
+
+from pyfastcli.render_cache import default_cache_dir
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl Linux FICLONE (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+# Modes de matérialisation ('auto' : reflink, sinon copie)
+LINK_MODES = ["auto", "reflink", "hardlink", "copy"]
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone source vers target par reflink ; False si non pris en charge."""
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            target.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def _hardlink(source: Path, target: Path) -> bool:
+    """Crée un lien physique ; False si non pris en charge (ex: autre volume)."""
+    try:
+        os.link(source, target)
+        return True
+    except OSError:
+        return False
+
+
+class ContentStore:
+    """
+    Magasin de contenu adressé par empreinte SHA-256.
+
+    Attributes:
+        directory: Dossier du magasin
+        mode: 'auto' ou 'reflink' (reflink, sinon copie), 'hardlink' (lien
+            physique, sinon copie) ou 'copy'
+        stats: Nombre de fichiers matérialisés par méthode
+    """
+
+    def __init__(self, directory: Path, mode: str = "auto"):
+        if mode not in LINK_MODES:
+            raise ValueError(
+                f"Mode de matérialisation invalide : {mode}. "
+                f"Modes valides : {', '.join(LINK_MODES)}"
+            )
+        self.directory = Path(directory)
+        self.mode = mode
+        self.stats: Dict[str, int] = {"reflink": 0, "hardlink": 0, "copy": 0}
+        self._verified: Set[str] = set()
+
+    def put(self, data: bytes) -> Path:
+        """
+        Stocke un contenu (une seule fois) et retourne son chemin.
+
+        Un objet existant n'est réutilisé que si son empreinte correspond
+        toujours à son nom (vérifiée une fois par session) : un objet modifié
+        sur place via un lien physique est réécrit.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.directory / "objects" / digest[:2] / digest
+        if digest not in self._verified:
+            try:
+                stored = hashlib.sha256(path.read_bytes()).hexdigest() == digest
+            except OSError:
+                stored = False
+        else:
+            stored = True
+        if not stored:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        self._verified.add(digest)
+        return path
+
+    def materialize(self, data: bytes, target: Path) -> str:
+        """
+        Écrit un contenu à l'emplacement cible en le clonant depuis le magasin.
+
+        Args:
+            data: Contenu du fichier
+            target: Fichier à créer (remplacé s'il existe)
+
+        Returns:
+            Méthode utilisée : 'reflink', 'hardlink' ou 'copy'
+        """
+        source = self.put(data)
+        if target.exists() or target.is_symlink():
+            target.unlink()
+
+        method = "copy"
+        if self.mode in ("auto", "reflink") and _reflink(source, target):
+            method = "reflink"
+        elif self.mode == "hardlink" and _hardlink(source, target):
+            method = "hardlink"
+        else:
+            shutil.copyfile(source, target)
+        self.stats[method] += 1
+        return method
+
+
+_current: Optional[ContentStore] = None
+
+
+def get_content_store() -> Optional[ContentStore]:
+    """Retourne le magasin de contenu actif, ou None."""
+    return _current
+
+
+@contextmanager
+def content_store(
+    directory: Optional[str] = None, mode: str = "auto"
+) -> Iterator[ContentStore]:
+    """
+    Active le magasin de contenu pour la durée du bloc.
+
+    Args:
+        directory: Dossier du magasin (défaut : <cache pyfastcli>/store)
+        mode: Mode de matérialisation (voir LINK_MODES)
+    """
+    global _current
+    previous = _current
+    store_dir = Path(directory) if directory else default_cache_dir() / "store"
+    _current = ContentStore(store_dir, mode)
+    try:
+        yield _current
+    finally:
+        _current = previous
@@ -1,25 +1,36 @@
-from pyfastcli.generators.ddd_domaine_generator import (
-    generate_ddd_domaine_structure,
-)
-from pyfastcli.generators.domaine_generator import (
-    generate_domaine_structure,
-)
-from pyfastcli.generators.model_generator import (
-    discover_existing_models,
-    generate_model_file,
-)
-from pyfastcli.generators.ninja_routes import (
-    generate_ninja_route_file,
-)
-from pyfastcli.generators.package_generator import (
-    generate_package_structure,
-)
-
-__all__ = [
-    "generate_ddd_domaine_structure",
-    "generate_domaine_structure",
-    "generate_ninja_route_file",
-    "generate_package_structure",
-    "generate_model_file",
-    "discover_existing_models",
-]
+"""Générateurs pyfastcli.
+
+Les fonctions publiques sont importées à la demande (PEP 562) : importer un
+générateur ne charge pas les autres.
+"""
+
+import importlib
+from typing import Any
+
+# Nom exporté -> module qui le définit
+_EXPORTS = {
+    "generate_ddd_domaine_structure": "pyfastcli.generators.ddd_domaine_generator",
+    "generate_domaine_structure": "pyfastcli.generators.domaine_generator",
+    "generate_ninja_route_file": "pyfastcli.generators.ninja_routes",
+    "generate_package_structure": "pyfastcli.generators.package_generator",
+    "generate_workspace_structure": "pyfastcli.generators.workspace_generator",
+    "generate_model_file": "pyfastcli.generators.model_generator",
+    "generate_models_batch": "pyfastcli.generators.model_generator",
+    "discover_existing_models": "pyfastcli.generators.model_generator",
+    "load_spec_file": "pyfastcli.generators.spec_loader",
+    "run_batch_spec": "pyfastcli.generators.batch_generator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
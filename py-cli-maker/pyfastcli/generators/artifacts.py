@@ -0,0 +1,124 @@
+"""Cœur de rendu commun des générateurs : graphe d'artefacts.
+
+Chaque fichier généré est un nœud (``Artifact``) décrit par son chemin
+relatif, sa fonction de rendu, son contexte et ses dépendances. Les
+générateurs de domaine sont des préréglages qui construisent une liste
+d'artefacts ; ``materialize`` les rend et les écrit dans l'ordre des
+dépendances.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from pyfastcli.instrumentation import count, rendering, write_text
+from pyfastcli.render_cache import get_render_cache
+
+
+@dataclass
+class Artifact:
+    """
+    Fichier à générer.
+
+    Attributes:
+        path: Chemin relatif à la racine de génération (séparateur '/')
+        render: Fonction de rendu, appelée avec le contexte en arguments nommés
+        context: Arguments de la fonction de rendu
+        depends_on: Chemins des artefacts à générer avant celui-ci
+    """
+
+    path: str
+    render: Callable[..., str]
+    context: Dict[str, Any] = field(default_factory=dict)
+    depends_on: Tuple[str, ...] = ()
+
+
+def render_artifact(artifact: Artifact) -> str:
+    """
+    Rend le contenu d'un artefact (phase 'rendering').
+
+    Si un cache de rendu est actif (voir pyfastcli.render_cache), le contenu
+    est lu depuis le cache ou rendu puis stocké, et les compteurs cache_hits
+    et cache_misses de l'instrumentation sont mis à jour.
+    """
+    render = rendering(artifact.render)
+    cache = get_render_cache()
+    if cache is None:
+        return render(**artifact.context)
+
+    hits = cache.hits
+    content = cache.get_or_render(render, artifact.context)
+    count("cache_hits" if cache.hits > hits else "cache_misses")
+    return content
+
+
+def order_artifacts(artifacts: Iterable[Artifact]) -> List[Artifact]:
+    """
+    Trie les artefacts selon leurs dépendances (ordre de déclaration conservé).
+
+    Args:
+        artifacts: Artefacts à trier
+
+    Returns:
+        Artefacts dans un ordre où chaque dépendance précède ses dépendants
+
+    Raises:
+        ValueError: Si un chemin est dupliqué, une dépendance inconnue ou
+            cyclique
+    """
+    by_path: Dict[str, Artifact] = {}
+    for artifact in artifacts:
+        if artifact.path in by_path:
+            raise ValueError(f"Artefact dupliqué : {artifact.path}")
+        by_path[artifact.path] = artifact
+
+    ordered: List[Artifact] = []
+    done: Set[str] = set()
+    visiting: Set[str] = set()
+
+    def visit(artifact: Artifact):
+        if artifact.path in done:
+            return
+        if artifact.path in visiting:
+            raise ValueError(f"Dépendance cyclique sur l'artefact {artifact.path}")
+        visiting.add(artifact.path)
+        for dependency in artifact.depends_on:
+            if dependency not in by_path:
+                raise ValueError(
+                    f"Dépendance inconnue pour {artifact.path} : {dependency}"
+                )
+            visit(by_path[dependency])
+        visiting.discard(artifact.path)
+        done.add(artifact.path)
+        ordered.append(artifact)
+
+    for artifact in by_path.values():
+        visit(artifact)
+    return ordered
+
+
+def materialize(root: Path, artifacts: Iterable[Artifact]) -> List[str]:
+    """
+    Rend et écrit les artefacts sous un dossier racine.
+
+    Args:
+        root: Dossier racine (doit exister)
+        artifacts: Artefacts à générer
+
+    Returns:
+        Chemins des fichiers écrits, dans l'ordre d'écriture
+
+    Raises:
+        ValueError: Si le graphe d'artefacts est invalide
+        OSError: Si un fichier ne peut pas être écrit
+    """
+    written: List[str] = []
+    created_dirs: Set[Path] = {root}
+    for artifact in order_artifacts(artifacts):
+        target = root / artifact.path
+        if target.parent not in created_dirs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(target.parent)
+        write_text(target, render_artifact(artifact))
+        written.append(str(target))
+    return written
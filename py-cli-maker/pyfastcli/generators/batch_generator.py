@@ -0,0 +1,192 @@
+"""Exécution d'une spécification de lot (plusieurs générateurs) sur un projet."""
+
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pyfastcli.content_store import content_store
+from pyfastcli.generators.ddd_domaine_generator import (
+    generate_ddd_domaine_structure,
+)
+from pyfastcli.generators.domaine_generator import generate_domaine_structure
+from pyfastcli.generators.model_generator import (
+    generate_models_batch,
+    models_from_spec,
+)
+from pyfastcli.generators.ninja_routes import generate_ninja_route_file
+from pyfastcli.generators.package_generator import generate_package_structure
+from pyfastcli.render_cache import DEFAULT_MAX_BYTES, render_cache
+
+
+def _with_default_model_name(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Déduit model_name de app_name s'il est absent (comme make:domaine)."""
+    if not step.get("model_name") and step.get("app_name"):
+        app_name = str(step["app_name"])
+        step = dict(
+            step, model_name=app_name.replace("_", " ").title().replace(" ", "")
+        )
+    return step
+
+
+def _run_domaine_step(step: Dict[str, Any], output_dir: str) -> List[str]:
+    """Exécute une étape 'domaine'."""
+    step = _with_default_model_name(step)
+    return [generate_domaine_structure(output_dir=output_dir, **step)]
+
+
+def _run_domaine_ddd_step(step: Dict[str, Any], output_dir: str) -> List[str]:
+    """Exécute une étape 'domaine-ddd'."""
+    step = _with_default_model_name(step)
+    return [generate_ddd_domaine_structure(output_dir=output_dir, **step)]
+
+
+def _run_models_step(step: Dict[str, Any], output_dir: str) -> List[str]:
+    """Exécute une étape 'models' (même format que make:model --from-spec)."""
+    return generate_models_batch(
+        models=models_from_spec(step),
+        output_dir=output_dir,
+        add_timestamps=bool(step.get("add_timestamps", True)),
+    )
+
+
+def _run_url_step(step: Dict[str, Any], output_dir: str) -> List[str]:
+    """Exécute une étape 'url'."""
+    step = dict({"module_name": "api", "http_method": "get", "tag": "Default"}, **step)
+    return [generate_ninja_route_file(output_dir=output_dir, **step)]
+
+
+def _run_package_step(step: Dict[str, Any], output_dir: str) -> List[str]:
+    """Exécute une étape 'package'."""
+    return [generate_package_structure(output_dir=output_dir, **step)]
+
+
+# Générateurs disponibles dans une spécification de lot
+BATCH_GENERATORS: Dict[str, Callable[[Dict[str, Any], str], List[str]]] = {
+    "domaine": _run_domaine_step,
+    "domaine-ddd": _run_domaine_ddd_step,
+    "models": _run_models_step,
+    "url": _run_url_step,
+    "package": _run_package_step,
+}
+
+
+def validate_batch_spec(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Valide une spécification de lot et retourne ses étapes.
+
+    Format attendu:
+        {"steps": [{"generator": "domaine", "app_name": "pratique", ...}]}
+
+    Args:
+        spec: Spécification chargée (JSON ou TOML)
+
+    Returns:
+        Liste des étapes à exécuter
+
+    Raises:
+        ValueError: Si la spécification est invalide
+    """
+    steps = spec.get("steps")
+    if not isinstance(steps, list) or not steps:
+        raise ValueError("La spécification doit contenir une liste 'steps' non vide")
+
+    for i, step in enumerate(steps, 1):
+        if not isinstance(step, dict):
+            raise ValueError(f"L'étape n°{i} de la spécification est invalide")
+        generator = step.get("generator")
+        if generator not in BATCH_GENERATORS:
+            raise ValueError(
+                f"Générateur inconnu pour l'étape n°{i} : {generator}. "
+                f"Générateurs valides : {', '.join(BATCH_GENERATORS)}"
+            )
+    return steps
+
+
+def run_batch_spec(
+    spec: Dict[str, Any],
+    project_root: str,
+    generated: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Exécute toutes les étapes d'une spécification de lot sur un projet.
+
+    Le dossier de sortie de chaque étape ('output_dir', "." par défaut) est
+    relatif à la racine du projet.
+
+    Args:
+        spec: Spécification de lot (voir validate_batch_spec)
+        project_root: Racine du projet cible
+        generated: Liste complétée au fil des étapes (optionnel) ; en cas
+            d'erreur, elle contient les chemins écrits par les étapes
+            précédentes
+
+    Returns:
+        Liste des chemins générés
+
+    Raises:
+        ValueError: Si la spécification est invalide
+        FileExistsError: Si un fichier ou dossier à générer existe déjà
+        OSError: Si les fichiers ne peuvent pas être créés
+    """
+    root = Path(project_root)
+    if not root.is_dir():
+        raise OSError(f"Le projet {root} n'existe pas ou n'est pas un dossier")
+
+    if generated is None:
+        generated = []
+    for step in validate_batch_spec(spec):
+        step = dict(step)
+        runner = BATCH_GENERATORS[step.pop("generator")]
+        output_dir = root / step.pop("output_dir", ".")
+        generated.extend(runner(step, str(output_dir)))
+    return generated
+
+
+def run_project(
+    spec: Dict[str, Any],
+    project_root: str,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    store_dir: Optional[str] = None,
+    link_mode: str = "auto",
+) -> Dict[str, Any]:
+    """
+    Exécute une spécification de lot sur un projet en isolant les erreurs.
+
+    Conçue pour être exécutée dans un processus de travail : elle ne lève
+    jamais d'exception et retourne un rapport sérialisable.
+
+    Args:
+        spec: Spécification de lot
+        project_root: Racine du projet cible
+        cache_dir: Dossier du cache de rendu à utiliser (optionnel)
+        cache_max_bytes: Taille maximale du cache de rendu
+        store_dir: Dossier du magasin de contenu à utiliser (optionnel)
+        link_mode: Mode de matérialisation du magasin de contenu
+
+    Returns:
+        Dictionnaire {"project", "files", "duration", "error", "cache"} ; en
+        cas d'erreur, "files" liste les chemins déjà écrits par les étapes
+        précédentes
+    """
+    start = time.perf_counter()
+    files: List[str] = []
+    error = None
+    with (
+        render_cache(cache_dir, cache_max_bytes) if cache_dir else nullcontext()
+    ) as cache, (content_store(store_dir, link_mode) if store_dir else nullcontext()):
+        try:
+            run_batch_spec(spec, project_root, files)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return {
+        "project": project_root,
+        "files": files,
+        "duration": time.perf_counter() - start,
+        "error": error,
+        "cache": {
+            "hits": cache.hits if cache else 0,
+            "misses": cache.misses if cache else 0,
+        },
+    }
@@ -1,12 +1,34 @@
 """Générateur de structure de domaine Django selon les principes DDD light."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from pyfastcli.generators.artifacts import Artifact, materialize
 from pyfastcli.generators.domaine_generator import (
+    _SESSIONS_COUNT_FIELD,
+    _admin_context,
+    _export_fields,
+    _normalize_fields,
+    _render_model_fields,
+    _render_session_count_services,
     _sanitize_app_name,
     _sanitize_model_name,
+    _summary_fields,
+    _validate_base_template,
+)
+from pyfastcli.generators.fragments import (
+    render_admin_py,
+    render_app_init,
+    render_apps_py,
+    render_detail_html,
+    render_empty,
+    render_exports_py,
+    render_forms_py,
+    render_formulaire_html,
+    render_liste_html,
+    render_urls_py,
 )
+from pyfastcli.instrumentation import phase
 
 
 def generate_ddd_domaine_structure(
@@ -15,6 +37,14 @@ def generate_ddd_domaine_structure(
     output_dir: str,
     include_serializers: bool = True,
     description: Optional[str] = None,
+    fields: Optional[List[Any]] = None,
+    include_export: bool = False,
+    include_async: bool = False,
+    optimistic_locking: bool = False,
+    skip_locked: bool = False,
+    include_session_count: bool = False,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
 ) -> str:
     """
     Génère une structure complète de domaine Django selon les principes DDD light.
@@ -25,6 +55,22 @@ def generate_ddd_domaine_structure(
         output_dir: Dossier de sortie où créer l'app
         include_serializers: Inclure serializers.py (pour DRF)
         description: Description optionnelle du domaine
+        fields: Champs du modèle principal (format de make:model) ; ils
+            déterminent aussi les projections de liste du repository
+        include_export: Inclure presentation/exports.py (export CSV/NDJSON en
+            streaming)
+        include_async: Ajouter les variantes async (aobtenir_par_id,
+            acreer_...) au repository et aux services
+        optimistic_locking: Verrou optimiste : champ version sur le modèle et
+            modification en un seul UPDATE conditionné par la version
+        skip_locked: Ajouter modifier_<app>_si_libre au service
+            (select_for_update(skip_locked=True))
+        include_session_count: Ajouter au modèle principal le compteur
+            dénormalisé sessions_count, maintenu par le service
+        base_template: Template de base étendu par les templates générés
+            (blocs title et content) au lieu de documents HTML complets
+        cache_fragments: Mettre en cache ({% cache %}) les lignes de la liste
+            et le détail, avec une clé incluant updated_at
 
     Returns:
         Chemin du dossier de l'app créé
@@ -34,21 +80,24 @@ def generate_ddd_domaine_structure(
         OSError: Si les fichiers ne peuvent pas être créés
     """
     # Validation et nettoyage
-    app_name = _sanitize_app_name(app_name)
-    model_name = _sanitize_model_name(model_name)
-
-    if not description:
-        description = f"Domaine {app_name} (DDD)"
-
-    # Création du dossier de sortie
-    output_path = Path(output_dir)
-    app_dir = output_path / app_name
-
-    if app_dir.exists():
-        raise FileExistsError(
-            f"Le dossier {app_dir} existe déjà. "
-            "Supprimez-le ou choisissez un autre nom d'app."
-        )
+    with phase("validation"):
+        app_name = _sanitize_app_name(app_name)
+        model_name = _sanitize_model_name(model_name)
+        fields = _normalize_fields(fields)
+        base_template = _validate_base_template(base_template)
+
+        if not description:
+            description = f"Domaine {app_name} (DDD)"
+
+        # Création du dossier de sortie
+        output_path = Path(output_dir)
+        app_dir = output_path / app_name
+
+        if app_dir.exists():
+            raise FileExistsError(
+                f"Le dossier {app_dir} existe déjà. "
+                "Supprimez-le ou choisissez un autre nom d'app."
+            )
 
     try:
         app_dir.mkdir(parents=True, exist_ok=True)
@@ -56,83 +105,225 @@ def generate_ddd_domaine_structure(
         raise OSError(f"Impossible de créer le dossier {app_dir}: {e}") from e
 
     # Génération des fichiers selon la structure DDD
-    _generate_app_init(app_dir, app_name)
-    _generate_apps_py(app_dir, app_name)
-    _generate_admin_py(app_dir, app_name, model_name)
-
-    # Domain layer
-    _generate_domain_models(app_dir, app_name, model_name)
-    _generate_domain_services(app_dir, app_name, model_name)
-    _generate_value_objects(app_dir, app_name, model_name)
-
-    # Infrastructure layer
-    _generate_repositories(app_dir, app_name, model_name)
-
-    # Presentation layer
-    _generate_presentation_views(app_dir, app_name, model_name)
-    _generate_presentation_forms(app_dir, app_name, model_name)
-    if include_serializers:
-        _generate_presentation_serializers(app_dir, app_name, model_name)
-    _generate_presentation_urls(app_dir, app_name, model_name)
-    _generate_templates(app_dir, app_name, model_name)
-
-    # Tests
-    _generate_tests_structure(app_dir, app_name, model_name)
+    materialize(
+        app_dir,
+        _ddd_artifacts(
+            app_name,
+            model_name,
+            include_serializers,
+            fields,
+            include_export,
+            include_async,
+            optimistic_locking,
+            skip_locked,
+            include_session_count,
+            base_template,
+            cache_fragments,
+        ),
+    )
 
     return str(app_dir)
 
 
-def _generate_app_init(app_dir: Path, app_name: str):
-    """Génère le fichier __init__.py de l'app."""
-    content = f'''"""
-Application Django : {app_name} (DDD)
-"""
-'''
-    (app_dir / "__init__.py").write_text(content, encoding="utf-8")
-
-
-def _generate_apps_py(app_dir: Path, app_name: str):
-    """Génère le fichier apps.py."""
-    app_name_capitalized = app_name.capitalize()
-    content = f'''from django.apps import AppConfig
-
-
-class {app_name_capitalized}Config(AppConfig):
-    """Configuration de l'application {app_name} (DDD)."""
-
-    default_auto_field = "django.db.models.BigAutoField"
-    name = "{app_name}"
-    verbose_name = "{app_name_capitalized} (DDD)"
-'''
-    (app_dir / "apps.py").write_text(content, encoding="utf-8")
-
-
-def _generate_admin_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier admin.py."""
-    content = f'''from django.contrib import admin
-
-from {app_name}.domain.models import {model_name}
+def _ddd_artifacts(
+    app_name: str,
+    model_name: str,
+    include_serializers: bool = True,
+    fields: Optional[List[Dict[str, str]]] = None,
+    include_export: bool = False,
+    include_async: bool = False,
+    optimistic_locking: bool = False,
+    skip_locked: bool = False,
+    include_session_count: bool = False,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
+) -> List[Artifact]:
+    """
+    Construit le graphe d'artefacts d'un domaine Django DDD.
 
+    Args:
+        app_name: Nom de l'app Django (déjà nettoyé)
+        model_name: Nom du modèle principal (déjà nettoyé)
+        include_serializers: Inclure presentation/serializers.py
+        fields: Champs normalisés du modèle principal
+        include_export: Inclure presentation/exports.py
+        include_async: Ajouter les variantes async du repository et des
+            services
+        optimistic_locking: Champ version et modification conditionnée par
+            la version (verrou optimiste)
+        skip_locked: Ajouter la modification avec
+            select_for_update(skip_locked=True)
+        include_session_count: Ajouter le compteur dénormalisé sessions_count
+        base_template: Template de base étendu par les templates générés
+        cache_fragments: Fragments {% cache %} clés par updated_at
 
-@admin.register({model_name})
-class {model_name}Admin(admin.ModelAdmin):
-    """Administration pour le modèle {model_name}."""
+    Returns:
+        Liste des artefacts à générer (chemins relatifs au dossier de l'app)
+    """
+    fields = fields or []
+    names = {"app_name": app_name, "model_name": model_name}
+    async_names = dict(names, include_async=include_async)
+    service_options = dict(
+        async_names,
+        optimistic_locking=optimistic_locking,
+        skip_locked=skip_locked,
+        include_session_count=include_session_count,
+    )
+    locking = dict(names, optimistic_locking=optimistic_locking)
+    summary_fields = _summary_fields(fields, cache_fragments)
+    export_fields = _export_fields(fields)
+    if include_session_count:
+        summary_fields.append("sessions_count")
+        export_fields.append("sessions_count")
+    label = {"app_name": app_name, "label_suffix": " (DDD)"}
+    models_module = f"{app_name}.domain.models"
+    artifacts = [
+        Artifact("__init__.py", render_app_init, label),
+        Artifact("apps.py", render_apps_py, label),
+        # Domain layer
+        Artifact("domain/__init__.py", render_empty),
+        Artifact(
+            "domain/models.py",
+            _render_domain_models,
+            dict(locking, fields=fields, include_session_count=include_session_count),
+        ),
+        Artifact(
+            "admin.py",
+            render_admin_py,
+            _admin_context(app_name, model_name, models_module, fields),
+            depends_on=("domain/models.py",),
+        ),
+        Artifact(
+            "domain/services.py",
+            _render_domain_services,
+            service_options,
+            depends_on=("domain/models.py",),
+        ),
+        Artifact("domain/value_objects.py", _render_value_objects, names),
+        # Infrastructure layer
+        Artifact("infrastructure/__init__.py", render_empty),
+        Artifact(
+            "infrastructure/repositories.py",
+            _render_repositories,
+            dict(
+                async_names,
+                summary_fields=summary_fields,
+                include_session_count=include_session_count,
+            ),
+            depends_on=("domain/models.py",),
+        ),
+        # Presentation layer
+        Artifact("presentation/__init__.py", render_empty),
+        Artifact(
+            "presentation/forms.py",
+            render_forms_py,
+            {
+                "model_name": model_name,
+                "models_module": models_module,
+                "docstring": f"Formulaires pour le domaine {app_name}.",
+                "with_clean": True,
+                "version_field": optimistic_locking,
+            },
+            depends_on=("domain/models.py",),
+        ),
+        Artifact(
+            "presentation/views.py",
+            _render_presentation_views,
+            locking,
+            depends_on=(
+                "domain/services.py",
+                "infrastructure/repositories.py",
+                "presentation/forms.py",
+            ),
+        ),
+    ]
+    if include_serializers:
+        artifacts.append(
+            Artifact(
+                "presentation/serializers.py",
+                _render_presentation_serializers,
+                names,
+                depends_on=("domain/models.py",),
+            )
+        )
+    exports_module = None
+    if include_export:
+        exports_module = f"{app_name}.presentation.exports"
+        artifacts.append(
+            Artifact(
+                "presentation/exports.py",
+                render_exports_py,
+                dict(
+                    names,
+                    export_fields=export_fields,
+                    rows_import=(
+                        f"from {app_name}.infrastructure.repositories import "
+                        f"{model_name}Repository"
+                    ),
+                    rows_expression=(
+                        f"{model_name}Repository.iter_valeurs(CHAMPS_EXPORT, "
+                        "chunk_size=CHUNK_SIZE)"
+                    ),
+                ),
+                depends_on=("infrastructure/repositories.py",),
+            )
+        )
+    artifacts.append(
+        Artifact(
+            "presentation/urls.py",
+            render_urls_py,
+            dict(
+                names,
+                views_module=f"{app_name}.presentation.views",
+                docstring=f"URLs pour le domaine {app_name}.",
+                exports_module=exports_module,
+            ),
+            depends_on=("presentation/views.py",),
+        )
+    )
 
-    list_display = ["id", "__str__"]
-    list_filter = []
-    search_fields = []
-    readonly_fields = ["id", "created_at", "updated_at"]
-'''
-    (app_dir / "admin.py").write_text(content, encoding="utf-8")
+    # Templates (Django les cherche dans templates/<app_name>/)
+    templates_dir = f"templates/{app_name}"
+    page = dict(names, base_template=base_template)
+    cached_page = dict(page, cache_fragments=cache_fragments)
+    artifacts += [
+        Artifact(f"{templates_dir}/liste.html", render_liste_html, cached_page),
+        Artifact(f"{templates_dir}/detail.html", render_detail_html, cached_page),
+        Artifact(f"{templates_dir}/formulaire.html", render_formulaire_html, page),
+    ]
 
+    # Tests
+    artifacts += [
+        Artifact("tests/__init__.py", render_empty),
+        Artifact("tests/test_models.py", _render_test_models, names),
+        Artifact("tests/test_services.py", _render_test_services, service_options),
+        Artifact("tests/test_views.py", _render_test_views, names),
+    ]
+    return artifacts
 
-def _generate_domain_models(app_dir: Path, app_name: str, model_name: str):
-    """Génère les modèles du domaine (domain/models.py)."""
-    domain_dir = app_dir / "domain"
-    domain_dir.mkdir(exist_ok=True)
-    (domain_dir / "__init__.py").write_text("", encoding="utf-8")
 
+def _render_domain_models(
+    app_name: str,
+    model_name: str,
+    fields: Optional[List[Dict[str, str]]] = None,
+    optimistic_locking: bool = False,
+    include_session_count: bool = False,
+) -> str:
+    """Rend les modèles du domaine (domain/models.py)."""
     session_model_name = f"Session{model_name}"
+    field_imports, field_lines, meta_lines = _render_model_fields(
+        model_name, fields or []
+    )
+    version_field = ""
+    if optimistic_locking:
+        version_field = """
+    # Verrou optimiste : incrémentée à chaque modification (service)
+    version = models.PositiveIntegerField(
+        default=1, editable=False, verbose_name="Version"
+    )
+"""
+    if include_session_count:
+        version_field += _SESSIONS_COUNT_FIELD
     content = f'''"""
 Modèles du domaine {app_name}.
 
@@ -141,7 +332,7 @@ Ce module contient les entités métier et la logique métier pure.
 
 from django.db import models
 from django.utils import timezone
-
+{field_imports}
 
 class {model_name}(models.Model):
     """
@@ -158,16 +349,13 @@ class {model_name}(models.Model):
     updated_at = models.DateTimeField(
         auto_now=True, verbose_name="Date de modification"
     )
-
-    # Ajoutez vos champs spécifiques ici
-    # nom = models.CharField(max_length=255, verbose_name="Nom")
-    # description = models.TextField(blank=True, verbose_name="Description")
-
+{version_field}
+{field_lines}
     class Meta:
         verbose_name = "{model_name}"
         verbose_name_plural = "{model_name}s"
         ordering = ["-created_at"]
-
+{meta_lines}
     def __str__(self):
         return f"{model_name} #{{self.id}}"
 
@@ -229,12 +417,74 @@ class {session_model_name}(models.Model):
     def __str__(self):
         return f"{session_model_name} #{{self.id}} - {{self.{app_name.lower()}}}"
 '''
-    (domain_dir / "models.py").write_text(content, encoding="utf-8")
+    return content
+
+
+def _render_domain_services(
+    app_name: str,
+    model_name: str,
+    include_async: bool = False,
+    optimistic_locking: bool = False,
+    skip_locked: bool = False,
+    include_session_count: bool = False,
+) -> str:
+    """Rend les services du domaine (domain/services.py)."""
+    async_import = async_helpers = ""
+    if include_async:
+        async_import = "from asgiref.sync import sync_to_async\n"
+        async_helpers = _ASYNC_TRANSACTION_HELPER
+    version_imports = version_helpers = ""
+    expressions = []
+    models_import = model_name
+    if include_session_count:
+        expressions = ["Count", "F", "OuterRef", "Subquery"]
+        models_import += f", Session{model_name}"
+    elif optimistic_locking:
+        expressions = ["F"]
+    if expressions:
+        version_imports = f"from django.db.models import {', '.join(expressions)}\n"
+    if include_session_count:
+        version_imports += "from django.db.models.functions import Coalesce\n"
+    if optimistic_locking:
+        version_imports += "from django.utils import timezone\n"
+        version_helpers = _VERSION_CONFLICT_EXCEPTION
+        modifier_method = _render_optimistic_update(app_name, model_name)
+    else:
+        modifier_method = f'''    @staticmethod
+    def modifier_{app_name.lower()}(
+        {app_name.lower()}_id: int, **kwargs
+    ) -> Optional[{model_name}]:
+        """
+        Modifie un {model_name} existant selon les règles métier.
+
+        Args:
+            {app_name.lower()}_id: ID du {model_name} à modifier
+            **kwargs: Arguments à mettre à jour
+
+        Returns:
+            Instance de {model_name} modifiée ou None si non trouvée
 
+        Raises:
+            ValueError: Si les règles métier ne sont pas respectées
+        """
+        try:
+            {app_name.lower()} = {model_name}.objects.get(id={app_name.lower()}_id)
 
-def _generate_domain_services(app_dir: Path, app_name: str, model_name: str):
-    """Génère les services du domaine (domain/services.py)."""
-    domain_dir = app_dir / "domain"
+            # Validation métier avant modification
+            if not {app_name.lower()}.peut_etre_modifiee():
+                raise ValueError(
+                    "L'entité ne peut pas être modifiée selon les règles métier"
+                )
+
+            with transaction.atomic():
+                for key, value in kwargs.items():
+                    setattr({app_name.lower()}, key, value)
+                {app_name.lower()}.save()
+            return {app_name.lower()}
+        except {model_name}.DoesNotExist:
+            return None
+
+'''
     content = f'''"""
 Services du domaine {app_name}.
 
@@ -242,10 +492,10 @@ Ce module contient les règles métier complexes et les opérations métier.
 """
 
 from typing import Optional
-from django.db import transaction
-
-from {app_name}.domain.models import {model_name}
-
+{async_import}from django.db import transaction
+{version_imports}
+from {app_name}.domain.models import {models_import}
+{async_helpers}{version_helpers}
 
 class {model_name}Service:
     """
@@ -276,19 +526,16 @@ class {model_name}Service:
             {app_name.lower()} = {model_name}.objects.create(**kwargs)
         return {app_name.lower()}
 
-    @staticmethod
-    def modifier_{app_name.lower()}(
-        {app_name.lower()}_id: int, **kwargs
-    ) -> Optional[{model_name}]:
+{modifier_method}    @staticmethod
+    def supprimer_{app_name.lower()}({app_name.lower()}_id: int) -> bool:
         """
-        Modifie un {model_name} existant selon les règles métier.
+        Supprime un {model_name} selon les règles métier.
 
         Args:
-            {app_name.lower()}_id: ID du {model_name} à modifier
-            **kwargs: Arguments à mettre à jour
+            {app_name.lower()}_id: ID du {model_name} à supprimer
 
         Returns:
-            Instance de {model_name} modifiée ou None si non trouvée
+            True si supprimé, False sinon
 
         Raises:
             ValueError: Si les règles métier ne sont pas respectées
@@ -296,53 +543,255 @@ class {model_name}Service:
         try:
             {app_name.lower()} = {model_name}.objects.get(id={app_name.lower()}_id)
 
-            # Validation métier avant modification
-            if not {app_name.lower()}.peut_etre_modifiee():
-                raise ValueError(
-                    "L'entité ne peut pas être modifiée selon les règles métier"
-                )
+            # Validation métier avant suppression
+            # if not {app_name.lower()}.peut_etre_supprimee():
+            #     raise ValueError("L'entité ne peut pas être supprimée")
 
             with transaction.atomic():
-                for key, value in kwargs.items():
-                    setattr({app_name.lower()}, key, value)
-                {app_name.lower()}.save()
-            return {app_name.lower()}
+                {app_name.lower()}.delete()
+            return True
+        except {model_name}.DoesNotExist:
+            return False
+'''
+    if include_session_count:
+        content += _render_session_count_services(app_name, model_name, methods=True)
+    if skip_locked:
+        content += _render_skip_locked_update(app_name, model_name, optimistic_locking)
+    if include_async:
+        content += _render_async_services(app_name, model_name, optimistic_locking)
+    return content
+
+
+# Fonction ajoutée à domain/services.py avec --async
+_ASYNC_TRANSACTION_HELPER = '''
+
+async def en_transaction(fonction, *args, **kwargs):
+    """
+    Exécute une fonction synchrone dans transaction.atomic() (depuis l'async).
+
+    transaction.atomic() n'est pas disponible en contexte async : la fonction
+    et sa transaction s'exécutent dans un thread via sync_to_async.
+    """
+
+    def executer():
+        with transaction.atomic():
+            return fonction(*args, **kwargs)
+
+    return await sync_to_async(executer)()
+'''
+
+
+def _render_async_services(
+    app_name: str, model_name: str, optimistic_locking: bool = False
+) -> str:
+    """Rend les méthodes async du service (écritures via en_transaction)."""
+    var = app_name.lower()
+    if optimistic_locking:
+        modifier_method = _render_optimistic_update(
+            app_name, model_name, asynchrone=True
+        )
+    else:
+        modifier_method = f'''    @staticmethod
+    async def amodifier_{var}(
+        {var}_id: int, **kwargs
+    ) -> Optional[{model_name}]:
+        """
+        Modifie un {model_name} existant selon les règles métier (async).
+
+        Args:
+            {var}_id: ID du {model_name} à modifier
+            **kwargs: Arguments à mettre à jour
+
+        Returns:
+            Instance de {model_name} modifiée ou None si non trouvée
+
+        Raises:
+            ValueError: Si les règles métier ne sont pas respectées
+        """
+        try:
+            {var} = await {model_name}.objects.aget(id={var}_id)
         except {model_name}.DoesNotExist:
             return None
 
+        # Validation métier avant modification
+        if not {var}.peut_etre_modifiee():
+            raise ValueError(
+                "L'entité ne peut pas être modifiée selon les règles métier"
+            )
+
+        def appliquer():
+            for key, value in kwargs.items():
+                setattr({var}, key, value)
+            {var}.save()
+
+        await en_transaction(appliquer)
+        return {var}
+
+'''
+    return f'''
+    # Variantes async (vues async, Ninja) : lectures et créations simples via
+    # l'API async de l'ORM, écritures multiples via en_transaction()
+
     @staticmethod
-    def supprimer_{app_name.lower()}({app_name.lower()}_id: int) -> bool:
+    async def acreer_{var}(**kwargs) -> {model_name}:
         """
-        Supprime un {model_name} selon les règles métier.
+        Crée un nouveau {model_name} selon les règles métier (async).
+
+        Un seul INSERT : pas de transaction explicite.
 
         Args:
-            {app_name.lower()}_id: ID du {model_name} à supprimer
+            **kwargs: Arguments pour créer le {model_name}
 
         Returns:
-            True si supprimé, False sinon
+            Instance de {model_name} créée
 
         Raises:
             ValueError: Si les règles métier ne sont pas respectées
         """
-        try:
-            {app_name.lower()} = {model_name}.objects.get(id={app_name.lower()}_id)
+        return await {model_name}.objects.acreate(**kwargs)
 
-            # Validation métier avant suppression
-            # if not {app_name.lower()}.peut_etre_supprimee():
-            #     raise ValueError("L'entité ne peut pas être supprimée")
+{modifier_method}    @staticmethod
+    async def asupprimer_{var}({var}_id: int) -> bool:
+        """
+        Supprime un {model_name} selon les règles métier (async).
 
-            with transaction.atomic():
-                {app_name.lower()}.delete()
-            return True
+        Args:
+            {var}_id: ID du {model_name} à supprimer
+
+        Returns:
+            True si supprimé, False sinon
+
+        Raises:
+            ValueError: Si les règles métier ne sont pas respectées
+        """
+        try:
+            {var} = await {model_name}.objects.aget(id={var}_id)
         except {model_name}.DoesNotExist:
             return False
+
+        # Validation métier avant suppression
+        # if not {var}.peut_etre_supprimee():
+        #     raise ValueError("L'entité ne peut pas être supprimée")
+
+        await en_transaction({var}.delete)
+        return True
 '''
-    (domain_dir / "services.py").write_text(content, encoding="utf-8")
 
 
-def _generate_value_objects(app_dir: Path, app_name: str, model_name: str):
-    """Génère les value objects (domain/value_objects.py)."""
-    domain_dir = app_dir / "domain"
+# Exception ajoutée à domain/services.py avec --optimistic-locking
+_VERSION_CONFLICT_EXCEPTION = '''
+
+class ConflitDeVersion(ValueError):
+    """L'entité a été modifiée depuis sa lecture (version périmée)."""
+'''
+
+
+def _render_optimistic_update(
+    app_name: str, model_name: str, asynchrone: bool = False
+) -> str:
+    """
+    Rend modifier_<app> avec verrou optimiste (UPDATE conditionné par version).
+
+    Args:
+        app_name: Nom de l'app Django
+        model_name: Nom du modèle principal
+        asynchrone: Rendre la variante async (amodifier_<app>, aupdate...)
+    """
+    var = app_name.lower()
+    prefix, suffix, attente = (
+        ("a", " (async)", "await ") if asynchrone else ("", "", "")
+    )
+    asynch = "async " if asynchrone else ""
+    return f'''    @staticmethod
+    {asynch}def {prefix}modifier_{var}(
+        {var}_id: int, version: int, **kwargs
+    ) -> Optional[int]:
+        """
+        Modifie un {model_name} si sa version n'a pas changé{suffix}.
+
+        Verrou optimiste : une seule requête UPDATE ... WHERE id = ... AND
+        version = ..., qui n'écrit que les champs passés et incrémente la
+        version. Une requête de plus n'est faite qu'en cas d'échec, pour
+        distinguer un {model_name} absent d'un conflit.
+
+        Args:
+            {var}_id: ID du {model_name} à modifier
+            version: Version lue par l'appelant (champ version)
+            **kwargs: Champs à mettre à jour
+
+        Returns:
+            Nouvelle version, ou None si le {model_name} n'existe pas
+
+        Raises:
+            ConflitDeVersion: Si le {model_name} a été modifié depuis la lecture
+        """
+        # Règles métier : ajoutez-les au filtre (ex: statut="brouillon") pour
+        # qu'elles soient vérifiées par la même requête
+        modifies = {attente}{model_name}.objects.filter(
+            id={var}_id, version=version
+        ).{prefix}update(
+            version=F("version") + 1, updated_at=timezone.now(), **kwargs
+        )
+        if modifies:
+            return version + 1
+        if not {attente}{model_name}.objects.filter(id={var}_id).{prefix}exists():
+            return None
+        raise ConflitDeVersion(
+            f"{model_name} #{{{var}_id}} a été modifié entre-temps "
+            f"(version {{version}} périmée)"
+        )
+
+'''
+
+
+def _render_skip_locked_update(
+    app_name: str, model_name: str, optimistic_locking: bool = False
+) -> str:
+    """Rend modifier_<app>_si_libre (select_for_update(skip_locked=True))."""
+    var = app_name.lower()
+    version_lines = ""
+    update_fields = '[*kwargs, "updated_at"]'
+    if optimistic_locking:
+        version_lines = f"            {var}.version += 1\n"
+        update_fields = '[*kwargs, "version", "updated_at"]'
+    return f'''
+    @staticmethod
+    def modifier_{var}_si_libre(
+        {var}_id: int, **kwargs
+    ) -> Optional[{model_name}]:
+        """
+        Modifie un {model_name} sauf s'il est verrouillé par une autre transaction.
+
+        select_for_update(skip_locked=True) : une ligne déjà verrouillée est
+        ignorée au lieu d'attendre (workers concurrents, files de traitement).
+        Seuls les champs passés sont écrits (save(update_fields=...)). Sous
+        SQLite, qui ne verrouille pas les lignes, le verrou est sans effet.
+
+        Args:
+            {var}_id: ID du {model_name} à modifier
+            **kwargs: Champs à mettre à jour
+
+        Returns:
+            Instance de {model_name} modifiée, ou None si non trouvée ou
+            verrouillée
+        """
+        with transaction.atomic():
+            {var} = (
+                {model_name}.objects.select_for_update(skip_locked=True)
+                .filter(id={var}_id)
+                .first()
+            )
+            if {var} is None:
+                return None
+            for key, value in kwargs.items():
+                setattr({var}, key, value)
+{version_lines}            {var}.save(update_fields={update_fields})
+        return {var}
+'''
+
+
+def _render_value_objects(app_name: str, model_name: str) -> str:
+    """Rend les value objects (domain/value_objects.py)."""
     content = f'''"""
 Value Objects pour le domaine {app_name}.
 
@@ -380,23 +829,45 @@ class {model_name}Id:
 #         if len(self.value) > 255:
 #             raise ValueError("Le nom ne peut pas dépasser 255 caractères")
 '''
-    (domain_dir / "value_objects.py").write_text(content, encoding="utf-8")
+    return content
 
 
-def _generate_repositories(app_dir: Path, app_name: str, model_name: str):
-    """Génère les repositories (infrastructure/repositories.py)."""
-    infra_dir = app_dir / "infrastructure"
-    infra_dir.mkdir(exist_ok=True)
-    (infra_dir / "__init__.py").write_text("", encoding="utf-8")
+def _render_repositories(
+    app_name: str,
+    model_name: str,
+    summary_fields: Optional[List[str]] = None,
+    include_async: bool = False,
+    include_session_count: bool = False,
+) -> str:
+    """Rend les repositories (infrastructure/repositories.py)."""
+    summary_fields = summary_fields or ["id", "created_at"]
+    summary = ", ".join(f'"{name}"' for name in summary_fields)
+    session_count_method = ""
+    if include_session_count:
+        session_count_method = f'''
+    @staticmethod
+    def lister_avec_nb_sessions() -> QuerySet[{model_name}]:
+        """
+        Liste les {model_name}s annotés du nombre exact de sessions (nb_sessions).
+
+        Une seule requête (COUNT ... GROUP BY) quel que soit le nombre de
+        lignes ; pour l'affichage courant, le champ dénormalisé
+        sessions_count (dans CHAMPS_RESUME) évite la jointure.
 
+        Returns:
+            QuerySet de {model_name}s annotés de nb_sessions
+        """
+        return {model_name}.objects.annotate(nb_sessions=Count("sessions"))
+'''
+    db_imports = "Count, QuerySet, Q" if include_session_count else "QuerySet, Q"
     content = f'''"""
 Repositories pour le domaine {app_name}.
 
 Ce module contient l'accès aux données et les querysets personnalisés.
 """
 
-from typing import Optional, List
-from django.db.models import QuerySet, Q
+from typing import Optional, List, Iterator, Sequence
+from django.db.models import {db_imports}
 
 from {app_name}.domain.models import {model_name}
 
@@ -408,6 +879,10 @@ class {model_name}Repository:
     Encapsule l'accès aux données et fournit des méthodes de requête métier.
     """
 
+    # Champs chargés par les listes et les exports (hors champs volumineux :
+    # TextField, JSONField, BinaryField)
+    CHAMPS_RESUME = [{summary}]
+
     @staticmethod
     def obtenir_par_id({app_name.lower()}_id: int) -> Optional[{model_name}]:
         """
@@ -434,6 +909,40 @@ class {model_name}Repository:
         """
         return {model_name}.objects.all()
 
+    @classmethod
+    def lister_resume(cls) -> QuerySet[{model_name}]:
+        """
+        Liste les {model_name}s en ne chargeant que les champs de CHAMPS_RESUME.
+
+        À utiliser pour les pages de liste : accéder à un autre champ
+        déclenche une requête par instance.
+
+        Returns:
+            QuerySet de {model_name}s (projection .only())
+        """
+        return {model_name}.objects.only(*cls.CHAMPS_RESUME)
+{session_count_method}
+    @classmethod
+    def iter_valeurs(
+        cls, champs: Optional[Sequence[str]] = None, chunk_size: int = 2000
+    ) -> Iterator[tuple]:
+        """
+        Parcourt les valeurs des {model_name}s par lots, sans créer d'instances.
+
+        À utiliser pour les exports : le QuerySet n'est pas mis en cache, la
+        mémoire reste constante quel que soit le nombre de lignes.
+
+        Args:
+            champs: Champs à extraire (défaut : CHAMPS_RESUME)
+            chunk_size: Nombre de lignes lues par lot
+
+        Returns:
+            Itérateur de tuples de valeurs
+        """
+        return {model_name}.objects.values_list(
+            *(champs or cls.CHAMPS_RESUME)
+        ).iterator(chunk_size=chunk_size)
+
     @staticmethod
     def filtrer(**filtres) -> QuerySet[{model_name}]:
         """
@@ -495,15 +1004,93 @@ class {model_name}Repository:
         except {model_name}.DoesNotExist:
             return False
 '''
-    (infra_dir / "repositories.py").write_text(content, encoding="utf-8")
+    if include_async:
+        content += _render_async_repositories(app_name, model_name)
+    return content
+
+
+def _render_async_repositories(app_name: str, model_name: str) -> str:
+    """Rend les méthodes async du repository (API async de l'ORM Django)."""
+    var = app_name.lower()
+    return f'''
+    # Variantes async (vues async, Ninja) : API async de l'ORM (aget,
+    # acreate, adelete...), sans passer par un thread
+
+    @staticmethod
+    async def aobtenir_par_id({var}_id: int) -> Optional[{model_name}]:
+        """
+        Récupère un {model_name} par son ID (async).
+
+        Args:
+            {var}_id: ID du {model_name}
+
+        Returns:
+            Instance de {model_name} ou None si non trouvée
+        """
+        try:
+            return await {model_name}.objects.aget(id={var}_id)
+        except {model_name}.DoesNotExist:
+            return None
+
+    @staticmethod
+    async def alister_tous() -> List[{model_name}]:
+        """
+        Liste tous les {model_name}s (async).
+
+        Returns:
+            Liste des {model_name}s (le QuerySet est évalué)
+        """
+        return [{var} async for {var} in {model_name}.objects.all()]
+
+    @staticmethod
+    async def acreer(**kwargs) -> {model_name}:
+        """
+        Crée un nouveau {model_name} (async).
+
+        Args:
+            **kwargs: Arguments pour créer le {model_name}
+
+        Returns:
+            Instance de {model_name} créée
+        """
+        return await {model_name}.objects.acreate(**kwargs)
+
+    @staticmethod
+    async def asupprimer({var}_id: int) -> bool:
+        """
+        Supprime un {model_name} (async).
+
+        Args:
+            {var}_id: ID du {model_name} à supprimer
 
+        Returns:
+            True si supprimé, False sinon
+        """
+        deleted, _ = await {model_name}.objects.filter(id={var}_id).adelete()
+        return deleted > 0
+'''
 
-def _generate_presentation_views(app_dir: Path, app_name: str, model_name: str):
-    """Génère les vues de présentation (presentation/views.py)."""
-    presentation_dir = app_dir / "presentation"
-    presentation_dir.mkdir(exist_ok=True)
-    (presentation_dir / "__init__.py").write_text("", encoding="utf-8")
 
+def _render_presentation_views(
+    app_name: str, model_name: str, optimistic_locking: bool = False
+) -> str:
+    """Rend les vues de présentation (presentation/views.py)."""
+    service_imports = f"{model_name}Service"
+    update_form_valid = f'''    def form_valid(self, form):
+        """Valide le formulaire et modifie via le service métier."""
+        try:
+            {model_name}Service.modifier_{app_name.lower()}(
+                self.object.id, **form.cleaned_data
+            )
+            messages.success(self.request, "{model_name} modifié avec succès.")
+            return super().form_valid(form)
+        except ValueError as e:
+            messages.error(self.request, f"Erreur: {{e}}")
+            return self.form_invalid(form)
+'''
+    if optimistic_locking:
+        service_imports = f"ConflitDeVersion, {model_name}Service"
+        update_form_valid = _render_optimistic_form_valid(app_name, model_name)
     content = f'''"""
 Vues de présentation pour le domaine {app_name}.
 
@@ -518,7 +1105,7 @@ from django.views.generic import (
 from django.urls import reverse_lazy
 
 from {app_name}.domain.models import {model_name}
-from {app_name}.domain.services import {model_name}Service
+from {app_name}.domain.services import {service_imports}
 from {app_name}.infrastructure.repositories import {model_name}Repository
 from {app_name}.presentation.forms import {model_name}Form
 
@@ -583,18 +1170,7 @@ class {model_name}UpdateView(UpdateView):
             {model_name}Repository.obtenir_par_id(self.kwargs["pk"])
         )
 
-    def form_valid(self, form):
-        """Valide le formulaire et modifie via le service métier."""
-        try:
-            {model_name}Service.modifier_{app_name.lower()}(
-                self.object.id, **form.cleaned_data
-            )
-            messages.success(self.request, "{model_name} modifié avec succès.")
-            return super().form_valid(form)
-        except ValueError as e:
-            messages.error(self.request, f"Erreur: {{e}}")
-            return self.form_invalid(form)
-
+{update_form_valid}
 
 class {model_name}DeleteView(DeleteView):
     """Vue pour supprimer un {model_name}."""
@@ -619,51 +1195,38 @@ class {model_name}DeleteView(DeleteView):
             messages.error(self.request, f"Erreur: {{e}}")
             return redirect(self.success_url)
 '''
-    (presentation_dir / "views.py").write_text(content, encoding="utf-8")
-
-
-def _generate_presentation_forms(app_dir: Path, app_name: str, model_name: str):
-    """Génère les formulaires (presentation/forms.py)."""
-    presentation_dir = app_dir / "presentation"
-    content = f'''"""
-Formulaires pour le domaine {app_name}.
-"""
-
-from django import forms
-
-from {app_name}.domain.models import {model_name}
-
-
-class {model_name}Form(forms.ModelForm):
-    """Formulaire pour le modèle {model_name}."""
-
-    class Meta:
-        model = {model_name}
-        fields = "__all__"
-        # Exclure les champs automatiques si nécessaire
-        # exclude = ["created_at", "updated_at"]
-
-        # Personnaliser les widgets si nécessaire
-        # widgets = {{
-        #     "description": forms.Textarea(attrs={{"rows": 4, "cols": 40}}),
-        # }}
+    return content
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Ajoutez vos personnalisations de formulaire ici
 
-    def clean(self):
-        """Validation personnalisée du formulaire."""
-        cleaned_data = super().clean()
-        # Ajoutez vos validations ici
-        return cleaned_data
+def _render_optimistic_form_valid(app_name: str, model_name: str) -> str:
+    """Rend form_valid de la vue de modification (verrou optimiste)."""
+    return f'''    def form_valid(self, form):
+        """Modifie via le service métier, si la version lue est à jour."""
+        donnees = dict(form.cleaned_data)
+        version = donnees.pop("version")
+        try:
+            nouvelle_version = {model_name}Service.modifier_{app_name.lower()}(
+                self.object.id, version, **donnees
+            )
+        except ConflitDeVersion:
+            form.add_error(
+                None, "{model_name} modifié entre-temps : rechargez la page."
+            )
+            return self.form_invalid(form)
+        except ValueError as e:
+            messages.error(self.request, f"Erreur: {{e}}")
+            return self.form_invalid(form)
+        if nouvelle_version is None:
+            messages.error(self.request, "{model_name} supprimé entre-temps.")
+        else:
+            messages.success(self.request, "{model_name} modifié avec succès.")
+        # Pas de form.save() : l'UPDATE du service a déjà écrit les champs
+        return redirect(self.get_success_url())
 '''
-    (presentation_dir / "forms.py").write_text(content, encoding="utf-8")
 
 
-def _generate_presentation_serializers(app_dir: Path, app_name: str, model_name: str):
-    """Génère les serializers DRF (presentation/serializers.py)."""
-    presentation_dir = app_dir / "presentation"
+def _render_presentation_serializers(app_name: str, model_name: str) -> str:
+    """Rend les serializers DRF (presentation/serializers.py)."""
     content = f'''"""
 Serializers DRF pour le domaine {app_name}.
 """
@@ -696,152 +1259,12 @@ class {model_name}ListSerializer(serializers.ModelSerializer):
         fields = ["id", "__str__", "created_at"]
         read_only_fields = ["id", "created_at"]
 '''
-    (presentation_dir / "serializers.py").write_text(content, encoding="utf-8")
-
-
-def _generate_presentation_urls(app_dir: Path, app_name: str, model_name: str):
-    """Génère les URLs (presentation/urls.py)."""
-    presentation_dir = app_dir / "presentation"
-    content = f'''"""
-URLs pour le domaine {app_name}.
-"""
-
-from django.urls import path
-
-from {app_name}.presentation.views import (
-    {model_name}ListView,
-    {model_name}DetailView,
-    {model_name}CreateView,
-    {model_name}UpdateView,
-    {model_name}DeleteView,
-)
-
-app_name = "{app_name}"
-
-urlpatterns = [
-    path("", {model_name}ListView.as_view(), name="liste"),
-    path("<int:pk>/", {model_name}DetailView.as_view(), name="detail"),
-    path("nouveau/", {model_name}CreateView.as_view(), name="creer"),
-    path("<int:pk>/modifier/", {model_name}UpdateView.as_view(), name="modifier"),
-    path("<int:pk>/supprimer/", {model_name}DeleteView.as_view(), name="supprimer"),
-]
-'''
-    (presentation_dir / "urls.py").write_text(content, encoding="utf-8")
-
-
-def _generate_templates(app_dir: Path, app_name: str, model_name: str):
-    """Génère les templates HTML."""
-    # Django cherche les templates dans templates/ à la racine de l'app
-    templates_dir = app_dir / "templates" / app_name
-    templates_dir.mkdir(parents=True, exist_ok=True)
-
-    # Template liste.html
-    liste_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Liste des {model_name}s</title>
-</head>
-<body>
-    <h1>Liste des {model_name}s</h1>
-
-    <a href="{{% url '{app_name}:creer' %}}">Créer un nouveau {model_name}</a>
-
-    <ul>
-        {{% for {app_name} in {app_name}_list %}}
-        <li>
-            <a href="{{% url '{app_name}:detail' {app_name}.pk %}}">
-                {{{{ {app_name} }}}}
-            </a>
-            <a href="{{% url '{app_name}:modifier' {app_name}.pk %}}">Modifier</a>
-            <a href="{{% url '{app_name}:supprimer' {app_name}.pk %}}">Supprimer</a>
-        </li>
-        {{% empty %}}
-        <li>Aucun {model_name} trouvé.</li>
-        {{% endfor %}}
-    </ul>
-
-    {{% if is_paginated %}}
-    <div class="pagination">
-        {{% if page_obj.has_previous %}}
-        <a href="?page={{{{ page_obj.previous_page_number }}}}">Précédent</a>
-        {{% endif %}}
-        <span>
-            Page {{{{ page_obj.number }}}} sur {{{{ page_obj.paginator.num_pages }}}}
-        </span>
-        {{% if page_obj.has_next %}}
-        <a href="?page={{{{ page_obj.next_page_number }}}}">Suivant</a>
-        {{% endif %}}
-    </div>
-    {{% endif %}}
-</body>
-</html>
-"""
-    (templates_dir / "liste.html").write_text(liste_content, encoding="utf-8")
-
-    # Template detail.html
-    detail_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Détails de {{{{ {app_name} }}}}</title>
-</head>
-<body>
-    <h1>Détails du {model_name}</h1>
-
-    <dl>
-        <dt>ID</dt>
-        <dd>{{{{ {app_name}.id }}}}</dd>
-        <dt>Créé le</dt>
-        <dd>{{{{ {app_name}.created_at }}}}</dd>
-        <dt>Modifié le</dt>
-        <dd>{{{{ {app_name}.updated_at }}}}</dd>
-    </dl>
-
-    <a href="{{% url '{app_name}:liste' %}}">Retour à la liste</a>
-    <a href="{{% url '{app_name}:modifier' {app_name}.pk %}}">Modifier</a>
-    <a href="{{% url '{app_name}:supprimer' {app_name}.pk %}}">Supprimer</a>
-</body>
-</html>
-"""
-    (templates_dir / "detail.html").write_text(detail_content, encoding="utf-8")
-
-    # Template formulaire.html
-    formulaire_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>
-        {{% if object %}}Modifier{{% else %}}Créer{{% endif %}} un {model_name}
-    </title>
-</head>
-<body>
-    <h1>{{% if object %}}Modifier{{% else %}}Créer{{% endif %}} un {model_name}</h1>
-
-    <form method="post">
-        {{% csrf_token %}}
-        {{{{ form.as_p }}}}
-        <button type="submit">Enregistrer</button>
-    </form>
-
-    <a href="{{% url '{app_name}:liste' %}}">Annuler</a>
-</body>
-</html>
-"""
-    (templates_dir / "formulaire.html").write_text(formulaire_content, encoding="utf-8")
-
+    return content
 
-def _generate_tests_structure(app_dir: Path, app_name: str, model_name: str):
-    """Génère la structure de tests."""
-    tests_dir = app_dir / "tests"
-    tests_dir.mkdir(exist_ok=True)
-    (tests_dir / "__init__.py").write_text("", encoding="utf-8")
 
-    # test_models.py
-    models_test_content = f'''"""
+def _render_test_models(app_name: str, model_name: str) -> str:
+    """Rend les tests des modèles (tests/test_models.py)."""
+    return f'''"""
 Tests pour les modèles du domaine {app_name}.
 """
 
@@ -865,10 +1288,43 @@ class {model_name}ModelTest(TestCase):
         {app_name.lower()} = {model_name}.objects.create()
         self.assertIn(str({app_name.lower()}.id), str({app_name.lower()}))
 '''
-    (tests_dir / "test_models.py").write_text(models_test_content, encoding="utf-8")
 
-    # test_services.py
-    services_test_content = f'''"""
+
+def _render_test_services(
+    app_name: str,
+    model_name: str,
+    include_async: bool = False,
+    optimistic_locking: bool = False,
+    skip_locked: bool = False,
+    include_session_count: bool = False,
+) -> str:
+    """Rend les tests des services (tests/test_services.py)."""
+    var = app_name.lower()
+    service_imports = f"{model_name}Service"
+    if optimistic_locking:
+        service_imports = f"ConflitDeVersion, {model_name}Service"
+        test_modifier = f'''    def test_modifier_{var}(self):
+        """Test de modification via le service (version incrémentée)."""
+        {var} = {model_name}Service.creer_{var}()
+        version = {model_name}Service.modifier_{var}({var}.id, {var}.version)
+        self.assertEqual(version, {var}.version + 1)
+
+    def test_modifier_{var}_conflit(self):
+        """Test : une version périmée lève ConflitDeVersion."""
+        {var} = {model_name}Service.creer_{var}()
+        {model_name}Service.modifier_{var}({var}.id, {var}.version)
+        with self.assertRaises(ConflitDeVersion):
+            {model_name}Service.modifier_{var}({var}.id, {var}.version)
+'''
+    else:
+        test_modifier = f'''    def test_modifier_{var}(self):
+        """Test de modification via le service."""
+        {var} = {model_name}Service.creer_{var}()
+        modifie = {model_name}Service.modifier_{var}({var}.id)
+        self.assertIsNotNone(modifie)
+        self.assertEqual(modifie.id, {var}.id)
+'''
+    content = f'''"""
 Tests pour les services du domaine {app_name}.
 """
 
@@ -876,36 +1332,93 @@ import pytest
 from django.test import TestCase
 
 from {app_name}.domain.models import {model_name}
-from {app_name}.domain.services import {model_name}Service
+from {app_name}.domain.services import {service_imports}
 
 
 class {model_name}ServiceTest(TestCase):
     """Tests pour le service {model_name}Service."""
 
-    def test_creer_{app_name.lower()}(self):
+    def test_creer_{var}(self):
         """Test de création via le service."""
-        {app_name.lower()} = {model_name}Service.creer_{app_name.lower()}()
-        self.assertIsNotNone({app_name.lower()})
-        self.assertIsNotNone({app_name.lower()}.id)
+        {var} = {model_name}Service.creer_{var}()
+        self.assertIsNotNone({var})
+        self.assertIsNotNone({var}.id)
 
-    def test_modifier_{app_name.lower()}(self):
-        """Test de modification via le service."""
-        {app_name.lower()} = {model_name}Service.creer_{app_name.lower()}()
-        modifie = {model_name}Service.modifier_{app_name.lower()}({app_name.lower()}.id)
-        self.assertIsNotNone(modifie)
-        self.assertEqual(modifie.id, {app_name.lower()}.id)
-
-    def test_supprimer_{app_name.lower()}(self):
+{test_modifier}
+    def test_supprimer_{var}(self):
         """Test de suppression via le service."""
-        {app_name.lower()} = {model_name}Service.creer_{app_name.lower()}()
-        result = {model_name}Service.supprimer_{app_name.lower()}({app_name.lower()}.id)
+        {var} = {model_name}Service.creer_{var}()
+        result = {model_name}Service.supprimer_{var}({var}.id)
         self.assertTrue(result)
-        self.assertFalse({model_name}.objects.filter(id={app_name.lower()}.id).exists())
+        self.assertFalse({model_name}.objects.filter(id={var}.id).exists())
+'''
+    if skip_locked:
+        content += f'''
+    def test_modifier_{var}_si_libre(self):
+        """Test de modification d'un {model_name} non verrouillé."""
+        {var} = {model_name}Service.creer_{var}()
+        modifie = {model_name}Service.modifier_{var}_si_libre({var}.id)
+        self.assertIsNotNone(modifie)
+        self.assertIsNone({model_name}Service.modifier_{var}_si_libre(0))
+'''
+    if include_session_count:
+        content += f'''
+    def test_sessions_count(self):
+        """Test : sessions_count suit les créations et suppressions."""
+        {var} = {model_name}Service.creer_{var}()
+        session = {model_name}Service.creer_session_{var}({var}.id)
+        {model_name}Service.creer_session_{var}({var}.id)
+        {var}.refresh_from_db()
+        self.assertEqual({var}.sessions_count, 2)
+        self.assertTrue({model_name}Service.supprimer_session_{var}(session.id))
+        self.assertFalse({model_name}Service.supprimer_session_{var}(session.id))
+        {var}.refresh_from_db()
+        self.assertEqual({var}.sessions_count, 1)
+
+    def test_recalculer_sessions_count(self):
+        """Test : le recalcul corrige un compteur désynchronisé."""
+        {var} = {model_name}Service.creer_{var}()
+        {model_name}Service.creer_session_{var}({var}.id)
+        {model_name}.objects.update(sessions_count=0)
+        {model_name}Service.recalculer_sessions_count()
+        {var}.refresh_from_db()
+        self.assertEqual({var}.sessions_count, 1)
 '''
-    (tests_dir / "test_services.py").write_text(services_test_content, encoding="utf-8")
+    if include_async:
+        if optimistic_locking:
+            test_amodifier = f'''    async def test_amodifier_{var}(self):
+        """Test de modification via le service (async)."""
+        {var} = await {model_name}Service.acreer_{var}()
+        version = await {model_name}Service.amodifier_{var}({var}.id, {var}.version)
+        self.assertEqual(version, {var}.version + 1)
+'''
+        else:
+            test_amodifier = f'''    async def test_amodifier_{var}(self):
+        """Test de modification via le service (async)."""
+        {var} = await {model_name}Service.acreer_{var}()
+        modifie = await {model_name}Service.amodifier_{var}({var}.id)
+        self.assertIsNotNone(modifie)
+        self.assertEqual(modifie.id, {var}.id)
+'''
+        content += f'''
+    async def test_acreer_{var}(self):
+        """Test de création via le service (async)."""
+        {var} = await {model_name}Service.acreer_{var}()
+        self.assertIsNotNone({var}.id)
+
+{test_amodifier}
+    async def test_asupprimer_{var}(self):
+        """Test de suppression via le service (async)."""
+        {var} = await {model_name}Service.acreer_{var}()
+        self.assertTrue(await {model_name}Service.asupprimer_{var}({var}.id))
+        self.assertFalse(await {model_name}.objects.filter(id={var}.id).aexists())
+'''
+    return content
+
 
-    # test_views.py
-    views_test_content = f'''"""
+def _render_test_views(app_name: str, model_name: str) -> str:
+    """Rend les tests des vues (tests/test_views.py)."""
+    return f'''"""
 Tests pour les vues de présentation {app_name}.
 """
 
@@ -941,4 +1454,3 @@ class {model_name}ViewsTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 '''
-    (tests_dir / "test_views.py").write_text(views_test_content, encoding="utf-8")
@@ -1,8 +1,23 @@
 """Générateur de structure de domaine Django selon les best practices."""
 
 import re
+import textwrap
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyfastcli.generators.artifacts import Artifact, materialize
+from pyfastcli.generators.fragments import (
+    render_admin_py,
+    render_app_init,
+    render_apps_py,
+    render_detail_html,
+    render_exports_py,
+    render_forms_py,
+    render_formulaire_html,
+    render_liste_html,
+    render_urls_py,
+)
+from pyfastcli.instrumentation import phase
 
 
 def _sanitize_app_name(name: str) -> str:
@@ -56,6 +71,112 @@ def _sanitize_model_name(name: str) -> str:
     return "".join(cleaned_parts)
 
 
+def _normalize_fields(fields: Optional[List[Any]]) -> List[Dict[str, str]]:
+    """Valide les champs du modèle principal (mêmes formats que make:model)."""
+    # Import local : model_generator importe ce module
+    from pyfastcli.generators.model_generator import normalize_field
+
+    return [normalize_field(field) for field in fields or []]
+
+
+def _render_model_fields(
+    model_name: str, fields: List[Dict[str, str]]
+) -> Tuple[str, str, str]:
+    """
+    Rend les champs spécifiques du modèle principal.
+
+    Returns:
+        Tuple (lignes d'import supplémentaires, déclarations des champs,
+        index et contraintes de la Meta) ; sans champ, des exemples en
+        commentaire
+    """
+    if not fields:
+        return (
+            "",
+            "    # Ajoutez vos champs spécifiques ici\n"
+            '    # nom = models.CharField(max_length=255, verbose_name="Nom")\n'
+            "    # description = models.TextField(blank=True, "
+            'verbose_name="Description")\n',
+            "",
+        )
+
+    from pyfastcli.generators.model_generator import (
+        _render_field,
+        render_meta_indexes,
+    )
+
+    imports = set()
+    lines = ["    # Champs spécifiques"]
+    for field in fields:
+        field_imports, field_line = _render_field(field)
+        imports |= field_imports
+        lines.append(field_line)
+    # unique_if, index_if, gin_index : index et contraintes de la Meta
+    meta_imports, meta_lines = render_meta_indexes(model_name, fields)
+    imports |= meta_imports
+    import_lines = "".join(f"{line}\n" for line in sorted(imports))
+    return import_lines, "\n".join(lines) + "\n", meta_lines
+
+
+def _summary_fields(
+    fields: List[Dict[str, str]], cache_fragments: bool = False
+) -> List[str]:
+    """
+    Champs chargés par les projections de liste (hors champs volumineux).
+
+    Avec cache_fragments, updated_at (clé des fragments {% cache %} de la
+    liste) est chargé aussi, sinon chaque ligne relirait ce champ différé.
+    """
+    from pyfastcli.generators.model_generator import display_field_names
+
+    names = ["id", *display_field_names(fields), "created_at"]
+    if cache_fragments:
+        names.append("updated_at")
+    return list(dict.fromkeys(names))
+
+
+def _admin_context(
+    app_name: str, model_name: str, models_module: str, fields: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Contexte de render_admin_py : recherche et relations selon les champs."""
+    from pyfastcli.generators.model_generator import RELATION_FIELD_TYPES
+
+    return {
+        "model_name": model_name,
+        "models_module": models_module,
+        "session_field": app_name.lower(),
+        "search_fields": [
+            field["name"]
+            for field in fields
+            if field["type"] in ("CharField", "SlugField", "EmailField")
+        ],
+        "select_related": [
+            field["name"]
+            for field in fields
+            if field["type"] in ("ForeignKey", "OneToOneField")
+        ],
+        "raw_id_fields": [
+            field["name"] for field in fields if field["type"] in RELATION_FIELD_TYPES
+        ],
+    }
+
+
+def _validate_base_template(base_template: Optional[str]) -> Optional[str]:
+    """Valide le nom du template de base ({% extends "..." %})."""
+    if base_template is None:
+        return None
+    base_template = base_template.strip()
+    if not base_template or any(c in base_template for c in "\"'{}%"):
+        raise ValueError(f"Nom de template de base invalide : {base_template!r}")
+    return base_template
+
+
+def _export_fields(fields: List[Dict[str, str]]) -> List[str]:
+    """Champs exportés : toutes les colonnes du modèle (hors ManyToMany)."""
+    names = [field["name"] for field in fields if field["type"] != "ManyToManyField"]
+    return list(dict.fromkeys(["id", *names, "created_at", "updated_at"]))
+
+
 def generate_domaine_structure(
     app_name: str,
     model_name: str,
@@ -63,6 +184,11 @@ def generate_domaine_structure(
     include_services: bool = True,
     include_selectors: bool = True,
     description: Optional[str] = None,
+    fields: Optional[List[Any]] = None,
+    include_export: bool = False,
+    include_session_count: bool = False,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
 ) -> str:
     """
     Génère une structure complète de domaine Django selon les best practices.
@@ -74,6 +200,17 @@ def generate_domaine_structure(
         include_services: Inclure services.py
         include_selectors: Inclure selectors.py
         description: Description optionnelle du domaine
+        fields: Champs du modèle principal (format de make:model : chaînes
+            nom:Type[:options] ou dictionnaires) ; ils déterminent aussi les
+            champs des projections de liste de selectors.py
+        include_export: Inclure exports.py (export CSV/NDJSON en streaming)
+        include_session_count: Ajouter au modèle principal le compteur
+            dénormalisé sessions_count, maintenu par les services (requiert
+            include_services)
+        base_template: Template de base étendu par les templates générés
+            (blocs title et content) au lieu de documents HTML complets
+        cache_fragments: Mettre en cache ({% cache %}) les lignes de la liste
+            et le détail, avec une clé incluant updated_at
 
     Returns:
         Chemin du dossier de l'app créé
@@ -83,21 +220,29 @@ def generate_domaine_structure(
         OSError: Si les fichiers ne peuvent pas être créés
     """
     # Validation et nettoyage
-    app_name = _sanitize_app_name(app_name)
-    model_name = _sanitize_model_name(model_name)
-
-    if not description:
-        description = f"Domaine {app_name}"
-
-    # Création du dossier de sortie
-    output_path = Path(output_dir)
-    app_dir = output_path / app_name
-
-    if app_dir.exists():
-        raise FileExistsError(
-            f"Le dossier {app_dir} existe déjà. "
-            "Supprimez-le ou choisissez un autre nom d'app."
-        )
+    with phase("validation"):
+        app_name = _sanitize_app_name(app_name)
+        model_name = _sanitize_model_name(model_name)
+        fields = _normalize_fields(fields)
+        base_template = _validate_base_template(base_template)
+        if include_session_count and not include_services:
+            raise ValueError(
+                "Le compteur sessions_count est maintenu par services.py : "
+                "include_session_count requiert include_services"
+            )
+
+        if not description:
+            description = f"Domaine {app_name}"
+
+        # Création du dossier de sortie
+        output_path = Path(output_dir)
+        app_dir = output_path / app_name
+
+        if app_dir.exists():
+            raise FileExistsError(
+                f"Le dossier {app_dir} existe déjà. "
+                "Supprimez-le ou choisissez un autre nom d'app."
+            )
 
     try:
         app_dir.mkdir(parents=True, exist_ok=True)
@@ -105,76 +250,163 @@ def generate_domaine_structure(
         raise OSError(f"Impossible de créer le dossier {app_dir}: {e}") from e
 
     # Génération des fichiers
-    _generate_app_init(app_dir, app_name)
-    _generate_apps_py(app_dir, app_name)
-    _generate_admin_py(app_dir, app_name, model_name)
-    _generate_models_py(app_dir, app_name, model_name)
-    _generate_views_py(app_dir, app_name, model_name)
-    _generate_urls_py(app_dir, app_name, model_name)
-    _generate_forms_py(app_dir, app_name, model_name)
-
-    if include_services:
-        _generate_services_py(app_dir, app_name, model_name)
-
-    if include_selectors:
-        _generate_selectors_py(app_dir, app_name, model_name)
-
-    # Génération des templates
-    _generate_templates(app_dir, app_name, model_name)
+    materialize(
+        app_dir,
+        _domaine_artifacts(
+            app_name,
+            model_name,
+            include_services,
+            include_selectors,
+            fields,
+            include_export,
+            include_session_count,
+            base_template,
+            cache_fragments,
+        ),
+    )
 
     return str(app_dir)
 
 
-def _generate_app_init(app_dir: Path, app_name: str):
-    """Génère le fichier __init__.py de l'app."""
-    content = f'''"""
-Application Django : {app_name}
-"""
-'''
-    (app_dir / "__init__.py").write_text(content, encoding="utf-8")
-
-
-def _generate_apps_py(app_dir: Path, app_name: str):
-    """Génère le fichier apps.py."""
-    app_name_capitalized = app_name.capitalize()
-    content = f'''from django.apps import AppConfig
-
-
-class {app_name_capitalized}Config(AppConfig):
-    """Configuration de l'application {app_name}."""
-
-    default_auto_field = "django.db.models.BigAutoField"
-    name = "{app_name}"
-    verbose_name = "{app_name_capitalized}"
-'''
-    (app_dir / "apps.py").write_text(content, encoding="utf-8")
+def _domaine_artifacts(
+    app_name: str,
+    model_name: str,
+    include_services: bool = True,
+    include_selectors: bool = True,
+    fields: Optional[List[Dict[str, str]]] = None,
+    include_export: bool = False,
+    include_session_count: bool = False,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
+) -> List[Artifact]:
+    """
+    Construit le graphe d'artefacts d'un domaine Django classique.
 
+    Args:
+        app_name: Nom de l'app Django (déjà nettoyé)
+        model_name: Nom du modèle principal (déjà nettoyé)
+        include_services: Inclure services.py
+        include_selectors: Inclure selectors.py
+        fields: Champs normalisés du modèle principal
+        include_export: Inclure exports.py
+        include_session_count: Ajouter le compteur dénormalisé sessions_count
+        base_template: Template de base étendu par les templates générés
+        cache_fragments: Fragments {% cache %} clés par updated_at
 
-def _generate_admin_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier admin.py."""
-    content = f'''from django.contrib import admin
+    Returns:
+        Liste des artefacts à générer (chemins relatifs au dossier de l'app)
+    """
+    fields = fields or []
+    names = {"app_name": app_name, "model_name": model_name}
+    models_module = f"{app_name}.models"
+    exports_module = f"{app_name}.exports" if include_export else None
+    counted = dict(names, include_session_count=include_session_count)
+    summary_fields = _summary_fields(fields, cache_fragments)
+    export_fields = _export_fields(fields)
+    if include_session_count:
+        summary_fields.append("sessions_count")
+        export_fields.append("sessions_count")
+    artifacts = [
+        Artifact("__init__.py", render_app_init, {"app_name": app_name}),
+        Artifact("apps.py", render_apps_py, {"app_name": app_name}),
+        Artifact("models.py", _render_models_py, dict(counted, fields=fields)),
+        Artifact(
+            "admin.py",
+            render_admin_py,
+            _admin_context(app_name, model_name, models_module, fields),
+            depends_on=("models.py",),
+        ),
+        Artifact(
+            "forms.py",
+            render_forms_py,
+            {"model_name": model_name, "models_module": models_module},
+            depends_on=("models.py",),
+        ),
+        Artifact("views.py", _render_views_py, names, depends_on=("forms.py",)),
+        Artifact(
+            "urls.py",
+            render_urls_py,
+            dict(
+                names,
+                views_module=f"{app_name}.views",
+                exports_module=exports_module,
+            ),
+            depends_on=("views.py",),
+        ),
+    ]
 
-from {app_name}.models import {model_name}
+    if include_services:
+        artifacts.append(
+            Artifact("services.py", _render_services_py, counted, ("models.py",))
+        )
 
+    if include_selectors:
+        artifacts.append(
+            Artifact(
+                "selectors.py",
+                _render_selectors_py,
+                dict(counted, summary_fields=summary_fields),
+                ("models.py",),
+            )
+        )
 
-@admin.register({model_name})
-class {model_name}Admin(admin.ModelAdmin):
-    """Administration pour le modèle {model_name}."""
+    if include_export:
+        # Lignes lues via le selector de projection s'il est généré
+        if include_selectors:
+            rows_import = (
+                f"from {app_name}.selectors import iter_{app_name.lower()}s_valeurs"
+            )
+            rows_expression = (
+                f"iter_{app_name.lower()}s_valeurs(CHAMPS_EXPORT, "
+                "chunk_size=CHUNK_SIZE)"
+            )
+        else:
+            rows_import = f"from {models_module} import {model_name}"
+            rows_expression = (
+                f"{model_name}.objects.values_list(*CHAMPS_EXPORT).iterator("
+                "chunk_size=CHUNK_SIZE)"
+            )
+        artifacts.append(
+            Artifact(
+                "exports.py",
+                render_exports_py,
+                dict(
+                    names,
+                    export_fields=export_fields,
+                    rows_import=rows_import,
+                    rows_expression=rows_expression,
+                ),
+                depends_on=("selectors.py",) if include_selectors else ("models.py",),
+            )
+        )
 
-    list_display = ["id", "__str__"]
-    list_filter = []
-    search_fields = []
-    readonly_fields = ["id", "created_at", "updated_at"]
-'''
-    (app_dir / "admin.py").write_text(content, encoding="utf-8")
+    # Templates (Django les cherche dans templates/<app_name>/)
+    templates_dir = f"templates/{app_name}"
+    page = dict(names, base_template=base_template)
+    cached_page = dict(page, cache_fragments=cache_fragments)
+    artifacts += [
+        Artifact(f"{templates_dir}/liste.html", render_liste_html, cached_page),
+        Artifact(f"{templates_dir}/detail.html", render_detail_html, cached_page),
+        Artifact(f"{templates_dir}/formulaire.html", render_formulaire_html, page),
+    ]
+    return artifacts
 
 
-def _generate_models_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier models.py."""
+def _render_models_py(
+    app_name: str,
+    model_name: str,
+    fields: Optional[List[Dict[str, str]]] = None,
+    include_session_count: bool = False,
+) -> str:
+    """Rend le fichier models.py."""
     session_model_name = f"Session{model_name}"
+    field_imports, field_lines, meta_lines = _render_model_fields(
+        model_name, fields or []
+    )
+    sessions_count_field = _SESSIONS_COUNT_FIELD if include_session_count else ""
     content = f'''from django.db import models
 from django.utils import timezone
-
+{field_imports}
 
 class {model_name}(models.Model):
     """Modèle {model_name}."""
@@ -187,16 +419,13 @@ class {model_name}(models.Model):
     updated_at = models.DateTimeField(
         auto_now=True, verbose_name="Date de modification"
     )
-
-    # Ajoutez vos champs spécifiques ici
-    # nom = models.CharField(max_length=255, verbose_name="Nom")
-    # description = models.TextField(blank=True, verbose_name="Description")
-
+{sessions_count_field}
+{field_lines}
     class Meta:
         verbose_name = "{model_name}"
         verbose_name_plural = "{model_name}s"
         ordering = ["-created_at"]
-
+{meta_lines}
     def __str__(self):
         return f"{model_name} #{{self.id}}"
 
@@ -233,11 +462,122 @@ class {session_model_name}(models.Model):
     def __str__(self):
         return f"{session_model_name} #{{self.id}} - {{self.{app_name.lower()}}}"
 '''
-    (app_dir / "models.py").write_text(content, encoding="utf-8")
+    return content
 
 
-def _generate_views_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier views.py."""
+# Compteur dénormalisé du modèle principal (--session-count)
+_SESSIONS_COUNT_FIELD = """
+    # Nombre de sessions, dénormalisé : maintenu par les services
+    # (creer_session_..., supprimer_session_..., recalculer_sessions_count)
+    sessions_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Nombre de sessions"
+    )
+"""
+
+# Imports des services qui maintiennent sessions_count
+_SESSIONS_COUNT_IMPORTS = (
+    "from django.db.models import Count, F, OuterRef, Subquery\n"
+    "from django.db.models.functions import Coalesce\n"
+)
+
+
+def _render_session_count_services(
+    app_name: str, model_name: str, methods: bool = False
+) -> str:
+    """
+    Rend les services qui maintiennent sessions_count avec des expressions F().
+
+    Args:
+        app_name: Nom de l'app Django
+        model_name: Nom du modèle principal
+        methods: Rendre des méthodes statiques (classe de service DDD) au lieu
+            de fonctions de module
+
+    Returns:
+        Code des fonctions (ou méthodes), précédé d'une ligne vide
+    """
+    var = app_name.lower()
+    session_model_name = f"Session{model_name}"
+    functions = [
+        f'''def creer_session_{var}({var}_id: int, **kwargs) -> {session_model_name}:
+    """
+    Crée une {session_model_name} et incrémente {model_name}.sessions_count.
+
+    Le compteur est mis à jour par UPDATE ... SET sessions_count =
+    sessions_count + 1 (expression F()), sans lecture préalable : des
+    créations concurrentes ne perdent aucun incrément.
+
+    Args:
+        {var}_id: ID du {model_name} parent
+        **kwargs: Arguments pour créer la {session_model_name}
+
+    Returns:
+        Instance de {session_model_name} créée
+    """
+    with transaction.atomic():
+        session = {session_model_name}.objects.create({var}_id={var}_id, **kwargs)
+        {model_name}.objects.filter(id={var}_id).update(
+            sessions_count=F("sessions_count") + 1
+        )
+    return session
+''',
+        f'''def supprimer_session_{var}(session_id: int) -> bool:
+    """
+    Supprime une {session_model_name} et décrémente {model_name}.sessions_count.
+
+    Args:
+        session_id: ID de la {session_model_name} à supprimer
+
+    Returns:
+        True si supprimée, False sinon
+    """
+    with transaction.atomic():
+        {var}_id = (
+            {session_model_name}.objects.filter(id=session_id)
+            .values_list("{var}_id", flat=True)
+            .first()
+        )
+        if {var}_id is None:
+            return False
+        supprimees, _ = {session_model_name}.objects.filter(id=session_id).delete()
+        if supprimees:
+            {model_name}.objects.filter(id={var}_id).update(
+                sessions_count=F("sessions_count") - 1
+            )
+    return bool(supprimees)
+''',
+        f'''def recalculer_sessions_count() -> int:
+    """
+    Recalcule {model_name}.sessions_count à partir des sessions (une requête).
+
+    À exécuter après des créations ou suppressions de sessions faites hors
+    des services (admin, bulk_create, QuerySet.delete()...).
+
+    Returns:
+        Nombre de {model_name}s mis à jour
+    """
+    nb_sessions = (
+        {session_model_name}.objects.filter({var}=OuterRef("pk"))
+        .order_by()
+        .values("{var}")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return {model_name}.objects.update(
+        sessions_count=Coalesce(Subquery(nb_sessions), 0)
+    )
+''',
+    ]
+    if not methods:
+        return "".join(f"\n\n{function}" for function in functions)
+    return "".join(
+        "\n    @staticmethod\n" + textwrap.indent(function, "    ")
+        for function in functions
+    )
+
+
+def _render_views_py(app_name: str, model_name: str) -> str:
+    """Rend le fichier views.py."""
     content = f'''from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.views.generic import (
@@ -303,64 +643,16 @@ class {model_name}DeleteView(DeleteView):
         messages.success(self.request, "{model_name} supprimé avec succès.")
         return super().delete(request, *args, **kwargs)
 '''
-    (app_dir / "views.py").write_text(content, encoding="utf-8")
-
-
-def _generate_urls_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier urls.py."""
-    content = f"""from django.urls import path
-
-from {app_name}.views import (
-    {model_name}ListView,
-    {model_name}DetailView,
-    {model_name}CreateView,
-    {model_name}UpdateView,
-    {model_name}DeleteView,
-)
-
-app_name = "{app_name}"
-
-urlpatterns = [
-    path("", {model_name}ListView.as_view(), name="liste"),
-    path("<int:pk>/", {model_name}DetailView.as_view(), name="detail"),
-    path("nouveau/", {model_name}CreateView.as_view(), name="creer"),
-    path("<int:pk>/modifier/", {model_name}UpdateView.as_view(), name="modifier"),
-    path("<int:pk>/supprimer/", {model_name}DeleteView.as_view(), name="supprimer"),
-]
-"""
-    (app_dir / "urls.py").write_text(content, encoding="utf-8")
-
-
-def _generate_forms_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier forms.py."""
-    content = f'''from django import forms
-
-from {app_name}.models import {model_name}
-
-
-class {model_name}Form(forms.ModelForm):
-    """Formulaire pour le modèle {model_name}."""
-
-    class Meta:
-        model = {model_name}
-        fields = "__all__"
-        # Exclure les champs automatiques si nécessaire
-        # exclude = ["created_at", "updated_at"]
-
-        # Personnaliser les widgets si nécessaire
-        # widgets = {{
-        #     "description": forms.Textarea(attrs={{"rows": 4, "cols": 40}}),
-        # }}
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Ajoutez vos personnalisations de formulaire ici
-'''
-    (app_dir / "forms.py").write_text(content, encoding="utf-8")
+    return content
 
 
-def _generate_services_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier services.py."""
+def _render_services_py(
+    app_name: str, model_name: str, include_session_count: bool = False
+) -> str:
+    """Rend le fichier services.py."""
+    models_import = f"\nfrom {app_name}.models import {model_name}"
+    if include_session_count:
+        models_import = f"{_SESSIONS_COUNT_IMPORTS}{models_import}, Session{model_name}"
     content = f'''"""
 Services pour le domaine {app_name}.
 
@@ -369,8 +661,7 @@ Ce module contient la logique métier réutilisable pour {app_name}.
 
 from typing import Optional
 from django.db import transaction
-
-from {app_name}.models import {model_name}
+{models_import}
 
 
 def creer_{app_name.lower()}(**kwargs) -> {model_name}:
@@ -430,22 +721,36 @@ def supprimer_{app_name.lower()}({app_name.lower()}_id: int) -> bool:
     except {model_name}.DoesNotExist:
         return False
 '''
-    (app_dir / "services.py").write_text(content, encoding="utf-8")
+    if include_session_count:
+        content += _render_session_count_services(app_name, model_name)
+    return content
 
 
-def _generate_selectors_py(app_dir: Path, app_name: str, model_name: str):
-    """Génère le fichier selectors.py."""
+def _render_selectors_py(
+    app_name: str,
+    model_name: str,
+    summary_fields: Optional[List[str]] = None,
+    include_session_count: bool = False,
+) -> str:
+    """Rend le fichier selectors.py (avec les projections de liste)."""
+    summary_fields = summary_fields or ["id", "created_at"]
+    summary = ", ".join(f'"{name}"' for name in summary_fields)
+    db_imports = "Count, QuerySet" if include_session_count else "QuerySet"
     content = f'''"""
 Selectors pour le domaine {app_name}.
 
 Ce module contient les requêtes complexes sur les modèles {app_name}.
 """
 
-from typing import Optional, List
-from django.db.models import QuerySet
+from typing import Optional, List, Iterator, Sequence
+from django.db.models import {db_imports}
 
 from {app_name}.models import {model_name}
 
+# Champs chargés par les listes et les exports (hors champs volumineux :
+# TextField, JSONField, BinaryField)
+CHAMPS_RESUME = [{summary}]
+
 
 def obtenir_{app_name.lower()}_par_id(
     {app_name.lower()}_id: int
@@ -475,6 +780,40 @@ def lister_{app_name.lower()}s() -> QuerySet[{model_name}]:
     return {model_name}.objects.all()
 
 
+def lister_{app_name.lower()}s_resume() -> QuerySet[{model_name}]:
+    """
+    Liste les {model_name}s en ne chargeant que les champs de CHAMPS_RESUME.
+
+    À utiliser pour les pages de liste : accéder à un autre champ déclenche
+    une requête par instance.
+
+    Returns:
+        QuerySet de {model_name}s (projection .only())
+    """
+    return {model_name}.objects.only(*CHAMPS_RESUME)
+
+
+def iter_{app_name.lower()}s_valeurs(
+    champs: Sequence[str] = CHAMPS_RESUME, chunk_size: int = 2000
+) -> Iterator[tuple]:
+    """
+    Parcourt les valeurs des {model_name}s par lots, sans créer d'instances.
+
+    À utiliser pour les exports : le QuerySet n'est pas mis en cache, la
+    mémoire reste constante quel que soit le nombre de lignes.
+
+    Args:
+        champs: Champs à extraire (un tuple par ligne, dans cet ordre)
+        chunk_size: Nombre de lignes lues par lot
+
+    Returns:
+        Itérateur de tuples de valeurs
+    """
+    return {model_name}.objects.values_list(*champs).iterator(
+        chunk_size=chunk_size
+    )
+
+
 def filtrer_{app_name.lower()}s(**filtres) -> QuerySet[{model_name}]:
     """
     Filtre les {model_name}s selon les critères donnés.
@@ -487,108 +826,20 @@ def filtrer_{app_name.lower()}s(**filtres) -> QuerySet[{model_name}]:
     """
     return {model_name}.objects.filter(**filtres)
 '''
-    (app_dir / "selectors.py").write_text(content, encoding="utf-8")
-
-
-def _generate_templates(app_dir: Path, app_name: str, model_name: str):
-    """Génère les templates HTML."""
-    templates_dir = app_dir / "templates" / app_name
-    templates_dir.mkdir(parents=True, exist_ok=True)
-
-    # Template liste.html
-    liste_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Liste des {model_name}s</title>
-</head>
-<body>
-    <h1>Liste des {model_name}s</h1>
-
-    <a href="{{% url '{app_name}:creer' %}}">Créer un nouveau {model_name}</a>
-
-    <ul>
-        {{% for {app_name} in {app_name}_list %}}
-        <li>
-            <a href="{{% url '{app_name}:detail' {app_name}.pk %}}">
-                {{{{ {app_name} }}}}
-            </a>
-            <a href="{{% url '{app_name}:modifier' {app_name}.pk %}}">Modifier</a>
-            <a href="{{% url '{app_name}:supprimer' {app_name}.pk %}}">Supprimer</a>
-        </li>
-        {{% empty %}}
-        <li>Aucun {model_name} trouvé.</li>
-        {{% endfor %}}
-    </ul>
-
-    {{% if is_paginated %}}
-    <div class="pagination">
-        {{% if page_obj.has_previous %}}
-        <a href="?page={{{{ page_obj.previous_page_number }}}}">Précédent</a>
-        {{% endif %}}
-        <span>
-            Page {{{{ page_obj.number }}}} sur {{{{ page_obj.paginator.num_pages }}}}
-        </span>
-        {{% if page_obj.has_next %}}
-        <a href="?page={{{{ page_obj.next_page_number }}}}">Suivant</a>
-        {{% endif %}}
-    </div>
-    {{% endif %}}
-</body>
-</html>
-"""
-    (templates_dir / "liste.html").write_text(liste_content, encoding="utf-8")
-
-    # Template detail.html
-    detail_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Détails de {{{{ {app_name} }}}}</title>
-</head>
-<body>
-    <h1>Détails du {model_name}</h1>
-
-    <dl>
-        <dt>ID</dt>
-        <dd>{{{{ {app_name}.id }}}}</dd>
-        <dt>Créé le</dt>
-        <dd>{{{{ {app_name}.created_at }}}}</dd>
-        <dt>Modifié le</dt>
-        <dd>{{{{ {app_name}.updated_at }}}}</dd>
-    </dl>
-
-    <a href="{{% url '{app_name}:liste' %}}">Retour à la liste</a>
-    <a href="{{% url '{app_name}:modifier' {app_name}.pk %}}">Modifier</a>
-    <a href="{{% url '{app_name}:supprimer' {app_name}.pk %}}">Supprimer</a>
-</body>
-</html>
-"""
-    (templates_dir / "detail.html").write_text(detail_content, encoding="utf-8")
-
-    # Template formulaire.html
-    formulaire_content = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>
-        {{% if object %}}Modifier{{% else %}}Créer{{% endif %}} un {model_name}
-    </title>
-</head>
-<body>
-    <h1>{{% if object %}}Modifier{{% else %}}Créer{{% endif %}} un {model_name}</h1>
-
-    <form method="post">
-        {{% csrf_token %}}
-        {{{{ form.as_p }}}}
-        <button type="submit">Enregistrer</button>
-    </form>
-
-    <a href="{{% url '{app_name}:liste' %}}">Annuler</a>
-</body>
-</html>
-"""
-    (templates_dir / "formulaire.html").write_text(formulaire_content, encoding="utf-8")
+    if include_session_count:
+        content += f'''
+
+def lister_{app_name.lower()}s_avec_nb_sessions() -> QuerySet[{model_name}]:
+    """
+    Liste les {model_name}s annotés du nombre exact de sessions (nb_sessions).
+
+    Une seule requête (COUNT ... GROUP BY) quel que soit le nombre de lignes ;
+    pour l'affichage courant, le champ dénormalisé sessions_count (dans
+    CHAMPS_RESUME) évite la jointure.
+
+    Returns:
+        QuerySet de {model_name}s annotés de nb_sessions
+    """
+    return {model_name}.objects.annotate(nb_sessions=Count("sessions"))
+'''
+    return content
@@ -0,0 +1,466 @@
+"""Fragments de rendu partagés par les générateurs de domaine Django.
+
+Chaque fonction reçoit son contexte en arguments nommés et retourne le
+contenu du fichier (voir ``pyfastcli.generators.artifacts``).
+"""
+
+from typing import List, Optional
+
+
+def _module_docstring(docstring: Optional[str]) -> str:
+    """Retourne l'en-tête docstring d'un module généré (vide si absent)."""
+    if not docstring:
+        return ""
+    return f'"""\n{docstring}\n"""\n\n'
+
+
+def render_empty() -> str:
+    """Rend un fichier vide (ex: __init__.py de sous-package)."""
+    return ""
+
+
+def render_app_init(app_name: str, label_suffix: str = "") -> str:
+    """Rend le fichier __init__.py de l'app."""
+    return f'''"""
+Application Django : {app_name}{label_suffix}
+"""
+'''
+
+
+def render_apps_py(app_name: str, label_suffix: str = "") -> str:
+    """Rend le fichier apps.py."""
+    app_name_capitalized = app_name.capitalize()
+    content = f'''from django.apps import AppConfig
+
+
+class {app_name_capitalized}Config(AppConfig):
+    """Configuration de l'application {app_name}{label_suffix}."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "{app_name}"
+    verbose_name = "{app_name_capitalized}{label_suffix}"
+'''
+    return content
+
+
+def _list_literal(values: List[str]) -> str:
+    """Rend une liste Python de chaînes (ex: ["id", "nom"])."""
+    return "[" + ", ".join(f'"{value}"' for value in values) + "]"
+
+
+def render_admin_py(
+    model_name: str,
+    models_module: str,
+    session_field: Optional[str] = None,
+    search_fields: Optional[List[str]] = None,
+    select_related: Optional[List[str]] = None,
+    raw_id_fields: Optional[List[str]] = None,
+) -> str:
+    """
+    Rend le fichier admin.py.
+
+    Les listes de l'admin évitent les requêtes coûteuses sur les grandes
+    tables : pas de COUNT(*) complet (show_full_result_count), relations
+    chargées par jointure (list_select_related), relations éditées par ID
+    ou autocomplétion plutôt qu'un <select> de toute la table.
+
+    Args:
+        model_name: Nom du modèle principal
+        models_module: Module des modèles (ex: pratique.models)
+        session_field: Nom de la ForeignKey de Session{model_name} vers le
+            modèle principal ; ajoute l'admin de Session{model_name}
+        search_fields: Champs de recherche du modèle principal (l'ID en plus,
+            requis par autocomplete_fields de l'admin des sessions)
+        select_related: Relations ForeignKey/OneToOne du modèle principal
+        raw_id_fields: Relations du modèle principal éditées par ID
+    """
+    imports = model_name
+    if session_field:
+        imports += f", Session{model_name}"
+    relation_lines = ""
+    if select_related:
+        relation_lines += f"    list_select_related = {_list_literal(select_related)}\n"
+    if raw_id_fields:
+        relation_lines += f"    raw_id_fields = {_list_literal(raw_id_fields)}\n"
+    content = f'''from django.contrib import admin
+
+from {models_module} import {imports}
+
+
+@admin.register({model_name})
+class {model_name}Admin(admin.ModelAdmin):
+    """Administration pour le modèle {model_name}."""
+
+    list_display = ["id", "__str__", "created_at"]
+    list_filter = []
+    search_fields = {_list_literal(["=id", *(search_fields or [])])}
+    readonly_fields = ["id", "created_at", "updated_at"]
+    date_hierarchy = "created_at"
+{relation_lines}    # Pas de COUNT(*) sur toute la table à chaque filtre ou recherche
+    show_full_result_count = False
+    list_per_page = 50
+'''
+    if session_field:
+        content += f'''
+
+@admin.register(Session{model_name})
+class Session{model_name}Admin(admin.ModelAdmin):
+    """Administration pour le modèle Session{model_name}."""
+
+    list_display = ["id", "__str__", "created_at"]
+    list_filter = []
+    search_fields = ["=id"]
+    readonly_fields = ["id", "created_at", "updated_at"]
+    date_hierarchy = "created_at"
+    # __str__ affiche le {model_name} parent : jointure plutôt qu'une requête
+    # par ligne
+    list_select_related = ["{session_field}"]
+    autocomplete_fields = ["{session_field}"]
+    show_full_result_count = False
+    list_per_page = 50
+'''
+    return content
+
+
+def render_forms_py(
+    model_name: str,
+    models_module: str,
+    docstring: Optional[str] = None,
+    with_clean: bool = False,
+    version_field: bool = False,
+) -> str:
+    """
+    Rend le fichier forms.py.
+
+    Args:
+        with_clean: Ajouter une méthode clean() à compléter
+        version_field: Ajouter le champ caché version (verrou optimiste),
+            initialisé avec la version de l'instance modifiée
+    """
+    version_declaration = version_init = ""
+    if version_field:
+        version_declaration = """
+    # Version lue à l'affichage, renvoyée au service (verrou optimiste)
+    version = forms.IntegerField(widget=forms.HiddenInput)
+"""
+        version_init = """        if self.instance.pk:
+            self.fields["version"].initial = self.instance.version
+        else:
+            del self.fields["version"]
+"""
+    content = _module_docstring(docstring) + f'''from django import forms
+
+from {models_module} import {model_name}
+
+
+class {model_name}Form(forms.ModelForm):
+    """Formulaire pour le modèle {model_name}."""
+{version_declaration}
+    class Meta:
+        model = {model_name}
+        fields = "__all__"
+        # Exclure les champs automatiques si nécessaire
+        # exclude = ["created_at", "updated_at"]
+
+        # Personnaliser les widgets si nécessaire
+        # widgets = {{
+        #     "description": forms.Textarea(attrs={{"rows": 4, "cols": 40}}),
+        # }}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+{version_init}        # Ajoutez vos personnalisations de formulaire ici
+'''
+    if with_clean:
+        content += '''
+    def clean(self):
+        """Validation personnalisée du formulaire."""
+        cleaned_data = super().clean()
+        # Ajoutez vos validations ici
+        return cleaned_data
+'''
+    return content
+
+
+def render_urls_py(
+    app_name: str,
+    model_name: str,
+    views_module: str,
+    docstring: Optional[str] = None,
+    exports_module: Optional[str] = None,
+) -> str:
+    """Rend le fichier urls.py (avec la route d'export si exports_module)."""
+    export_import = export_path = ""
+    if exports_module:
+        export_import = f"from {exports_module} import {model_name}ExportView\n"
+        export_path = (
+            f'    path("export/", {model_name}ExportView.as_view(), name="export"),\n'
+        )
+    content = _module_docstring(docstring) + f"""from django.urls import path
+
+from {views_module} import (
+    {model_name}ListView,
+    {model_name}DetailView,
+    {model_name}CreateView,
+    {model_name}UpdateView,
+    {model_name}DeleteView,
+)
+{export_import}
+app_name = "{app_name}"
+
+urlpatterns = [
+    path("", {model_name}ListView.as_view(), name="liste"),
+    path("<int:pk>/", {model_name}DetailView.as_view(), name="detail"),
+    path("nouveau/", {model_name}CreateView.as_view(), name="creer"),
+    path("<int:pk>/modifier/", {model_name}UpdateView.as_view(), name="modifier"),
+    path("<int:pk>/supprimer/", {model_name}DeleteView.as_view(), name="supprimer"),
+{export_path}]
+"""
+    return content
+
+
+def render_exports_py(
+    app_name: str,
+    model_name: str,
+    export_fields: List[str],
+    rows_import: str,
+    rows_expression: str,
+) -> str:
+    """
+    Rend le module de la vue d'export en streaming (CSV ou NDJSON).
+
+    Args:
+        app_name: Nom de l'app Django
+        model_name: Nom du modèle exporté
+        export_fields: Champs exportés, dans l'ordre des colonnes
+        rows_import: Import de la source des lignes (selector, repository...)
+        rows_expression: Expression qui retourne l'itérateur des lignes, à
+            partir de CHAMPS_EXPORT et CHUNK_SIZE
+    """
+    champs = ", ".join(f'"{name}"' for name in export_fields)
+    return f'''"""
+Export en streaming des {model_name}s (CSV ou NDJSON).
+
+Les lignes sont lues par lots (iterator(chunk_size=CHUNK_SIZE)) et envoyées
+au fur et à mesure : la mémoire reste constante quel que soit le nombre de
+lignes, sans pagination OFFSET.
+"""
+
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.views import View
+
+{rows_import}
+
+# Champs exportés (colonnes du CSV, clés des lignes NDJSON)
+CHAMPS_EXPORT = [{champs}]
+
+# Nombre de lignes lues par requête SQL (curseur serveur sous PostgreSQL)
+CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """Pseudo-fichier : csv.writer retourne la ligne au lieu de l'écrire."""
+
+    def write(self, value):
+        return value
+
+
+def lignes_csv(rows):
+    """Encode les lignes en CSV (en-tête compris), une chaîne par ligne."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CHAMPS_EXPORT)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def lignes_ndjson(rows):
+    """Encode les lignes en NDJSON (un objet JSON par ligne)."""
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(CHAMPS_EXPORT, row))) + "\\n"
+
+
+# Format -> (type de contenu, encodeur des lignes)
+FORMATS = {{
+    "csv": ("text/csv; charset=utf-8", lignes_csv),
+    "ndjson": ("application/x-ndjson", lignes_ndjson),
+}}
+
+
+class {model_name}ExportView(View):
+    """Exporte les {model_name}s en streaming (?format=csv ou ?format=ndjson)."""
+
+    def get(self, request):
+        format_export = request.GET.get("format", "csv")
+        if format_export not in FORMATS:
+            return HttpResponseBadRequest(
+                f"Format d'export inconnu : {{format_export}} (csv ou ndjson)"
+            )
+        content_type, encoder = FORMATS[format_export]
+
+        rows = {rows_expression}
+        response = StreamingHttpResponse(encoder(rows), content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="{app_name}.{{format_export}}"'
+        )
+        return response
+'''
+
+
+# Durée de vie (secondes) des fragments {% cache %} des templates générés ;
+# la clé inclut updated_at, une modification invalide donc le fragment
+FRAGMENT_CACHE_TIMEOUT = 3600
+
+
+def _render_page(
+    title: str, body: str, base_template: Optional[str] = None, load: str = ""
+) -> str:
+    """
+    Rend une page HTML : document complet, ou blocs d'un template de base.
+
+    Args:
+        title: Contenu de la balise <title> (bloc title)
+        body: Contenu de la page, indenté de 4 espaces (bloc content)
+        base_template: Template étendu ({% extends %}) au lieu d'un document
+            complet ; il doit définir les blocs title et content
+        load: Bibliothèques de tags à charger (ex: "cache")
+
+    Returns:
+        Contenu du template
+    """
+    load_tag = f"{{% load {load} %}}" if load else ""
+    if base_template:
+        return (
+            f'{{% extends "{base_template}" %}}{load_tag}\n\n'
+            f"{{% block title %}}{title}{{% endblock %}}\n\n"
+            f"{{% block content %}}\n{body}{{% endblock %}}\n"
+        )
+    return f"""{load_tag}<!DOCTYPE html>
+<html lang="fr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+</head>
+<body>
+{body}</body>
+</html>
+"""
+
+
+def render_liste_html(
+    app_name: str,
+    model_name: str,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
+) -> str:
+    """
+    Rend le template liste.html.
+
+    Les liens de chaque ligne sont construits à partir de l'URL de la liste,
+    résolue une seule fois (les routes détail/modifier/supprimer sont
+    <pk>/, <pk>/modifier/ et <pk>/supprimer/, voir render_urls_py).
+    """
+    var = app_name
+    row = f"""        <li>
+            <a href="{{{{ liste_url }}}}{{{{ {var}.pk }}}}/">
+                {{{{ {var} }}}}
+            </a>
+            <a href="{{{{ liste_url }}}}{{{{ {var}.pk }}}}/modifier/">Modifier</a>
+            <a href="{{{{ liste_url }}}}{{{{ {var}.pk }}}}/supprimer/">Supprimer</a>
+        </li>
+"""
+    if cache_fragments:
+        row = (
+            f"        {{% cache {FRAGMENT_CACHE_TIMEOUT} {var}_ligne {var}.pk "
+            f"{var}.updated_at liste_url %}}\n{row}        {{% endcache %}}\n"
+        )
+    body = f"""    <h1>Liste des {model_name}s</h1>
+
+    <a href="{{% url '{app_name}:creer' %}}">Créer un nouveau {model_name}</a>
+
+    {{% url '{app_name}:liste' as liste_url %}}
+    <ul>
+        {{% for {var} in {app_name}_list %}}
+{row}        {{% empty %}}
+        <li>Aucun {model_name} trouvé.</li>
+        {{% endfor %}}
+    </ul>
+
+    {{% if is_paginated %}}
+    <div class="pagination">
+        {{% if page_obj.has_previous %}}
+        <a href="?page={{{{ page_obj.previous_page_number }}}}">Précédent</a>
+        {{% endif %}}
+        <span>
+            Page {{{{ page_obj.number }}}} sur {{{{ page_obj.paginator.num_pages }}}}
+        </span>
+        {{% if page_obj.has_next %}}
+        <a href="?page={{{{ page_obj.next_page_number }}}}">Suivant</a>
+        {{% endif %}}
+    </div>
+    {{% endif %}}
+"""
+    return _render_page(
+        f"Liste des {model_name}s",
+        body,
+        base_template,
+        "cache" if cache_fragments else "",
+    )
+
+
+def render_detail_html(
+    app_name: str,
+    model_name: str,
+    base_template: Optional[str] = None,
+    cache_fragments: bool = False,
+) -> str:
+    """Rend le template detail.html."""
+    details = f"""    <dl>
+        <dt>ID</dt>
+        <dd>{{{{ {app_name}.id }}}}</dd>
+        <dt>Créé le</dt>
+        <dd>{{{{ {app_name}.created_at }}}}</dd>
+        <dt>Modifié le</dt>
+        <dd>{{{{ {app_name}.updated_at }}}}</dd>
+    </dl>
+"""
+    if cache_fragments:
+        details = (
+            f"    {{% cache {FRAGMENT_CACHE_TIMEOUT} {app_name}_detail "
+            f"{app_name}.pk {app_name}.updated_at %}}\n{details}    {{% endcache %}}\n"
+        )
+    body = f"""    <h1>Détails du {model_name}</h1>
+
+{details}
+    <a href="{{% url '{app_name}:liste' %}}">Retour à la liste</a>
+    <a href="{{% url '{app_name}:modifier' {app_name}.pk %}}">Modifier</a>
+    <a href="{{% url '{app_name}:supprimer' {app_name}.pk %}}">Supprimer</a>
+"""
+    return _render_page(
+        f"Détails de {{{{ {app_name} }}}}",
+        body,
+        base_template,
+        "cache" if cache_fragments else "",
+    )
+
+
+def render_formulaire_html(
+    app_name: str, model_name: str, base_template: Optional[str] = None
+) -> str:
+    """Rend le template formulaire.html (jamais mis en cache : jeton CSRF)."""
+    action = "{% if object %}Modifier{% else %}Créer{% endif %}"
+    body = f"""    <h1>{action} un {model_name}</h1>
+
+    <form method="post">
+        {{% csrf_token %}}
+        {{{{ form.as_p }}}}
+        <button type="submit">Enregistrer</button>
+    </form>
+
+    <a href="{{% url '{app_name}:liste' %}}">Annuler</a>
+"""
+    return _render_page(f"{action} un {model_name}", body, base_template)
@@ -1,13 +1,18 @@
 """Générateur de modèles Django avec champs interactifs."""
 
+import ast
+import hashlib
+import json
+import keyword
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from pyfastcli.generators.domaine_generator import (
     _sanitize_app_name,
     _sanitize_model_name,
 )
+from pyfastcli.instrumentation import phase, rendering, write_text
 
 # Types de champs Django disponibles
 DJANGO_FIELD_TYPES = {
@@ -41,7 +46,50 @@ DJANGO_FIELD_TYPES = {
     "IPAddressField": "models.GenericIPAddressField()",
 }
 
+# Types de champs de relation (nécessitent un modèle lié)
+RELATION_FIELD_TYPES = ["ForeignKey", "ManyToManyField", "OneToOneField"]
+
+# Types de champs volumineux, exclus des projections de liste (.only(),
+# values_list)
+HEAVY_FIELD_TYPES = ["TextField", "JSONField", "BinaryField"]
+
+# Options de champ émises dans la Meta du modèle (et non dans la déclaration
+# du champ) : unicité conditionnelle, index partiel, index GIN
+META_FIELD_OPTIONS = ["unique_if", "index_if", "gin_index"]
+
+# Modules reconnus comme préfixes d'expression dans les valeurs d'options
+# (ex: default=timezone.now), avec l'import ajouté au fichier généré
+OPTION_EXPRESSION_MODULES = {
+    "models": None,
+    "timezone": "from django.utils import timezone",
+    "uuid": "import uuid",
+    "datetime": "import datetime",
+    "decimal": "import decimal",
+    "settings": "from django.conf import settings",
+}
+
+# Comportements on_delete acceptés sans préfixe (on_delete=SET_NULL)
+ON_DELETE_BEHAVIOURS = [
+    "CASCADE",
+    "PROTECT",
+    "RESTRICT",
+    "SET_NULL",
+    "SET_DEFAULT",
+    "DO_NOTHING",
+]
+
+# Appelables acceptés sans préfixe pour default (default=dict)
+DEFAULT_CALLABLES = ["dict", "list", "set"]
+
+# Options dont la valeur est toujours du code Python : un nom pointé y est une
+# expression (choices=Statut.choices) et un mot inconnu est refusé
+EXPRESSION_OPTIONS = ["on_delete", "choices", "validators", "limit_choices_to"]
 
+# Longueur maximale d'un nom d'index Django (models.Index.max_name_length)
+INDEX_NAME_MAX_LENGTH = 30
+
+
+@phase("discovery")
 def discover_existing_models(project_path: Path) -> List[Tuple[str, str]]:
     """
     Découvre les modèles Django existants dans le projet.
@@ -66,12 +114,8 @@ def discover_existing_models(project_path: Path) -> List[Tuple[str, str]]:
 
         try:
             content = models_file.read_text(encoding="utf-8")
-            # Recherche les classes de modèles
-            pattern = r"class\s+(\w+)\s*\([^)]*models\.Model"
-            matches = re.findall(pattern, content)
-            for model_name in matches:
-                if model_name not in ["Model", "TimeStampedModel", "AbstractBaseUser"]:
-                    models_found.append((app_dir.name, model_name))
+            for model_name in parse_model_names(content):
+                models_found.append((app_dir.name, model_name))
         except Exception:
             # Ignore les erreurs de lecture
             continue
@@ -79,6 +123,338 @@ def discover_existing_models(project_path: Path) -> List[Tuple[str, str]]:
     return models_found
 
 
+def parse_model_names(content: str) -> List[str]:
+    """
+    Extrait les noms des modèles Django déclarés dans un fichier models.py.
+
+    Args:
+        content: Contenu du fichier
+
+    Returns:
+        Noms des classes héritant de models.Model (classes de base exclues)
+    """
+    # Recherche les classes de modèles
+    pattern = r"class\s+(\w+)\s*\([^)]*models\.Model"
+    return [
+        model_name
+        for model_name in re.findall(pattern, content)
+        if model_name not in ["Model", "TimeStampedModel", "AbstractBaseUser"]
+    ]
+
+
+def display_field_names(fields: List[Dict[str, str]]) -> List[str]:
+    """
+    Champs d'affichage d'un modèle, pour les projections de liste.
+
+    Args:
+        fields: Champs normalisés (voir normalize_field)
+
+    Returns:
+        Noms des champs hors types volumineux (HEAVY_FIELD_TYPES) et
+        ManyToManyField (sans colonne dans la table du modèle)
+    """
+    return [
+        field["name"]
+        for field in fields
+        if field["type"] not in HEAVY_FIELD_TYPES and field["type"] != "ManyToManyField"
+    ]
+
+
+def _resolve_field_type(field_type: str) -> str:
+    """Valide un type de champ (insensible à la casse) contre DJANGO_FIELD_TYPES."""
+    for known_type in DJANGO_FIELD_TYPES:
+        if known_type.lower() == field_type.strip().lower():
+            return known_type
+    raise ValueError(
+        f"Type de champ invalide : {field_type}. "
+        f"Types valides : {', '.join(DJANGO_FIELD_TYPES)}"
+    )
+
+
+def _validate_field_name(name: str) -> str:
+    """Valide un nom de champ (identifiant Python non réservé)."""
+    name = name.strip()
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"Nom de champ invalide : '{name}'")
+    return name
+
+
+def _split_options(options: str) -> List[str]:
+    """Découpe 'a=1,b="x,y",c' sur les virgules hors guillemets et parenthèses."""
+    parts = []
+    current = ""
+    depth = 0
+    quote = ""
+    for char in options:
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "\"'":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+            continue
+        current += char
+    if current.strip():
+        parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+def _format_option_value(value: Any, key: Optional[str] = None) -> str:
+    """
+    Convertit une valeur d'option en code Python.
+
+    Args:
+        value: Valeur brute de l'option
+        key: Nom de l'option ; on_delete, default et les options de
+            EXPRESSION_OPTIONS acceptent des noms nus (SET_NULL, dict)
+
+    Raises:
+        ValueError: Si la valeur n'est pas supportée, ou si une option de
+            EXPRESSION_OPTIONS reçoit un mot qui n'est pas une expression
+    """
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return str(value)
+    if not isinstance(value, str):
+        raise ValueError(f"Valeur d'option non supportée : {value!r}")
+
+    value = value.strip()
+    if value in ("True", "False", "None") or value[:1] in ("'", '"'):
+        return value
+    if re.fullmatch(r"-?\d+(\.\d+)?", value):
+        return value
+    if key == "on_delete" and value in ON_DELETE_BEHAVIOURS:
+        return f"models.{value}"
+    if key == "default" and value in DEFAULT_CALLABLES:
+        return value
+    # Expressions Python : préfixe de module connu (models.SET_NULL,
+    # timezone.now, ...) ou appel explicite (dict(), uuid.uuid4()). Tout autre
+    # mot, même pointé (v1.2), reste une chaîne, sauf pour les options de
+    # EXPRESSION_OPTIONS.
+    modules = "|".join(OPTION_EXPRESSION_MODULES)
+    if re.fullmatch(rf"({modules})\.\w+(\.\w+)*(\(.*\))?", value):
+        return value
+    if re.fullmatch(r"[A-Za-z_]\w*(\.\w+)*\(.*\)", value):
+        return value
+    if key in EXPRESSION_OPTIONS:
+        if re.fullmatch(r"[A-Za-z_]\w*(\.\w+)+", value):
+            return value
+        expected = (
+            ", ".join(ON_DELETE_BEHAVIOURS)
+            if key == "on_delete"
+            else "une expression, ex: Statut.choices"
+        )
+        raise ValueError(
+            f"Valeur invalide pour {key} : {value!r} (attendu : {expected})"
+        )
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _default_options(field_type: str) -> Dict[str, str]:
+    """Options par défaut d'un type (ex: max_length=255 pour CharField)."""
+    definition = DJANGO_FIELD_TYPES[field_type]
+    args = definition[definition.index("(") + 1 : definition.rindex(")")]
+    defaults = {}
+    for part in _split_options(args):
+        if "=" in part:
+            key, value = part.split("=", 1)
+            defaults[key.strip()] = value.strip()
+    return defaults
+
+
+def _build_options(field_type: str, options: Dict[str, Any]) -> str:
+    """Construit la chaîne d'options, complétée par les options par défaut."""
+    formatted = {
+        key: _format_option_value(value, key) for key, value in options.items()
+    }
+    if field_type not in RELATION_FIELD_TYPES and formatted:
+        formatted = dict(_default_options(field_type), **formatted)
+    return ", ".join(f"{key}={value}" for key, value in formatted.items())
+
+
+def parse_field_spec(spec: str) -> Dict[str, str]:
+    """
+    Parse une définition compacte de champ (option --field).
+
+    Format: nom:Type[:option=valeur,option_booleenne,...]
+    Pour une relation, le modèle lié est donné par l'option to=app.Model.
+
+    Exemples:
+        titre:CharField:max_length=200,db_index
+        auteur:ForeignKey:to=users.User,related_name=articles
+
+    Args:
+        spec: Définition compacte du champ
+
+    Returns:
+        Dictionnaire de champ {"name", "type", "options"[, "related_model"]}
+
+    Raises:
+        ValueError: Si la définition ou le type de champ est invalide
+    """
+    parts = spec.split(":", 2)
+    if len(parts) < 2 or not parts[0].strip() or not parts[1].strip():
+        raise ValueError(
+            f"Définition de champ invalide : '{spec}'. "
+            "Format attendu : nom:Type[:options]"
+        )
+
+    options: Dict[str, Any] = {}
+    for option in _split_options(parts[2]) if len(parts) == 3 else []:
+        if "=" in option:
+            key, value = option.split("=", 1)
+            options[key.strip()] = value.strip()
+        else:
+            options[option] = True
+
+    return normalize_field(
+        {"name": parts[0], "type": parts[1], "options": options},
+    )
+
+
+def _validate_condition(field_name: str, condition: Any) -> str:
+    """Valide une condition (arguments de models.Q, ex: actif=True)."""
+    if not isinstance(condition, str) or not condition.strip():
+        raise ValueError(
+            f"Condition manquante pour le champ '{field_name}' "
+            "(arguments de models.Q, ex: actif=True)"
+        )
+    condition = condition.strip()
+    if len(condition) > 1 and condition[0] == condition[-1] and condition[0] in "\"'":
+        condition = condition[1:-1].strip()
+    try:
+        ast.parse(f"Q({condition})", mode="eval")
+    except SyntaxError:
+        raise ValueError(
+            f"Condition invalide pour le champ '{field_name}' : {condition}"
+        ) from None
+    return condition
+
+
+def meta_field_options(
+    field_name: str, field_type: str, values: Dict[str, Any]
+) -> Dict[str, str]:
+    """
+    Valide les options de champ émises dans la Meta (META_FIELD_OPTIONS).
+
+    Args:
+        field_name: Nom du champ
+        field_type: Type du champ
+        values: Options brutes (unique_if, index_if, gin_index)
+
+    Returns:
+        Options normalisées, conditions sous forme d'arguments de models.Q
+
+    Raises:
+        ValueError: Si une condition est invalide, ou si l'option ne
+            s'applique pas au type du champ
+    """
+    meta: Dict[str, str] = {}
+    if values and field_type == "ManyToManyField":
+        raise ValueError(
+            f"Le champ '{field_name}' (ManyToManyField) ne peut pas être indexé "
+            "ni contraint dans la Meta"
+        )
+    for key in ("unique_if", "index_if"):
+        if values.get(key) not in (None, False):
+            meta[key] = _validate_condition(field_name, values[key])
+    if values.get("gin_index") not in (None, False, "False"):
+        if field_type != "JSONField":
+            raise ValueError(
+                f"gin_index est réservé aux JSONField (champ '{field_name}' : "
+                f"{field_type})"
+            )
+        meta["gin_index"] = "True"
+    return meta
+
+
+@phase("validation")
+def normalize_field(field: Union[str, Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Valide et normalise une définition de champ.
+
+    Accepte la forme compacte (voir parse_field_spec) ou un dictionnaire dont
+    les options sont une chaîne ("max_length=100") ou un dictionnaire
+    ({"max_length": 100, "db_index": true}).
+
+    Args:
+        field: Définition du champ
+
+    Returns:
+        Dictionnaire de champ au format attendu par generate_model_file
+
+    Raises:
+        ValueError: Si le champ est invalide
+    """
+    if isinstance(field, str):
+        return parse_field_spec(field)
+    if not isinstance(field, dict) or "name" not in field or "type" not in field:
+        raise ValueError(f"Champ invalide (clés 'name' et 'type' requises) : {field}")
+
+    name = _validate_field_name(str(field["name"]))
+    field_type = _resolve_field_type(str(field["type"]))
+    options = field.get("options") or ""
+    related_model = field.get("related_model")
+
+    meta_values = {key: field[key] for key in META_FIELD_OPTIONS if key in field}
+    if isinstance(options, dict):
+        options = dict(options)
+        related_model = options.pop("to", None) or related_model
+        for key in META_FIELD_OPTIONS:
+            if key in options:
+                meta_values[key] = options.pop(key)
+        options = _build_options(field_type, options)
+    elif not isinstance(options, str):
+        raise ValueError(f"Options invalides pour le champ '{name}' : {options!r}")
+
+    normalized = {"name": name, "type": field_type, "options": options}
+    normalized.update(meta_field_options(name, field_type, meta_values))
+    if field_type in RELATION_FIELD_TYPES:
+        if not related_model:
+            raise ValueError(
+                f"Le champ de relation '{name}' (type: {field_type}) "
+                "nécessite un modèle lié (option to=app.Model)."
+            )
+        normalized["related_model"] = str(related_model)
+    return normalized
+
+
+def parse_fields_json(value: str) -> List[Dict[str, str]]:
+    """
+    Parse l'option --fields-json (JSON en ligne ou chemin d'un fichier .json).
+
+    Args:
+        value: Liste JSON de champs, ou chemin d'un fichier la contenant
+
+    Returns:
+        Liste de champs normalisés
+
+    Raises:
+        ValueError: Si le JSON ou l'un des champs est invalide
+    """
+    value = value.strip()
+    if not value.startswith("["):
+        json_path = Path(value)
+        if not json_path.is_file():
+            raise ValueError(f"Fichier JSON introuvable : {value}")
+        value = json_path.read_text(encoding="utf-8")
+
+    try:
+        fields = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON de champs invalide : {e}") from e
+    if not isinstance(fields, list):
+        raise ValueError("--fields-json doit contenir une liste de champs")
+    return [normalize_field(field) for field in fields]
+
+
 def generate_model_file(
     app_name: str,
     model_name: str,
@@ -123,67 +499,391 @@ def generate_model_file(
         model_code = _generate_model_code(model_name, fields, add_timestamps)
         # Ajoute deux lignes vides avant le nouveau modèle
         content = content.rstrip() + "\n\n" + model_code
-        models_file.write_text(content, encoding="utf-8")
+        write_text(models_file, content)
     else:
         # Crée le fichier models.py complet
         content = _generate_models_file_content(model_name, fields, add_timestamps)
         models_file.parent.mkdir(parents=True, exist_ok=True)
-        models_file.write_text(content, encoding="utf-8")
+        write_text(models_file, content)
 
     return str(models_file)
 
 
+def models_from_spec(
+    spec: Dict[str, Any], default_app_name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extrait la liste des modèles d'une spécification (fichier --from-spec).
+
+    Format attendu:
+        {"app_name": "blog", "models": [
+            {"name": "Article", "app_name": "blog", "fields": [...]}
+        ]}
+
+    Args:
+        spec: Spécification chargée (JSON ou TOML)
+        default_app_name: App utilisée si ni le modèle ni la spécification
+            n'en précisent une
+
+    Returns:
+        Liste de dictionnaires {"app_name", "model_name", "fields"}
+
+    Raises:
+        ValueError: Si la spécification est incomplète
+    """
+    models_spec = spec.get("models")
+    if not isinstance(models_spec, list) or not models_spec:
+        raise ValueError("La spécification doit contenir une liste 'models' non vide")
+
+    spec_app_name = spec.get("app_name") or default_app_name
+    models = []
+    for i, model_spec in enumerate(models_spec, 1):
+        if not isinstance(model_spec, dict):
+            raise ValueError(f"Le modèle n°{i} de la spécification est invalide")
+        model_name = model_spec.get("name") or model_spec.get("model_name")
+        if not model_name:
+            raise ValueError(f"Le modèle n°{i} n'a pas de nom ('name')")
+        app_name = model_spec.get("app_name") or spec_app_name
+        if not app_name:
+            raise ValueError(
+                f"Le modèle {model_name} n'a pas d'app ('app_name') "
+                "et aucune app par défaut n'est définie"
+            )
+        fields = model_spec.get("fields") or []
+        if not fields:
+            raise ValueError(f"Le modèle {model_name} n'a aucun champ ('fields')")
+        fields = [normalize_field(field) for field in fields]
+        models.append(
+            {"app_name": app_name, "model_name": model_name, "fields": fields}
+        )
+    return models
+
+
+def _resolve_lazy_refs(
+    app_name: str,
+    fields: List[Dict[str, str]],
+    batch_models: Dict[str, List[str]],
+) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+    """
+    Résout les relations vers les modèles générés dans le même lot.
+
+    Les références vers un modèle du lot deviennent des références Django
+    paresseuses ("Model" dans la même app, "app.Model" sinon) : aucun import
+    ni scan du projet n'est nécessaire, et l'ordre de déclaration est libre.
+
+    Args:
+        app_name: App (nettoyée) du modèle en cours
+        fields: Champs du modèle
+        batch_models: Modèles du lot, {nom de modèle nettoyé: [apps]}
+
+    Returns:
+        Tuple (champs avec related_model normalisé, références paresseuses)
+    """
+    resolved_fields = []
+    lazy_refs: Dict[str, str] = {}
+    for field in fields:
+        related_model = field.get("related_model")
+        if field.get("type") not in RELATION_FIELD_TYPES or not related_model:
+            resolved_fields.append(field)
+            continue
+
+        if "." in related_model:
+            ref_app, ref_model = related_model.split(".", 1)
+            ref_app = _sanitize_app_name(ref_app)
+        else:
+            ref_app, ref_model = "", related_model
+        ref_model = _sanitize_model_name(ref_model)
+        apps = batch_models.get(ref_model, [])
+
+        if not ref_app:
+            # Nom sans app : modèle du lot (même app en priorité) ou même app
+            if app_name in apps or not apps:
+                ref_app = app_name
+            elif len(apps) == 1:
+                ref_app = apps[0]
+            else:
+                raise ValueError(
+                    f"Référence ambiguë '{related_model}' pour le champ "
+                    f"'{field['name']}' : précisez l'app ({', '.join(apps)})"
+                )
+
+        if ref_app in apps or (ref_app == app_name and not apps):
+            key = f"{ref_app}.{ref_model}"
+            target = ref_model if ref_app == app_name else key
+            lazy_refs[key] = f'"{target}"'
+            field = dict(field, related_model=key)
+        resolved_fields.append(field)
+    return resolved_fields, lazy_refs
+
+
+def generate_models_batch(
+    models: List[Dict[str, Any]],
+    output_dir: str,
+    add_timestamps: bool = True,
+) -> List[str]:
+    """
+    Génère plusieurs modèles Django en une seule passe.
+
+    Les modèles sont regroupés par app : chaque fichier models.py est lu au
+    plus une fois et écrit une seule fois. Les relations entre modèles du lot
+    (y compris les références en avant) sont résolues sans scan du projet.
+
+    Args:
+        models: Liste de dictionnaires {"app_name", "model_name", "fields"}
+        output_dir: Dossier de sortie (chemin du projet Django)
+        add_timestamps: Ajouter created_at et updated_at
+
+    Returns:
+        Liste des chemins des fichiers models.py créés ou modifiés
+
+    Raises:
+        ValueError: Si un modèle est dupliqué ou existe déjà
+        OSError: Si un fichier ne peut pas être écrit
+    """
+    if not models:
+        raise ValueError("Aucun modèle à générer")
+
+    # Nettoyage et regroupement par app (l'ordre de déclaration est conservé)
+    models_by_app: Dict[str, List[Tuple[str, List[Dict[str, str]]]]] = {}
+    batch_models: Dict[str, List[str]] = {}
+    for model in models:
+        app_name = _sanitize_app_name(model["app_name"])
+        model_name = _sanitize_model_name(model["model_name"])
+        if app_name in batch_models.get(model_name, []):
+            raise ValueError(
+                f"Le modèle {app_name}.{model_name} est défini plusieurs fois"
+            )
+        batch_models.setdefault(model_name, []).append(app_name)
+        models_by_app.setdefault(app_name, []).append((model_name, model["fields"]))
+
+    # Validation et rendu de toutes les apps avant la première écriture : un
+    # conflit dans une app ne laisse aucun fichier modifié
+    output_path = Path(output_dir)
+    rendered_files: List[Tuple[Path, str]] = []
+    for app_name, app_models in models_by_app.items():
+        models_file = output_path / app_name / "models.py"
+        existing_content = (
+            models_file.read_text(encoding="utf-8") if models_file.exists() else None
+        )
+
+        imports: Set[str] = set()
+        classes = []
+        for model_name, fields in app_models:
+            if existing_content is not None and re.search(
+                rf"class\s+{re.escape(model_name)}\s*\(", existing_content
+            ):
+                raise ValueError(
+                    f"Le modèle {model_name} existe déjà dans {models_file}"
+                )
+            fields, lazy_refs = _resolve_lazy_refs(app_name, fields, batch_models)
+            model_imports, model_code = _render_model(
+                model_name, fields, add_timestamps, lazy_refs
+            )
+            imports |= model_imports
+            classes.append(model_code)
+
+        if existing_content is None:
+            import_lines = ["from django.db import models"] + sorted(imports)
+            content = "\n".join(import_lines) + "\n\n" + "\n\n".join(classes)
+        else:
+            existing_lines = set(existing_content.splitlines())
+            import_lines = [
+                line
+                for line in ["from django.db import models"] + sorted(imports)
+                if line not in existing_lines
+            ]
+            content = existing_content.rstrip() + "\n\n"
+            if import_lines:
+                content += "\n".join(import_lines) + "\n\n"
+            content += "\n\n".join(classes)
+        rendered_files.append((models_file, content))
+
+    written_files = []
+    for models_file, content in rendered_files:
+        models_file.parent.mkdir(parents=True, exist_ok=True)
+        write_text(models_file, content)
+        written_files.append(str(models_file))
+
+    return written_files
+
+
 def _generate_model_code(
     model_name: str, fields: List[Dict[str, str]], add_timestamps: bool
 ) -> str:
     """Génère le code Python pour un modèle Django."""
+    imports, model_code = _render_model(model_name, fields, add_timestamps)
+
+    # Génère le code complet
+    imports_code = "\n".join(sorted(imports)) if imports else ""
+    if imports_code and "from django.db import models" not in imports_code:
+        imports_code = "from django.db import models\n" + imports_code
+
+    if imports_code:
+        return imports_code + "\n\n" + model_code
+    return "from django.db import models\n\n" + model_code
+
+
+def _render_field(
+    field: Dict[str, str], lazy_refs: Optional[Dict[str, str]] = None
+) -> Tuple[Set[str], str]:
+    """
+    Génère les imports et la ligne de déclaration d'un champ de modèle.
+
+    Args:
+        field: Champ normalisé {"name", "type", "options"[, "related_model"]}
+        lazy_refs: Références paresseuses des modèles liés (voir _render_model)
+
+    Returns:
+        Tuple (imports nécessaires, ligne du champ indentée)
+    """
+    lazy_refs = lazy_refs or {}
+    imports = set()
+    field_name = field["name"]
+    field_type = field["type"]
+    field_options = field.get("options", "")
+    related_model = field.get("related_model", None)
+
+    # Gère les imports nécessaires
+    for module in re.findall(r"\b(\w+)\.", field_options):
+        if OPTION_EXPRESSION_MODULES.get(module):
+            imports.add(OPTION_EXPRESSION_MODULES[module])
+    if field_type == "UUIDField":
+        imports.add("import uuid")
+    elif field_type in RELATION_FIELD_TYPES:
+        if related_model and related_model not in lazy_refs:
+            app_name, model_name_ref = related_model.split(".")
+            imports.add(f"from {app_name}.models import {model_name_ref}")
+
+    # Construit la ligne du champ
+    if field_type in RELATION_FIELD_TYPES:
+        if not related_model:
+            raise ValueError(
+                f"Le champ de relation '{field_name}' (type: {field_type}) "
+                "nécessite un modèle lié (related_model). "
+                "Utilisez le format 'app.Model'."
+            )
+        if related_model in lazy_refs:
+            model_name_ref = lazy_refs[related_model]
+        else:
+            app_name_ref, model_name_ref = related_model.split(".")
+        field_line = f"    {field_name} = models.{field_type}("
+        field_line += f"{model_name_ref}"
+        # on_delete=models.CASCADE par défaut, sauf s'il est fourni dans les
+        # options (ManyToManyField n'a pas besoin de on_delete)
+        has_on_delete = any(
+            option.split("=", 1)[0].strip() == "on_delete"
+            for option in _split_options(field_options)
+        )
+        if field_type in ("ForeignKey", "OneToOneField") and not has_on_delete:
+            field_line += ", on_delete=models.CASCADE"
+        if field_options:
+            field_line += f", {field_options}"
+        field_line += ")"
+    else:
+        field_def = DJANGO_FIELD_TYPES.get(field_type, f"models.{field_type}()")
+        # Remplace les options par défaut si fournies
+        if field_options:
+            # Extrait le type de base (ex: IPAddressField -> GenericIPAddressField)
+            base_type = field_def.split("(", 1)[0]
+            field_line = f"    {field_name} = {base_type}({field_options})"
+        else:
+            field_line = f"    {field_name} = {field_def}"
+
+    return imports, field_line
+
+
+def _index_name(model_name: str, field_name: str, suffix: str) -> str:
+    """
+    Nom d'index ou de contrainte (ex: article_slug_uniq).
+
+    Tronqué à INDEX_NAME_MAX_LENGTH caractères, avec un suffixe de hachage
+    pour rester unique, si le nom complet est trop long.
+    """
+    name = f"{model_name.lower()}_{field_name}_{suffix}"
+    if len(name) <= INDEX_NAME_MAX_LENGTH:
+        return name
+    digest = hashlib.md5(name.encode("utf-8")).hexdigest()[:8]
+    return f"{name[: INDEX_NAME_MAX_LENGTH - 9].rstrip('_')}_{digest}"
+
+
+def render_meta_indexes(
+    model_name: str, fields: List[Dict[str, str]]
+) -> Tuple[Set[str], str]:
+    """
+    Génère les entrées indexes/constraints de la Meta à partir des champs.
+
+    Args:
+        model_name: Nom du modèle (préfixe des noms d'index)
+        fields: Champs normalisés (options unique_if, index_if, gin_index)
+
+    Returns:
+        Tuple (imports nécessaires, lignes de la Meta, vide si aucune)
+    """
+    imports = set()
+    indexes = []
+    constraints = []
+    for field in fields:
+        name = field["name"]
+        if field.get("unique_if"):
+            constraints.append(
+                "models.UniqueConstraint(\n"
+                f'                fields=["{name}"],\n'
+                f"                condition=models.Q({field['unique_if']}),\n"
+                f'                name="{_index_name(model_name, name, "uniq")}",\n'
+                "            ),"
+            )
+        if field.get("index_if"):
+            indexes.append(
+                "models.Index(\n"
+                f'                fields=["{name}"],\n'
+                f"                condition=models.Q({field['index_if']}),\n"
+                f'                name="{_index_name(model_name, name, "idx")}",\n'
+                "            ),"
+            )
+        if field.get("gin_index"):
+            imports.add("from django.contrib.postgres.indexes import GinIndex")
+            indexes.append(
+                f'GinIndex(fields=["{name}"], '
+                f'name="{_index_name(model_name, name, "gin")}"),'
+            )
+
+    lines = ""
+    for attribute, entries in (("indexes", indexes), ("constraints", constraints)):
+        if entries:
+            lines += f"        {attribute} = [\n"
+            lines += "".join(f"            {entry}\n" for entry in entries)
+            lines += "        ]\n"
+    return imports, lines
+
+
+@rendering
+def _render_model(
+    model_name: str,
+    fields: List[Dict[str, str]],
+    add_timestamps: bool,
+    lazy_refs: Optional[Dict[str, str]] = None,
+) -> Tuple[Set[str], str]:
+    """
+    Génère les imports et le code de classe d'un modèle Django.
+
+    Args:
+        model_name: Nom du modèle
+        fields: Liste des champs du modèle
+        add_timestamps: Ajouter created_at et updated_at
+        lazy_refs: Références paresseuses ("app.Model" -> '"Model"') pour les
+            modèles liés générés dans le même lot (aucun import nécessaire)
+
+    Returns:
+        Tuple (imports nécessaires, code de la classe)
+    """
+    lazy_refs = lazy_refs or {}
     imports = set()
     field_lines = []
 
     # Génère les champs
     for field in fields:
-        field_name = field["name"]
-        field_type = field["type"]
-        field_options = field.get("options", "")
-        related_model = field.get("related_model", None)
-
-        # Gère les imports nécessaires
-        if field_type == "UUIDField":
-            imports.add("import uuid")
-        elif field_type in ["ForeignKey", "ManyToManyField", "OneToOneField"]:
-            if related_model:
-                app_name, model_name_ref = related_model.split(".")
-                imports.add(f"from {app_name}.models import {model_name_ref}")
-
-        # Construit la ligne du champ
-        if field_type in ["ForeignKey", "ManyToManyField", "OneToOneField"]:
-            if not related_model:
-                raise ValueError(
-                    f"Le champ de relation '{field_name}' (type: {field_type}) "
-                    "nécessite un modèle lié (related_model). "
-                    "Utilisez le format 'app.Model'."
-                )
-            app_name_ref, model_name_ref = related_model.split(".")
-            field_line = f"    {field_name} = models.{field_type}("
-            field_line += f"{model_name_ref}"
-            if field_type == "ForeignKey":
-                field_line += ", on_delete=models.CASCADE"
-            elif field_type == "OneToOneField":
-                field_line += ", on_delete=models.CASCADE"
-            # ManyToManyField n'a pas besoin de on_delete
-            if field_options:
-                field_line += f", {field_options}"
-            field_line += ")"
-        else:
-            field_def = DJANGO_FIELD_TYPES.get(field_type, f"models.{field_type}()")
-            # Remplace les options par défaut si fournies
-            if field_options:
-                # Extrait le type de base
-                base_type = field_type
-                field_line = f"    {field_name} = models.{base_type}({field_options})"
-            else:
-                field_line = f"    {field_name} = {field_def}"
-
+        field_imports, field_line = _render_field(field, lazy_refs)
+        imports |= field_imports
         field_lines.append(field_line)
 
     # Ajoute les timestamps si demandé
@@ -203,14 +903,13 @@ def _generate_model_code(
             ")"
         )
 
-    # Génère le code complet
-    imports_code = "\n".join(sorted(imports)) if imports else ""
-    if imports_code and "from django.db import models" not in imports_code:
-        imports_code = "from django.db import models\n" + imports_code
-
     # Détermine l'ordering
     ordering_value = '["-created_at"]' if add_timestamps else '["id"]'
 
+    # Index et contraintes déclarés par les champs (Meta)
+    meta_imports, meta_lines = render_meta_indexes(model_name, fields)
+    imports |= meta_imports
+
     model_code = f'''class {model_name}(models.Model):
     """Modèle {model_name}."""
 
@@ -220,14 +919,12 @@ def _generate_model_code(
         verbose_name = "{model_name}"
         verbose_name_plural = "{model_name}s"
         ordering = {ordering_value}
-
+{meta_lines}
     def __str__(self):
         return f"{model_name} #{{self.id}}"
 '''
 
-    if imports_code:
-        return imports_code + "\n\n" + model_code
-    return "from django.db import models\n\n" + model_code
+    return imports, model_code
 
 
 def _generate_models_file_content(
@@ -1,6 +1,98 @@
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+from pyfastcli.generators.route_index import RouteIndex, parse_routes
+from pyfastcli.instrumentation import phase, write_text
+
+# Marqueur des modules utilitaires partagés par les routes d'un dossier
+# (générés une seule fois ; un module sans marqueur n'est jamais écrasé)
+HELPER_MARKER = "# Module généré par pyfastcli"
+
+# Module utilitaire des routes conditionnelles (--conditional)
+CONDITIONAL_HELPER_MODULE = "cache_http"
+CONDITIONAL_HELPER_MARKER = f"{HELPER_MARKER} (make:url --conditional)"
+
+# Module utilitaire des routes limitées en débit (--throttle)
+THROTTLE_HELPER_MODULE = "limite_http"
+THROTTLE_HELPER_MARKER = f"{HELPER_MARKER} (make:url --throttle)"
+
+# Unités acceptées par --throttle (nombre/unité), en secondes
+THROTTLE_UNITS = {
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "h": 3600,
+    "hour": 3600,
+    "d": 86400,
+    "day": 86400,
+}
+
+# Méthodes HTTP pour lesquelles une réponse 304 a un sens
+CONDITIONAL_METHODS = {"get", "head"}
+
+_CONDITIONAL_HELPER = f'''{CONDITIONAL_HELPER_MARKER}
+"""
+Réponses conditionnelles (ETag / Last-Modified) des routes générées.
+
+La signature d'une collection (nombre de lignes et max(updated_at)) est
+calculée en une requête agrégée avant la vue : si le client a déjà cette
+version (If-None-Match / If-Modified-Since), la réponse est un 304, sans
+exécuter la vue ni sérialiser la réponse.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+
+def signature(queryset):
+    """
+    Signature d'une collection : (ETag, Last-Modified), en une requête.
+
+    L'ETag change dès qu'une ligne est ajoutée, supprimée ou modifiée
+    (updated_at) ; Last-Modified vaut max(updated_at), None si vide.
+    """
+    agregat = queryset.order_by().aggregate(
+        total=Count("pk"), derniere=Max("updated_at")
+    )
+    derniere = agregat["derniere"]
+    brut = f"{{agregat['total']}}:{{derniere.isoformat() if derniere else ''}}"
+    return hashlib.sha256(brut.encode()).hexdigest()[:32], derniere
+
+
+def conditionnel(queryset_func):
+    """
+    Décorateur de vue : 304 si la collection servie n'a pas changé.
+
+    À appliquer avec ninja.decorators.decorate_view, pour que le 304
+    court-circuite aussi la sérialisation de la réponse.
+
+    Args:
+        queryset_func: Fonction (request, *args, **kwargs) -> QuerySet de la
+            collection servie (modèle avec un champ updated_at) ; filtrez-la
+            sur un objet pour une signature par objet
+    """
+
+    def decorateur(vue):
+        @wraps(vue)
+        def wrapper(request, *args, **kwargs):
+            etag, derniere = signature(queryset_func(request, *args, **kwargs))
+            vue_conditionnelle = condition(
+                etag_func=lambda *_args, **_kwargs: etag,
+                last_modified_func=lambda *_args, **_kwargs: derniere,
+            )(vue)
+            return vue_conditionnelle(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorateur
+'''
 
 
 def _sanitize_func_name(name: str) -> str:
@@ -44,6 +136,223 @@ def _escape_string(s: str) -> str:
     return s.replace('"', '\\"').replace("'", "\\'")
 
 
+_THROTTLE_UNIT_LINES = "".join(
+    f'    "{unit}": {seconds},\n' for unit, seconds in THROTTLE_UNITS.items()
+)
+
+_THROTTLE_HELPER = f'''{THROTTLE_HELPER_MARKER}
+"""
+Limitation de débit des routes générées.
+
+Chaque client (utilisateur connecté, sinon adresse IP) a droit à N
+requêtes par période. Au-delà, la réponse est un 429 avec Retry-After,
+sans exécuter la vue.
+
+Avec un cache partagé (Redis, Memcached, base de données), un compteur par
+fenêtre de période est tenu dans le cache Django avec cache.add puis
+cache.incr, atomiques sur ces backends : ni verrou ni attente sur le
+chemin de la requête. Au plus N requêtes par fenêtre, soit jusqu'à 2N de
+part et d'autre d'un changement de fenêtre.
+
+Sans cache partagé (DummyCache, ou PYFASTCLI_THROTTLE_LOCAL = True dans
+les settings, par exemple pour les tests), un seau à jetons en mémoire du
+processus est utilisé : rechargé en continu, une rafale n'y dépasse jamais
+N requêtes, mais il est propre à chaque processus.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.http import JsonResponse
+
+# Durée des unités de débit, en secondes
+UNITES = {{
+{_THROTTLE_UNIT_LINES}}}
+
+# Clients suivis au plus par seau local (les moins récents sont oubliés)
+MAX_CLIENTS_LOCAUX = 10000
+
+
+def parser_debit(debit):
+    """Convertit un débit "100/min" en (100, 60)."""
+    nombre, _, unite = debit.partition("/")
+    return int(nombre), UNITES[unite.strip().lower()]
+
+
+def identifiant_client(request):
+    """Identifiant du client : utilisateur connecté, sinon REMOTE_ADDR."""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"u{{user.pk}}"
+    return f"ip{{request.META.get('REMOTE_ADDR', '')}}"
+
+
+class SeauLocal:
+    """
+    Seau à jetons en mémoire du processus (sans dépendance).
+
+    Les jetons se rechargent en continu : nombre / période par seconde. Un
+    seau redevenu plein équivaut à un client inconnu : il est oublié, et au
+    plus MAX_CLIENTS_LOCAUX clients sont suivis (LRU).
+    """
+
+    def __init__(self, nombre, periode):
+        self.capacite = nombre
+        self.recharge = nombre / periode
+        self.seaux = OrderedDict()
+        self.verrou = threading.Lock()
+
+    def consommer(self, cle):
+        """Consomme un jeton : 0 si accepté, sinon l'attente en secondes."""
+        maintenant = time.monotonic()
+        with self.verrou:
+            jetons, dernier = self.seaux.pop(cle, (self.capacite, maintenant))
+            jetons = min(self.capacite, jetons + (maintenant - dernier) * self.recharge)
+            self._oublier(maintenant)
+            if jetons < 1:
+                self.seaux[cle] = (jetons, maintenant)
+                return (1 - jetons) / self.recharge
+            self.seaux[cle] = (jetons - 1, maintenant)
+            return 0
+
+    def _oublier(self, maintenant):
+        """Retire les seaux les moins récents pleins ou en surnombre."""
+        while self.seaux:
+            jetons, dernier = next(iter(self.seaux.values()))
+            plein = jetons + (maintenant - dernier) * self.recharge >= self.capacite
+            if not plein and len(self.seaux) < MAX_CLIENTS_LOCAUX:
+                break
+            self.seaux.popitem(last=False)
+
+
+def consommer_cache(cache, cle, nombre, periode):
+    """
+    Compte une requête dans le cache Django : 0 si acceptée, sinon l'attente.
+
+    Compteur par fenêtre fixe : la clé porte le numéro de la fenêtre
+    courante, créée à 0 par cache.add (sans effet si elle existe) puis
+    incrémentée par cache.incr ; au-delà de `nombre`, la requête est refusée
+    jusqu'à la fenêtre suivante. Aucun verrou : deux requêtes simultanées
+    obtiennent deux valeurs distinctes.
+    """
+    maintenant = time.time()
+    fenetre = int(maintenant // periode)
+    cle_fenetre = f"{{cle}}:{{fenetre}}"
+    timeout = math.ceil(periode) + 1
+    cache.add(cle_fenetre, 0, timeout=timeout)
+    try:
+        compte = cache.incr(cle_fenetre)
+    except ValueError:
+        # Clé expirée (ou évincée) entre add et incr : nouvelle fenêtre
+        cache.add(cle_fenetre, 1, timeout=timeout)
+        compte = 1
+    if compte > nombre:
+        return (fenetre + 1) * periode - maintenant
+    return 0
+
+
+def limiter(debit, portee):
+    """
+    Décorateur de vue : au plus `debit` requêtes par client (429 au-delà).
+
+    À appliquer avec ninja.decorators.decorate_view, pour que le 429
+    court-circuite aussi la vue et la sérialisation.
+
+    Args:
+        debit: Débit autorisé, ex: "100/min" (unités : s, min, h, day)
+        portee: Nom du compteur (un par route)
+    """
+    nombre, periode = parser_debit(debit)
+    seau_local = SeauLocal(nombre, periode)
+
+    def decorateur(vue):
+        @wraps(vue)
+        def wrapper(request, *args, **kwargs):
+            cle = f"pyfastcli-throttle:{{portee}}:{{identifiant_client(request)}}"
+            cache = caches["default"]
+            if getattr(settings, "PYFASTCLI_THROTTLE_LOCAL", False) or isinstance(
+                cache, DummyCache
+            ):
+                attente = seau_local.consommer(cle)
+            else:
+                attente = consommer_cache(cache, cle, nombre, periode)
+            if attente:
+                reponse = JsonResponse({{"detail": "Trop de requêtes"}}, status=429)
+                reponse["Retry-After"] = str(max(1, math.ceil(attente)))
+                return reponse
+            return vue(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorateur
+'''
+
+
+def _parse_throttle_rate(rate: str) -> str:
+    """
+    Valide un débit --throttle (ex: 100/min) et le normalise.
+
+    Returns:
+        Débit normalisé "nombre/unité"
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*([A-Za-z]+)\s*", rate)
+    if (
+        not match
+        or int(match.group(1)) <= 0
+        or match.group(2).lower() not in THROTTLE_UNITS
+    ):
+        raise ValueError(
+            f"Débit invalide : {rate!r} (attendu : nombre/unité, ex: 100/min ; "
+            f"unités : {', '.join(THROTTLE_UNITS)})"
+        )
+    return f"{int(match.group(1))}/{match.group(2).lower()}"
+
+
+def _parse_model_reference(reference: str) -> Tuple[str, str]:
+    """
+    Valide une référence de modèle : app.Modele ou module.complet.Modele.
+
+    Returns:
+        Tuple (module à importer, nom du modèle) ; app.Modele importe depuis
+        app.models
+    """
+    reference = reference.strip()
+    if not re.fullmatch(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)+", reference):
+        raise ValueError(
+            f"Modèle invalide : {reference!r} (attendu : app.Modele ou "
+            "module.complet.Modele)"
+        )
+    module, model = reference.rsplit(".", 1)
+    if "." not in module:
+        module = f"{module}.models"
+    return module, model
+
+
+def _ensure_helper_module(out_dir: Path, module: str, content: str) -> Path:
+    """
+    Écrit un module utilitaire partagé par les routes du dossier, s'il est absent.
+
+    Raises:
+        FileExistsError: Si un module du même nom existe sans être généré
+    """
+    helper_path = out_dir / f"{module}.py"
+    if helper_path.exists():
+        if not helper_path.read_text(encoding="utf-8").startswith(HELPER_MARKER):
+            raise FileExistsError(
+                f"Le fichier {helper_path} existe déjà et n'a pas été généré "
+                "par pyfastcli."
+            )
+        return helper_path
+    write_text(helper_path, content)
+    return helper_path
+
+
 def generate_ninja_route_file(
     module_name: str,
     function_name: str,
@@ -52,6 +361,9 @@ def generate_ninja_route_file(
     tag: str,
     output_dir: str,
     description: Optional[str] = None,
+    route_index: Optional[RouteIndex] = None,
+    conditional_model: Optional[str] = None,
+    throttle: Optional[str] = None,
 ) -> str:
     """
     Génère un fichier Python contenant une route Django Ninja.
@@ -65,24 +377,53 @@ def generate_ninja_route_file(
         tag: Tag Ninja pour la documentation
         output_dir: Dossier de sortie
         description: Description optionnelle de l'endpoint
+        route_index: Index des routes du projet ; si fourni, la route est
+            refusée si (méthode, chemin) est déjà déclaré sous l'un des
+            préfixes de montage du dossier de sortie, puis ajoutée à
+            l'index (à enregistrer par l'appelant avec route_index.save()).
+            Si le chemin est déjà servi par le router d'un module du dossier
+            de sortie (autre méthode), le module généré déclare sa route sur
+            ce router (from .<module> import router) : un même chemin doit
+            être servi par un seul router, sinon Django répond 405
+        conditional_model: Modèle servi (app.Modele) ; la route répond 304
+            si la collection n'a pas changé (ETag / Last-Modified), avec
+            l'utilitaire partagé cache_http.py du dossier de sortie
+        throttle: Débit maximal par client (ex: 100/min) ; au-delà, la route
+            répond 429, avec l'utilitaire partagé limite_http.py
 
     Returns:
         Chemin du fichier généré
 
     Raises:
-        ValueError: Si les paramètres sont invalides
+        ValueError: Si les paramètres sont invalides ou la route en conflit
         OSError: Si le fichier ne peut pas être écrit
     """
     # Validation et nettoyage des entrées
-    func_name = _sanitize_func_name(function_name)
-    http_method = _validate_http_method(http_method)
-    url_path = _validate_url_path(url_path)
-    tag = tag.strip() or "Default"
+    with phase("validation"):
+        func_name = _sanitize_func_name(function_name)
+        http_method = _validate_http_method(http_method)
+        url_path = _validate_url_path(url_path)
+        tag = tag.strip() or "Default"
 
-    if description:
-        description = description.strip()
-    else:
-        description = f"Endpoint {func_name}"
+        if description:
+            description = description.strip()
+        else:
+            description = f"Endpoint {func_name}"
+
+        conditional = None
+        if conditional_model:
+            if http_method not in CONDITIONAL_METHODS:
+                raise ValueError(
+                    "Les réponses conditionnelles (--conditional) ne concernent "
+                    f"que GET et HEAD, pas {http_method.upper()}"
+                )
+            conditional = _parse_model_reference(conditional_model)
+        if throttle:
+            throttle = _parse_throttle_rate(throttle)
+        if func_name in (CONDITIONAL_HELPER_MODULE, THROTTLE_HELPER_MODULE):
+            raise ValueError(
+                f"Nom de fonction réservé : {func_name} (module utilitaire)"
+            )
 
     # Nom du fichier = fonction, par exemple get_orders.py
     file_name = f"{func_name}.py"
@@ -103,6 +444,24 @@ def generate_ninja_route_file(
             "Supprimez-le ou choisissez un autre nom de fonction."
         )
 
+    # Conflit (méthode, chemin) avec une route existante du projet ; router
+    # partagé avec le module du dossier qui sert déjà ce chemin
+    shared_router = None
+    if route_index is not None:
+        module = route_index.module_name(file_path)
+        router_module = route_index.path_router(url_path, module)
+        if (
+            router_module is not None
+            and (route_index.project_root / router_module).parent == out_dir.resolve()
+        ):
+            shared_router = Path(router_module).stem
+        route_index.check(
+            http_method,
+            url_path,
+            module,
+            router_module if shared_router else None,
+        )
+
     # Mapping des méthodes HTTP vers les décorateurs Django Ninja
     method_decorator_map = {
         "get": "router.get",
@@ -119,24 +478,66 @@ def generate_ninja_route_file(
     escaped_tag = _escape_string(tag)
     escaped_description = _escape_string(description)
 
-    # Template de route Django Ninja amélioré
-    template = f'''from ninja import Router
+    # Décorateurs de vue (decorate_view), du plus externe au plus interne :
+    # limitation de débit, puis signature de la collection (réponse 304).
+    # Imports par groupe : ninja, modèle servi, modules du dossier
+    ninja_imports = [] if shared_router else ["from ninja import Router"]
+    model_imports = []
+    local_imports = []
+    router_line = f'\nrouter = Router(tags=["{escaped_tag}"])\n'
+    route_args = f'"{escaped_url}"'
+    if shared_router:
+        local_imports.append(f"from .{shared_router} import router")
+        router_line = ""
+        route_args += f', tags=["{escaped_tag}"]'
+    queryset_func = view_decorators = ""
+    if throttle:
+        local_imports.append(f"from .{THROTTLE_HELPER_MODULE} import limiter")
+        view_decorators += f'@decorate_view(limiter("{throttle}", "{func_name}"))\n'
+    if conditional:
+        model_module, model = conditional
+        model_imports.append(f"from {model_module} import {model}")
+        local_imports.append(f"from .{CONDITIONAL_HELPER_MODULE} import conditionnel")
+        queryset_func = f'''
 
-router = Router(tags=["{escaped_tag}"])
+def {func_name}_queryset(request, *args, **kwargs):
+    """Collection servie par {func_name} (ETag / Last-Modified)."""
+    return {model}.objects.all()
+'''
+        view_decorators += f"@decorate_view(conditionnel({func_name}_queryset))\n"
+    if view_decorators:
+        ninja_imports.append("from ninja.decorators import decorate_view")
+    imports = "\n".join(
+        "".join(f"{line}\n" for line in sorted(group))
+        for group in (ninja_imports, model_imports, local_imports)
+        if group
+    )
 
+    # Template de route Django Ninja amélioré
+    template = f'''{imports}{router_line}{queryset_func}
 
-@{decorator}("{escaped_url}")
-def {func_name}(request):
+@{decorator}({route_args})
+{view_decorators}def {func_name}(request):
     """
     {escaped_description}
     """
     return {{"message": "Hello from {func_name}!"}}
 '''
 
+    # Utilitaires partagés par les routes du dossier (écrits une seule fois)
+    if conditional:
+        _ensure_helper_module(out_dir, CONDITIONAL_HELPER_MODULE, _CONDITIONAL_HELPER)
+    if throttle:
+        _ensure_helper_module(out_dir, THROTTLE_HELPER_MODULE, _THROTTLE_HELPER)
+
     # Écriture du fichier
     try:
-        file_path.write_text(template, encoding="utf-8")
+        write_text(file_path, template)
     except OSError as e:
         raise OSError(f"Impossible d'écrire le fichier {file_path}: {e}") from e
 
+    if route_index is not None:
+        module = route_index.module_name(file_path)
+        route_index.add_module(file_path, parse_routes(template, module))
+
     return str(file_path)
@@ -4,6 +4,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from pyfastcli.instrumentation import phase, rendering, write_text
+
 
 def _sanitize_package_name(name: str) -> str:
     """
@@ -135,28 +137,29 @@ def generate_package_structure(
         OSError: Si les fichiers ne peuvent pas être créés
     """
     # Validation et nettoyage
-    project_name = _sanitize_project_name(project_name)
-    package_name = _sanitize_package_name(package_name)
-    author_email = _validate_email(author_email)
-    python_version = _validate_python_version(python_version)
-
-    if not description.strip():
-        description = f"A Python package: {package_name}"
-
-    if dependencies is None:
-        dependencies = []
-    if dev_dependencies is None:
-        dev_dependencies = ["pytest>=7.0.0", "black>=23.0.0", "ruff>=0.1.0"]
-
-    # Création du dossier de sortie
-    output_path = Path(output_dir)
-    package_dir = output_path / project_name
-
-    if package_dir.exists():
-        raise FileExistsError(
-            f"Le dossier {package_dir} existe déjà. "
-            "Supprimez-le ou choisissez un autre nom de projet."
-        )
+    with phase("validation"):
+        project_name = _sanitize_project_name(project_name)
+        package_name = _sanitize_package_name(package_name)
+        author_email = _validate_email(author_email)
+        python_version = _validate_python_version(python_version)
+
+        if not description.strip():
+            description = f"A Python package: {package_name}"
+
+        if dependencies is None:
+            dependencies = []
+        if dev_dependencies is None:
+            dev_dependencies = ["pytest>=7.0.0", "black>=23.0.0", "ruff>=0.1.0"]
+
+        # Création du dossier de sortie
+        output_path = Path(output_dir)
+        package_dir = output_path / project_name
+
+        if package_dir.exists():
+            raise FileExistsError(
+                f"Le dossier {package_dir} existe déjà. "
+                "Supprimez-le ou choisissez un autre nom de projet."
+            )
 
     try:
         package_dir.mkdir(parents=True, exist_ok=True)
@@ -210,6 +213,7 @@ def generate_package_structure(
     return str(package_dir)
 
 
+@rendering
 def _generate_pyproject_toml(
     package_dir: Path,
     project_name: str,
@@ -319,9 +323,10 @@ warn_unused_configs = true
 disallow_untyped_defs = false
 """
 
-    (package_dir / "pyproject.toml").write_text(content, encoding="utf-8")
+    write_text(package_dir / "pyproject.toml", content)
 
 
+@rendering
 def _generate_readme(
     package_dir: Path,
     project_name: str,
@@ -396,9 +401,10 @@ Ce projet est sous licence MIT. Voir le fichier LICENSE pour plus de détails.
 
 {author_name}
 """
-    (package_dir / "README.md").write_text(content, encoding="utf-8")
+    write_text(package_dir / "README.md", content)
 
 
+@rendering
 def _generate_license(package_dir: Path, license_type: str, author_name: str):
     """Génère le fichier LICENSE."""
     year = "2025"
@@ -435,9 +441,10 @@ Copyright (c) {year} {author_name}
 See LICENSE file for full license text.
 """
 
-    (package_dir / "LICENSE").write_text(content, encoding="utf-8")
+    write_text(package_dir / "LICENSE", content)
 
 
+@rendering
 def _generate_gitignore(package_dir: Path):
     """Génère le fichier .gitignore standard pour Python."""
     content = """# Byte-compiled / optimized / DLL files
@@ -580,9 +587,10 @@ cython_debug/
 # PyPI configuration file
 .pypirc
 """
-    (package_dir / ".gitignore").write_text(content, encoding="utf-8")
+    write_text(package_dir / ".gitignore", content)
 
 
+@rendering
 def _generate_package_init(package_dir: Path, package_name: str):
     """Génère le fichier __init__.py du package."""
     package_path = package_dir / package_name
@@ -594,16 +602,17 @@ def _generate_package_init(package_dir: Path, package_name: str):
 
 __version__ = "0.1.0"
 '''
-    (package_path / "__init__.py").write_text(content, encoding="utf-8")
+    write_text(package_path / "__init__.py", content)
 
 
+@rendering
 def _generate_tests_structure(package_dir: Path, package_name: str):
     """Génère la structure de tests."""
     tests_dir = package_dir / "tests"
     tests_dir.mkdir(exist_ok=True)
 
     # __init__.py pour tests
-    (tests_dir / "__init__.py").write_text("", encoding="utf-8")
+    write_text(tests_dir / "__init__.py", "")
 
     # test_package.py exemple
     content = f'''"""Tests pour le package {package_name}."""
@@ -613,9 +622,10 @@ def test_example():
     """Test d'exemple."""
     assert True
 '''
-    (tests_dir / f"test_{package_name}.py").write_text(content, encoding="utf-8")
+    write_text(tests_dir / f"test_{package_name}.py", content)
 
 
+@rendering
 def _generate_manifest_in(package_dir: Path, package_name: str):
     """Génère le fichier MANIFEST.in."""
     content = f"""include README.md
@@ -625,9 +635,10 @@ recursive-include {package_name} *.py
 recursive-exclude * __pycache__
 recursive-exclude * *.py[co]
 """
-    (package_dir / "MANIFEST.in").write_text(content, encoding="utf-8")
+    write_text(package_dir / "MANIFEST.in", content)
 
 
+@rendering
 def _generate_makefile(package_dir: Path):
     """Génère un Makefile avec des commandes utiles."""
     content = """# Makefile pour le développement Python
@@ -676,9 +687,10 @@ build:
 upload:
 	twine upload dist/*
 """
-    (package_dir / "Makefile").write_text(content, encoding="utf-8")
+    write_text(package_dir / "Makefile", content)
 
 
+@rendering
 def _generate_setup_py(
     package_dir: Path,
     project_name: str,
@@ -694,4 +706,4 @@ from setuptools import setup
 
 setup()
 '''
-    (package_dir / "setup.py").write_text(content, encoding="utf-8")
+    write_text(package_dir / "setup.py", content)
@@ -0,0 +1,611 @@
+"""Index des routes Django Ninja d'un projet, construit avec ast.
+
+Chaque module Python du projet est analysé une seule fois : le résultat est
+conservé dans un index persistant (``<cache pyfastcli>/routes/``) et n'est
+recalculé que pour les fichiers dont la date de modification ou la taille a
+changé. Les routes sont indexées par (méthode, chemin complet) pour détecter
+les conflits en temps constant ; le chemin complet inclut le préfixe sous
+lequel le router du module est monté (``add_router("/v1", ...)``,
+``register_routes(api, "/v1")``). Un module peut déclarer ses routes sur le
+router d'un autre module (``from .list_orders import router``) : elles sont
+alors servies par ce router, sous ses préfixes.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyfastcli.instrumentation import phase
+from pyfastcli.render_cache import default_cache_dir
+
+# Méthodes HTTP des décorateurs de Router / NinjaAPI
+HTTP_METHODS = ("get", "post", "put", "delete", "patch", "head", "options")
+
+# Dossiers ignorés lors du scan du projet (en plus des dossiers cachés)
+IGNORED_DIRS = {
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+    "venv",
+    "env",
+    "build",
+    "dist",
+}
+
+# Version du format de l'index des routes
+ROUTE_INDEX_VERSION = 3
+
+# Fonctions des registres générés (route_registry) qui montent tous les
+# modules de routes de leur package
+REGISTRY_MOUNT_FUNCTIONS = ("register_routes", "build_router")
+
+# Préfiltres textuels : seuls les fichiers contenant un décorateur de route
+# (ou un montage de router) sont analysés avec ast
+_ROUTE_DECORATORS = "|".join(HTTP_METHODS + ("api_operation",))
+_DECORATOR_RE = re.compile(rf"@[\w.]+\.(?:{_ROUTE_DECORATORS})\s*\(")
+_MOUNT_FUNCTIONS = "|".join(("add_router",) + REGISTRY_MOUNT_FUNCTIONS)
+_MOUNT_RE = re.compile(rf"\b(?:{_MOUNT_FUNCTIONS})\s*\(")
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    Route déclarée par un décorateur Django Ninja.
+
+    Attributes:
+        method: Méthode HTTP en majuscules (ex: GET)
+        path: Chemin tel que déclaré (ex: /orders/{id})
+        function: Nom de la fonction décorée
+        module: Fichier du module (relatif à la racine du projet si possible)
+        line: Ligne du décorateur
+        prefix: Préfixe sous lequel le router du module est monté
+        router: Nom pointé du module qui définit le router, s'il est importé
+            d'un autre module (vide : router du module lui-même)
+    """
+
+    method: str
+    path: str
+    function: str
+    module: str
+    line: int
+    prefix: str = ""
+    router: str = ""
+
+    @property
+    def full_path(self) -> str:
+        """Chemin servi : préfixe de montage suivi du chemin déclaré."""
+        return join_route_path(self.prefix, self.path)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Clé de conflit : (méthode, chemin complet normalisé)."""
+        return self.method, normalize_route_path(self.full_path)
+
+    @property
+    def location(self) -> str:
+        """Emplacement lisible de la route (fichier:ligne)."""
+        return f"{self.module}:{self.line}"
+
+
+def normalize_route_path(path: str) -> str:
+    """
+    Normalise un chemin pour la comparaison des routes.
+
+    Les paramètres ne comptent que par leur position : /orders/{id} et
+    /orders/{int:order_id} sont la même route.
+    """
+    path = "/" + path.strip().lstrip("/")
+    return re.sub(r"\{[^}]*\}", "{}", path)
+
+
+def join_route_path(prefix: str, path: str) -> str:
+    """Concatène un préfixe de montage et un chemin, comme Django Ninja."""
+    joined = "/".join(part for part in (prefix, path) if part)
+    return "/" + re.sub(r"/+", "/", joined).lstrip("/")
+
+
+def module_dotted_name(relative: str) -> str:
+    """Nom pointé d'un module à partir de son fichier (api/routes/x.py)."""
+    parts = relative[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _mount_matches(module: str, target: str) -> bool:
+    """
+    Indique si un montage vise un module.
+
+    La cible est un nom pointé de module, ou '<package>.*' pour tous les
+    modules d'un package. Elle est comparée par suffixe : un projet dont les
+    sources sont sous src/ importe 'api.routes' pour 'src/api/routes'.
+    """
+    if target.endswith(".*"):
+        module = module.rpartition(".")[0]
+        target = target[:-2]
+    return module == target or module.endswith(f".{target}")
+
+
+def _string_value(node: Optional[ast.AST]) -> Optional[str]:
+    """Valeur d'une constante chaîne, ou None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _decorator_routes(decorator: ast.AST) -> List[Tuple[str, str]]:
+    """Routes (méthode, chemin) déclarées par un décorateur."""
+    if not isinstance(decorator, ast.Call) or not isinstance(
+        decorator.func, ast.Attribute
+    ):
+        return []
+
+    keywords = {keyword.arg: keyword.value for keyword in decorator.keywords}
+    args = decorator.args
+    if decorator.func.attr in HTTP_METHODS:
+        methods = [decorator.func.attr.upper()]
+        path = _string_value(args[0] if args else keywords.get("path"))
+    elif decorator.func.attr == "api_operation":
+        methods_node = args[0] if args else keywords.get("methods")
+        if not isinstance(methods_node, (ast.List, ast.Tuple)):
+            return []
+        methods = [
+            value.upper()
+            for value in map(_string_value, methods_node.elts)
+            if value is not None
+        ]
+        path = _string_value(args[1] if len(args) > 1 else keywords.get("path"))
+    else:
+        return []
+
+    if path is None:
+        return []
+    return [(method, path) for method in methods]
+
+
+def parse_routes(source: str, module: str) -> List[Route]:
+    """
+    Extrait les routes Django Ninja d'un module Python.
+
+    Args:
+        source: Code source du module
+        module: Nom du fichier (reporté dans les routes)
+
+    Returns:
+        Routes déclarées par les décorateurs @<router>.<méthode>(chemin)
+        et @<router>.api_operation([méthodes], chemin)
+    """
+    if not _DECORATOR_RE.search(source):
+        return []
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    imported = _imported_names(tree, module)
+    routes = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            # Router importé d'un autre module (from .list_orders import router)
+            router = ""
+            if isinstance(decorator, ast.Call) and isinstance(
+                decorator.func, ast.Attribute
+            ):
+                name = _dotted_expression(decorator.func.value)
+                if name in imported:
+                    router = imported[name].rpartition(".")[0]
+            for method, path in _decorator_routes(decorator):
+                routes.append(
+                    Route(method, path, node.name, module, decorator.lineno, "", router)
+                )
+    return routes
+
+
+def _dotted_expression(node: ast.AST) -> Optional[str]:
+    """Nom pointé d'une expression (a.b.c), ou None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted_expression(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    return None
+
+
+def _imported_names(tree: ast.AST, module: str) -> Dict[str, str]:
+    """Noms importés par un module -> nom pointé complet (imports relatifs résolus)."""
+    package = module_dotted_name(module).split(".")
+    if not module.endswith("__init__.py"):
+        package = package[:-1]
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    head = alias.name.split(".")[0]
+                    names[head] = head
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package[: len(package) - node.level + 1]
+                base = ".".join(part for part in parent + [base] if part)
+            for alias in node.names:
+                names[alias.asname or alias.name] = f"{base}.{alias.name}"
+    return names
+
+
+def parse_mounts(source: str, module: str) -> List[Tuple[str, str]]:
+    """
+    Extrait les montages de routers d'un module Python.
+
+    Args:
+        source: Code source du module
+        module: Fichier du module, relatif à la racine du projet
+
+    Returns:
+        Liste de (préfixe, cible) : la cible est le module dont le router est
+        monté par add_router(préfixe, router), ou '<package>.*' pour
+        register_routes(api, préfixe) / add_router(préfixe, build_router())
+        d'un registre généré. Un router défini dans le module lui-même a pour
+        cible ce module.
+    """
+    if not _MOUNT_RE.search(source):
+        return []
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    imported = _imported_names(tree, module)
+    own_module = module_dotted_name(module)
+
+    def resolve(node: ast.AST) -> Optional[str]:
+        dotted = _dotted_expression(node)
+        if dotted is None:
+            return None
+        head, _, rest = dotted.partition(".")
+        if head not in imported:
+            return None
+        return f"{imported[head]}.{rest}" if rest else imported[head]
+
+    def registry_target(node: Optional[ast.AST]) -> Optional[str]:
+        if not isinstance(node, ast.Call):
+            return None
+        function = resolve(node.func)
+        if function is None:
+            return None
+        package, _, name = function.rpartition(".")
+        return f"{package}.*" if name in REGISTRY_MOUNT_FUNCTIONS else None
+
+    mounts = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+        args = node.args
+        prefix = _string_value(args[0] if args else keywords.get("prefix"))
+        if isinstance(node.func, ast.Attribute) and node.func.attr == "add_router":
+            if prefix is None:
+                continue
+            router = args[1] if len(args) > 1 else keywords.get("router")
+            target = _string_value(router)
+            if target is not None:
+                # Router donné par son chemin d'import ("app.api.router")
+                target = target.rpartition(".")[0]
+            elif registry_target(router):
+                target = registry_target(router)
+            elif isinstance(router, (ast.Name, ast.Attribute)):
+                resolved = resolve(router)
+                target = resolved.rpartition(".")[0] if resolved else own_module
+            if target:
+                mounts.append((prefix, target))
+        else:
+            # register_routes(api, "/v1") d'un registre généré
+            target = registry_target(node)
+            if target is not None and _dotted_expression(node.func).endswith(
+                "register_routes"
+            ):
+                prefix = _string_value(
+                    args[1] if len(args) > 1 else keywords.get("prefix")
+                )
+                mounts.append((prefix or "", target))
+    return mounts
+
+
+class RouteIndex:
+    """
+    Index des routes d'un projet, par (méthode, chemin complet normalisé).
+
+    Attributes:
+        project_root: Racine du projet analysé
+        files: Routes et montages de routers par fichier, avec la date de
+            modification et la taille du fichier au moment de l'analyse
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root).resolve()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._by_key: Dict[Tuple[str, str], Route] = {}
+        self._duplicates: List[Tuple[Route, Route]] = []
+        self._by_path: Dict[str, Route] = {}
+        self._shadowed: List[Tuple[Route, Route]] = []
+        self._prefixes: Dict[str, List[str]] = {}
+
+    @property
+    def index_path(self) -> Path:
+        """Fichier de l'index persistant du projet."""
+        digest = hashlib.sha256(str(self.project_root).encode("utf-8")).hexdigest()
+        return default_cache_dir() / "routes" / f"{digest[:16]}.json"
+
+    @classmethod
+    def load(cls, project_root) -> "RouteIndex":
+        """
+        Construit l'index d'un projet en réutilisant l'analyse précédente.
+
+        Seuls les fichiers nouveaux ou modifiés (date de modification ou
+        taille) sont relus ; l'index est enregistré s'il a changé.
+        """
+        index = cls(project_root)
+        with phase("discovery"):
+            cached = index._read_cache()
+            changed = False
+            for relative, stat in index._scan():
+                entry = cached.get(relative)
+                signature = [stat.st_mtime_ns, stat.st_size]
+                if entry is None or entry.get("signature") != signature:
+                    try:
+                        source = (index.project_root / relative).read_text(
+                            encoding="utf-8"
+                        )
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    routes = parse_routes(source, relative)
+                    entry = {
+                        "signature": signature,
+                        "routes": [
+                            [
+                                route.method,
+                                route.path,
+                                route.function,
+                                route.line,
+                                route.router,
+                            ]
+                            for route in routes
+                        ],
+                        "mounts": [
+                            list(mount) for mount in parse_mounts(source, relative)
+                        ],
+                    }
+                    changed = True
+                index.files[relative] = entry
+
+            if changed or set(index.files) != set(cached):
+                index.save()
+            for relative, entry in index.files.items():
+                for method, path, function, line, router in entry["routes"]:
+                    index._register_mounted(
+                        Route(method, path, function, relative, line, "", router)
+                    )
+        return index
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Analyse précédente enregistrée, ou dictionnaire vide."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if data["version"] == ROUTE_INDEX_VERSION and isinstance(
+                data["files"], dict
+            ):
+                return data["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _scan(self):
+        """Parcourt les modules Python du projet : (chemin relatif, stat)."""
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = sorted(
+                name
+                for name in dirnames
+                if not name.startswith(".") and name not in IGNORED_DIRS
+            )
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield Path(path).relative_to(self.project_root).as_posix(), stat
+
+    def prefixes(self, module: str, _seen: Tuple[str, ...] = ()) -> List[str]:
+        """
+        Préfixes sous lesquels le router d'un module est monté.
+
+        Les montages imbriqués sont composés (un module monté sous /shop qui
+        monte un router sous /orders donne /shop/orders).
+
+        Args:
+            module: Fichier du module, relatif à la racine du projet
+
+        Returns:
+            Préfixes triés ; [""] si le module n'est monté nulle part
+        """
+        if module in self._prefixes:
+            return self._prefixes[module]
+        dotted = module_dotted_name(module)
+        prefixes = set()
+        for mounting, entry in self.files.items():
+            for prefix, target in entry.get("mounts", []):
+                if not _mount_matches(dotted, target):
+                    continue
+                # Router défini et monté dans le même module : monté sur l'API
+                if mounting == module or mounting in _seen:
+                    parents = [""]
+                else:
+                    parents = self.prefixes(mounting, _seen + (module,))
+                for parent in parents:
+                    full_prefix = join_route_path(parent, prefix)
+                    prefixes.add("" if full_prefix == "/" else full_prefix)
+        result = sorted(prefixes) or [""]
+        if not _seen:
+            self._prefixes[module] = result
+        return result
+
+    def router_module(self, route: Route) -> str:
+        """
+        Fichier du module qui définit le router d'une route : le module de la
+        route, ou le module indexé dont elle importe le router.
+        """
+        if route.router:
+            for relative in self.files:
+                if _mount_matches(module_dotted_name(relative), route.router):
+                    return relative
+        return route.module
+
+    def _register_mounted(self, route: Route):
+        """Ajoute une route sous chacun des préfixes de montage de son router."""
+        for prefix in self.prefixes(self.router_module(route)):
+            self._register(replace(route, prefix=prefix))
+
+    def _register(self, route: Route):
+        """Ajoute une route à la table (méthode, chemin), doublons conservés à part."""
+        existing = self._by_key.get(route.key)
+        if existing is not None:
+            self._duplicates.append((existing, route))
+            return
+        self._by_key[route.key] = route
+        # Même chemin sur un autre router : chaque router produit ses propres
+        # URLs, Django ne résout que la première (les autres méthodes -> 405)
+        first = self._by_path.setdefault(route.key[1], route)
+        if self.router_module(first) != self.router_module(route):
+            self._shadowed.append((first, route))
+
+    def module_name(self, path: Path) -> str:
+        """Nom d'un fichier dans l'index (relatif à la racine si possible)."""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @property
+    def routes(self) -> List[Route]:
+        """Routes du projet triées par chemin complet puis méthode."""
+        routes = list(self._by_key.values()) + [dup for _, dup in self._duplicates]
+        return sorted(routes, key=lambda route: (route.key[1], route.method))
+
+    def find(self, method: str, path: str) -> Optional[Route]:
+        """Route déjà déclarée pour (méthode, chemin complet), ou None."""
+        return self._by_key.get((method.upper(), normalize_route_path(path)))
+
+    def conflicts(self) -> List[Tuple[Route, Route]]:
+        """
+        Paires de routes du projet en conflit : même (méthode, chemin), ou
+        même chemin déclaré sur deux routers différents.
+        """
+        return self._duplicates + self._shadowed
+
+    def path_router(self, path: str, module: str) -> Optional[str]:
+        """
+        Fichier du module dont le router sert déjà un chemin, sous l'un des
+        préfixes de montage d'un module, ou None.
+        """
+        for prefix in self.prefixes(module):
+            existing = self._by_path.get(
+                normalize_route_path(join_route_path(prefix, path))
+            )
+            if existing is not None:
+                return self.router_module(existing)
+        return None
+
+    def check(
+        self,
+        method: str,
+        path: str,
+        module: Optional[str] = None,
+        router: Optional[str] = None,
+    ):
+        """
+        Vérifie qu'une route peut être ajoutée.
+
+        Args:
+            method: Méthode HTTP
+            path: Chemin déclaré dans le module
+            module: Fichier du module qui déclare la route (voir module_name) ;
+                le chemin est vérifié sous chacun des préfixes de son router
+            router: Fichier du module dont le router est importé par le module
+                (par défaut : le module lui-même)
+
+        Raises:
+            ValueError: Si (méthode, chemin complet) est déjà déclaré dans le
+                projet, ou si le chemin est servi par un autre router : chaque
+                router produit ses propres URLs et Django ne résout que la
+                première, les autres méthodes répondraient 405
+        """
+        router = router or module
+        prefixes = self.prefixes(router) if router is not None else [""]
+        for prefix in prefixes:
+            full_path = join_route_path(prefix, path)
+            existing = self.find(method, full_path)
+            if existing is not None:
+                raise ValueError(
+                    f"Conflit de route : {method.upper()} {full_path} est déjà "
+                    f"déclaré par {existing.function} ({existing.location})"
+                )
+            existing = self._by_path.get(normalize_route_path(full_path))
+            if existing is not None and self.router_module(existing) != router:
+                raise ValueError(
+                    f"Conflit de route : {full_path} est déjà servi par le "
+                    f"router de {self.router_module(existing)} "
+                    f"({existing.function}, {existing.location}) ; Django ne "
+                    f"résout que le premier router d'un chemin et "
+                    f"{method.upper()} répondrait 405. Déclarez "
+                    f"{method.upper()} {path} sur ce router."
+                )
+
+    def add_module(self, path: Path, routes: List[Route]):
+        """
+        Enregistre les routes d'un module généré.
+
+        Raises:
+            ValueError: Si une des routes entre en conflit avec le projet
+        """
+        relative = self.module_name(path)
+        routes = [replace(route, module=relative) for route in routes]
+        for route in routes:
+            self.check(route.method, route.path, relative, self.router_module(route))
+        stat = Path(path).stat()
+        self.files[relative] = {
+            "signature": [stat.st_mtime_ns, stat.st_size],
+            "routes": [
+                [route.method, route.path, route.function, route.line, route.router]
+                for route in routes
+            ],
+            "mounts": [],
+        }
+        for route in routes:
+            self._register_mounted(route)
+
+    def save(self):
+        """Enregistre l'index (écriture atomique, erreurs ignorées)."""
+        path = self.index_path
+        data = {"version": ROUTE_INDEX_VERSION, "files": self.files}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(data, tmp_file, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except OSError:
+            # L'index est une optimisation : un échec d'écriture n'est pas fatal
+            pass
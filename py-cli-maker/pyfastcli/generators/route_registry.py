@@ -0,0 +1,417 @@
+"""Registre des routers Ninja généré dans le dossier des routes (__init__.py).
+
+Le registre liste les modules de routes du dossier et les enregistre sur
+l'API Ninja en un seul appel (``register_routes(api)``) : les routers des
+modules sont agrégés dans un Router unique, ajouté par un seul
+``api.add_router`` ; un router partagé par plusieurs modules (même chemin,
+méthodes différentes) n'est ajouté qu'une fois. Il est réécrit à chaque
+route ajoutée par make:url.
+
+En mode paresseux (``lazy``), le registre associe en plus chaque module au
+premier segment de ses chemins et fournit ``lazy_urlpatterns(api)`` : un
+module n'est importé qu'à la première requête sur son préfixe, ou à la
+génération du schéma OpenAPI.
+"""
+
+import ast
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pyfastcli.generators.route_index import Route, parse_routes
+from pyfastcli.instrumentation import rendering, write_text
+
+# Marqueur des registres générés (un __init__.py sans marqueur n'est jamais
+# réécrit)
+REGISTRY_MARKER = "# Registre de routes généré par pyfastcli"
+
+
+def _read_registry(registry_path: Path) -> Optional[Tuple[Dict[str, str], bool]]:
+    """
+    Lit ROUTE_MODULES d'un registre généré.
+
+    Returns:
+        (module -> préfixe, registre paresseux) ; ({}, False) si le registre
+        n'existe pas, None si le fichier n'est pas un registre généré
+    """
+    try:
+        source = registry_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}, False
+    if not source.startswith(REGISTRY_MARKER):
+        return None
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "ROUTE_MODULES"
+        ):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                return None
+            if isinstance(value, dict):
+                return {str(k): str(v) for k, v in value.items()}, True
+            return {str(name): "" for name in value}, False
+    return None
+
+
+def read_registry_modules(registry_path: Path) -> Optional[List[str]]:
+    """
+    Lit la liste des modules d'un registre généré.
+
+    Returns:
+        Modules enregistrés, liste vide si le registre n'existe pas, ou None
+        si le fichier existe mais n'est pas un registre généré
+    """
+    registry = _read_registry(registry_path)
+    return None if registry is None else list(registry[0])
+
+
+def is_lazy_registry(registry_path: Path) -> bool:
+    """Indique si le registre généré est paresseux (lazy_urlpatterns)."""
+    registry = _read_registry(registry_path)
+    return registry is not None and registry[1]
+
+
+def route_prefix(routes: Iterable[Route]) -> str:
+    """
+    Préfixe d'URL qui déclenche l'import d'un module (registre paresseux).
+
+    Returns:
+        Premier segment commun des chemins du module (ex: 'orders'), ou ''
+        s'il n'y en a pas (segments différents ou paramètre de chemin) : le
+        module est alors chargé à la première requête non résolue
+    """
+    segments = {route.path.strip("/").split("/")[0] for route in routes}
+    if len(segments) != 1:
+        return ""
+    segment = segments.pop()
+    return "" if "{" in segment else segment
+
+
+def _module_routes(routes_dir: Path, name: str) -> List[Route]:
+    """Routes déclarées par un module du dossier (liste vide si illisible)."""
+    path = routes_dir / f"{name}.py"
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+    return parse_routes(source, path.name)
+
+
+def _route_modules(routes_dir: Path) -> Dict[str, str]:
+    """Modules du dossier qui déclarent des routes (création du registre)."""
+    modules = {}
+    for path in sorted(routes_dir.glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        routes = _module_routes(routes_dir, path.stem)
+        if routes:
+            modules[path.stem] = route_prefix(routes)
+    return modules
+
+
+def update_route_registry(
+    routes_dir: Path, module_name: str, lazy: Optional[bool] = None
+) -> Optional[str]:
+    """
+    Ajoute un module de routes au registre du dossier (__init__.py).
+
+    À la création, le registre reprend les modules de routes déjà présents
+    dans le dossier ; ensuite, seul le module ajouté est inséré, et le
+    fichier n'est réécrit que si son contenu change.
+
+    Args:
+        routes_dir: Dossier des modules de routes
+        module_name: Module ajouté (nom du fichier sans .py)
+        lazy: Registre paresseux (import des modules à la première requête
+            sur leur préfixe) ; None conserve le mode du registre existant
+
+    Returns:
+        Chemin du registre, ou None si le dossier contient déjà un
+        __init__.py qui n'est pas un registre généré (il n'est pas modifié)
+
+    Raises:
+        OSError: Si le registre ne peut pas être écrit
+    """
+    routes_dir = Path(routes_dir)
+    registry_path = routes_dir / "__init__.py"
+    registry = _read_registry(registry_path)
+    if registry is None:
+        return None
+    modules, was_lazy = registry
+    if not registry_path.exists():
+        modules = _route_modules(routes_dir)
+    if lazy is None:
+        lazy = was_lazy
+    if lazy and not was_lazy:
+        # Passage en mode paresseux : préfixes des modules déjà enregistrés
+        modules = {
+            name: route_prefix(_module_routes(routes_dir, name)) for name in modules
+        }
+
+    modules[module_name] = route_prefix(_module_routes(routes_dir, module_name))
+    content = (
+        _render_lazy_registry(modules) if lazy else _render_registry(list(modules))
+    )
+    try:
+        current = registry_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = None
+    if content != current:
+        write_text(registry_path, content)
+    return str(registry_path)
+
+
+# Fonctions communes aux deux registres (enregistrement immédiat)
+_REGISTER_FUNCTIONS = '''
+
+def build_router():
+    """Agrège les routers de tous les modules de routes dans un seul Router."""
+    from ninja import Router
+
+    router = Router()
+    added = []
+    for name in ROUTE_MODULES:
+        module = import_module(f"{__name__}.{name}")
+        # Les modules d'un même chemin partagent le router du premier
+        if not any(module.router is other for other in added):
+            added.append(module.router)
+            router.add_router("", module.router)
+    return router
+
+
+def register_routes(api, prefix=""):
+    """Enregistre toutes les routes générées sur l'API (un seul add_router)."""
+    api.add_router(prefix, build_router())
+'''
+
+
+@rendering
+def _render_registry(modules: List[str]) -> str:
+    """Rend le registre des routes."""
+    module_lines = "".join(f'    "{name}",\n' for name in modules)
+    return f'''{REGISTRY_MARKER} (make:url) : ne pas modifier.
+"""
+Enregistre les routes générées sur l'API Ninja.
+
+Utilisation (urls.py) :
+
+    from ninja import NinjaAPI
+
+    from <package des routes> import register_routes
+
+    api = NinjaAPI()
+    register_routes(api)
+"""
+
+from importlib import import_module
+
+# Modules de routes, dans l'ordre d'enregistrement
+ROUTE_MODULES = [
+{module_lines}]
+{_REGISTER_FUNCTIONS}'''
+
+
+@rendering
+def _render_lazy_registry(modules: Dict[str, str]) -> str:
+    """Rend le registre des routes paresseux (import à la première requête)."""
+    module_lines = "".join(
+        f'    "{name}": "{prefix}",\n' for name, prefix in modules.items()
+    )
+    return f'''{REGISTRY_MARKER} (make:url --lazy-registry) : ne pas modifier.
+"""
+Enregistre les routes générées sur l'API Ninja, avec import différé.
+
+Chaque module de routes n'est importé qu'à la première requête dont le
+chemin commence par son préfixe, ou à la génération du schéma OpenAPI.
+Les modules sans préfixe commun ('') sont importés à la première requête
+non résolue par les autres préfixes. reverse() (et le tag {{% url %}})
+importe tous les modules, Django devant alors connaître toutes les URLs.
+
+Les routes différées reprennent les réglages de l'API principale (auth,
+throttle, renderer, parser, décorateurs), lui délèguent la gestion des
+exceptions (api.on_exception) et partagent son espace de noms d'URL :
+reverse("<api.urls_namespace>:<nom>") les résout comme avec
+register_routes(api). L'API doit être une LazyNinjaAPI, dont le schéma
+OpenAPI inclut les routes différées.
+
+Compatibilité : django-ninja 1.x (vérifié avec 1.7). Les décorateurs de
+l'API (api.add_decorator) n'ont pas d'accesseur public : ils sont relus
+dans api.default_router._decorators, et lazy_urlpatterns lève
+ImproperlyConfigured si cet attribut disparaît.
+
+Utilisation (urls.py) :
+
+    from django.urls import include, path
+
+    from <package des routes> import LazyNinjaAPI, lazy_urlpatterns
+
+    api = LazyNinjaAPI()
+    urlpatterns = [
+        path("api/", include(lazy_urlpatterns(api))),
+    ]
+"""
+
+import re
+import threading
+from importlib import import_module
+
+from django.core.exceptions import ImproperlyConfigured
+from ninja import NinjaAPI
+
+# Modules de routes -> préfixe d'URL qui déclenche leur import
+ROUTE_MODULES = {{
+{module_lines}}}
+
+# Réglages publics de l'API principale repris par les API des préfixes
+API_SETTINGS = ("auth", "throttle", "renderer", "parser")
+
+
+class LazyNinjaAPI(NinjaAPI):
+    """NinjaAPI dont le schéma OpenAPI inclut les routes différées."""
+
+    lazy_routes = ()
+
+    def get_openapi_schema(self, *, path_prefix=None, path_params=None):
+        schema = super().get_openapi_schema(
+            path_prefix=path_prefix, path_params=path_params
+        )
+        if path_prefix is None:
+            path_prefix = self.get_root_path(path_params or {{}})
+        for routes in self.lazy_routes:
+            lazy_schema = routes.load().get_openapi_schema(path_prefix=path_prefix)
+            schema["paths"].update(lazy_schema["paths"])
+            components = schema.setdefault("components", {{}})
+            for key, values in lazy_schema.get("components", {{}}).items():
+                components.setdefault(key, {{}}).update(values)
+        return schema
+
+
+class _PrefixAPI(NinjaAPI):
+    """API interne d'un préfixe : exceptions traitées par l'API principale."""
+
+    def __init__(self, api, namespace):
+        super().__init__(
+            title=api.title,
+            version=api.version,
+            urls_namespace=namespace,
+            openapi_url=None,
+            docs_url=None,
+        )
+        self.main_api = api
+        for name in API_SETTINGS:
+            setattr(self, name, getattr(api, name))
+        for decorator, mode in _api_decorators(api):
+            self.add_decorator(decorator, mode)
+
+    def on_exception(self, request, exc):
+        return self.main_api.on_exception(request, exc)
+
+
+def _api_decorators(api):
+    """Décorateurs ajoutés par api.add_decorator (attribut interne de ninja)."""
+    try:
+        return list(api.default_router._decorators)
+    except AttributeError:
+        import ninja
+
+        raise ImproperlyConfigured(
+            f"lazy_urlpatterns : django-ninja {{ninja.__version__}} n'expose plus "
+            "Router._decorators (décorateurs de l'API) ; versions supportées : "
+            "1.x. Utilisez register_routes(api) ou régénérez le registre."
+        ) from None
+
+
+class _LazyRoutes:
+    """Routes d'un préfixe, importées et montées au premier accès."""
+
+    def __init__(self, api, prefix, modules):
+        self.api = api
+        self.prefix = prefix
+        self.modules = modules
+        self._lock = threading.Lock()
+        self._api = None
+
+    def load(self):
+        """Importe les modules du préfixe sur une API dédiée (une seule fois)."""
+        with self._lock:
+            if self._api is None:
+                namespace = f"{{self.api.urls_namespace}}-{{self.prefix or 'default'}}"
+                api = _PrefixAPI(self.api, namespace)
+                added = []
+                for name in self.modules:
+                    router = import_module(f"{{__name__}}.{{name}}").router
+                    # Router partagé par les modules d'un même chemin
+                    if not any(router is other for other in added):
+                        added.append(router)
+                        api.add_router("", router)
+                self._api = api
+        return self._api
+
+    @property
+    def urlpatterns(self):
+        # Lu par Django à la première requête qui atteint ce préfixe ; la
+        # racine de l'API dédiée est exclue (celle de l'API principale suffit)
+        return [
+            pattern
+            for pattern in self.load().urls[0]
+            if getattr(pattern, "name", None) != "api-root"
+        ]
+
+
+def lazy_urlpatterns(api):
+    """
+    URLs de l'API (docs, schéma) et routes différées par préfixe, dans
+    l'espace de noms de l'API.
+
+    La racine de l'API est placée après les routes différées, pour qu'une
+    route différée sur "/" ne soit pas masquée. Le schéma OpenAPI de l'API
+    inclut les routes différées (leurs modules sont importés à sa
+    génération).
+
+    Raises:
+        TypeError: Si l'API n'est pas une LazyNinjaAPI
+        ImproperlyConfigured: Si la version de django-ninja n'est pas prise
+            en charge
+    """
+    from django.urls import URLResolver
+    from django.urls.resolvers import RegexPattern
+
+    if not isinstance(api, LazyNinjaAPI):
+        raise TypeError(
+            "lazy_urlpatterns attend une LazyNinjaAPI (from "
+            f"{{__name__}} import LazyNinjaAPI), pas {{type(api).__name__}}"
+        )
+    # Vérifié dès le chargement des URLs plutôt qu'à la première requête
+    _api_decorators(api)
+
+    groups = {{}}
+    for name, prefix in ROUTE_MODULES.items():
+        groups.setdefault(prefix, []).append(name)
+    api.lazy_routes = [
+        _LazyRoutes(api, prefix, names) for prefix, names in groups.items()
+    ]
+
+    api_patterns, app_name, namespace = api.urls
+    root = [p for p in api_patterns if getattr(p, "name", None) == "api-root"]
+    patterns = [p for p in api_patterns if p not in root]
+    # Préfixes précis d'abord, modules sans préfixe commun en dernier
+    for routes in sorted(api.lazy_routes, key=lambda routes: routes.prefix == ""):
+        regex = rf"^(?={{re.escape(routes.prefix)}}(?:/|$))" if routes.prefix else "^"
+        # Le préfixe est vérifié sans être consommé : les modules gardent
+        # leurs chemins complets
+        patterns.append(URLResolver(RegexPattern(regex), routes))
+    patterns += root
+    return [
+        URLResolver(
+            RegexPattern("^"), patterns, app_name=app_name, namespace=namespace
+        )
+    ]
+{_REGISTER_FUNCTIONS}'''
@@ -0,0 +1,65 @@
+"""Chargement des fichiers de spécification (JSON ou TOML) des générateurs."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Union
+
+
+def _load_toml(content: str, spec_path: Path) -> Dict[str, Any]:
+    """Parse un contenu TOML avec tomllib (3.11+) ou tomli s'il est installé."""
+    try:
+        import tomllib  # type: ignore[import-not-found]
+    except ImportError:
+        try:
+            import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+        except ImportError as e:
+            raise ValueError(
+                f"Impossible de lire {spec_path} : le format TOML nécessite "
+                "Python 3.11+ ou le paquet 'tomli'. Utilisez un fichier JSON."
+            ) from e
+
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Fichier TOML invalide {spec_path}: {e}") from e
+
+
+def load_spec_file(spec_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Charge un fichier de spécification JSON ou TOML.
+
+    Le format est déterminé par l'extension du fichier (.json ou .toml).
+
+    Args:
+        spec_path: Chemin du fichier de spécification
+
+    Returns:
+        Dictionnaire décrivant la spécification
+
+    Raises:
+        ValueError: Si le fichier est illisible ou mal formé
+    """
+    spec_path = Path(spec_path)
+    if not spec_path.is_file():
+        raise ValueError(f"Fichier de spécification introuvable : {spec_path}")
+
+    content = spec_path.read_text(encoding="utf-8")
+    suffix = spec_path.suffix.lower()
+
+    if suffix == ".toml":
+        data = _load_toml(content, spec_path)
+    elif suffix == ".json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Fichier JSON invalide {spec_path}: {e}") from e
+    else:
+        raise ValueError(
+            f"Extension non supportée pour {spec_path}. Formats acceptés : .json, .toml"
+        )
+
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"La spécification {spec_path} doit être un objet (clé/valeur)"
+        )
+    return data
@@ -0,0 +1,350 @@
+"""Générateur de workspace Python (uv/pip) avec plusieurs packages membres."""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pyfastcli.generators.artifacts import Artifact, materialize
+from pyfastcli.generators.package_generator import (
+    _generate_gitignore,
+    _generate_license,
+    _sanitize_package_name,
+    _sanitize_project_name,
+    _validate_email,
+    _validate_python_version,
+    generate_package_structure,
+)
+from pyfastcli.instrumentation import phase
+
+# Dépendances de développement partagées par défaut (groupe dev du workspace)
+DEFAULT_DEV_DEPENDENCIES = ["pytest>=7.0.0", "black>=23.0.0", "ruff>=0.1.0"]
+
+
+def _normalize_members(
+    packages: List[Any], version: str, description: str
+) -> List[Dict[str, Any]]:
+    """
+    Normalise la liste des packages membres.
+
+    Chaque membre est un nom de projet ou un dictionnaire
+    {"name", "package_name", "version", "description", "dependencies",
+    "dev_dependencies", "include_manifest"}.
+
+    Raises:
+        ValueError: Si un membre est invalide ou dupliqué
+    """
+    if not packages:
+        raise ValueError("Le workspace doit contenir au moins un package")
+
+    members = []
+    seen = set()
+    for i, package in enumerate(packages, 1):
+        if isinstance(package, str):
+            package = {"name": package}
+        if not isinstance(package, dict) or not str(package.get("name", "")).strip():
+            raise ValueError(f"Le package n°{i} du workspace doit avoir un nom")
+
+        project_name = _sanitize_project_name(str(package["name"]))
+        if project_name in seen:
+            raise ValueError(f"Le package {project_name} est défini plusieurs fois")
+        seen.add(project_name)
+
+        members.append(
+            {
+                "project_name": project_name,
+                "package_name": _sanitize_package_name(
+                    str(package.get("package_name") or project_name)
+                ),
+                "version": str(package.get("version") or version),
+                "description": str(
+                    package.get("description") or f"{description} : {project_name}"
+                ),
+                "dependencies": list(package.get("dependencies") or []),
+                "dev_dependencies": list(package.get("dev_dependencies") or []),
+                "include_manifest": bool(package.get("include_manifest", True)),
+            }
+        )
+    return members
+
+
+def _workspace_sources(members: List[Dict[str, Any]]) -> List[str]:
+    """Membres utilisés comme dépendances par d'autres membres du workspace."""
+    names = {member["project_name"] for member in members}
+    sources = []
+    for member in members:
+        for dependency in member["dependencies"]:
+            # Nom du projet en tête de la spécification (ex: core-lib>=0.1)
+            name = re.split(r"[\s<>=!~\[;]", dependency.strip(), 1)[0].lower()
+            if name in names and name not in sources:
+                sources.append(name)
+    return sources
+
+
+def generate_workspace_structure(
+    workspace_name: str,
+    packages: List[Any],
+    output_dir: str,
+    author_name: str,
+    author_email: str,
+    version: str = "0.1.0",
+    description: Optional[str] = None,
+    python_version: str = "3.8",
+    license_type: str = "MIT",
+    dev_dependencies: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+) -> str:
+    """
+    Génère un workspace uv/pip contenant plusieurs packages Python.
+
+    La racine contient la configuration partagée (pyproject.toml avec
+    [tool.uv.workspace], outils de qualité, groupe dev), le squelette de
+    verrouillage (Makefile 'lock', requirements-dev.txt pour pip,
+    .python-version) ; chaque membre est généré dans packages/<nom> comme
+    avec make:package. Les membres sont écrits en parallèle.
+
+    Args:
+        workspace_name: Nom du workspace (dossier racine)
+        packages: Packages membres (noms ou dictionnaires, voir
+            _normalize_members)
+        output_dir: Dossier de sortie où créer le workspace
+        author_name: Nom de l'auteur (partagé par les membres)
+        author_email: Email de l'auteur
+        version: Version initiale par défaut des membres
+        description: Description du workspace
+        python_version: Version Python minimale (ex: 3.8)
+        license_type: Type de licence
+        dev_dependencies: Dépendances de développement partagées
+        workers: Nombre de threads d'écriture des membres (défaut : automatique)
+
+    Returns:
+        Chemin du dossier du workspace créé
+
+    Raises:
+        ValueError: Si les paramètres sont invalides
+        FileExistsError: Si le dossier du workspace existe déjà
+        OSError: Si les fichiers ne peuvent pas être créés
+    """
+    # Validation et nettoyage
+    with phase("validation"):
+        workspace_name = _sanitize_project_name(workspace_name)
+        author_email = _validate_email(author_email)
+        python_version = _validate_python_version(python_version)
+        if not description or not description.strip():
+            description = f"Workspace {workspace_name}"
+        if dev_dependencies is None:
+            dev_dependencies = DEFAULT_DEV_DEPENDENCIES
+        members = _normalize_members(packages, version, description)
+
+        workspace_dir = Path(output_dir) / workspace_name
+        if workspace_dir.exists():
+            raise FileExistsError(
+                f"Le dossier {workspace_dir} existe déjà. "
+                "Supprimez-le ou choisissez un autre nom de workspace."
+            )
+
+    packages_dir = workspace_dir / "packages"
+    try:
+        packages_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise OSError(f"Impossible de créer le dossier {workspace_dir}: {e}") from e
+
+    # Configuration partagée à la racine
+    context = {
+        "workspace_name": workspace_name,
+        "description": description,
+        "python_version": python_version,
+        "members": [member["project_name"] for member in members],
+        "sources": _workspace_sources(members),
+        "dev_dependencies": list(dev_dependencies),
+    }
+    materialize(
+        workspace_dir,
+        [
+            Artifact("pyproject.toml", _render_workspace_pyproject, context),
+            Artifact("README.md", _render_workspace_readme, context),
+            Artifact("Makefile", _render_workspace_makefile, context),
+            Artifact("requirements-dev.txt", _render_requirements_dev, context),
+            Artifact(".python-version", _render_python_version, context),
+        ],
+    )
+    _generate_license(workspace_dir, license_type, author_name)
+    _generate_gitignore(workspace_dir)
+
+    # Packages membres, écrits en parallèle
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                generate_package_structure,
+                author_name=author_name,
+                author_email=author_email,
+                python_version=python_version,
+                license_type=license_type,
+                output_dir=str(packages_dir),
+                include_makefile=False,
+                **member,
+            )
+            for member in members
+        ]
+        errors = [future.exception() for future in futures]
+
+    for error in errors:
+        if error is not None:
+            raise error
+
+    return str(workspace_dir)
+
+
+def _toml_list(values: List[str], indent: str = "    ") -> str:
+    """Formate une liste de chaînes TOML sur plusieurs lignes."""
+    if not values:
+        return "[]"
+    lines = "\n".join(f'{indent}"{value}",' for value in values)
+    return f"[\n{lines}\n]"
+
+
+def _render_workspace_pyproject(
+    workspace_name: str,
+    description: str,
+    python_version: str,
+    members: List[str],
+    sources: List[str],
+    dev_dependencies: List[str],
+) -> str:
+    """Rend le pyproject.toml racine (workspace virtuel uv)."""
+    major, minor = python_version.split(".")
+    testpaths = ", ".join(f'"packages/{name}/tests"' for name in members)
+    content = f"""# {description}
+# Racine virtuelle : chaque package de packages/ a son propre pyproject.toml.
+
+[tool.uv.workspace]
+members = ["packages/*"]
+"""
+    if sources:
+        content += "\n[tool.uv.sources]\n"
+        content += "".join(f"{name} = {{ workspace = true }}\n" for name in sources)
+
+    content += f"""
+[dependency-groups]
+dev = {_toml_list(dev_dependencies)}
+
+[tool.pytest.ini_options]
+testpaths = [{testpaths}]
+python_files = ["test_*.py"]
+python_classes = ["Test*"]
+python_functions = ["test_*"]
+# Chaque package a son propre dossier tests/ : évite les conflits de noms
+addopts = "--import-mode=importlib"
+
+[tool.black]
+line-length = 88
+target-version = ['py{major}{minor}']
+include = '\\.pyi?$'
+
+[tool.ruff]
+line-length = 88
+target-version = "py{major}{minor}"
+
+[tool.ruff.lint]
+select = ["E", "F", "I", "N", "W", "UP"]
+ignore = []
+
+[tool.mypy]
+python_version = "{python_version}"
+warn_return_any = true
+warn_unused_configs = true
+disallow_untyped_defs = false
+"""
+    return content
+
+
+def _render_workspace_readme(
+    workspace_name: str, description: str, members: List[str], **_: Any
+) -> str:
+    """Rend le README.md racine."""
+    members_list = "\n".join(f"- [`{name}`](packages/{name})" for name in members)
+    return f"""# {workspace_name}
+
+{description}
+
+## Packages
+
+{members_list}
+
+## Installation
+
+### Avec uv (recommandé)
+
+```bash
+uv lock                 # Crée uv.lock pour tout le workspace
+uv sync --all-packages  # Installe tous les packages et le groupe dev
+```
+
+### Avec pip
+
+```bash
+pip install -r requirements-dev.txt
+```
+
+## Tests
+
+```bash
+make test
+```
+"""
+
+
+def _render_workspace_makefile(members: List[str], **_: Any) -> str:
+    """Rend le Makefile racine (installation, verrouillage, qualité)."""
+    return """# Makefile du workspace
+
+.PHONY: help lock sync install test lint format clean
+
+help:
+	@echo "Commandes disponibles:"
+	@echo "  make lock     - Verrouiller les dépendances (uv.lock)"
+	@echo "  make sync     - Installer le workspace avec uv"
+	@echo "  make install  - Installer le workspace avec pip"
+	@echo "  make test     - Exécuter les tests de tous les packages"
+	@echo "  make lint     - Vérifier le code avec ruff"
+	@echo "  make format   - Formater le code avec black"
+	@echo "  make clean    - Nettoyer les fichiers générés"
+
+lock:
+	uv lock
+
+sync:
+	uv sync --all-packages
+
+install:
+	pip install -r requirements-dev.txt
+
+test:
+	pytest
+
+lint:
+	ruff check packages
+
+format:
+	black packages
+
+clean:
+	rm -rf .pytest_cache .mypy_cache .ruff_cache
+	find . -type d -name __pycache__ -exec rm -r {} +
+	find . -type d -name "*.egg-info" -exec rm -r {} +
+"""
+
+
+def _render_requirements_dev(
+    members: List[str], dev_dependencies: List[str], **_: Any
+) -> str:
+    """Rend requirements-dev.txt (installation pip éditable des membres)."""
+    lines = ["# Installation pip du workspace (équivalent de uv sync)"]
+    lines += [f"-e ./packages/{name}" for name in members]
+    lines += dev_dependencies
+    return "\n".join(lines) + "\n"
+
+
+def _render_python_version(python_version: str, **_: Any) -> str:
+    """Rend .python-version (utilisé par uv et pyenv)."""
+    return f"{python_version}\n"
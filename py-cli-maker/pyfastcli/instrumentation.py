@@ -0,0 +1,229 @@
+"""Instrumentation des générateurs : phases, fichiers écrits et compteurs.
+
+Les générateurs signalent leurs phases (discovery, validation, rendering,
+writing) via ``phase()``, décorent leurs fonctions de rendu avec
+``rendering`` et écrivent leurs fichiers via ``write_text()``. Sans
+instrumentation active (cas par défaut), ces appels ne coûtent qu'un test
+sur une variable globale.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from pyfastcli.content_store import get_content_store
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Phases standard, dans l'ordre d'affichage
+PHASES = ["discovery", "validation", "rendering", "writing"]
+
+
+class Instrumentation:
+    """
+    Collecte les durées des phases de génération.
+
+    Les durées sont exclusives : le temps passé dans une phase imbriquée
+    (ex: writing dans rendering) n'est compté que pour la phase imbriquée.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.helpers: Dict[str, float] = {}
+        self.files: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self.started_at = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[List]:
+        """Pile des phases en cours du thread courant ([nom, reprise])."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _add(self, name: str, duration: float):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + duration
+        if name == "rendering":
+            # Temps de rendu en attente d'attribution au prochain fichier écrit
+            self._local.pending_render = self._pending_render() + duration
+
+    def _pending_render(self) -> float:
+        return getattr(self._local, "pending_render", 0.0)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mesure le temps exclusif passé dans une phase."""
+        stack = self._stack()
+        now = time.perf_counter()
+        if stack:
+            parent = stack[-1]
+            self._add(parent[0], now - parent[1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            current = stack.pop()
+            self._add(current[0], now - current[1])
+            if stack:
+                stack[-1][1] = now
+
+    def add_helper(self, name: str, duration: float):
+        """Cumule la durée (inclusive) d'une fonction de rendu."""
+        with self._lock:
+            self.helpers[name] = self.helpers.get(name, 0.0) + duration
+
+    def record_file(self, path: Path, size: int, write_duration: float):
+        """
+        Enregistre un fichier écrit.
+
+        Le temps de rendu attribué au fichier est le temps passé dans la
+        phase 'rendering' (dans le même thread) depuis l'écriture précédente.
+        """
+        render_duration = self._pending_render()
+        self._local.pending_render = 0.0
+        with self._lock:
+            self.files.append(
+                {
+                    "path": str(path),
+                    "bytes": size,
+                    "render_duration": render_duration,
+                    "write_duration": write_duration,
+                }
+            )
+
+    def count(self, name: str, increment: int = 1):
+        """Incrémente un compteur (ex: cache_hits, cache_misses)."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + increment
+
+    def elapsed(self) -> float:
+        """Durée totale depuis le début de l'instrumentation."""
+        return time.perf_counter() - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rapport sérialisable en JSON (voir l'option --metrics-json)."""
+        with self._lock:
+            files = list(self.files)
+            return {
+                "total_duration": self.elapsed(),
+                "phases": dict({name: 0.0 for name in PHASES}, **self.phases),
+                "discovery_duration": self.phases.get("discovery", 0.0),
+                "files_written": len(files),
+                "bytes_written": sum(entry["bytes"] for entry in files),
+                "files": files,
+                "helpers": dict(self.helpers),
+                "cache": {
+                    "hits": self.counters.get("cache_hits", 0),
+                    "misses": self.counters.get("cache_misses", 0),
+                },
+                "counters": dict(self.counters),
+            }
+
+
+_current: Optional[Instrumentation] = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """Retourne l'instrumentation active, ou None."""
+    return _current
+
+
+@contextmanager
+def instrument() -> Iterator[Instrumentation]:
+    """Active une nouvelle instrumentation pour la durée du bloc."""
+    global _current
+    previous = _current
+    _current = Instrumentation()
+    try:
+        yield _current
+    finally:
+        _current = previous
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Signale une phase de génération (utilisable aussi comme décorateur).
+
+    Args:
+        name: Nom de la phase (voir PHASES)
+    """
+    instrumentation = _current
+    if instrumentation is None:
+        yield
+        return
+    with instrumentation.phase(name):
+        yield
+
+
+def rendering(func: F) -> F:
+    """
+    Décorateur des fonctions de rendu : phase 'rendering' et durée par fonction.
+
+    Args:
+        func: Fonction de rendu (ex: _generate_models)
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        instrumentation = _current
+        if instrumentation is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            with instrumentation.phase("rendering"):
+                return func(*args, **kwargs)
+        finally:
+            instrumentation.add_helper(func.__qualname__, time.perf_counter() - start)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def count(name: str, increment: int = 1):
+    """Incrémente un compteur de l'instrumentation active, s'il y en a une."""
+    instrumentation = _current
+    if instrumentation is not None:
+        instrumentation.count(name, increment)
+
+
+def _write_file(path: Path, content: str) -> int:
+    """
+    Écrit le fichier (via le magasin de contenu s'il est actif).
+
+    Un fichier existant partagé par lien physique est d'abord détaché, pour
+    ne jamais modifier les autres fichiers liés.
+
+    Returns:
+        Nombre d'octets écrits
+    """
+    data = content.encode("utf-8")
+    store = get_content_store()
+    if store is not None:
+        count(f"store_{store.materialize(data, path)}")
+        return len(data)
+    try:
+        if os.lstat(path).st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+    path.write_text(content, encoding="utf-8")
+    return len(data)
+
+
+def write_text(path: Path, content: str):
+    """Écrit un fichier généré (UTF-8) dans la phase 'writing'."""
+    instrumentation = _current
+    if instrumentation is None:
+        _write_file(path, content)
+        return
+    start = time.perf_counter()
+    with instrumentation.phase("writing"):
+        size = _write_file(path, content)
+    instrumentation.record_file(path, size, time.perf_counter() - start)
@@ -0,0 +1,57 @@
+"""Rapport de métriques JSON des commandes (option globale --metrics-json)."""
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import click
+
+from pyfastcli.instrumentation import Instrumentation, instrument
+
+
+def build_metrics_report(
+    instrumentation: Instrumentation,
+    command: Optional[str] = None,
+    success: bool = True,
+) -> Dict[str, Any]:
+    """
+    Construit le rapport de métriques d'une exécution.
+
+    Args:
+        instrumentation: Instrumentation de l'exécution
+        command: Nom de la commande exécutée
+        success: False si la commande s'est terminée en erreur
+
+    Returns:
+        Dictionnaire sérialisable en JSON
+    """
+    return dict({"command": command, "success": success}, **instrumentation.to_dict())
+
+
+@contextmanager
+def metrics_session(
+    output: str, command: Optional[str] = None
+) -> Iterator[Instrumentation]:
+    """
+    Instrumente le bloc puis écrit le rapport JSON.
+
+    Args:
+        output: Fichier de sortie, ou '-' pour stderr
+        command: Nom de la commande exécutée
+    """
+    success = False
+    with instrument() as instrumentation:
+        try:
+            yield instrumentation
+            success = True
+        finally:
+            report = json.dumps(
+                build_metrics_report(instrumentation, command, success),
+                ensure_ascii=False,
+                indent=2,
+            )
+            if output == "-":
+                click.echo(report, err=True)
+            else:
+                Path(output).write_text(report + "\n", encoding="utf-8")
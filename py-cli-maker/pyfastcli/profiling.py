@@ -0,0 +1,181 @@
+"""Profilage des commandes (option globale --profile)."""
+
+import cProfile
+import importlib.util
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Iterator, Optional
+
+import click
+
+from pyfastcli.instrumentation import (
+    PHASES,
+    Instrumentation,
+    get_instrumentation,
+    instrument,
+)
+
+# Extension du fichier de sortie par défaut selon le format
+PROFILE_FORMATS = {"prof": "pyfastcli.prof", "collapsed": "pyfastcli.collapsed"}
+
+
+class StackSampler:
+    """
+    Profileur par échantillonnage sans dépendance, utilisé si pyinstrument
+    n'est pas installé (voir make_sampler).
+
+    Un thread relève périodiquement la pile du thread profilé et compte les
+    piles identiques. Le résultat est écrit au format « collapsed stacks »
+    (une ligne ``frame;frame;frame N`` par pile), lisible par flamegraph.pl,
+    speedscope ou inferno.
+    """
+
+    name = "interne"
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, output: Path):
+        """Écrit les piles échantillonnées au format collapsed."""
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class PyinstrumentSampler:
+    """
+    Profileur par échantillonnage reposant sur pyinstrument.
+
+    Les piles relevées par pyinstrument sont écrites au même format
+    collapsed que StackSampler, en nombre d'intervalles d'échantillonnage.
+    """
+
+    name = "pyinstrument"
+
+    def __init__(self, interval: float = 0.001):
+        from pyinstrument import Profiler
+
+        self.interval = interval
+        self._profiler = Profiler(interval=interval)
+
+    def start(self):
+        self._profiler.start()
+
+    def stop(self):
+        self._profiler.stop()
+
+    def _collect(self, frame, stack, samples: Counter):
+        if not frame.is_synthetic:
+            stack = stack + [f"{frame.function} ({frame.file_path}:{frame.line_no})"]
+        own = frame.time - sum(child.time for child in frame.children)
+        count = round(own / self.interval)
+        if count > 0 and stack:
+            samples[";".join(stack)] += count
+        for child in frame.children:
+            self._collect(child, stack, samples)
+
+    def write(self, output: Path):
+        """Écrit les piles échantillonnées au format collapsed."""
+        samples: Counter = Counter()
+        root = self._profiler.last_session.root_frame()
+        if root is not None:
+            self._collect(root, [], samples)
+        lines = [f"{stack} {count}" for stack, count in samples.most_common()]
+        output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def make_sampler():
+    """Échantillonneur du format collapsed : pyinstrument s'il est installé."""
+    if importlib.util.find_spec("pyinstrument") is not None:
+        return PyinstrumentSampler()
+    return StackSampler()
+
+
+def format_phase_breakdown(instrumentation: Instrumentation) -> str:
+    """Formate la répartition du temps par phase de génération."""
+    total = instrumentation.elapsed()
+    phases = dict(instrumentation.phases)
+    names = PHASES + sorted(name for name in phases if name not in PHASES)
+    lines = ["Répartition par phase :"]
+    for name in names:
+        duration = phases.get(name, 0.0)
+        share = (duration / total * 100) if total else 0.0
+        lines.append(f"  {name:<12} {duration:8.4f}s  {share:5.1f}%")
+    other = max(total - sum(phases.values()), 0.0)
+    lines.append(f"  {'autres':<12} {other:8.4f}s")
+    lines.append(f"  {'total':<12} {total:8.4f}s")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_session(
+    output: Optional[str] = None, fmt: str = "prof"
+) -> Iterator[Instrumentation]:
+    """
+    Profile le bloc et affiche la répartition par phase sur stderr.
+
+    Réutilise l'instrumentation active (ex: --metrics-json) s'il y en a une.
+
+    Args:
+        output: Fichier de sortie (défaut selon le format, voir PROFILE_FORMATS)
+        fmt: 'prof' (cProfile, lisible par pstats/snakeviz) ou 'collapsed'
+            (échantillonnage par pyinstrument s'il est installé, sinon par
+            StackSampler ; compatible flamegraph)
+    """
+    output_path = Path(output or PROFILE_FORMATS[fmt])
+    profiler = cProfile.Profile() if fmt == "prof" else None
+    sampler = make_sampler() if fmt == "collapsed" else None
+
+    active = get_instrumentation()
+    with nullcontext(active) if active else instrument() as instrumentation:
+        if profiler is not None:
+            profiler.enable()
+        if sampler is not None:
+            sampler.start()
+        start = time.perf_counter()
+        try:
+            yield instrumentation
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(str(output_path))
+            if sampler is not None:
+                sampler.stop()
+                sampler.write(output_path)
+            source = f", échantillonneur {sampler.name}" if sampler else ""
+            click.echo(
+                click.style(
+                    f"\n⏱️  Profil écrit dans {output_path} "
+                    f"({time.perf_counter() - start:.3f}s{source})",
+                    fg="cyan",
+                ),
+                err=True,
+            )
+            click.echo(format_phase_breakdown(instrumentation), err=True)
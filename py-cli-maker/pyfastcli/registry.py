@@ -0,0 +1,282 @@
+"""Registre des générateurs : commandes intégrées et plugins (entry points).
+
+Les commandes sont déclarées par leur référence ``module:attribut`` et ne
+sont importées qu'au moment de leur exécution. Les plugins externes sont
+découverts via le groupe d'entry points ``pyfastcli.generators`` en lisant
+uniquement les métadonnées des distributions installées, sans importer leur
+code ::
+
+    [project.entry-points."pyfastcli.generators"]
+    "make:api" = "mon_plugin.commands:make_api"
+
+Les commandes disponibles et leur aide sont conservées dans un index
+persistant (``<cache pyfastcli>/commands.json``), invalidé par l'empreinte
+des distributions installées : ``--help`` et la complétion n'ont alors ni à
+parcourir ``importlib.metadata`` ni à importer les commandes.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import click
+
+from pyfastcli import __version__
+
+# Groupe d'entry points des générateurs externes
+ENTRY_POINT_GROUP = "pyfastcli.generators"
+
+# Commandes intégrées : nom -> référence "module:attribut"
+BUILTIN_COMMANDS: Dict[str, str] = {
+    "make:url": "pyfastcli.commands.url_command:make_url",
+    "make:package": "pyfastcli.commands.package_command:make_package",
+    "make:domaine": "pyfastcli.commands.domaine_command:make_domaine",
+    "make:domaine-ddd": "pyfastcli.commands.domaine_ddd_command:make_domaine_ddd",
+    "make:model": "pyfastcli.commands.model_command:make_model",
+    "make:workspace": "pyfastcli.commands.workspace_command:make_workspace",
+    "fanout": "pyfastcli.commands.fanout_command:fanout",
+    "completion": "pyfastcli.commands.completion_command:completion",
+}
+
+# Version du format de l'index des commandes
+INDEX_VERSION = 1
+
+
+def _installed_entry_points():
+    """Entry points installés (import différé de importlib.metadata, coûteux)."""
+    from importlib.metadata import entry_points
+
+    return entry_points()
+
+
+@lru_cache(maxsize=None)
+def discover_plugins() -> Dict[str, str]:
+    """
+    Découvre les générateurs déclarés par les distributions installées.
+
+    Seules les métadonnées sont lues (aucun import) ; le résultat est mis en
+    cache pour la durée du processus. Les noms déjà pris par une commande
+    intégrée sont ignorés.
+
+    Returns:
+        Dictionnaire nom de commande -> référence "module:attribut"
+    """
+    eps = _installed_entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group=ENTRY_POINT_GROUP)
+    else:  # pragma: no cover - Python < 3.10 (dictionnaire par groupe)
+        group = eps.get(ENTRY_POINT_GROUP, [])
+
+    plugins: Dict[str, str] = {}
+    for entry_point in group:
+        if entry_point.name not in BUILTIN_COMMANDS:
+            plugins.setdefault(entry_point.name, entry_point.value)
+    return plugins
+
+
+def installed_fingerprint() -> str:
+    """
+    Empreinte des distributions installées, calculée sans lire leurs métadonnées.
+
+    Installer ou désinstaller une distribution ajoute ou retire un dossier
+    ``*.dist-info`` (ou un fichier ``.pth``) dans un dossier de sys.path, ce
+    qui change sa date de modification. Le dossier courant est ignoré (la
+    génération y écrit) ; les modules des commandes intégrées sont inclus
+    pour les installations éditables.
+    """
+    try:
+        cwd = os.getcwd()
+    except OSError:
+        cwd = ""
+    parts = [sys.version, __version__]
+    for entry in sys.path:
+        path = os.path.abspath(entry or cwd)
+        if path == cwd:
+            continue
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    for path in sorted((Path(__file__).parent / "commands").glob("*.py")):
+        parts.append(f"{path.name}:{path.stat().st_mtime_ns}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def index_path() -> Path:
+    """Fichier de l'index persistant des commandes."""
+    # Import différé : le démarrage de la CLI ne charge pas le cache de rendu
+    from pyfastcli.render_cache import default_cache_dir
+
+    return default_cache_dir() / "commands.json"
+
+
+def _build_index() -> Dict[str, Dict[str, Any]]:
+    """Construit l'index : importe chaque commande une fois pour lire son aide."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for name, reference in dict(BUILTIN_COMMANDS, **discover_plugins()).items():
+        entry = {"reference": reference, "help": "", "short_help": "", "hidden": False}
+        try:
+            command = load_command(reference)
+        except Exception:
+            # Plugin défaillant : l'erreur sera affichée à son exécution
+            pass
+        else:
+            entry["help"] = command.help or ""
+            entry["short_help"] = command.short_help or ""
+            entry["hidden"] = command.hidden
+        index[name] = entry
+    return index
+
+
+def _write_index(path: Path, data: Dict[str, Any]):
+    """Écrit l'index (écriture atomique, erreurs ignorées)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(data, tmp_file, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except OSError:
+        # L'index est une optimisation : un échec d'écriture n'est pas fatal
+        pass
+
+
+@lru_cache(maxsize=None)
+def command_index() -> Dict[str, Dict[str, Any]]:
+    """
+    Index des commandes disponibles (intégrées puis plugins).
+
+    L'index persistant est réutilisé tant que l'empreinte des distributions
+    installées est inchangée, sinon il est reconstruit puis enregistré.
+
+    Returns:
+        Dictionnaire nom de commande -> {"reference", "help", "short_help",
+        "hidden"}
+    """
+    fingerprint = installed_fingerprint()
+    path = index_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["version"] == INDEX_VERSION and data["fingerprint"] == fingerprint:
+            return data["commands"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    commands = _build_index()
+    _write_index(
+        path,
+        {"version": INDEX_VERSION, "fingerprint": fingerprint, "commands": commands},
+    )
+    return commands
+
+
+def command_references() -> Dict[str, str]:
+    """Toutes les commandes disponibles : intégrées puis plugins."""
+    return {name: entry["reference"] for name, entry in command_index().items()}
+
+
+def load_command(reference: str) -> click.Command:
+    """
+    Importe une commande depuis sa référence "module:attribut".
+
+    Raises:
+        ImportError: Si le module ne peut pas être importé
+        AttributeError: Si l'attribut n'existe pas
+        TypeError: Si l'objet n'est pas une commande click
+    """
+    module_name, _, attribute = reference.partition(":")
+    command = importlib.import_module(module_name.strip())
+    for part in attribute.strip().split("."):
+        command = getattr(command, part)
+    if not isinstance(command, click.Command):
+        raise TypeError(f"{reference} n'est pas une commande click")
+    return command
+
+
+class LazyGroup(click.Group):
+    """
+    Groupe click dont les sous-commandes sont importées à la demande.
+
+    Les commandes ajoutées avec add_command restent prioritaires sur le
+    registre. L'aide du groupe et la complétion des noms de commandes
+    utilisent l'index persistant, sans importer les commandes.
+    """
+
+    def _summary(self, cmd_name: str) -> Optional[click.Command]:
+        """Commande déjà chargée, ou résumé construit depuis l'index."""
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        entry = command_index().get(cmd_name)
+        if entry is None:
+            return None
+        return click.Command(
+            cmd_name,
+            help=entry["help"] or None,
+            short_help=entry["short_help"] or None,
+            hidden=entry["hidden"],
+        )
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(command_references()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+
+        reference = command_references().get(cmd_name)
+        if reference is None:
+            return None
+        try:
+            command = load_command(reference)
+        except (ImportError, AttributeError, TypeError) as e:
+            click.echo(
+                click.style(
+                    f"❌ Impossible de charger le générateur {cmd_name} "
+                    f"({reference}) : {e}",
+                    fg="red",
+                ),
+                err=True,
+            )
+            raise click.Abort()
+
+        # Mémorise la commande chargée pour les appels suivants
+        self.commands[cmd_name] = command
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        commands = []
+        for subcommand in self.list_commands(ctx):
+            command = self._summary(subcommand)
+            if command is not None and not command.hidden:
+                commands.append((subcommand, command))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [
+                (name, command.get_short_help_str(limit)) for name, command in commands
+            ]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for name in self.list_commands(ctx):
+            command = self._summary(name)
+            if (
+                command is not None
+                and not command.hidden
+                and name.startswith(incomplete)
+            ):
+                results.append(CompletionItem(name, help=command.get_short_help_str()))
+        # Complétion des options du groupe
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
@@ -0,0 +1,234 @@
+"""Cache de rendu persistant, adressé par contenu, partagé entre exécutions.
+
+Le contenu rendu d'un artefact est stocké sous une clé dérivée de
+(empreinte de la fonction de rendu, empreinte du contexte). L'empreinte de
+la fonction couvre la version de pyfastcli et le source de son module et des
+modules pyfastcli dont il importe des helpers ou des constantes. Le cache est
+stocké sous ``~/.cache/pyfastcli/render`` (ou ``$XDG_CACHE_HOME``, ou
+``$PYFASTCLI_CACHE_DIR``) et borné en taille : les entrées les moins
+récemment utilisées sont évincées en fin de session.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import click
+
+from pyfastcli import __version__
+
+# Taille maximale par défaut du cache (octets)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Empreintes des sources de modules, calculées une fois par processus
+_module_hashes: Dict[str, str] = {}
+
+
+def _module_source_hash(module_name: str) -> str:
+    """Empreinte du fichier source d'un module (mémoïsée)."""
+    digest = _module_hashes.get(module_name)
+    if digest is None:
+        module = sys.modules.get(module_name)
+        try:
+            source = Path(module.__file__).read_bytes()  # type: ignore[union-attr]
+        except (AttributeError, OSError, TypeError):
+            source = module_name.encode("utf-8")
+        digest = hashlib.sha256(source).hexdigest()
+        _module_hashes[module_name] = digest
+    return digest
+
+
+def _dependent_modules(module_name: str) -> List[str]:
+    """
+    Modules pyfastcli dont dépend un module de rendu.
+
+    Le module lui-même, et ceux dont il importe des fonctions, classes ou
+    sous-modules (ex: fragments pour _render_page).
+    """
+    names = {module_name}
+    module = sys.modules.get(module_name)
+    for value in vars(module).values() if module else []:
+        name = (
+            value.__name__
+            if inspect.ismodule(value)
+            else getattr(value, "__module__", None)
+        )
+        if isinstance(name, str) and name.split(".")[0] == "pyfastcli":
+            names.add(name)
+    return sorted(names)
+
+
+def default_cache_dir() -> Path:
+    """Dossier racine du cache pyfastcli."""
+    if os.environ.get("PYFASTCLI_CACHE_DIR"):
+        return Path(os.environ["PYFASTCLI_CACHE_DIR"]).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser() / "pyfastcli"
+
+
+class RenderCache:
+    """
+    Cache de rendu sur disque avec éviction LRU bornée en taille.
+
+    Chaque entrée est un fichier ``<clé[:2]>/<clé>`` ; sa date de modification
+    sert de date de dernier accès pour l'éviction.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._template_hashes: Dict[Callable[..., str], str] = {}
+
+    def template_hash(self, render: Callable[..., str]) -> str:
+        """
+        Empreinte de la fonction de rendu (mémoïsée).
+
+        Dérivée de la version de pyfastcli, du nom qualifié de la fonction et
+        du source des modules dont elle dépend (voir _dependent_modules) :
+        une mise à jour de pyfastcli ou la modification d'un helper ou d'une
+        constante (ex: FRAGMENT_CACHE_TIMEOUT) invalide les entrées.
+        """
+        # Les décorateurs (ex: instrumentation.rendering) exposent __wrapped__
+        render = inspect.unwrap(render)
+        digest = self._template_hashes.get(render)
+        if digest is None:
+            parts = [__version__, f"{render.__module__}.{render.__qualname__}"]
+            parts += [
+                f"{name}={_module_source_hash(name)}"
+                for name in _dependent_modules(render.__module__)
+            ]
+            digest = hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+            self._template_hashes[render] = digest
+        return digest
+
+    def key(self, render: Callable[..., str], context: Dict[str, Any]) -> str:
+        """Clé d'une entrée : (empreinte du template, empreinte du contexte)."""
+        context_hash = hashlib.sha256(
+            json.dumps(context, sort_keys=True, default=repr).encode("utf-8")
+        ).hexdigest()
+        return hashlib.sha256(
+            f"{self.template_hash(render)}:{context_hash}".encode()
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        """Retourne le contenu en cache (et le marque utilisé), ou None."""
+        path = self._path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return content
+
+    def set(self, key: str, content: str):
+        """Stocke un contenu rendu (écriture atomique, erreurs ignorées)."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_name, path)
+        except OSError:
+            # Le cache est une optimisation : un échec d'écriture n'est pas fatal
+            pass
+
+    def get_or_render(self, render: Callable[..., str], context: Dict[str, Any]) -> str:
+        """Retourne le rendu en cache ou rend puis stocke le résultat."""
+        key = self.key(render, context)
+        content = self.get(key)
+        if content is None:
+            content = render(**context)
+            self.set(key, content)
+        return content
+
+    def prune(self) -> int:
+        """
+        Évince les entrées les moins récemment utilisées au-delà de max_bytes.
+
+        Returns:
+            Nombre d'entrées évincées
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("??/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        return evicted
+
+
+_current: Optional[RenderCache] = None
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Retourne le cache de rendu actif, ou None."""
+    return _current
+
+
+@contextmanager
+def render_cache(
+    directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Iterator[RenderCache]:
+    """
+    Active le cache de rendu pour la durée du bloc, puis applique l'éviction.
+
+    Args:
+        directory: Dossier du cache (défaut : <cache pyfastcli>/render)
+        max_bytes: Taille maximale du cache en octets
+    """
+    global _current
+    previous = _current
+    cache_dir = Path(directory) if directory else default_cache_dir() / "render"
+    _current = RenderCache(cache_dir, max_bytes)
+    try:
+        yield _current
+    finally:
+        cache, _current = _current, previous
+        cache.prune()
+
+
+@contextmanager
+def cache_session(
+    directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Iterator[RenderCache]:
+    """Active le cache de rendu et affiche ses succès/échecs sur stderr."""
+    with render_cache(directory, max_bytes) as cache:
+        try:
+            yield cache
+        finally:
+            click.echo(
+                click.style(
+                    f"🗄️  Cache de rendu ({cache.directory}) : "
+                    f"{cache.hits} succès, {cache.misses} échec(s)",
+                    fg="cyan",
+                ),
+                err=True,
+            )
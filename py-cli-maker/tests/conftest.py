@@ -0,0 +1,14 @@
+"""Configuration commune des tests."""
+
+import pytest
+
+from pyfastcli.registry import command_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Isole le cache pyfastcli (index des commandes...) dans un dossier temporaire."""
+    monkeypatch.setenv("PYFASTCLI_CACHE_DIR", str(tmp_path / "pyfastcli-cache"))
+    command_index.cache_clear()
+    yield
+    command_index.cache_clear()
@@ -0,0 +1,112 @@
+"""Tests pour le cœur de rendu commun (graphe d'artefacts)."""
+
+import pytest
+
+from pyfastcli.generators.artifacts import Artifact, materialize, order_artifacts
+from pyfastcli.generators.ddd_domaine_generator import _ddd_artifacts
+from pyfastcli.generators.domaine_generator import _domaine_artifacts
+from pyfastcli.generators.fragments import render_admin_py, render_liste_html
+
+
+def _render_text(text: str) -> str:
+    return text
+
+
+class TestOrderArtifacts:
+    """Tests pour le tri des artefacts selon leurs dépendances."""
+
+    def test_dependencies_first(self):
+        """Test qu'une dépendance est générée avant ses dépendants."""
+        artifacts = [
+            Artifact("admin.py", _render_text, {"text": "a"}, ("models.py",)),
+            Artifact("models.py", _render_text, {"text": "m"}),
+            Artifact("apps.py", _render_text, {"text": "c"}),
+        ]
+
+        ordered = [artifact.path for artifact in order_artifacts(artifacts)]
+
+        assert ordered == ["models.py", "admin.py", "apps.py"]
+
+    def test_unknown_dependency(self):
+        """Test d'une dépendance inconnue."""
+        artifacts = [Artifact("admin.py", _render_text, {"text": ""}, ("x.py",))]
+
+        with pytest.raises(ValueError, match="Dépendance inconnue"):
+            order_artifacts(artifacts)
+
+    def test_cycle(self):
+        """Test d'une dépendance cyclique."""
+        artifacts = [
+            Artifact("a.py", _render_text, {"text": ""}, ("b.py",)),
+            Artifact("b.py", _render_text, {"text": ""}, ("a.py",)),
+        ]
+
+        with pytest.raises(ValueError, match="cyclique"):
+            order_artifacts(artifacts)
+
+    def test_duplicate_path(self):
+        """Test d'un chemin dupliqué."""
+        artifacts = [
+            Artifact("a.py", _render_text, {"text": ""}),
+            Artifact("a.py", _render_text, {"text": ""}),
+        ]
+
+        with pytest.raises(ValueError, match="dupliqué"):
+            order_artifacts(artifacts)
+
+
+class TestMaterialize:
+    """Tests pour l'écriture des artefacts."""
+
+    def test_materialize_creates_directories(self, tmp_path):
+        """Test de la création des sous-dossiers et du contenu."""
+        artifacts = [
+            Artifact("domain/__init__.py", _render_text, {"text": ""}),
+            Artifact("templates/app/liste.html", _render_text, {"text": "<ul>"}),
+        ]
+
+        written = materialize(tmp_path, artifacts)
+
+        assert written == [
+            str(tmp_path / "domain" / "__init__.py"),
+            str(tmp_path / "templates" / "app" / "liste.html"),
+        ]
+        assert (tmp_path / "templates" / "app" / "liste.html").read_text() == "<ul>"
+
+
+class TestPresets:
+    """Tests pour les préréglages des générateurs de domaine."""
+
+    def test_presets_share_fragments(self):
+        """Test que les deux générateurs partagent les fragments communs."""
+        domaine = {a.path: a for a in _domaine_artifacts("pratique", "Pratique")}
+        ddd = {a.path: a for a in _ddd_artifacts("pratique", "Pratique")}
+
+        for path in ["admin.py", "templates/pratique/liste.html"]:
+            assert domaine[path].render is ddd[path].render
+        assert domaine["admin.py"].render is render_admin_py
+        assert ddd["templates/pratique/liste.html"].render is render_liste_html
+        assert ddd["admin.py"].context["models_module"] == "pratique.domain.models"
+
+    def test_domaine_options(self):
+        """Test des options du préréglage classique."""
+        paths = {
+            a.path
+            for a in _domaine_artifacts(
+                "pratique", "Pratique", include_services=False, include_selectors=False
+            )
+        }
+
+        assert "models.py" in paths
+        assert "services.py" not in paths
+        assert "selectors.py" not in paths
+
+    def test_ddd_options(self):
+        """Test des options du préréglage DDD."""
+        paths = {
+            a.path
+            for a in _ddd_artifacts("pratique", "Pratique", include_serializers=False)
+        }
+
+        assert "presentation/urls.py" in paths
+        assert "presentation/serializers.py" not in paths
@@ -0,0 +1,96 @@
+"""Tests pour l'exécution des spécifications de lot."""
+
+from pathlib import Path
+
+import pytest
+
+from pyfastcli.generators.batch_generator import (
+    run_batch_spec,
+    run_project,
+    validate_batch_spec,
+)
+
+SPEC = {
+    "steps": [
+        {"generator": "domaine", "app_name": "pratique", "model_name": "Pratique"},
+        {
+            "generator": "models",
+            "app_name": "blog",
+            "models": [
+                {"name": "Article", "fields": ["titre:CharField"]},
+            ],
+        },
+        {
+            "generator": "url",
+            "function_name": "get_orders",
+            "url_path": "/orders",
+            "output_dir": "api/routes",
+        },
+    ]
+}
+
+
+class TestValidateBatchSpec:
+    """Tests pour la validation des spécifications de lot."""
+
+    def test_valid_spec(self):
+        """Test d'une spécification valide."""
+        assert len(validate_batch_spec(SPEC)) == 3
+
+    def test_missing_steps(self):
+        """Test d'une spécification sans étapes."""
+        with pytest.raises(ValueError, match="steps"):
+            validate_batch_spec({})
+
+    def test_unknown_generator(self):
+        """Test d'un générateur inconnu."""
+        with pytest.raises(ValueError, match="Générateur inconnu"):
+            validate_batch_spec({"steps": [{"generator": "inconnu"}]})
+
+
+class TestRunBatchSpec:
+    """Tests pour l'exécution d'une spécification sur un projet."""
+
+    def test_run_all_steps(self, tmp_path):
+        """Test que chaque étape est générée relativement au projet."""
+        generated = run_batch_spec(SPEC, str(tmp_path))
+
+        assert str(tmp_path / "pratique") in generated
+        assert (tmp_path / "pratique" / "models.py").exists()
+        assert (tmp_path / "blog" / "models.py").exists()
+        assert (tmp_path / "api" / "routes" / "get_orders.py").exists()
+
+    def test_missing_project(self, tmp_path):
+        """Test d'un projet inexistant."""
+        with pytest.raises(OSError, match="n'existe pas"):
+            run_batch_spec(SPEC, str(tmp_path / "absent"))
+
+    def test_run_project_isolates_errors(self, tmp_path):
+        """Test que run_project retourne l'erreur au lieu de la lever."""
+        (tmp_path / "pratique").mkdir()
+
+        result = run_project(SPEC, str(tmp_path))
+
+        assert result["project"] == str(tmp_path)
+        assert result["error"].startswith("FileExistsError")
+        assert result["duration"] >= 0
+
+    def test_run_project_keeps_partial_files(self, tmp_path):
+        """Test que les fichiers des étapes réussies restent dans le rapport."""
+        (tmp_path / "api" / "routes").mkdir(parents=True)
+        (tmp_path / "api" / "routes" / "get_orders.py").write_text("")
+
+        result = run_project(SPEC, str(tmp_path))
+
+        assert result["error"].startswith("FileExistsError")
+        assert result["files"] == [
+            str(tmp_path / "pratique"),
+            str(tmp_path / "blog" / "models.py"),
+        ]
+
+    def test_run_project_success(self, tmp_path):
+        """Test du rapport d'un projet généré sans erreur."""
+        result = run_project(SPEC, str(tmp_path))
+
+        assert result["error"] is None
+        assert Path(result["files"][0]).name == "pratique"
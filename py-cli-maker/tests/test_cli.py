@@ -1,5 +1,6 @@
 """Tests pour l'interface CLI."""
 
+import json
 import shutil
 import tempfile
 from pathlib import Path
@@ -68,6 +69,72 @@ class TestCLI:
         assert '@router.get("/orders")' in content
         assert "Récupère les commandes" in content
 
+    def test_make_url_conditional(self):
+        """Test de make:url avec --conditional."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "--function-name",
+                "get_orders",
+                "--url-path",
+                "/orders",
+                "--output-dir",
+                str(self.output_dir),
+                "--description",
+                "Commandes",
+                "--conditional",
+                "orders.Order",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert (self.output_dir / "cache_http.py").exists()
+        content = (self.output_dir / "get_orders.py").read_text(encoding="utf-8")
+        assert "@decorate_view(conditionnel(get_orders_queryset))" in content
+
+    def test_make_url_throttle(self):
+        """Test de make:url avec --throttle."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "--function-name",
+                "get_orders",
+                "--url-path",
+                "/orders",
+                "--output-dir",
+                str(self.output_dir),
+                "--description",
+                "Commandes",
+                "--throttle",
+                "100/min",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert (self.output_dir / "limite_http.py").exists()
+
+    def test_make_url_invalid_throttle(self):
+        """Test du refus d'un débit invalide."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "--function-name",
+                "get_orders",
+                "--output-dir",
+                str(self.output_dir),
+                "--description",
+                "Commandes",
+                "--throttle",
+                "100",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Débit invalide" in result.output
+
     def test_make_url_interactive(self):
         """Test de la génération en mode interactif."""
         # Simuler les réponses interactives
@@ -171,6 +238,136 @@ class TestCLI:
             content = file_path.read_text(encoding="utf-8")
             assert f"@router.{method}(" in content
 
+    def _make_url(self, function_name, url_path, http_method="get"):
+        """Génère une route dans un projet temporaire (--project-dir)."""
+        return self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "-f",
+                function_name,
+                "-u",
+                url_path,
+                "-M",
+                http_method,
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Route de test",
+                "--project-dir",
+                self.temp_dir,
+            ],
+        )
+
+    def test_make_url_route_conflict(self):
+        """Test du refus d'une route (méthode, chemin) déjà déclarée."""
+        assert self._make_url("get_orders", "/orders").exit_code == 0
+        assert self._make_url("get_order", "/orders/{order_id}").exit_code == 0
+
+        result = self._make_url("list_orders", "/orders")
+
+        assert result.exit_code != 0
+        assert "Conflit de route : GET /orders" in result.output
+        assert "get_orders (routes/get_orders.py:6)" in result.output
+        assert not (self.output_dir / "list_orders.py").exists()
+
+    def test_make_url_same_path_other_method(self):
+        """Test : GET puis POST /orders, le second module partage le router."""
+        assert self._make_url("list_orders", "/orders").exit_code == 0
+
+        result = self._make_url("create_order", "/orders", "post")
+
+        assert result.exit_code == 0
+        content = (self.output_dir / "create_order.py").read_text()
+        assert "from .list_orders import router\n" in content
+        assert "Router(" not in content
+        assert content.startswith(
+            'from .list_orders import router\n\n\n@router.post("/orders", '
+            'tags=["Default"])\n'
+        )
+
+        # Même (méthode, chemin) : toujours refusé
+        result = self._make_url("create_order_bis", "/orders", "post")
+        assert result.exit_code != 0
+        assert "Conflit de route : POST /orders" in result.output
+
+    def test_make_url_list_routes(self):
+        """Test de l'affichage de la table des routes du projet."""
+        self._make_url("get_orders", "/orders")
+        self._make_url("get_order", "/orders/{order_id}")
+
+        result = self.runner.invoke(
+            cli, ["make:url", "--list-routes", "--project-dir", self.temp_dir]
+        )
+
+        assert result.exit_code == 0
+        assert "GET      /orders             get_orders" in result.output
+        assert "routes/get_order.py:6" in result.output
+        assert "2 route(s)" in result.output
+
+    def test_make_url_updates_registry(self):
+        """Test de la mise à jour du registre des routes (__init__.py)."""
+        self._make_url("get_orders", "/orders")
+        result = self._make_url("create_order", "/orders/new", "post")
+
+        assert result.exit_code == 0
+        assert "Route ajoutée au registre" in result.output
+        assert "register_routes(api)" in result.output
+        registry = (self.output_dir / "__init__.py").read_text(encoding="utf-8")
+        assert '    "get_orders",\n    "create_order",\n' in registry
+
+    def test_make_url_lazy_registry(self):
+        """Test de la génération d'un registre paresseux (--lazy-registry)."""
+        self._make_url("get_orders", "/orders")
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "-f",
+                "get_users",
+                "-u",
+                "/users",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "x",
+                "--project-dir",
+                self.temp_dir,
+                "--lazy-registry",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "include(lazy_urlpatterns(api))" in result.output
+        registry = (self.output_dir / "__init__.py").read_text(encoding="utf-8")
+        assert '    "get_orders": "orders",\n    "get_users": "users",\n' in registry
+
+        # Le mode paresseux est conservé
+        result = self._make_url("get_items", "/items")
+        assert "lazy_urlpatterns" in result.output
+
+    def test_make_url_no_registry(self):
+        """Test de la génération sans registre."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:url",
+                "-f",
+                "get_orders",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "x",
+                "--project-dir",
+                self.temp_dir,
+                "--no-registry",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "api.add_router(router)" in result.output
+        assert not (self.output_dir / "__init__.py").exists()
+
 
 class TestCLIMakePackage:
     """Tests pour la commande make:package."""
@@ -543,6 +740,116 @@ class TestCLIMakeDomaine:
         assert (app_dir / "templates" / "pratique" / "detail.html").exists()
         assert (app_dir / "templates" / "pratique" / "formulaire.html").exists()
 
+    def test_make_domaine_with_fields(self):
+        """Test des champs du modèle principal (--field)."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine",
+                "-a",
+                "blog",
+                "-m",
+                "Article",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Blog",
+                "-f",
+                "titre:CharField:max_length=200",
+                "-f",
+                "corps:TextField",
+            ],
+        )
+
+        assert result.exit_code == 0
+        selectors = (self.output_dir / "blog" / "selectors.py").read_text(
+            encoding="utf-8"
+        )
+        assert 'CHAMPS_RESUME = ["id", "titre", "created_at"]' in selectors
+
+    def test_make_domaine_export(self):
+        """Test de la génération de la vue d'export (--export)."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine",
+                "-a",
+                "blog",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Blog",
+                "--export",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "exports.py" in result.output
+        assert (self.output_dir / "blog" / "exports.py").exists()
+
+    def test_make_domaine_session_count(self):
+        """Test de make:domaine avec --session-count."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine",
+                "-a",
+                "blog",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Blog",
+                "--session-count",
+            ],
+        )
+
+        assert result.exit_code == 0
+        services_content = (self.output_dir / "blog" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "def creer_session_blog(" in services_content
+
+    def test_make_domaine_session_count_without_services(self):
+        """Test du refus de --session-count avec --no-services."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine",
+                "-a",
+                "blog",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Blog",
+                "--session-count",
+                "--no-services",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "requiert include_services" in result.output
+        assert not (self.output_dir / "blog").exists()
+
+    def test_make_domaine_invalid_field(self):
+        """Test du refus d'un champ invalide."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine",
+                "-a",
+                "blog",
+                "-o",
+                str(self.output_dir),
+                "-d",
+                "Blog",
+                "-f",
+                "titre",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Définition de champ invalide" in result.output
+
     def test_make_domaine_with_services(self):
         """Test génération avec services.py."""
         result = self.runner.invoke(
@@ -1081,6 +1388,109 @@ class TestCLIMakeDomaineDDD:
         assert "def obtenir_par_id" in repos_content
         assert "def lister_tous" in repos_content
         assert "def rechercher" in repos_content
+        assert "async def" not in repos_content
+
+    def test_make_domaine_ddd_async(self):
+        """Test de make:domaine-ddd avec --async."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine-ddd",
+                "--app-name",
+                "pratique",
+                "--model-name",
+                "Pratique",
+                "--output-dir",
+                str(self.output_dir),
+                "--async",
+            ],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        app_dir = self.output_dir / "pratique"
+
+        repos_content = (app_dir / "infrastructure" / "repositories.py").read_text(
+            encoding="utf-8"
+        )
+        assert "async def aobtenir_par_id" in repos_content
+        services_content = (app_dir / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "async def amodifier_pratique" in services_content
+
+    def test_make_domaine_ddd_optimistic_locking(self):
+        """Test de make:domaine-ddd avec --optimistic-locking et --skip-locked."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine-ddd",
+                "--app-name",
+                "pratique",
+                "--model-name",
+                "Pratique",
+                "--output-dir",
+                str(self.output_dir),
+                "--optimistic-locking",
+                "--skip-locked",
+            ],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        app_dir = self.output_dir / "pratique"
+
+        services_content = (app_dir / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "class ConflitDeVersion(ValueError):" in services_content
+        assert "def modifier_pratique_si_libre(" in services_content
+
+    def test_make_domaine_ddd_base_template(self):
+        """Test de make:domaine-ddd avec --base-template et --cache-fragments."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine-ddd",
+                "--app-name",
+                "pratique",
+                "--output-dir",
+                str(self.output_dir),
+                "--base-template",
+                "base.html",
+                "--cache-fragments",
+            ],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        detail_content = (
+            self.output_dir / "pratique" / "templates" / "pratique" / "detail.html"
+        ).read_text(encoding="utf-8")
+        assert detail_content.startswith('{% extends "base.html" %}{% load cache %}')
+
+    def test_make_domaine_ddd_session_count(self):
+        """Test de make:domaine-ddd avec --session-count."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:domaine-ddd",
+                "--app-name",
+                "pratique",
+                "--model-name",
+                "Pratique",
+                "--output-dir",
+                str(self.output_dir),
+                "--session-count",
+            ],
+            input="\n",
+        )
+
+        assert result.exit_code == 0
+        repositories_content = (
+            self.output_dir / "pratique" / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert "def lister_avec_nb_sessions()" in repositories_content
 
     def test_make_domaine_ddd_presentation_structure(self):
         """Test de la structure presentation."""
@@ -1173,3 +1583,546 @@ class TestCLIMakeDomaineDDD:
 
         assert result.exit_code != 0
         assert "existe déjà" in result.output
+
+
+class TestCLIMakeModel:
+    """Tests pour la commande make:model."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_make_model_interactive(self):
+        """Test de la génération interactive d'un modèle."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "--app-name",
+                "blog",
+                "--model-name",
+                "Article",
+                "--output-dir",
+                str(self.output_dir),
+            ],
+            input="titre\nn\nCharField\nn\nn\nn\nn\nn\nfin\n",
+        )
+
+        assert result.exit_code == 0
+        content = (self.output_dir / "blog" / "models.py").read_text()
+        assert "class Article(models.Model):" in content
+        assert "titre = models.CharField" in content
+
+    def test_make_model_multiple(self):
+        """Test de la génération de plusieurs modèles en mode interactif."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "--app-name",
+                "blog",
+                "--model-name",
+                "Auteur",
+                "--output-dir",
+                str(self.output_dir),
+                "--multiple",
+            ],
+            input=(
+                "nom\nn\nCharField\nn\nn\nn\nn\nn\nfin\n"
+                "y\nArticle\n"
+                "auteur\ny\nForeignKey\nblog.Auteur\nn\nn\nn\nn\nfin\n"
+                "n\n"
+            ),
+        )
+
+        assert result.exit_code == 0
+        content = (self.output_dir / "blog" / "models.py").read_text()
+        assert "class Auteur(models.Model):" in content
+        assert "class Article(models.Model):" in content
+        assert 'models.ForeignKey("Auteur"' in content
+
+    def test_make_model_from_spec(self):
+        """Test de la génération depuis un fichier de spécification."""
+        spec_file = self.output_dir / "models.json"
+        spec_file.write_text(
+            '{"app_name": "blog", "models": ['
+            '{"name": "Article", "fields": [{"name": "auteur", '
+            '"type": "ForeignKey", "related_model": "Auteur"}]},'
+            '{"name": "Auteur", "fields": [{"name": "nom", "type": "CharField"}]}'
+            "]}"
+        )
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "--from-spec",
+                str(spec_file),
+                "--output-dir",
+                str(self.output_dir),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "2 modèle(s) écrit(s) dans 1 fichier(s)" in result.output
+        content = (self.output_dir / "blog" / "models.py").read_text()
+        assert 'models.ForeignKey("Auteur"' in content
+
+    def test_make_model_from_spec_no_timestamps_wins(self):
+        """Test que --no-timestamps prime sur add_timestamps de la spécification."""
+        spec_file = self.output_dir / "models.json"
+        spec_file.write_text(
+            '{"app_name": "blog", "add_timestamps": true, "models": ['
+            '{"name": "Auteur", "fields": [{"name": "nom", "type": "CharField"}]}'
+            "]}"
+        )
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "--from-spec",
+                str(spec_file),
+                "--output-dir",
+                str(self.output_dir),
+                "--no-timestamps",
+            ],
+        )
+
+        assert result.exit_code == 0
+        content = (self.output_dir / "blog" / "models.py").read_text()
+        assert "created_at" not in content
+
+    def test_make_model_from_invalid_spec(self):
+        """Test avec une spécification invalide."""
+        spec_file = self.output_dir / "models.json"
+        spec_file.write_text('{"models": []}')
+
+        result = self.runner.invoke(
+            cli,
+            ["make:model", "--from-spec", str(spec_file)],
+        )
+
+        assert result.exit_code != 0
+        assert "Erreur de validation" in result.output
+
+    def test_make_model_with_fields(self):
+        """Test de la génération non interactive avec --field."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "-a",
+                "blog",
+                "-m",
+                "Article",
+                "-o",
+                str(self.output_dir),
+                "-f",
+                "titre:CharField:max_length=200,db_index",
+                "-f",
+                "auteur:ForeignKey:to=users.User",
+                "--fields-json",
+                '[{"name": "vues", "type": "IntegerField"}]',
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Recherche des modèles existants" not in result.output
+        content = (self.output_dir / "blog" / "models.py").read_text()
+        assert "titre = models.CharField(max_length=200, db_index=True)" in content
+        assert "auteur = models.ForeignKey(User" in content
+        assert "vues = models.IntegerField()" in content
+
+    def test_make_model_with_invalid_field_type(self):
+        """Test qu'un type invalide est refusé avant toute écriture."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:model",
+                "-a",
+                "blog",
+                "-m",
+                "Article",
+                "-o",
+                str(self.output_dir),
+                "-f",
+                "titre:Inconnu",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Type de champ invalide" in result.output
+        assert not (self.output_dir / "blog").exists()
+
+
+class TestCLIFanout:
+    """Tests pour la commande fanout."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+        self.spec_file = self.output_dir / "spec.json"
+        self.spec_file.write_text(
+            '{"steps": [{"generator": "domaine", "app_name": "pratique"}]}'
+        )
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_projects(self, names):
+        """Crée les projets et le fichier les listant."""
+        for name in names:
+            (self.output_dir / name).mkdir()
+        projects_file = self.output_dir / "projects.txt"
+        projects_file.write_text("# projets\n" + "\n".join(names) + "\n")
+        return projects_file
+
+    def test_fanout_generates_all_projects(self):
+        """Test de la génération sur plusieurs projets."""
+        projects_file = self._write_projects(["svc_a", "svc_b"])
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "fanout",
+                "--projects",
+                str(projects_file),
+                "--spec",
+                str(self.spec_file),
+                "--workers",
+                "2",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "2/2 projet(s) générés" in result.output
+        for name in ["svc_a", "svc_b"]:
+            assert (self.output_dir / name / "pratique" / "models.py").exists()
+
+    def test_fanout_aggregates_errors(self):
+        """Test qu'une erreur sur un projet n'arrête pas les autres."""
+        projects_file = self._write_projects(["svc_a", "svc_b"])
+        (self.output_dir / "svc_b" / "pratique").mkdir()
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "fanout",
+                "--projects",
+                str(projects_file),
+                "--spec",
+                str(self.spec_file),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "1/2 projet(s) générés" in result.output
+        assert "FileExistsError" in result.output
+        assert (self.output_dir / "svc_a" / "pratique" / "models.py").exists()
+
+    def test_fanout_invalid_spec(self):
+        """Test d'une spécification invalide."""
+        projects_file = self._write_projects(["svc_a"])
+        self.spec_file.write_text('{"steps": [{"generator": "inconnu"}]}')
+
+        result = self.runner.invoke(
+            cli,
+            ["fanout", "--projects", str(projects_file), "--spec", str(self.spec_file)],
+        )
+
+        assert result.exit_code != 0
+        assert "Générateur inconnu" in result.output
+
+
+class TestCLIProfile:
+    """Tests pour l'option globale --profile."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_url_args(self):
+        """Arguments d'un make:url non interactif."""
+        return [
+            "make:url",
+            "--module-name",
+            "api",
+            "--function-name",
+            "get_orders",
+            "--url-path",
+            "/orders",
+            "--http-method",
+            "get",
+            "--tag",
+            "Orders",
+            "--description",
+            "Liste des commandes",
+            "--output-dir",
+            str(self.output_dir / "routes"),
+        ]
+
+    def test_profile_prof_format(self):
+        """Test du profil cProfile et de la répartition par phase."""
+        profile_file = self.output_dir / "make_url.prof"
+
+        result = self.runner.invoke(
+            cli, ["--profile-output", str(profile_file)] + self._make_url_args()
+        )
+
+        assert result.exit_code == 0
+        assert profile_file.exists()
+        assert "Répartition par phase" in result.output
+        assert "writing" in result.output
+
+    def test_profile_collapsed_format(self):
+        """Test du profil par échantillonnage au format collapsed."""
+        profile_file = self.output_dir / "make_url.collapsed"
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "--profile",
+                "--profile-format",
+                "collapsed",
+                "--profile-output",
+                str(profile_file),
+            ]
+            + self._make_url_args(),
+        )
+
+        assert result.exit_code == 0
+        assert profile_file.exists()
+        assert "Répartition par phase" in result.output
+
+
+class TestCLIMetricsJson:
+    """Tests pour l'option globale --metrics-json."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_domaine_args(self):
+        """Arguments d'un make:domaine non interactif."""
+        return [
+            "make:domaine",
+            "--app-name",
+            "pratique",
+            "--model-name",
+            "Pratique",
+            "--description",
+            "Gestion des pratiques",
+            "--output-dir",
+            str(self.output_dir),
+        ]
+
+    def test_metrics_json_to_file(self):
+        """Test du rapport écrit dans un fichier."""
+        report_file = self.output_dir / "metrics.json"
+
+        result = self.runner.invoke(
+            cli, ["--metrics-json", str(report_file)] + self._make_domaine_args()
+        )
+
+        assert result.exit_code == 0
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        assert report["command"] == "make:domaine"
+        assert report["success"] is True
+        assert report["files_written"] > 0
+        assert report["bytes_written"] > 0
+        assert set(report["files"][0]) == {
+            "path",
+            "bytes",
+            "render_duration",
+            "write_duration",
+        }
+        assert "discovery_duration" in report
+        assert report["cache"] == {"hits": 0, "misses": 0}
+
+    def test_metrics_json_to_stderr(self):
+        """Test du rapport écrit sur stderr."""
+        result = self.runner.invoke(
+            cli, ["--metrics-json", "-"] + self._make_domaine_args()
+        )
+
+        assert result.exit_code == 0
+        assert '"files_written"' in result.output
+
+    def test_metrics_json_on_error(self):
+        """Test du rapport quand la commande échoue."""
+        report_file = self.output_dir / "metrics.json"
+        (self.output_dir / "pratique").mkdir()
+
+        result = self.runner.invoke(
+            cli, ["--metrics-json", str(report_file)] + self._make_domaine_args()
+        )
+
+        assert result.exit_code != 0
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        assert report["success"] is False
+        assert report["files_written"] == 0
+
+
+class TestCLIRenderCache:
+    """Tests pour le cache de rendu (--render-cache, --cache-dir)."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_render_cache_reused_across_runs(self):
+        """Test qu'une seconde exécution est servie par le cache."""
+        cache_dir = self.output_dir / "cache"
+        for project in ["svc_a", "svc_b"]:
+            report_file = self.output_dir / f"{project}.json"
+            result = self.runner.invoke(
+                cli,
+                [
+                    "--cache-dir",
+                    str(cache_dir),
+                    "--metrics-json",
+                    str(report_file),
+                    "make:domaine",
+                    "--app-name",
+                    "pratique",
+                    "--model-name",
+                    "Pratique",
+                    "--description",
+                    "Gestion des pratiques",
+                    "--output-dir",
+                    str(self.output_dir / project),
+                ],
+            )
+            assert result.exit_code == 0
+            assert "Cache de rendu" in result.output
+
+        first = json.loads((self.output_dir / "svc_a.json").read_text())
+        second = json.loads((self.output_dir / "svc_b.json").read_text())
+        assert first["cache"]["hits"] == 0
+        assert second["cache"]["misses"] == 0
+        assert second["cache"]["hits"] == first["cache"]["misses"]
+
+
+class TestCLIMakeWorkspace:
+    """Tests pour la commande make:workspace."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_make_workspace_with_options(self):
+        """Test de la génération avec options en ligne de commande."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:workspace",
+                "--name",
+                "platform",
+                "-p",
+                "core-lib",
+                "-p",
+                "api-client",
+                "--author-name",
+                "Jane Doe",
+                "--author-email",
+                "jane@example.com",
+                "--output-dir",
+                str(self.output_dir),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Workspace créé avec succès" in result.output
+        packages_dir = self.output_dir / "platform" / "packages"
+        assert (packages_dir / "core-lib" / "pyproject.toml").exists()
+        assert (packages_dir / "api-client" / "pyproject.toml").exists()
+
+    def test_make_workspace_from_spec(self):
+        """Test de la génération depuis une spécification TOML."""
+        spec_file = self.output_dir / "workspace.toml"
+        spec_file.write_text(
+            'name = "platform"\n'
+            'author_name = "Jane Doe"\n'
+            'author_email = "jane@example.com"\n'
+            'python_version = "3.10"\n'
+            "[[packages]]\n"
+            'name = "core-lib"\n'
+            "[[packages]]\n"
+            'name = "api-client"\n'
+            'dependencies = ["core-lib"]\n'
+        )
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:workspace",
+                "--spec",
+                str(spec_file),
+                "--output-dir",
+                str(self.output_dir),
+            ],
+        )
+
+        assert result.exit_code == 0
+        workspace_dir = self.output_dir / "platform"
+        assert (workspace_dir / ".python-version").read_text() == "3.10\n"
+        assert (
+            "core-lib = { workspace = true }"
+            in (workspace_dir / "pyproject.toml").read_text()
+        )
+
+    def test_make_workspace_invalid_email(self):
+        """Test avec un email invalide."""
+        result = self.runner.invoke(
+            cli,
+            [
+                "make:workspace",
+                "-n",
+                "platform",
+                "-p",
+                "core-lib",
+                "-a",
+                "Jane",
+                "-e",
+                "invalide",
+                "-o",
+                str(self.output_dir),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Erreur de validation" in result.output
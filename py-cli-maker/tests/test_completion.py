@@ -0,0 +1,193 @@
+"""Tests pour la complétion shell et l'index persistant de projet."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.shell_completion import ShellComplete
+from click.testing import CliRunner
+
+from pyfastcli import completion
+from pyfastcli.cli import cli
+from pyfastcli.completion import project_index_path, project_models
+
+
+def _complete(args, incomplete):
+    """Retourne les valeurs proposées par la complétion de la CLI."""
+    shell_complete = ShellComplete(cli, {}, "pyfastcli", "_PYFASTCLI_COMPLETE")
+    return [item.value for item in shell_complete.get_completions(args, incomplete)]
+
+
+class TestProjectModels:
+    """Tests pour l'index persistant des apps et modèles du projet."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Path(self.temp_dir)
+        self._write_models("blog", ["Article", "Commentaire"])
+        self._write_models("users", ["User"])
+        (self.project / "accounts").mkdir()
+        (self.project / "accounts" / "apps.py").write_text("")
+        (self.project / "static").mkdir()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_models(self, app_name, model_names):
+        app_dir = self.project / app_name
+        app_dir.mkdir(exist_ok=True)
+        content = "from django.db import models\n"
+        for model_name in model_names:
+            content += f"\n\nclass {model_name}(models.Model):\n    pass\n"
+        (app_dir / "models.py").write_text(content)
+
+    def test_project_models(self):
+        """Test de la découverte des apps et modèles."""
+        assert project_models(self.project) == {
+            "accounts": [],
+            "blog": ["Article", "Commentaire"],
+            "users": ["User"],
+        }
+        assert project_index_path(self.project.resolve()).exists()
+
+    def test_index_reused(self, monkeypatch):
+        """Test que les models.py inchangés ne sont pas relus."""
+        project_models(self.project)
+
+        def fail(content):
+            raise AssertionError("models.py relu inutilement")
+
+        monkeypatch.setattr(completion, "parse_model_names", fail)
+
+        assert project_models(self.project)["blog"] == ["Article", "Commentaire"]
+
+    def test_index_updated(self):
+        """Test que l'index est mis à jour quand un models.py change."""
+        project_models(self.project)
+        self._write_models("blog", ["Article", "Tag"])
+        models_file = self.project / "blog" / "models.py"
+        stat = models_file.stat()
+        os.utime(models_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        shutil.rmtree(self.project / "users")
+
+        models = project_models(self.project)
+
+        assert models["blog"] == ["Article", "Tag"]
+        assert "users" not in models
+
+
+class TestShellCompletion:
+    """Tests pour la complétion des commandes et options."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Path(self.temp_dir)
+        (self.project / "users").mkdir()
+        (self.project / "users" / "models.py").write_text(
+            "from django.db import models\n\nclass User(models.Model):\n    pass\n"
+        )
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_complete_commands(self):
+        """Test de la complétion des noms de commandes."""
+        assert _complete([], "make:d") == ["make:domaine", "make:domaine-ddd"]
+
+    def test_complete_app_name(self):
+        """Test de la complétion de --app-name depuis le projet (--output-dir)."""
+        args = ["make:model", "-o", str(self.project), "--app-name"]
+
+        assert _complete(args, "") == ["users"]
+
+    def test_complete_field_type(self):
+        """Test de la complétion du type d'un champ."""
+        values = _complete(["make:model", "--field"], "titre:char")
+
+        assert values == ["titre:CharField"]
+
+    def test_complete_related_model(self):
+        """Test de la complétion du modèle lié d'un champ de relation."""
+        args = ["make:model", "-o", str(self.project), "--field"]
+
+        values = _complete(args, "auteur:ForeignKey:related_name=articles,to=u")
+
+        assert values == ["auteur:ForeignKey:related_name=articles,to=users.User"]
+
+    def test_complete_field_name_is_free(self):
+        """Test qu'aucune valeur n'est imposée pour le nom du champ."""
+        assert _complete(["make:model", "--field"], "tit") == []
+
+
+class TestCompletionCommand:
+    """Tests pour la commande completion."""
+
+    def test_completion_script(self):
+        """Test de l'affichage du script de complétion."""
+        runner = CliRunner()
+
+        for shell in ["bash", "zsh", "fish"]:
+            result = runner.invoke(cli, ["completion", shell], prog_name="pyfastcli")
+            assert result.exit_code == 0
+            assert "_PYFASTCLI_COMPLETE" in result.output
+
+    def test_bash_script_keeps_wordbreaks(self):
+        """Test : le script bash ne modifie pas COMP_WORDBREAKS du shell."""
+        result = CliRunner().invoke(cli, ["completion", "bash"], prog_name="pyfastcli")
+
+        assert result.exit_code == 0
+        assert "COMP_WORDBREAKS" not in result.output
+
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash absent")
+    def test_bash_completes_colon_words(self, tmp_path):
+        """Test du script bash sur des mots coupés par bash sur ':'."""
+        script = tmp_path / "completion.sh"
+        script.write_text(
+            CliRunner()
+            .invoke(cli, ["completion", "bash"], prog_name="pyfastcli")
+            .output
+        )
+        root = Path(__file__).resolve().parent.parent
+        executable = tmp_path / "pyfastcli"
+        executable.write_text(
+            f"#!/bin/sh\nPYTHONPATH={root} exec {sys.executable} -c "
+            '\'from pyfastcli.cli import cli; cli(prog_name="pyfastcli")\' "$@"\n'
+        )
+        executable.chmod(0o755)
+        # COMP_WORDS tels que découpés par bash (':' dans COMP_WORDBREAKS)
+        commands = f"""
+source {script}
+complete_line() {{
+    COMP_LINE=$1; COMP_POINT=${{#1}}; COMP_CWORD=$2; shift 2
+    COMP_WORDS=("$@"); COMPREPLY=()
+    _pyfastcli_completion pyfastcli
+    echo "${{COMPREPLY[*]}}"
+}}
+complete_line "pyfastcli make:ur" 3 pyfastcli make : ur
+complete_line "pyfastcli make:model --field titre:Char" 6 \\
+    pyfastcli make : model --field titre : Char
+"""
+
+        result = subprocess.run(
+            ["bash", "-c", commands],
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PATH=f"{tmp_path}{os.pathsep}{os.environ['PATH']}"),
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == ["url", "CharField"]
+
+    def test_invalid_shell(self):
+        """Test avec un shell non pris en charge."""
+        result = CliRunner().invoke(cli, ["completion", "powershell"])
+
+        assert result.exit_code != 0
@@ -0,0 +1,100 @@
+"""Tests pour le magasin de contenu (matérialisation des fichiers identiques)."""
+
+import os
+
+import pytest
+
+from pyfastcli.content_store import ContentStore, content_store, get_content_store
+from pyfastcli.generators.ddd_domaine_generator import generate_ddd_domaine_structure
+from pyfastcli.instrumentation import instrument, write_text
+
+
+class TestContentStore:
+    """Tests pour ContentStore."""
+
+    def test_put_stores_content_once(self, tmp_path):
+        """Test qu'un contenu identique n'est stocké qu'une fois."""
+        store = ContentStore(tmp_path / "store")
+
+        first = store.put(b"contenu")
+        second = store.put(b"contenu")
+
+        assert first == second
+        assert first.read_bytes() == b"contenu"
+        assert len(list((tmp_path / "store" / "objects").glob("*/*"))) == 1
+
+    def test_put_rewrites_modified_object(self, tmp_path):
+        """Test qu'un objet modifié sur place (même taille) est réécrit."""
+        path = ContentStore(tmp_path / "store").put(b"x = 1\n")
+        path.write_bytes(b"x = 2\n")
+
+        assert ContentStore(tmp_path / "store").put(b"x = 1\n") == path
+        assert path.read_bytes() == b"x = 1\n"
+
+    def test_invalid_mode(self, tmp_path):
+        """Test d'un mode de matérialisation invalide."""
+        with pytest.raises(ValueError, match="Mode de matérialisation invalide"):
+            ContentStore(tmp_path, mode="symlink")
+
+    def test_copy_mode(self, tmp_path):
+        """Test du mode copie (fichiers indépendants)."""
+        store = ContentStore(tmp_path / "store", mode="copy")
+
+        assert store.materialize(b"x", tmp_path / "a") == "copy"
+        assert (tmp_path / "a").read_bytes() == b"x"
+        assert os.stat(tmp_path / "a").st_nlink == 1
+
+    def test_hardlink_mode(self, tmp_path):
+        """Test du mode lien physique (repli sur la copie si non pris en charge)."""
+        store = ContentStore(tmp_path / "store", mode="hardlink")
+
+        method_a = store.materialize(b"x", tmp_path / "a")
+        method_b = store.materialize(b"x", tmp_path / "b")
+
+        assert method_a == method_b
+        assert method_a in ("hardlink", "copy")
+        if method_a == "hardlink":
+            assert os.path.samefile(tmp_path / "a", tmp_path / "b")
+        assert store.stats[method_a] == 2
+
+    def test_auto_mode(self, tmp_path):
+        """Test du mode auto (reflink ou copie, jamais de lien physique)."""
+        store = ContentStore(tmp_path / "store")
+
+        method = store.materialize(b"x", tmp_path / "a")
+
+        assert method in ("reflink", "copy")
+        assert (tmp_path / "a").read_bytes() == b"x"
+        assert os.stat(tmp_path / "a").st_nlink == 1
+
+
+class TestContentStoreWriteText:
+    """Tests de l'écriture des fichiers générés via le magasin de contenu."""
+
+    def test_rewrite_does_not_modify_linked_files(self, tmp_path):
+        """Test qu'une réécriture détache le fichier de ses liens physiques."""
+        with content_store(str(tmp_path / "store"), mode="hardlink"):
+            write_text(tmp_path / "a.py", "")
+            write_text(tmp_path / "b.py", "")
+
+        write_text(tmp_path / "a.py", "x = 1\n")
+
+        assert (tmp_path / "a.py").read_text() == "x = 1\n"
+        assert (tmp_path / "b.py").read_text() == ""
+
+    def test_generator_with_content_store(self, tmp_path):
+        """Test de la génération d'un domaine via le magasin de contenu."""
+        with instrument() as instrumentation:
+            with content_store(str(tmp_path / "store")) as store:
+                assert get_content_store() is store
+                generate_ddd_domaine_structure(
+                    "pratique", "Pratique", str(tmp_path / "out")
+                )
+        assert get_content_store() is None
+
+        app_dir = tmp_path / "out" / "pratique"
+        for package in ["domain", "infrastructure", "presentation", "tests"]:
+            assert (app_dir / package / "__init__.py").read_text() == ""
+        assert "class Pratique" in (app_dir / "domain" / "models.py").read_text()
+        counters = instrumentation.to_dict()["counters"]
+        assert sum(counters.values()) == sum(store.stats.values()) > 0
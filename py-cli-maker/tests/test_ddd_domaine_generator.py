@@ -85,6 +85,254 @@ class TestGenerateDDDDomaineStructure:
         assert "class PratiqueRepository" in repos_content
         assert "def obtenir_par_id" in repos_content
 
+    def test_generate_repository_projections(self):
+        """Test des projections de liste du repository."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="blog",
+            model_name="Article",
+            output_dir=str(self.output_dir),
+            fields=["titre:CharField", "corps:TextField"],
+        )
+
+        models_content = (Path(app_dir) / "domain" / "models.py").read_text(
+            encoding="utf-8"
+        )
+        assert "    titre = models.CharField(max_length=255)" in models_content
+        repos_content = (
+            Path(app_dir) / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert 'CHAMPS_RESUME = ["id", "titre", "created_at"]' in repos_content
+        assert "def lister_resume(cls) -> QuerySet[Article]:" in repos_content
+        assert "Article.objects.only(*cls.CHAMPS_RESUME)" in repos_content
+        assert "def iter_valeurs(" in repos_content
+        compile(repos_content, "repositories.py", "exec")
+
+    def test_generate_meta_indexes(self):
+        """Test des index et contraintes déclarés par les champs (Meta)."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="blog",
+            model_name="Article",
+            output_dir=str(self.output_dir),
+            fields=["publie:BooleanField", "slug:SlugField:unique_if=publie=True"],
+        )
+
+        models_content = (Path(app_dir) / "domain" / "models.py").read_text(
+            encoding="utf-8"
+        )
+        assert "condition=models.Q(publie=True)" in models_content
+        assert 'name="article_slug_uniq"' in models_content
+        compile(models_content, "models.py", "exec")
+
+    def test_generate_export(self):
+        """Test de la vue d'export en streaming via le repository."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            include_export=True,
+        )
+
+        exports_content = (Path(app_dir) / "presentation" / "exports.py").read_text(
+            encoding="utf-8"
+        )
+        assert "class PratiqueExportView(View):" in exports_content
+        assert (
+            "PratiqueRepository.iter_valeurs(CHAMPS_EXPORT, chunk_size=CHUNK_SIZE)"
+            in exports_content
+        )
+        urls_content = (Path(app_dir) / "presentation" / "urls.py").read_text(
+            encoding="utf-8"
+        )
+        assert (
+            "from pratique.presentation.exports import PratiqueExportView"
+            in urls_content
+        )
+
+    def test_generate_async(self):
+        """Test des variantes async du repository et des services."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            include_async=True,
+        )
+
+        repos_content = (
+            Path(app_dir) / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert "async def aobtenir_par_id(pratique_id: int)" in repos_content
+        assert "await Pratique.objects.aget(id=pratique_id)" in repos_content
+        assert "async def alister_tous() -> List[Pratique]:" in repos_content
+        assert "async def acreer(**kwargs) -> Pratique:" in repos_content
+        assert "await Pratique.objects.acreate(**kwargs)" in repos_content
+        compile(repos_content, "repositories.py", "exec")
+
+        services_content = (Path(app_dir) / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "from asgiref.sync import sync_to_async" in services_content
+        assert "async def en_transaction(fonction, *args, **kwargs):" in (
+            services_content
+        )
+        assert "async def acreer_pratique(**kwargs) -> Pratique:" in services_content
+        assert "await en_transaction(appliquer)" in services_content
+        assert "await en_transaction(pratique.delete)" in services_content
+        compile(services_content, "services.py", "exec")
+
+        tests_content = (Path(app_dir) / "tests" / "test_services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "async def test_acreer_pratique(self):" in tests_content
+
+    def test_generate_without_async(self):
+        """Test : pas de variantes async par défaut."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        services_content = (Path(app_dir) / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "async def" not in services_content
+        assert "sync_to_async" not in services_content
+        repos_content = (
+            Path(app_dir) / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert "async def" not in repos_content
+
+    def test_generate_optimistic_locking(self):
+        """Test du verrou optimiste (version + UPDATE conditionné)."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            optimistic_locking=True,
+            skip_locked=True,
+        )
+
+        models_content = (Path(app_dir) / "domain" / "models.py").read_text(
+            encoding="utf-8"
+        )
+        assert "    version = models.PositiveIntegerField(" in models_content
+        services_content = (Path(app_dir) / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "class ConflitDeVersion(ValueError):" in services_content
+        assert "id=pratique_id, version=version" in services_content
+        assert 'version=F("version") + 1' in services_content
+        modifier = services_content.split("def modifier_")[1].split("def ")[0]
+        assert ".objects.get(" not in modifier
+        assert "select_for_update(skip_locked=True)" in services_content
+        assert "def modifier_pratique_si_libre(" in services_content
+        compile(services_content, "services.py", "exec")
+
+        forms_content = (Path(app_dir) / "presentation" / "forms.py").read_text(
+            encoding="utf-8"
+        )
+        assert "version = forms.IntegerField(widget=forms.HiddenInput)" in (
+            forms_content
+        )
+        views_content = (Path(app_dir) / "presentation" / "views.py").read_text(
+            encoding="utf-8"
+        )
+        assert "except ConflitDeVersion:" in views_content
+        compile(views_content, "views.py", "exec")
+        tests_content = (Path(app_dir) / "tests" / "test_services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "def test_modifier_pratique_conflit(self):" in tests_content
+
+    def test_generate_optimistic_locking_async(self):
+        """Test de la variante async du verrou optimiste (aupdate)."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            include_async=True,
+            optimistic_locking=True,
+        )
+
+        services_content = (Path(app_dir) / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "async def amodifier_pratique(" in services_content
+        assert ").aupdate(" in services_content
+        assert "select_for_update" not in services_content
+        compile(services_content, "services.py", "exec")
+
+    def test_generate_without_optimistic_locking(self):
+        """Test : pas de champ version par défaut."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        models_content = (Path(app_dir) / "domain" / "models.py").read_text(
+            encoding="utf-8"
+        )
+        assert "version" not in models_content
+        forms_content = (Path(app_dir) / "presentation" / "forms.py").read_text(
+            encoding="utf-8"
+        )
+        assert "version" not in forms_content
+
+    def test_generate_session_count(self):
+        """Test du compteur dénormalisé sessions_count (--session-count)."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            optimistic_locking=True,
+            include_session_count=True,
+        )
+
+        models_content = (Path(app_dir) / "domain" / "models.py").read_text(
+            encoding="utf-8"
+        )
+        assert "sessions_count = models.PositiveIntegerField(" in models_content
+        services_content = (Path(app_dir) / "domain" / "services.py").read_text(
+            encoding="utf-8"
+        )
+        assert (
+            "from django.db.models import Count, F, OuterRef, Subquery"
+            in services_content
+        )
+        assert "    def creer_session_pratique(" in services_content
+        assert "    def supprimer_session_pratique(" in services_content
+        assert "    def recalculer_sessions_count() -> int:" in services_content
+        repositories_content = (
+            Path(app_dir) / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert "def lister_avec_nb_sessions()" in repositories_content
+        assert '"sessions_count"]' in repositories_content
+        tests_content = (Path(app_dir) / "tests" / "test_services.py").read_text(
+            encoding="utf-8"
+        )
+        assert "def test_sessions_count(self):" in tests_content
+
+    def test_generate_cache_fragments(self):
+        """Test des fragments {% cache %} et du template de base (DDD)."""
+        app_dir = generate_ddd_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            base_template="layouts/base.html",
+            cache_fragments=True,
+        )
+
+        liste_content = (
+            Path(app_dir) / "templates" / "pratique" / "liste.html"
+        ).read_text(encoding="utf-8")
+        assert '{% extends "layouts/base.html" %}' in liste_content
+        assert "{% cache 3600 pratique_ligne" in liste_content
+        repositories_content = (
+            Path(app_dir) / "infrastructure" / "repositories.py"
+        ).read_text(encoding="utf-8")
+        assert '"created_at", "updated_at"]' in repositories_content
+
     def test_generate_presentation_layer(self):
         """Test de génération de la couche presentation."""
         app_dir = generate_ddd_domaine_structure(
@@ -201,3 +449,4 @@ class TestGenerateDDDDomaineStructure:
 
         admin_content = (Path(app_dir) / "admin.py").read_text(encoding="utf-8")
         assert "from pratique.domain.models import Pratique" in admin_content
+        assert "@admin.register(SessionPratique)" in admin_content
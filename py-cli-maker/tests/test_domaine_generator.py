@@ -247,6 +247,33 @@ class TestGenerateDomaineStructure:
         assert "@admin.register(Pratique)" in admin_content
         assert "class PratiqueAdmin" in admin_content
         assert "from django.contrib import admin" in admin_content
+        assert "show_full_result_count = False" in admin_content
+        assert 'date_hierarchy = "created_at"' in admin_content
+        assert "list_per_page = 50" in admin_content
+        assert "class SessionPratiqueAdmin(admin.ModelAdmin):" in admin_content
+        session_admin = admin_content.split("class SessionPratiqueAdmin")[1]
+        assert 'list_select_related = ["pratique"]' in session_admin
+        assert 'autocomplete_fields = ["pratique"]' in session_admin
+
+    def test_generate_admin_relations(self):
+        """Test : recherche et relations de l'admin déduites des champs."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            fields=[
+                "titre:CharField:max_length=200",
+                "corps:TextField",
+                "auteur:ForeignKey:to=users.User",
+                "tags:ManyToManyField:to=tags.Tag",
+            ],
+        )
+
+        admin_content = (Path(app_dir) / "admin.py").read_text(encoding="utf-8")
+        main_admin = admin_content.split("class SessionPratiqueAdmin")[0]
+        assert 'search_fields = ["=id", "titre"]' in main_admin
+        assert 'list_select_related = ["auteur"]' in main_admin
+        assert 'raw_id_fields = ["auteur", "tags"]' in main_admin
 
     def test_generate_apps_content(self):
         """Test du contenu de apps.py."""
@@ -352,3 +379,256 @@ class TestGenerateDomaineStructure:
         assert "def obtenir_pratique_par_id" in selectors_content
         assert "def lister_pratiques" in selectors_content
         assert "def filtrer_pratiques" in selectors_content
+
+    def test_generate_selectors_projections(self):
+        """Test des projections de liste pilotées par les champs du modèle."""
+        app_dir = generate_domaine_structure(
+            app_name="blog",
+            model_name="Article",
+            output_dir=str(self.output_dir),
+            fields=[
+                "titre:CharField:max_length=200",
+                "corps:TextField",
+                "auteur:ForeignKey:to=users.User",
+                {"name": "meta", "type": "JSONField"},
+                "tags:ManyToManyField:to=tags.Tag",
+            ],
+        )
+
+        models_content = (Path(app_dir) / "models.py").read_text(encoding="utf-8")
+        assert "from users.models import User" in models_content
+        assert "    titre = models.CharField(max_length=200)" in models_content
+        assert "    corps = models.TextField()" in models_content
+        compile(models_content, "models.py", "exec")
+
+        selectors_content = (Path(app_dir) / "selectors.py").read_text(encoding="utf-8")
+        # Champs volumineux et ManyToMany exclus des projections
+        assert 'CHAMPS_RESUME = ["id", "titre", "auteur", "created_at"]' in (
+            selectors_content
+        )
+        assert "def lister_blogs_resume() -> QuerySet[Article]:" in selectors_content
+        assert "Article.objects.only(*CHAMPS_RESUME)" in selectors_content
+        assert "def iter_blogs_valeurs(" in selectors_content
+        assert ".values_list(*champs).iterator(" in selectors_content
+        compile(selectors_content, "selectors.py", "exec")
+
+    def test_generate_meta_indexes(self):
+        """Test des options unique_if, index_if et gin_index (Meta du modèle)."""
+        app_dir = generate_domaine_structure(
+            app_name="blog",
+            model_name="Article",
+            output_dir=str(self.output_dir),
+            fields=[
+                "publie:BooleanField",
+                "slug:SlugField:unique_if=publie=True",
+                "code:CharField:index_if=publie=True",
+                "metadonnees:JSONField:gin_index",
+            ],
+        )
+
+        models_content = (Path(app_dir) / "models.py").read_text(encoding="utf-8")
+        assert "from django.contrib.postgres.indexes import GinIndex" in (
+            models_content
+        )
+        assert 'name="article_slug_uniq"' in models_content
+        assert 'name="article_code_idx"' in models_content
+        assert 'GinIndex(fields=["metadonnees"], name="article_metadonnees_gin")' in (
+            models_content
+        )
+        # Index dans la Meta du modèle principal, pas dans celle des sessions
+        article, sessions = models_content.split("class SessionArticle")
+        assert "        constraints = [\n" in article
+        assert "indexes" not in sessions
+        compile(models_content, "models.py", "exec")
+
+    def test_generate_without_fields_keeps_placeholder(self):
+        """Test du modèle sans champ : exemples en commentaire."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        models_content = (Path(app_dir) / "models.py").read_text(encoding="utf-8")
+        assert "# Ajoutez vos champs spécifiques ici" in models_content
+        selectors_content = (Path(app_dir) / "selectors.py").read_text(encoding="utf-8")
+        assert 'CHAMPS_RESUME = ["id", "created_at"]' in selectors_content
+
+    def test_generate_export(self):
+        """Test de la vue d'export en streaming (exports.py et route)."""
+        app_dir = generate_domaine_structure(
+            app_name="blog",
+            model_name="Article",
+            output_dir=str(self.output_dir),
+            fields=["titre:CharField", "tags:ManyToManyField:to=tags.Tag"],
+            include_export=True,
+        )
+
+        exports_content = (Path(app_dir) / "exports.py").read_text(encoding="utf-8")
+        assert "class ArticleExportView(View):" in exports_content
+        assert "StreamingHttpResponse" in exports_content
+        assert (
+            'CHAMPS_EXPORT = ["id", "titre", "created_at", "updated_at"]'
+            in exports_content
+        )
+        assert "CHUNK_SIZE = 2000" in exports_content
+        # Lignes lues via le selector de projection
+        assert "from blog.selectors import iter_blogs_valeurs" in exports_content
+        compile(exports_content, "exports.py", "exec")
+
+        urls_content = (Path(app_dir) / "urls.py").read_text(encoding="utf-8")
+        assert "from blog.exports import ArticleExportView" in urls_content
+        assert 'name="export"' in urls_content
+
+    def test_generate_export_without_selectors(self):
+        """Test de l'export sans selectors.py (QuerySet du modèle)."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            include_selectors=False,
+            include_export=True,
+        )
+
+        exports_content = (Path(app_dir) / "exports.py").read_text(encoding="utf-8")
+        assert (
+            "Pratique.objects.values_list(*CHAMPS_EXPORT).iterator("
+            "chunk_size=CHUNK_SIZE)" in exports_content
+        )
+
+    def test_generate_without_export(self):
+        """Test que l'export n'est pas généré par défaut."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        assert not (Path(app_dir) / "exports.py").exists()
+        urls_content = (Path(app_dir) / "urls.py").read_text(encoding="utf-8")
+        assert "export" not in urls_content
+
+    def test_generate_session_count(self):
+        """Test du compteur dénormalisé sessions_count (--session-count)."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            include_session_count=True,
+        )
+
+        models_content = (Path(app_dir) / "models.py").read_text(encoding="utf-8")
+        assert "sessions_count = models.PositiveIntegerField(" in models_content
+        services_content = (Path(app_dir) / "services.py").read_text(encoding="utf-8")
+        assert "from pratique.models import Pratique, SessionPratique" in (
+            services_content
+        )
+        assert "def creer_session_pratique(" in services_content
+        assert 'sessions_count=F("sessions_count") + 1' in services_content
+        assert 'sessions_count=F("sessions_count") - 1' in services_content
+        assert "def recalculer_sessions_count() -> int:" in services_content
+        selectors_content = (Path(app_dir) / "selectors.py").read_text(encoding="utf-8")
+        assert "from django.db.models import Count, QuerySet" in selectors_content
+        assert 'CHAMPS_RESUME = ["id", "created_at", "sessions_count"]' in (
+            selectors_content
+        )
+        assert 'annotate(nb_sessions=Count("sessions"))' in selectors_content
+
+    def test_generate_session_count_requires_services(self):
+        """Test du refus de sessions_count sans services.py pour le maintenir."""
+        with pytest.raises(ValueError, match="requiert include_services"):
+            generate_domaine_structure(
+                app_name="pratique",
+                model_name="Pratique",
+                output_dir=str(self.output_dir),
+                include_services=False,
+                include_session_count=True,
+            )
+
+        assert not (self.output_dir / "pratique").exists()
+
+    def test_generate_without_session_count(self):
+        """Test que sessions_count n'est pas généré par défaut."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        for filename in ("models.py", "services.py", "selectors.py"):
+            content = (Path(app_dir) / filename).read_text(encoding="utf-8")
+            assert "sessions_count" not in content
+            assert "nb_sessions" not in content
+
+    def test_generate_templates_lean_urls(self):
+        """Test : l'URL de la liste est résolue une fois, hors de la boucle."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+        )
+
+        liste_content = (
+            Path(app_dir) / "templates" / "pratique" / "liste.html"
+        ).read_text(encoding="utf-8")
+        assert liste_content.startswith("<!DOCTYPE html>")
+        assert "{% url 'pratique:liste' as liste_url %}" in liste_content
+        assert '<a href="{{ liste_url }}{{ pratique.pk }}/modifier/">' in (
+            liste_content
+        )
+        loop = liste_content.split("{% for ")[1].split("{% endfor %}")[0]
+        assert "{% url" not in loop
+        assert "{% cache" not in liste_content
+
+    def test_generate_templates_cache_and_base(self):
+        """Test des fragments {% cache %} et du template de base."""
+        app_dir = generate_domaine_structure(
+            app_name="pratique",
+            model_name="Pratique",
+            output_dir=str(self.output_dir),
+            base_template="base.html",
+            cache_fragments=True,
+        )
+
+        templates_dir = Path(app_dir) / "templates" / "pratique"
+        liste_content = (templates_dir / "liste.html").read_text(encoding="utf-8")
+        assert liste_content.startswith('{% extends "base.html" %}{% load cache %}')
+        assert "<!DOCTYPE html>" not in liste_content
+        assert "{% block content %}" in liste_content
+        assert (
+            "{% cache 3600 pratique_ligne pratique.pk pratique.updated_at "
+            "liste_url %}" in liste_content
+        )
+        detail_content = (templates_dir / "detail.html").read_text(encoding="utf-8")
+        assert "pratique_detail pratique.pk pratique.updated_at" in detail_content
+        formulaire_content = (templates_dir / "formulaire.html").read_text(
+            encoding="utf-8"
+        )
+        assert formulaire_content.startswith('{% extends "base.html" %}\n')
+        assert "{% cache" not in formulaire_content
+        selectors_content = (Path(app_dir) / "selectors.py").read_text(encoding="utf-8")
+        assert 'CHAMPS_RESUME = ["id", "created_at", "updated_at"]' in (
+            selectors_content
+        )
+
+    def test_generate_invalid_base_template(self):
+        """Test du refus d'un nom de template de base invalide."""
+        with pytest.raises(ValueError, match="template de base invalide"):
+            generate_domaine_structure(
+                app_name="pratique",
+                model_name="Pratique",
+                output_dir=str(self.output_dir),
+                base_template='base".html',
+            )
+        assert not (self.output_dir / "pratique").exists()
+
+    def test_generate_invalid_field(self):
+        """Test du refus d'un champ invalide (avant toute écriture)."""
+        with pytest.raises(ValueError, match="Type de champ invalide"):
+            generate_domaine_structure(
+                app_name="pratique",
+                model_name="Pratique",
+                output_dir=str(self.output_dir),
+                fields=["titre:Inconnu"],
+            )
+        assert not (self.output_dir / "pratique").exists()
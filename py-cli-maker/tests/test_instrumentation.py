@@ -0,0 +1,200 @@
+"""Tests pour l'instrumentation et le profilage des générateurs."""
+
+import importlib.util
+import time
+import types
+
+import pytest
+
+from pyfastcli import profiling
+from pyfastcli.generators.domaine_generator import generate_domaine_structure
+from pyfastcli.instrumentation import (
+    count,
+    get_instrumentation,
+    instrument,
+    phase,
+    rendering,
+    write_text,
+)
+from pyfastcli.metrics import build_metrics_report
+from pyfastcli.profiling import (
+    PyinstrumentSampler,
+    StackSampler,
+    format_phase_breakdown,
+    make_sampler,
+)
+
+
+class TestInstrumentation:
+    """Tests pour la mesure des phases."""
+
+    def test_phase_without_instrumentation(self):
+        """Test que phase() est sans effet sans instrumentation active."""
+        assert get_instrumentation() is None
+        with phase("rendering"):
+            pass
+        assert get_instrumentation() is None
+
+    def test_instrument_restores_previous(self):
+        """Test que l'instrumentation est désactivée en sortie de bloc."""
+        with instrument() as instrumentation:
+            assert get_instrumentation() is instrumentation
+        assert get_instrumentation() is None
+
+    def test_nested_phases_are_exclusive(self):
+        """Test que le temps d'une phase imbriquée n'est compté qu'une fois."""
+        with instrument() as instrumentation:
+            with phase("rendering"):
+                with phase("writing"):
+                    time.sleep(0.02)
+
+        assert instrumentation.phases["writing"] >= 0.02
+        assert instrumentation.phases["rendering"] < 0.02
+
+    def test_phase_as_decorator(self):
+        """Test de phase() utilisé comme décorateur."""
+
+        @phase("validation")
+        def validate():
+            return "ok"
+
+        with instrument() as instrumentation:
+            assert validate() == "ok"
+
+        assert "validation" in instrumentation.phases
+
+    def test_write_text(self, tmp_path):
+        """Test de l'écriture instrumentée d'un fichier."""
+        target = tmp_path / "fichier.py"
+        with instrument() as instrumentation:
+            write_text(target, "é = 1\n")
+
+        assert target.read_text(encoding="utf-8") == "é = 1\n"
+        assert "writing" in instrumentation.phases
+
+    def test_write_text_records_file(self, tmp_path):
+        """Test de l'attribution des durées de rendu et d'écriture au fichier."""
+        target = tmp_path / "fichier.py"
+
+        @rendering
+        def render():
+            time.sleep(0.01)
+            write_text(target, "é = 1\n")
+
+        with instrument() as instrumentation:
+            render()
+
+        (entry,) = instrumentation.files
+        assert entry["path"] == str(target)
+        assert entry["bytes"] == len("é = 1\n".encode())
+        assert entry["render_duration"] >= 0.01
+        assert entry["write_duration"] > 0
+        assert "TestInstrumentation.test_write_text_records_file.<locals>.render" in (
+            instrumentation.helpers
+        )
+
+    def test_count(self):
+        """Test des compteurs (sans effet sans instrumentation active)."""
+        count("cache_hits")
+        with instrument() as instrumentation:
+            count("cache_hits")
+            count("cache_misses", 2)
+
+        report = instrumentation.to_dict()
+        assert report["cache"] == {"hits": 1, "misses": 2}
+
+    def test_generator_phases(self, tmp_path):
+        """Test que les générateurs signalent leurs phases."""
+        with instrument() as instrumentation:
+            generate_domaine_structure(
+                app_name="pratique", model_name="Pratique", output_dir=str(tmp_path)
+            )
+
+        for name in ["validation", "rendering", "writing"]:
+            assert instrumentation.phases[name] > 0
+
+    def test_generator_metrics_report(self, tmp_path):
+        """Test du rapport de métriques d'un générateur."""
+        with instrument() as instrumentation:
+            generate_domaine_structure(
+                app_name="pratique", model_name="Pratique", output_dir=str(tmp_path)
+            )
+
+        report = build_metrics_report(instrumentation, "make:domaine")
+        assert report["command"] == "make:domaine"
+        assert report["success"] is True
+        assert report["files_written"] == len(report["files"]) > 0
+        assert report["bytes_written"] == sum(f["bytes"] for f in report["files"])
+        paths = {f["path"] for f in report["files"]}
+        assert str(tmp_path / "pratique" / "models.py") in paths
+        assert "_render_models_py" in report["helpers"]
+
+    def test_format_phase_breakdown(self):
+        """Test du formatage de la répartition par phase."""
+        with instrument() as instrumentation:
+            with phase("writing"):
+                pass
+
+        output = format_phase_breakdown(instrumentation)
+        assert "Répartition par phase" in output
+        for name in ["discovery", "validation", "rendering", "writing", "total"]:
+            assert name in output
+
+
+def _frame(function, time, children=(), synthetic=False):
+    """Frame pyinstrument minimale (arbre de la session)."""
+    return types.SimpleNamespace(
+        function=function,
+        file_path="mod.py",
+        line_no=1,
+        time=time,
+        children=list(children),
+        is_synthetic=synthetic,
+    )
+
+
+class TestSamplers:
+    """Tests du choix et de la sortie des échantillonneurs (--profile-format)."""
+
+    def test_fallback_without_pyinstrument(self, monkeypatch):
+        """Test : sans pyinstrument, l'échantillonneur interne est utilisé."""
+        monkeypatch.setattr(profiling.importlib.util, "find_spec", lambda name: None)
+
+        assert isinstance(make_sampler(), StackSampler)
+
+    def test_pyinstrument_tree_to_collapsed(self, tmp_path):
+        """Test de la conversion de l'arbre pyinstrument au format collapsed."""
+        sampler = PyinstrumentSampler.__new__(PyinstrumentSampler)
+        sampler.interval = 0.001
+        leaf = _frame("[self]", 0.003, synthetic=True)
+        root = _frame(
+            "main", 0.010, [_frame("render", 0.007, [leaf]), _frame("write", 0.0)]
+        )
+        sampler._profiler = types.SimpleNamespace(
+            last_session=types.SimpleNamespace(root_frame=lambda: root)
+        )
+
+        output = tmp_path / "profil.collapsed"
+        sampler.write(output)
+
+        assert output.read_text().splitlines() == [
+            "main (mod.py:1);render (mod.py:1) 7",
+            "main (mod.py:1) 3",
+        ]
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("pyinstrument") is None,
+        reason="pyinstrument absent",
+    )
+    def test_pyinstrument_is_used(self, tmp_path):
+        """Test : pyinstrument installé, il échantillonne le format collapsed."""
+        sampler = make_sampler()
+        assert isinstance(sampler, PyinstrumentSampler)
+
+        sampler.start()
+        sum(i * i for i in range(200000))
+        sampler.stop()
+        output = tmp_path / "profil.collapsed"
+        sampler.write(output)
+
+        assert output.read_text().strip()
@@ -1,13 +1,21 @@
 """Tests pour le générateur de modèles Django."""
 
+import ast
 from pathlib import Path
 
 import pytest
 
 from pyfastcli.generators.model_generator import (
     discover_existing_models,
+    display_field_names,
     generate_model_file,
+    generate_models_batch,
+    models_from_spec,
+    normalize_field,
+    parse_field_spec,
+    parse_fields_json,
 )
+from pyfastcli.generators.spec_loader import load_spec_file
 
 
 class TestDiscoverExistingModels:
@@ -314,3 +322,438 @@ class TestGenerateModelFile:
                 output_dir=str(tmp_path),
                 add_timestamps=True,
             )
+
+
+class TestGenerateModelsBatch:
+    """Tests pour la génération de plusieurs modèles en une passe."""
+
+    def test_generate_batch_single_file(self, tmp_path):
+        """Test que les modèles d'une même app sont écrits dans un seul fichier."""
+        models = [
+            {
+                "app_name": "blog",
+                "model_name": "Article",
+                "fields": [
+                    {
+                        "name": "auteur",
+                        "type": "ForeignKey",
+                        "options": "",
+                        "related_model": "Auteur",
+                    }
+                ],
+            },
+            {
+                "app_name": "blog",
+                "model_name": "Auteur",
+                "fields": [{"name": "nom", "type": "CharField", "options": ""}],
+            },
+        ]
+
+        result = generate_models_batch(models, output_dir=str(tmp_path))
+
+        assert result == [str(tmp_path / "blog" / "models.py")]
+        content = Path(result[0]).read_text()
+        assert content.count("from django.db import models") == 1
+        assert "class Article(models.Model):" in content
+        assert "class Auteur(models.Model):" in content
+        # Référence en avant résolue sans import
+        assert 'auteur = models.ForeignKey("Auteur"' in content
+        assert "from blog.models import" not in content
+
+    def test_generate_batch_cross_app_reference(self, tmp_path):
+        """Test des références entre apps du même lot."""
+        models = [
+            {
+                "app_name": "shop",
+                "model_name": "Product",
+                "fields": [
+                    {
+                        "name": "category",
+                        "type": "ForeignKey",
+                        "options": "",
+                        "related_model": "catalog.Category",
+                    },
+                    {
+                        "name": "tags",
+                        "type": "ManyToManyField",
+                        "options": "",
+                        "related_model": "tags.Tag",
+                    },
+                ],
+            },
+            {
+                "app_name": "catalog",
+                "model_name": "Category",
+                "fields": [{"name": "nom", "type": "CharField", "options": ""}],
+            },
+        ]
+
+        result = generate_models_batch(models, output_dir=str(tmp_path))
+
+        assert len(result) == 2
+        content = (tmp_path / "shop" / "models.py").read_text()
+        assert 'models.ForeignKey("catalog.Category"' in content
+        # Les modèles hors du lot restent importés
+        assert "from tags.models import Tag" in content
+
+    def test_generate_batch_appends_to_existing_file(self, tmp_path):
+        """Test de l'ajout de plusieurs modèles à un fichier existant."""
+        app_dir = tmp_path / "blog"
+        app_dir.mkdir()
+        (app_dir / "models.py").write_text(
+            "from django.db import models\n\n"
+            "class Existing(models.Model):\n"
+            "    pass\n"
+        )
+        models = [
+            {
+                "app_name": "blog",
+                "model_name": name,
+                "fields": [{"name": "nom", "type": "CharField", "options": ""}],
+            }
+            for name in ["Premier", "Second"]
+        ]
+
+        generate_models_batch(models, output_dir=str(tmp_path))
+
+        content = (app_dir / "models.py").read_text()
+        assert content.count("from django.db import models") == 1
+        assert "class Existing" in content
+        assert "class Premier" in content
+        assert "class Second" in content
+
+    def test_generate_batch_raises_on_duplicate(self, tmp_path):
+        """Test qu'un modèle défini deux fois est refusé."""
+        model = {
+            "app_name": "blog",
+            "model_name": "Article",
+            "fields": [{"name": "nom", "type": "CharField", "options": ""}],
+        }
+
+        with pytest.raises(ValueError, match="plusieurs fois"):
+            generate_models_batch([model, model], output_dir=str(tmp_path))
+
+    def test_generate_batch_conflict_writes_nothing(self, tmp_path):
+        """Test qu'un conflit dans une app ne modifie aucune autre app."""
+        app_dir = tmp_path / "shop"
+        app_dir.mkdir()
+        (app_dir / "models.py").write_text(
+            "from django.db import models\n\n"
+            "class Product(models.Model):\n"
+            "    pass\n"
+        )
+        models = [
+            {
+                "app_name": app_name,
+                "model_name": model_name,
+                "fields": [{"name": "nom", "type": "CharField", "options": ""}],
+            }
+            for app_name, model_name in [("blog", "Article"), ("shop", "Product")]
+        ]
+
+        with pytest.raises(ValueError, match="existe déjà"):
+            generate_models_batch(models, output_dir=str(tmp_path))
+
+        assert not (tmp_path / "blog" / "models.py").exists()
+
+    def test_models_from_spec_file(self, tmp_path):
+        """Test du chargement d'une spécification JSON."""
+        spec_file = tmp_path / "models.json"
+        spec_file.write_text(
+            '{"app_name": "blog", "models": ['
+            '{"name": "Article", "fields": '
+            '[{"name": "titre", "type": "CharField"}]}]}'
+        )
+
+        models = models_from_spec(load_spec_file(spec_file))
+
+        assert models == [
+            {
+                "app_name": "blog",
+                "model_name": "Article",
+                "fields": [{"name": "titre", "type": "CharField", "options": ""}],
+            }
+        ]
+
+    def test_models_from_spec_requires_models(self):
+        """Test qu'une spécification sans modèles est refusée."""
+        with pytest.raises(ValueError, match="models"):
+            models_from_spec({"app_name": "blog"})
+
+
+class TestParseFieldSpec:
+    """Tests pour la définition non interactive des champs."""
+
+    def test_parse_simple_field(self):
+        """Test d'un champ sans options."""
+        assert parse_field_spec("titre:CharField") == {
+            "name": "titre",
+            "type": "CharField",
+            "options": "",
+        }
+
+    def test_parse_field_with_options(self):
+        """Test des options avec valeur et booléennes."""
+        field = parse_field_spec("titre:charfield:max_length=200,db_index")
+        assert field["type"] == "CharField"
+        assert field["options"] == "max_length=200, db_index=True"
+
+    def test_parse_field_keeps_required_defaults(self):
+        """Test que les options par défaut requises sont conservées."""
+        field = parse_field_spec("prix:DecimalField:null")
+        assert field["options"] == "max_digits=10, decimal_places=2, null=True"
+
+    def test_parse_field_quotes_strings(self):
+        """Test que les chaînes sont entourées de guillemets."""
+        field = parse_field_spec('titre:CharField:verbose_name=Titre,help_text="a, b"')
+        assert field["options"] == (
+            'max_length=255, verbose_name="Titre", help_text="a, b"'
+        )
+
+    def test_parse_relation_field(self):
+        """Test d'une relation avec to=app.Model."""
+        field = parse_field_spec(
+            "auteur:ForeignKey:to=users.User,related_name=articles"
+        )
+        assert field == {
+            "name": "auteur",
+            "type": "ForeignKey",
+            "options": 'related_name="articles"',
+            "related_model": "users.User",
+        }
+
+    def test_relation_with_explicit_on_delete(self, tmp_path):
+        """Test qu'un on_delete fourni remplace le CASCADE par défaut."""
+        field = parse_field_spec(
+            "auteur:ForeignKey:to=users.User,on_delete=models.SET_NULL,null=True"
+        )
+        result = generate_model_file(
+            app_name="blog",
+            model_name="Article",
+            fields=[field],
+            output_dir=str(tmp_path),
+        )
+
+        content = Path(result).read_text()
+        ast.parse(content)
+        assert (
+            "auteur = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)"
+            in content
+        )
+        assert "CASCADE" not in content
+
+    def test_parse_field_expressions(self):
+        """Test que seuls les préfixes connus et les appels sont des expressions."""
+        field = parse_field_spec("version:CharField:default=v1.2,help_text=doc.txt")
+        assert field["options"] == (
+            'max_length=255, default="v1.2", help_text="doc.txt"'
+        )
+        field = parse_field_spec("meta:JSONField:default=dict(),null")
+        assert field["options"] == "default=dict(), null=True"
+
+    def test_parse_bare_expression_names(self):
+        """Test des noms nus : constantes on_delete et appelables de default."""
+        field = parse_field_spec(
+            "auteur:ForeignKey:to=blog.Post,on_delete=SET_NULL,null,"
+            "related_name=articles"
+        )
+        assert field["options"] == (
+            'on_delete=models.SET_NULL, null=True, related_name="articles"'
+        )
+        field = parse_field_spec("data:JSONField:default=dict")
+        assert field["options"] == "default=dict"
+        field = parse_field_spec("statut:CharField:choices=Statut.choices")
+        assert "choices=Statut.choices" in field["options"]
+
+    def test_parse_unknown_bare_expression_name(self):
+        """Test du refus d'un mot inconnu pour une option qui attend du code."""
+        with pytest.raises(ValueError, match="Valeur invalide pour on_delete"):
+            parse_field_spec("auteur:ForeignKey:to=blog.Post,on_delete=SUPPRIMER")
+        with pytest.raises(ValueError, match="Valeur invalide pour choices"):
+            parse_field_spec("statut:CharField:choices=statuts")
+
+    def test_expression_module_is_imported(self, tmp_path):
+        """Test que default=timezone.now ajoute l'import de timezone."""
+        result = generate_model_file(
+            app_name="blog",
+            model_name="Article",
+            fields=[parse_field_spec("publie_le:DateTimeField:default=timezone.now")],
+            output_dir=str(tmp_path),
+        )
+
+        content = Path(result).read_text()
+        assert "from django.utils import timezone" in content
+        assert "publie_le = models.DateTimeField(default=timezone.now)" in content
+
+    def test_parse_relation_without_model(self):
+        """Test qu'une relation sans modèle lié est refusée."""
+        with pytest.raises(ValueError, match="nécessite un modèle lié"):
+            parse_field_spec("auteur:ForeignKey")
+
+    def test_parse_invalid_type(self):
+        """Test qu'un type inconnu est refusé d'emblée."""
+        with pytest.raises(ValueError, match="Type de champ invalide"):
+            parse_field_spec("titre:StringField")
+
+    def test_parse_invalid_name(self):
+        """Test qu'un nom de champ invalide est refusé."""
+        with pytest.raises(ValueError, match="Nom de champ invalide"):
+            parse_field_spec("class:CharField")
+
+    def test_parse_invalid_format(self):
+        """Test d'une définition incomplète."""
+        with pytest.raises(ValueError, match="Format attendu"):
+            parse_field_spec("titre")
+
+    def test_normalize_field_with_options_dict(self):
+        """Test d'un champ JSON avec un dictionnaire d'options."""
+        field = normalize_field(
+            {"name": "actif", "type": "BooleanField", "options": {"default": True}}
+        )
+        assert field["options"] == "default=True"
+
+    def test_parse_fields_json_inline(self):
+        """Test de --fields-json en ligne."""
+        fields = parse_fields_json(
+            '[{"name": "titre", "type": "CharField"}, "vues:IntegerField:default=0"]'
+        )
+        assert [f["name"] for f in fields] == ["titre", "vues"]
+        assert fields[1]["options"] == "default=0"
+
+    def test_parse_fields_json_file(self, tmp_path):
+        """Test de --fields-json avec un fichier."""
+        json_file = tmp_path / "fields.json"
+        json_file.write_text('[{"name": "titre", "type": "CharField"}]')
+        assert parse_fields_json(str(json_file))[0]["type"] == "CharField"
+
+    def test_generated_field_uses_real_class(self, tmp_path):
+        """Test que IPAddressField avec options génère GenericIPAddressField."""
+        result = generate_model_file(
+            app_name="myapp",
+            model_name="Acces",
+            fields=[parse_field_spec("ip:IPAddressField:null")],
+            output_dir=str(tmp_path),
+        )
+        assert (
+            "ip = models.GenericIPAddressField(null=True)" in Path(result).read_text()
+        )
+
+
+class TestDisplayFieldNames:
+    """Tests pour les champs des projections de liste."""
+
+    def test_excludes_heavy_and_many_to_many(self):
+        """Test de l'exclusion des champs volumineux et ManyToMany."""
+        fields = [
+            parse_field_spec(spec)
+            for spec in [
+                "titre:CharField",
+                "corps:TextField",
+                "donnees:JSONField",
+                "fichier:BinaryField",
+                "auteur:ForeignKey:to=users.User",
+                "tags:ManyToManyField:to=tags.Tag",
+                "publie:BooleanField",
+            ]
+        ]
+        assert display_field_names(fields) == ["titre", "auteur", "publie"]
+
+
+class TestMetaIndexes:
+    """Tests pour les index et contraintes émis dans la Meta."""
+
+    def test_parse_meta_options(self):
+        """Test des options unique_if, index_if et gin_index."""
+        field = parse_field_spec("slug:SlugField:unique,unique_if=publie=True")
+        assert field["options"] == "unique=True"
+        assert field["unique_if"] == "publie=True"
+
+        field = parse_field_spec("code:CharField:index_if='actif=True,stock__gt=0'")
+        assert field["options"] == ""
+        assert field["index_if"] == "actif=True,stock__gt=0"
+
+        field = parse_field_spec("data:JSONField:gin_index")
+        assert field["gin_index"] == "True"
+
+    def test_meta_options_from_json(self):
+        """Test des options de Meta dans un champ JSON (dictionnaire)."""
+        field = normalize_field(
+            {"name": "slug", "type": "SlugField", "options": {"index_if": "actif"}}
+        )
+        assert field["index_if"] == "actif"
+        field = normalize_field(
+            {"name": "slug", "type": "SlugField", "unique_if": "actif=True"}
+        )
+        assert field["unique_if"] == "actif=True"
+
+    def test_invalid_meta_options(self):
+        """Test des conditions invalides et de gin_index hors JSONField."""
+        with pytest.raises(ValueError, match="Condition invalide"):
+            parse_field_spec("slug:SlugField:unique_if=publie=")
+        with pytest.raises(ValueError, match="Condition manquante"):
+            parse_field_spec("slug:SlugField:unique_if")
+        with pytest.raises(ValueError, match="réservé aux JSONField"):
+            parse_field_spec("titre:CharField:gin_index")
+        with pytest.raises(ValueError, match="ManyToManyField"):
+            parse_field_spec("tags:ManyToManyField:to=tags.Tag,index_if=actif=True")
+
+    def test_generate_meta_indexes(self, tmp_path):
+        """Test de la génération des index et contraintes dans la Meta."""
+        result = generate_model_file(
+            app_name="blog",
+            model_name="Article",
+            fields=[
+                parse_field_spec(spec)
+                for spec in [
+                    "slug:SlugField:unique_if=publie=True",
+                    "publie:BooleanField",
+                    "code:CharField:db_index,index_if=publie=True",
+                    "data:JSONField:gin_index",
+                ]
+            ],
+            output_dir=str(tmp_path),
+        )
+
+        content = Path(result).read_text()
+        assert "from django.contrib.postgres.indexes import GinIndex" in content
+        assert "code = models.CharField(max_length=255, db_index=True)" in content
+        assert (
+            "        indexes = [\n"
+            "            models.Index(\n"
+            '                fields=["code"],\n'
+            "                condition=models.Q(publie=True),\n"
+            '                name="article_code_idx",\n'
+            "            ),\n"
+            '            GinIndex(fields=["data"], name="article_data_gin"),\n'
+            "        ]\n"
+        ) in content
+        assert "models.UniqueConstraint(" in content
+        assert 'name="article_slug_uniq",' in content
+        compile(content, "models.py", "exec")
+
+    def test_index_name_is_truncated(self, tmp_path):
+        """Test des noms d'index limités à 30 caractères."""
+        result = generate_model_file(
+            app_name="blog",
+            model_name="ArticleTresLong",
+            fields=[parse_field_spec("identifiant_externe:CharField:index_if=actif")],
+            output_dir=str(tmp_path),
+        )
+
+        content = Path(result).read_text()
+        name = content.split('name="')[-1].split('"')[0]
+        assert len(name) == 30
+        assert name.startswith("articletreslong_ident_")
+
+    def test_no_meta_indexes_by_default(self, tmp_path):
+        """Test : pas d'indexes ni de constraints sans option."""
+        result = generate_model_file(
+            app_name="blog",
+            model_name="Article",
+            fields=[parse_field_spec("titre:CharField")],
+            output_dir=str(tmp_path),
+        )
+
+        content = Path(result).read_text()
+        assert "indexes" not in content
+        assert "constraints" not in content
@@ -1,13 +1,22 @@
 """Tests pour le générateur de routes Django Ninja."""
 
+import ast
+import math
 import shutil
 import tempfile
+import threading
+import types
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
 from pyfastcli.generators.ninja_routes import (
+    CONDITIONAL_HELPER_MARKER,
+    THROTTLE_HELPER_MARKER,
     _escape_string,
+    _parse_model_reference,
+    _parse_throttle_rate,
     _sanitize_func_name,
     _validate_http_method,
     _validate_url_path,
@@ -298,3 +307,258 @@ class TestGenerateNinjaRouteFile:
         assert (
             '\\"' in content or content.count('"') <= 2
         )  # Seulement les guillemets du code
+
+
+class TestConditionalRoutes:
+    """Tests des routes conditionnelles (ETag / Last-Modified)."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir) / "routes"
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, function_name="get_orders", http_method="get", model=None):
+        return generate_ninja_route_file(
+            module_name="api",
+            function_name=function_name,
+            url_path="/orders",
+            http_method=http_method,
+            tag="Orders",
+            output_dir=str(self.output_dir),
+            conditional_model=model,
+        )
+
+    def test_parse_model_reference(self):
+        """Test des références de modèle."""
+        assert _parse_model_reference("orders.Order") == ("orders.models", "Order")
+        assert _parse_model_reference("orders.domain.models.Order") == (
+            "orders.domain.models",
+            "Order",
+        )
+        with pytest.raises(ValueError, match="Modèle invalide"):
+            _parse_model_reference("Order")
+
+    def test_generate_conditional_route(self):
+        """Test de la route conditionnelle et de l'utilitaire partagé."""
+        content = Path(self._generate(model="orders.Order")).read_text(encoding="utf-8")
+
+        assert "from orders.models import Order" in content
+        assert "from .cache_http import conditionnel" in content
+        assert "return Order.objects.all()" in content
+        assert (
+            '@router.get("/orders")\n'
+            "@decorate_view(conditionnel(get_orders_queryset))\n"
+            "def get_orders(request):"
+        ) in content
+        helper = (self.output_dir / "cache_http.py").read_text(encoding="utf-8")
+        assert helper.startswith(CONDITIONAL_HELPER_MARKER)
+        assert 'total=Count("pk"), derniere=Max("updated_at")' in helper
+        assert "from django.views.decorators.http import condition" in helper
+
+    def test_helper_generated_once(self):
+        """Test : l'utilitaire n'est écrit qu'une fois par dossier."""
+        self._generate(model="orders.Order")
+        helper_path = self.output_dir / "cache_http.py"
+        helper_path.write_text(
+            helper_path.read_text(encoding="utf-8") + "# modifié\n", encoding="utf-8"
+        )
+        self._generate(function_name="get_order", model="orders.Order")
+
+        assert helper_path.read_text(encoding="utf-8").endswith("# modifié\n")
+
+    def test_helper_not_generated_by_default(self):
+        """Test : pas d'utilitaire sans --conditional."""
+        content = Path(self._generate()).read_text(encoding="utf-8")
+
+        assert "decorate_view" not in content
+        assert not (self.output_dir / "cache_http.py").exists()
+
+    def test_conditional_rejects_write_methods(self):
+        """Test : les réponses conditionnelles sont réservées à GET/HEAD."""
+        with pytest.raises(ValueError, match="GET et HEAD"):
+            self._generate(
+                function_name="create_order", http_method="post", model="orders.Order"
+            )
+        assert not self.output_dir.exists() or not any(self.output_dir.iterdir())
+
+    def test_existing_foreign_helper(self):
+        """Test : un cache_http.py non généré n'est jamais écrasé."""
+        self.output_dir.mkdir(parents=True)
+        (self.output_dir / "cache_http.py").write_text("x = 1\n", encoding="utf-8")
+
+        with pytest.raises(FileExistsError):
+            self._generate(model="orders.Order")
+        assert not (self.output_dir / "get_orders.py").exists()
+
+
+class _FakeCache:
+    """Cache Django minimal (add, get, incr, delete), sans expiration."""
+
+    def __init__(self):
+        self.data = {}
+
+    def add(self, key, value, timeout=None):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def incr(self, key, delta=1):
+        if key not in self.data:
+            raise ValueError(f"Key '{key}' not found")
+        self.data[key] += delta
+        return self.data[key]
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestThrottledRoutes:
+    """Tests des routes limitées en débit (--throttle)."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir) / "routes"
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, throttle, model=None, http_method="get"):
+        return generate_ninja_route_file(
+            module_name="api",
+            function_name="get_orders",
+            url_path="/orders",
+            http_method=http_method,
+            tag="Orders",
+            output_dir=str(self.output_dir),
+            conditional_model=model,
+            throttle=throttle,
+        )
+
+    def test_parse_throttle_rate(self):
+        """Test de la validation des débits."""
+        assert _parse_throttle_rate("100/min") == "100/min"
+        assert _parse_throttle_rate(" 10 / Hour ") == "10/hour"
+        for rate in ["100", "0/min", "100/week", "abc/min"]:
+            with pytest.raises(ValueError, match="Débit invalide"):
+                _parse_throttle_rate(rate)
+
+    def test_generate_throttled_route(self):
+        """Test de la route limitée et de l'utilitaire partagé."""
+        content = Path(self._generate("100/min")).read_text(encoding="utf-8")
+
+        assert "from .limite_http import limiter" in content
+        assert (
+            '@router.get("/orders")\n'
+            '@decorate_view(limiter("100/min", "get_orders"))\n'
+            "def get_orders(request):"
+        ) in content
+        helper = (self.output_dir / "limite_http.py").read_text(encoding="utf-8")
+        assert helper.startswith(THROTTLE_HELPER_MARKER)
+        assert "compte = cache.incr(cle_fenetre)" in helper
+        assert "VERROU" not in helper and "sleep" not in helper
+        assert "class SeauLocal:" in helper
+        assert '"min": 60,' in helper
+        compile(helper, "limite_http.py", "exec")
+
+    def _helper_namespace(self, names, clock):
+        """Définitions de limite_http.py, exécutées avec une horloge fixe."""
+        self._generate("3/min")
+        helper = (self.output_dir / "limite_http.py").read_text(encoding="utf-8")
+        nodes = [
+            node
+            for node in ast.parse(helper).body
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name in names
+        ]
+        namespace = {
+            "math": math,
+            "threading": threading,
+            "OrderedDict": OrderedDict,
+            "MAX_CLIENTS_LOCAUX": 3,
+            "time": types.SimpleNamespace(
+                time=lambda: clock[0], monotonic=lambda: clock[0]
+            ),
+        }
+        exec(compile(ast.Module(nodes, []), "limite_http.py", "exec"), namespace)
+        return namespace
+
+    def test_cache_window_counter(self):
+        """Test du compteur partagé : N requêtes par fenêtre, sans verrou."""
+        clock = [1000.0]
+        consommer_cache = self._helper_namespace(["consommer_cache"], clock)[
+            "consommer_cache"
+        ]
+        cache = _FakeCache()
+
+        # N requêtes acceptées, puis attente de la fenêtre suivante (t = 1020)
+        assert [consommer_cache(cache, "c", 3, 60) for _ in range(3)] == [0, 0, 0]
+        assert consommer_cache(cache, "c", 3, 60) == pytest.approx(20)
+        assert cache.data == {"c:16": 4}
+        # Nouvelle fenêtre : nouveau compteur
+        clock[0] = 1021.0
+        assert consommer_cache(cache, "c", 3, 60) == 0
+        assert cache.data["c:17"] == 1
+
+    def test_cache_window_counter_key_expired(self):
+        """Test : clé expirée entre add et incr, la requête ouvre la fenêtre."""
+        consommer_cache = self._helper_namespace(["consommer_cache"], [1000.0])[
+            "consommer_cache"
+        ]
+        cache = _FakeCache()
+        # Premier add sans effet (clé présente), puis expiration avant incr
+        cache.add = lambda key, value, timeout=None: delattr(cache, "add")
+
+        assert consommer_cache(cache, "c", 3, 60) == 0
+        assert cache.data == {"c:16": 1}
+
+    def test_local_bucket_forgets_clients(self):
+        """Test du seau local : seaux pleins oubliés, clients plafonnés (LRU)."""
+        clock = [1000.0]
+        seau = self._helper_namespace(["SeauLocal"], clock)["SeauLocal"](3, 60)
+
+        assert [seau.consommer("a") for _ in range(3)] == [0, 0, 0]
+        assert seau.consommer("a") == pytest.approx(20)
+        # 60 s plus tard, le seau de "a" est plein : il est oublié
+        clock[0] = 1060.0
+        seau.consommer("b")
+        assert list(seau.seaux) == ["b"]
+        # Au plus MAX_CLIENTS_LOCAUX (3 ici) clients : le moins récent sort
+        for cle in ("c", "d", "b", "e"):
+            seau.consommer(cle)
+        assert list(seau.seaux) == ["d", "b", "e"]
+
+    def test_throttle_wraps_conditional(self):
+        """Test : la limitation s'applique avant la signature (304)."""
+        content = Path(self._generate("5/s", model="orders.Order")).read_text(
+            encoding="utf-8"
+        )
+
+        assert (
+            '@decorate_view(limiter("5/s", "get_orders"))\n'
+            "@decorate_view(conditionnel(get_orders_queryset))\n"
+        ) in content
+        assert content.count("from ninja.decorators import decorate_view") == 1
+        assert (self.output_dir / "cache_http.py").exists()
+
+    def test_throttle_allowed_on_write_methods(self):
+        """Test : --throttle n'est pas réservé aux lectures."""
+        content = Path(self._generate("10/min", http_method="post")).read_text(
+            encoding="utf-8"
+        )
+
+        assert '@decorate_view(limiter("10/min", "get_orders"))' in content
+
+    def test_invalid_throttle_writes_nothing(self):
+        """Test : un débit invalide est refusé avant toute écriture."""
+        with pytest.raises(ValueError):
+            self._generate("beaucoup")
+        assert not self.output_dir.exists()
@@ -0,0 +1,213 @@
+"""Tests pour le registre des générateurs (commandes intégrées et plugins)."""
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from pyfastcli import registry
+from pyfastcli.cli import cli
+from pyfastcli.registry import (
+    BUILTIN_COMMANDS,
+    ENTRY_POINT_GROUP,
+    command_index,
+    command_references,
+    discover_plugins,
+    load_command,
+)
+
+
+class _FakeEntryPoints(list):
+    """Résultat de entry_points() (API select de Python >= 3.10)."""
+
+    def select(self, group):
+        return [entry_point for entry_point in self if entry_point.group == group]
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Déclare des plugins factices dans les métadonnées installées."""
+
+    def install(*declarations):
+        fake = _FakeEntryPoints(
+            EntryPoint(name, value, group) for name, value, group in declarations
+        )
+        monkeypatch.setattr(registry, "_installed_entry_points", lambda: fake)
+        discover_plugins.cache_clear()
+        command_index.cache_clear()
+
+    yield install
+    discover_plugins.cache_clear()
+    # Oublie les plugins chargés par le groupe de la CLI
+    for name in list(cli.commands):
+        if name not in BUILTIN_COMMANDS:
+            del cli.commands[name]
+
+
+class TestDiscoverPlugins:
+    """Tests pour la découverte des plugins via entry points."""
+
+    def test_discover_plugins(self, plugins):
+        """Test de la découverte d'un plugin du groupe pyfastcli.generators."""
+        plugins(
+            ("make:api", "mon_plugin.commands:make_api", ENTRY_POINT_GROUP),
+            ("autre", "autre.module:cmd", "console_scripts"),
+        )
+
+        assert discover_plugins() == {"make:api": "mon_plugin.commands:make_api"}
+
+    def test_builtin_has_priority(self, plugins):
+        """Test qu'un plugin ne peut pas remplacer une commande intégrée."""
+        plugins(("make:url", "mon_plugin.commands:make_url", ENTRY_POINT_GROUP))
+
+        assert discover_plugins() == {}
+        assert command_references()["make:url"] == BUILTIN_COMMANDS["make:url"]
+
+    def test_discovery_does_not_import(self, plugins):
+        """Test que la découverte n'importe pas le module du plugin."""
+        plugins(("make:api", "plugin_inexistant.commands:make_api", ENTRY_POINT_GROUP))
+
+        assert "make:api" in discover_plugins()
+        assert "plugin_inexistant" not in sys.modules
+
+
+class TestCommandIndex:
+    """Tests pour l'index persistant des commandes."""
+
+    def test_index_contains_help(self):
+        """Test que l'index contient la référence et l'aide des commandes."""
+        index = command_index()
+
+        assert index["make:url"]["reference"] == BUILTIN_COMMANDS["make:url"]
+        assert "route Django Ninja" in index["make:url"]["help"]
+        assert registry.index_path().exists()
+
+    def test_index_reused_from_disk(self, monkeypatch):
+        """Test que l'index enregistré est réutilisé sans importer les commandes."""
+        command_index()
+        command_index.cache_clear()
+
+        def fail(reference):
+            raise AssertionError(f"import inattendu de {reference}")
+
+        monkeypatch.setattr(registry, "load_command", fail)
+
+        assert "route Django Ninja" in command_index()["make:url"]["help"]
+
+    def test_index_invalidated_by_fingerprint(self, plugins, monkeypatch):
+        """Test que l'index est reconstruit si les distributions changent."""
+        command_index()
+        command_index.cache_clear()
+
+        # Installation d'un plugin : l'empreinte change
+        plugins(("make:route", BUILTIN_COMMANDS["make:url"], ENTRY_POINT_GROUP))
+        monkeypatch.setattr(registry, "installed_fingerprint", lambda: "nouvelle")
+
+        assert "make:route" in command_index()
+
+    def test_corrupted_index(self):
+        """Test avec un fichier d'index invalide."""
+        registry.index_path().parent.mkdir(parents=True, exist_ok=True)
+        registry.index_path().write_text("{invalide")
+
+        assert "make:url" in command_index()
+
+
+class TestLoadCommand:
+    """Tests pour la fonction load_command."""
+
+    def test_load_builtin(self):
+        """Test du chargement d'une commande intégrée."""
+        command = load_command(BUILTIN_COMMANDS["make:url"])
+
+        assert isinstance(command, click.Command)
+        assert command.name == "make:url"
+
+    def test_load_not_a_command(self):
+        """Test avec une référence qui n'est pas une commande click."""
+        with pytest.raises(TypeError, match="commande click"):
+            load_command("os.path:join")
+
+
+class TestLazyGroup:
+    """Tests pour le chargement paresseux des commandes."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.runner = CliRunner()
+
+    def test_startup_does_not_import_commands(self):
+        """Test que l'import de la CLI ne charge aucune commande."""
+        code = (
+            "import sys, pyfastcli.cli; "
+            "print(any(m.startswith(('pyfastcli.commands.', 'pyfastcli.generators.')) "
+            "for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_startup_does_not_import_global_option_modules(self):
+        """Test que les modules des options globales sont importés à la demande."""
+        code = (
+            "import sys, pyfastcli.cli; "
+            "print(sorted(m for m in sys.modules if m in ("
+            "'pyfastcli.content_store', 'pyfastcli.render_cache', "
+            "'pyfastcli.profiling', 'pyfastcli.metrics')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_global_option_choices_match_modules(self):
+        """Test que les choix recopiés dans la CLI restent synchronisés."""
+        from pyfastcli.cli import LINK_MODE_CHOICES, PROFILE_FORMAT_CHOICES
+        from pyfastcli.content_store import LINK_MODES
+        from pyfastcli.profiling import PROFILE_FORMATS
+
+        assert LINK_MODE_CHOICES == LINK_MODES
+        assert PROFILE_FORMAT_CHOICES == list(PROFILE_FORMATS)
+
+    def test_help_does_not_import_commands(self):
+        """Test que --help utilise l'index sans importer les commandes."""
+        code = (
+            "import sys\n"
+            "from pyfastcli.cli import cli\n"
+            "cli(['--help'], standalone_mode=False)\n"
+            "print(any(m.startswith('pyfastcli.commands.') for m in sys.modules))\n"
+        )
+        # Le premier appel construit l'index, le second le réutilise
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            )
+
+        assert "make:url" in result.stdout
+        assert result.stdout.strip().endswith("False")
+
+    def test_plugin_command(self, plugins):
+        """Test de l'exécution d'un plugin déclaré par entry point."""
+        plugins(("make:route", BUILTIN_COMMANDS["make:url"], ENTRY_POINT_GROUP))
+
+        result = self.runner.invoke(cli, ["--help"])
+        assert "make:route" in result.output
+
+        result = self.runner.invoke(cli, ["make:route", "--help"])
+        assert result.exit_code == 0
+        assert "--function-name" in result.output
+
+    def test_broken_plugin(self, plugins):
+        """Test avec un plugin dont le module est introuvable."""
+        plugins(("make:api", "plugin_inexistant.commands:make_api", ENTRY_POINT_GROUP))
+
+        result = self.runner.invoke(cli, ["make:api"])
+
+        assert result.exit_code != 0
+        assert "Impossible de charger le générateur make:api" in result.output
@@ -0,0 +1,117 @@
+"""Tests pour le cache de rendu persistant."""
+
+import os
+
+from pyfastcli import render_cache as render_cache_module
+from pyfastcli.generators import fragments
+from pyfastcli.generators.domaine_generator import (
+    _render_views_py,
+    generate_domaine_structure,
+)
+from pyfastcli.instrumentation import instrument
+from pyfastcli.render_cache import (
+    RenderCache,
+    default_cache_dir,
+    get_render_cache,
+    render_cache,
+)
+
+
+def _render_greeting(name: str) -> str:
+    return f"Bonjour {name}"
+
+
+def _render_other(name: str) -> str:
+    return f"Salut {name}"
+
+
+class TestRenderCache:
+    """Tests pour RenderCache."""
+
+    def test_get_or_render(self, tmp_path):
+        """Test d'un échec puis d'un succès pour le même rendu."""
+        cache = RenderCache(tmp_path)
+
+        first = cache.get_or_render(_render_greeting, {"name": "Ada"})
+        second = cache.get_or_render(_render_greeting, {"name": "Ada"})
+
+        assert first == second == "Bonjour Ada"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_template_and_context(self, tmp_path):
+        """Test que la clé dépend du template et du contexte."""
+        cache = RenderCache(tmp_path)
+
+        key = cache.key(_render_greeting, {"name": "Ada"})
+
+        assert key == cache.key(_render_greeting, {"name": "Ada"})
+        assert key != cache.key(_render_greeting, {"name": "Bob"})
+        assert key != cache.key(_render_other, {"name": "Ada"})
+
+    def test_key_depends_on_version(self, tmp_path, monkeypatch):
+        """Test qu'une mise à jour de pyfastcli invalide les clés."""
+        key = RenderCache(tmp_path).key(_render_greeting, {"name": "Ada"})
+
+        monkeypatch.setattr(render_cache_module, "__version__", "99.0.0")
+
+        assert RenderCache(tmp_path).key(_render_greeting, {"name": "Ada"}) != key
+
+    def test_key_depends_on_helper_modules(self, tmp_path, monkeypatch):
+        """Test qu'une modification de fragments invalide les rendus qui l'importent."""
+        monkeypatch.setattr(render_cache_module, "_module_hashes", {})
+        key = RenderCache(tmp_path).key(_render_views_py, {"app_name": "blog"})
+        fragments_hash = render_cache_module._module_hashes[fragments.__name__]
+
+        monkeypatch.setitem(
+            render_cache_module._module_hashes, fragments.__name__, fragments_hash[::-1]
+        )
+
+        assert RenderCache(tmp_path).key(_render_views_py, {"app_name": "blog"}) != key
+
+    def test_prune_evicts_least_recently_used(self, tmp_path):
+        """Test de l'éviction LRU bornée en taille."""
+        cache = RenderCache(tmp_path, max_bytes=10)
+        cache.set("aa-old", "x" * 8)
+        cache.set("bb-new", "y" * 8)
+        old_entry = tmp_path / "aa" / "aa-old"
+        stat = old_entry.stat()
+
+        os.utime(old_entry, (stat.st_atime - 60, stat.st_mtime - 60))
+
+        assert cache.prune() == 1
+        assert cache.get("aa-old") is None
+        assert cache.get("bb-new") == "y" * 8
+
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        """Test du dossier de cache par défaut et de ses surcharges."""
+        monkeypatch.delenv("PYFASTCLI_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "pyfastcli"
+
+        monkeypatch.setenv("PYFASTCLI_CACHE_DIR", str(tmp_path / "ci"))
+        assert default_cache_dir() == tmp_path / "ci"
+
+
+class TestRenderCacheGenerators:
+    """Tests du cache de rendu avec les générateurs."""
+
+    def test_repeated_generation_hits_cache(self, tmp_path):
+        """Test qu'une seconde génération identique est servie par le cache."""
+        cache_dir = tmp_path / "cache"
+
+        with render_cache(str(cache_dir)) as cache:
+            assert get_render_cache() is cache
+            generate_domaine_structure("pratique", "Pratique", str(tmp_path / "a"))
+        assert get_render_cache() is None
+        assert cache.hits == 0
+        assert cache.misses > 0
+
+        with instrument() as instrumentation, render_cache(str(cache_dir)) as cache:
+            generate_domaine_structure("pratique", "Pratique", str(tmp_path / "b"))
+
+        assert cache.misses == 0
+        assert instrumentation.to_dict()["cache"]["hits"] == cache.hits > 0
+        for name in ["models.py", "admin.py", "templates/pratique/liste.html"]:
+            assert (tmp_path / "a" / "pratique" / name).read_text() == (
+                tmp_path / "b" / "pratique" / name
+            ).read_text()
@@ -0,0 +1,357 @@
+"""Tests pour l'index des routes Django Ninja d'un projet."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from pyfastcli.generators import route_index as route_index_module
+from pyfastcli.generators.ninja_routes import generate_ninja_route_file
+from pyfastcli.generators.route_index import (
+    RouteIndex,
+    normalize_route_path,
+    parse_mounts,
+    parse_routes,
+)
+
+ROUTES_SOURCE = """from ninja import Router
+
+router = Router()
+
+
+@router.get("/orders/{int:order_id}")
+def get_order(request, order_id: int):
+    return {}
+
+
+@router.api_operation(["POST", "PATCH"], path="/orders")
+async def save_order(request):
+    return {}
+
+
+def helper():
+    return "@router.get('/ignored')"
+"""
+
+
+class TestParseRoutes:
+    """Tests pour la fonction parse_routes."""
+
+    def test_parse_routes(self):
+        """Test de l'extraction des routes d'un module."""
+        routes = parse_routes(ROUTES_SOURCE, "api/orders.py")
+
+        assert [(r.method, r.path, r.function) for r in routes] == [
+            ("GET", "/orders/{int:order_id}", "get_order"),
+            ("POST", "/orders", "save_order"),
+            ("PATCH", "/orders", "save_order"),
+        ]
+        assert routes[0].location == "api/orders.py:6"
+
+    def test_parse_imported_router(self):
+        """Test du router importé d'un autre module (import relatif résolu)."""
+        routes = parse_routes(
+            "from .list_orders import router\n\n"
+            "@router.post('/orders')\ndef create_order(request):\n    pass\n",
+            "api/routes/create_order.py",
+        )
+
+        assert routes[0].router == "api.routes.list_orders"
+        assert parse_routes(ROUTES_SOURCE, "api/orders.py")[0].router == ""
+
+    def test_parse_without_routes(self):
+        """Test avec un module sans décorateur de route."""
+        assert parse_routes("def f():\n    return 1\n", "f.py") == []
+
+    def test_parse_syntax_error(self):
+        """Test avec un module invalide."""
+        assert parse_routes("@router.get('/x')\ndef (:\n", "bad.py") == []
+
+    def test_normalize_route_path(self):
+        """Test de la normalisation des paramètres de chemin."""
+        assert normalize_route_path("orders/{id}") == "/orders/{}"
+        assert normalize_route_path("/orders/{int:order_id}") == "/orders/{}"
+
+
+URLS_SOURCE = """from ninja import NinjaAPI
+
+from api import orders
+from api.routes import register_routes
+from shop.api import router as shop_router
+
+api = NinjaAPI()
+api.add_router("/v1", orders.router)
+api.add_router("/shop", shop_router)
+api.add_router("/events", "events.api.router")
+register_routes(api, prefix="/gen")
+"""
+
+
+class TestParseMounts:
+    """Tests pour la fonction parse_mounts."""
+
+    def test_parse_mounts(self):
+        """Test de l'extraction des montages de routers."""
+        assert parse_mounts(URLS_SOURCE, "config/urls.py") == [
+            ("/v1", "api.orders"),
+            ("/shop", "shop.api"),
+            ("/events", "events.api"),
+            ("/gen", "api.routes.*"),
+        ]
+
+    def test_parse_relative_and_local_mounts(self):
+        """Test des imports relatifs et d'un router défini dans le module."""
+        source = (
+            "from . import orders\n"
+            "from .registry import build_router\n"
+            "router = Router()\n"
+            "router.add_router('/orders', orders.router)\n"
+            "api.add_router('/local', router)\n"
+            "api.add_router('/gen', build_router())\n"
+        )
+
+        assert parse_mounts(source, "shop/api/__init__.py") == [
+            ("/orders", "shop.api.orders"),
+            ("/local", "shop.api"),
+            ("/gen", "shop.api.registry.*"),
+        ]
+
+
+class TestRouteIndex:
+    """Tests pour la classe RouteIndex."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Path(self.temp_dir)
+        (self.project / "api").mkdir()
+        (self.project / "api" / "orders.py").write_text(ROUTES_SOURCE)
+        (self.project / ".venv").mkdir()
+        (self.project / ".venv" / "lib.py").write_text(ROUTES_SOURCE)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_load(self):
+        """Test de la construction de l'index (dossiers cachés ignorés)."""
+        index = RouteIndex.load(self.project)
+
+        assert len(index.routes) == 3
+        assert index.find("get", "/orders/{id}").function == "get_order"
+        assert index.find("delete", "/orders") is None
+        assert index.conflicts() == []
+
+    def test_load_reuses_cache(self, monkeypatch):
+        """Test que les fichiers inchangés ne sont pas réanalysés."""
+        RouteIndex.load(self.project)
+
+        def fail(source, module):
+            raise AssertionError(f"{module} réanalysé inutilement")
+
+        monkeypatch.setattr(route_index_module, "parse_routes", fail)
+
+        assert len(RouteIndex.load(self.project).routes) == 3
+
+    def test_load_detects_changes(self):
+        """Test que les fichiers modifiés sont réanalysés."""
+        RouteIndex.load(self.project)
+        orders = self.project / "api" / "orders.py"
+        orders.write_text(ROUTES_SOURCE.replace("/orders/{int:order_id}", "/items"))
+        stat = orders.stat()
+        os.utime(orders, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        index = RouteIndex.load(self.project)
+
+        assert index.find("get", "/items") is not None
+        assert index.find("get", "/orders/{id}") is None
+
+    def test_conflicts_in_project(self):
+        """Test de la détection des doublons déjà présents dans le projet."""
+        (self.project / "api" / "copy.py").write_text(ROUTES_SOURCE)
+
+        index = RouteIndex.load(self.project)
+
+        assert len(index.conflicts()) == 3
+
+    def test_mount_prefixes(self):
+        """Test que les routes sont indexées sous leur préfixe de montage."""
+        (self.project / "config").mkdir()
+        (self.project / "config" / "urls.py").write_text(URLS_SOURCE)
+        (self.project / "api" / "legacy.py").write_text(ROUTES_SOURCE)
+
+        index = RouteIndex.load(self.project)
+
+        # Même chemin déclaré, préfixes différents : pas de conflit
+        assert index.conflicts() == []
+        assert index.find("post", "/v1/orders").module == "api/orders.py"
+        assert index.find("post", "/orders").module == "api/legacy.py"
+        assert index.prefixes("api/orders.py") == ["/v1"]
+
+    def test_mount_prefix_conflict(self):
+        """Test d'un conflit révélé par le préfixe de montage."""
+        (self.project / "config").mkdir()
+        (self.project / "config" / "urls.py").write_text(URLS_SOURCE)
+        (self.project / "api" / "legacy.py").write_text(
+            ROUTES_SOURCE.replace('path="/orders"', 'path="/v1/orders"')
+        )
+
+        index = RouteIndex.load(self.project)
+
+        assert [(dup.method, dup.full_path) for _, dup in index.conflicts()] == [
+            ("POST", "/v1/orders"),
+            ("PATCH", "/v1/orders"),
+        ]
+
+    def test_nested_mount_prefixes(self):
+        """Test de la composition des montages imbriqués."""
+        (self.project / "shop").mkdir()
+        (self.project / "shop" / "urls.py").write_text(
+            "from api import orders\n"
+            "router = Router()\n"
+            "router.add_router('/orders', orders.router)\n"
+        )
+        (self.project / "config").mkdir()
+        (self.project / "config" / "urls.py").write_text(
+            "from shop.urls import router\napi.add_router('/shop', router)\n"
+        )
+
+        index = RouteIndex.load(self.project)
+
+        assert index.prefixes("api/orders.py") == ["/shop/orders"]
+        assert index.find("get", "/shop/orders/orders/{id}") is not None
+
+    def test_generate_checks_mount_prefix(self):
+        """Test que la route générée est vérifiée sous le préfixe du registre."""
+        (self.project / "config").mkdir()
+        (self.project / "config" / "urls.py").write_text(URLS_SOURCE)
+        index = RouteIndex.load(self.project)
+        kwargs = {
+            "module_name": "api",
+            "tag": "Orders",
+            "output_dir": str(self.project / "api" / "routes"),
+            "route_index": index,
+        }
+
+        # /orders est libre sous /gen (api/orders.py est monté sous /v1)
+        generate_ninja_route_file(
+            function_name="gen_orders", url_path="/orders", http_method="post", **kwargs
+        )
+        assert index.find("post", "/gen/orders").function == "gen_orders"
+        with pytest.raises(ValueError, match="POST /gen/orders"):
+            generate_ninja_route_file(
+                function_name="other_orders",
+                url_path="/orders",
+                http_method="post",
+                **kwargs,
+            )
+
+    def test_generate_rejects_conflict(self):
+        """Test que generate_ninja_route_file refuse une route en conflit."""
+        index = RouteIndex.load(self.project)
+        output_dir = str(self.project / "api" / "routes")
+
+        with pytest.raises(ValueError, match="Conflit de route"):
+            generate_ninja_route_file(
+                module_name="api",
+                function_name="update_order",
+                url_path="/orders",
+                http_method="patch",
+                tag="Orders",
+                output_dir=output_dir,
+                route_index=index,
+            )
+        assert not (self.project / "api" / "routes" / "update_order.py").exists()
+
+    def test_generate_registers_route(self):
+        """Test que la route générée est ajoutée à l'index."""
+        index = RouteIndex.load(self.project)
+        output_dir = str(self.project / "api" / "routes")
+        kwargs = {"module_name": "api", "tag": "Orders", "output_dir": output_dir}
+
+        generate_ninja_route_file(
+            function_name="list_invoices",
+            url_path="/invoices",
+            http_method="get",
+            route_index=index,
+            **kwargs,
+        )
+        with pytest.raises(ValueError, match="list_invoices"):
+            generate_ninja_route_file(
+                function_name="other_invoices",
+                url_path="invoices",
+                http_method="get",
+                route_index=index,
+                **kwargs,
+            )
+
+        index.save()
+        route = RouteIndex.load(self.project).find("get", "/invoices")
+        assert route.module == "api/routes/list_invoices.py"
+
+    def test_same_path_in_other_module(self):
+        """Test d'un même chemin servi par deux modules (routers) différents."""
+        (self.project / "api" / "list.py").write_text(
+            "@router.get('/orders')\ndef list_orders(request):\n    return []\n"
+        )
+
+        index = RouteIndex.load(self.project)
+
+        # api/list.py est analysé en premier : /orders de api/orders.py masqué
+        assert [(dup.method, dup.module) for _, dup in index.conflicts()] == [
+            ("POST", "api/orders.py"),
+            ("PATCH", "api/orders.py"),
+        ]
+        with pytest.raises(ValueError, match="DELETE répondrait 405"):
+            index.check("delete", "/orders", "api/new.py")
+        # Une autre méthode dans le module qui sert le chemin reste possible
+        index.check("delete", "/orders", "api/list.py")
+
+    def test_shared_router_same_path(self):
+        """Test d'un module qui déclare ses routes sur le router d'un autre."""
+        (self.project / "config").mkdir()
+        (self.project / "config" / "urls.py").write_text(URLS_SOURCE)
+        (self.project / "api" / "list.py").write_text(
+            "from api.orders import router\n\n"
+            "@router.get('/orders')\ndef list_orders(request):\n    return []\n"
+        )
+
+        index = RouteIndex.load(self.project)
+
+        # Un seul router sert /orders : pas de 405, routes sous son préfixe
+        assert index.conflicts() == []
+        assert index.find("get", "/v1/orders").module == "api/list.py"
+        assert index.router_module(index.find("get", "/v1/orders")) == ("api/orders.py")
+        index.check("delete", "/orders", "api/new.py", "api/orders.py")
+        with pytest.raises(ValueError, match="router de api/orders.py"):
+            index.check("delete", "/v1/orders", "api/new.py")
+
+    def test_generate_shares_router_in_output_dir(self):
+        """Test : même chemin, autre méthode, router partagé dans le dossier."""
+        index = RouteIndex.load(self.project)
+        kwargs = {
+            "module_name": "api",
+            "tag": "Orders",
+            "output_dir": str(self.project / "api" / "routes"),
+            "route_index": index,
+        }
+        generate_ninja_route_file(
+            function_name="list_items", url_path="/items", http_method="get", **kwargs
+        )
+
+        path = generate_ninja_route_file(
+            function_name="create_item", url_path="/items", http_method="post", **kwargs
+        )
+
+        assert Path(path).read_text().startswith("from .list_items import router\n")
+        assert index.conflicts() == []
+        # Router écrit à la main hors du dossier de sortie : toujours refusé
+        with pytest.raises(ValueError, match="GET répondrait 405"):
+            generate_ninja_route_file(
+                function_name="list_orders",
+                url_path="/orders",
+                http_method="get",
+                **kwargs,
+            )
@@ -0,0 +1,335 @@
+"""Tests pour le registre des routes Ninja généré (__init__.py)."""
+
+import importlib
+import importlib.util
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import pytest
+
+from pyfastcli.generators.ninja_routes import generate_ninja_route_file
+from pyfastcli.generators.route_index import Route, RouteIndex
+from pyfastcli.generators.route_registry import (
+    is_lazy_registry,
+    read_registry_modules,
+    route_prefix,
+    update_route_registry,
+)
+
+LAZY_API_SCRIPT = """
+import sys, types
+import django
+from django.conf import settings
+
+settings.configure(ROOT_URLCONF="test_urls", ALLOWED_HOSTS=["*"], SECRET_KEY="x")
+django.setup()
+from django.test import Client
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import include, path, reverse
+from ninja import NinjaAPI
+from ninja.security import APIKeyHeader
+
+from generated_routes import LazyNinjaAPI, lazy_urlpatterns
+
+
+class Key(APIKeyHeader):
+    param_name = "X-Key"
+
+    def authenticate(self, request, key):
+        return key == "ok"
+
+
+try:
+    lazy_urlpatterns(NinjaAPI(urls_namespace="simple"))
+except TypeError as exc:
+    assert "LazyNinjaAPI" in str(exc)
+else:
+    raise AssertionError("NinjaAPI accepté")
+
+api = LazyNinjaAPI(auth=Key())
+urls = types.ModuleType("test_urls")
+urls.urlpatterns = [path("api/", include(lazy_urlpatterns(api)))]
+sys.modules["test_urls"] = urls
+
+
+# Gestionnaire ajouté après lazy_urlpatterns : délégué à l'API principale
+@api.exception_handler(ValueError)
+def value_error(request, exc):
+    return api.create_response(request, {"erreur": str(exc)}, status=418)
+
+
+client = Client(headers={"X-Key": "ok"})
+assert not [name for name in sys.modules if name.startswith("generated_routes.")]
+assert Client().get("/api/").status_code == 401
+assert client.get("/api/").json() == {"message": "Hello from root_view!"}
+assert [name for name in sys.modules if name.startswith("generated_routes.")] == [
+    "generated_routes.root_view"
+]
+assert client.get("/api/orders").status_code == 200
+assert client.get("/api/boom").status_code == 418
+assert reverse("api-1.0.0:get_orders") == "/api/orders"
+assert reverse("api-1.0.0:api-root") == "/api/"
+paths = client.get("/api/openapi.json").json()["paths"]
+assert sorted(paths) == ["/api/", "/api/boom", "/api/orders"]
+
+# Attribut interne de ninja absent : échec explicite au chargement des URLs
+broken = LazyNinjaAPI(urls_namespace="casse")
+del broken.default_router._decorators
+try:
+    lazy_urlpatterns(broken)
+except ImproperlyConfigured as exc:
+    assert "versions supportées" in str(exc)
+else:
+    raise AssertionError("_decorators absent non détecté")
+print("ok")
+"""
+
+
+SHARED_ROUTER_SCRIPT = """
+import sys, types
+import django
+from django.conf import settings
+
+settings.configure(ROOT_URLCONF="test_urls", ALLOWED_HOSTS=["*"], SECRET_KEY="x")
+django.setup()
+from django.test import Client
+from django.urls import include, path
+from ninja import NinjaAPI
+
+from generated_routes import LazyNinjaAPI, lazy_urlpatterns, register_routes
+
+api = NinjaAPI(urls_namespace="immediat")
+register_routes(api)
+lazy_api = LazyNinjaAPI(urls_namespace="paresseux")
+urls = types.ModuleType("test_urls")
+urls.urlpatterns = [
+    path("api/", api.urls),
+    path("lazy/", include(lazy_urlpatterns(lazy_api))),
+]
+sys.modules["test_urls"] = urls
+
+client = Client()
+for root in ("/api", "/lazy"):
+    assert client.get(f"{root}/orders").status_code == 200, root
+    assert client.post(f"{root}/orders").status_code == 200, root
+print("ok")
+"""
+
+
+class _FakeRouter:
+    """Router Ninja minimal : enregistre les routers ajoutés."""
+
+    def __init__(self, **kwargs):
+        self.routers = []
+
+    def add_router(self, prefix, router):
+        self.routers.append((prefix, router))
+
+    def get(self, path, **kwargs):
+        return lambda func: func
+
+    post = get
+
+
+class TestRouteRegistry:
+    """Tests pour la fonction update_route_registry."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.routes_dir = Path(self.temp_dir) / "generated_routes"
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, function_name, url_path, http_method="get", lazy=None):
+        generate_ninja_route_file(
+            module_name="api",
+            function_name=function_name,
+            url_path=url_path,
+            http_method=http_method,
+            tag="Orders",
+            output_dir=str(self.routes_dir),
+        )
+        return update_route_registry(self.routes_dir, function_name, lazy=lazy)
+
+    def test_create_registry(self):
+        """Test de la création du registre avec les modules existants."""
+        generate_ninja_route_file(
+            module_name="api",
+            function_name="get_orders",
+            url_path="/orders",
+            http_method="get",
+            tag="Orders",
+            output_dir=str(self.routes_dir),
+        )
+        (self.routes_dir / "helpers.py").write_text("def util():\n    pass\n")
+
+        registry_path = self._generate("create_order", "/orders", "post")
+
+        assert registry_path == str(self.routes_dir / "__init__.py")
+        # Modules déjà présents (triés), sans les modules sans route
+        assert read_registry_modules(Path(registry_path)) == [
+            "create_order",
+            "get_orders",
+        ]
+
+    def test_update_is_incremental(self):
+        """Test que le registre n'est réécrit que si la liste change."""
+        registry_path = Path(self._generate("get_orders", "/orders"))
+        mtime = registry_path.stat().st_mtime_ns
+
+        update_route_registry(self.routes_dir, "get_orders")
+
+        assert registry_path.stat().st_mtime_ns == mtime
+        assert read_registry_modules(registry_path) == ["get_orders"]
+
+    def test_foreign_init_is_preserved(self):
+        """Test qu'un __init__.py écrit à la main n'est jamais modifié."""
+        self.routes_dir.mkdir(parents=True)
+        init_file = self.routes_dir / "__init__.py"
+        init_file.write_text("# mes routes\n")
+
+        assert self._generate("get_orders", "/orders") is None
+        assert init_file.read_text() == "# mes routes\n"
+
+    def test_registry_registers_in_one_call(self, monkeypatch):
+        """Test que register_routes ajoute un seul router agrégé à l'API."""
+        self._generate("get_orders", "/orders")
+        self._generate("create_order", "/orders", "post")
+
+        monkeypatch.setitem(
+            sys.modules, "ninja", types.SimpleNamespace(Router=_FakeRouter)
+        )
+        monkeypatch.syspath_prepend(self.temp_dir)
+        registry = importlib.import_module("generated_routes")
+        api = _FakeRouter()
+
+        registry.register_routes(api, prefix="/api")
+
+        assert len(api.routers) == 1
+        prefix, router = api.routers[0]
+        assert prefix == "/api"
+        assert [module_router for _, module_router in router.routers] == [
+            sys.modules["generated_routes.get_orders"].router,
+            sys.modules["generated_routes.create_order"].router,
+        ]
+
+        for name in list(sys.modules):
+            if name.startswith("generated_routes"):
+                monkeypatch.delitem(sys.modules, name)
+
+    def test_lazy_registry_prefixes(self):
+        """Test du registre paresseux : modules associés à leur préfixe."""
+        self._generate("get_orders", "/orders")
+        registry_path = Path(self._generate("get_item", "/{item_id}", lazy=True))
+
+        content = registry_path.read_text(encoding="utf-8")
+        assert is_lazy_registry(registry_path)
+        assert '    "get_orders": "orders",\n    "get_item": "",\n' in content
+        assert "def lazy_urlpatterns(api):" in content
+        assert "class LazyNinjaAPI(NinjaAPI):" in content
+        assert "_exception_handlers" not in content
+        assert 'def register_routes(api, prefix=""):' in content
+        compile(content, str(registry_path), "exec")
+        assert read_registry_modules(registry_path) == ["get_orders", "get_item"]
+
+    def test_lazy_mode_is_kept(self):
+        """Test que le mode paresseux est conservé sans --lazy-registry."""
+        registry_path = Path(self._generate("get_orders", "/orders", lazy=True))
+        self._generate("get_users", "/users")
+
+        assert is_lazy_registry(registry_path)
+        assert '    "get_users": "users",\n' in registry_path.read_text()
+
+    def test_switch_to_lazy(self):
+        """Test du passage d'un registre existant en mode paresseux."""
+        registry_path = Path(self._generate("get_orders", "/orders"))
+        assert not is_lazy_registry(registry_path)
+
+        self._generate("get_users", "/users", lazy=True)
+
+        content = registry_path.read_text()
+        assert '    "get_orders": "orders",\n    "get_users": "users",\n' in content
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("ninja") is None, reason="django-ninja absent"
+    )
+    def test_lazy_registry_shares_api(self):
+        """
+        Test du registre paresseux sur une vraie API Ninja : route "/" non
+        masquée, auth et gestionnaires d'erreurs de l'API, espace de noms unique.
+        """
+        self._generate("root_view", "/", lazy=True)
+        self._generate("get_orders", "/orders")
+        self._generate("boom", "/boom")
+        boom = self.routes_dir / "boom.py"
+        boom.write_text(
+            boom.read_text().replace(
+                'return {"message": "Hello from boom!"}', 'raise ValueError("boom")'
+            )
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", LAZY_API_SCRIPT],
+            cwd=self.temp_dir,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "ok"
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("ninja") is None, reason="django-ninja absent"
+    )
+    def test_shared_router_serves_all_methods(self):
+        """
+        Test : GET et POST /orders dans deux modules, un seul router
+        enregistré (pas de 405), en mode immédiat et paresseux.
+        """
+        index = RouteIndex.load(self.temp_dir)
+        for function_name, method in [("list_orders", "get"), ("create_order", "post")]:
+            generate_ninja_route_file(
+                module_name="api",
+                function_name=function_name,
+                url_path="/orders",
+                http_method=method,
+                tag="Orders",
+                output_dir=str(self.routes_dir),
+                route_index=index,
+            )
+            update_route_registry(self.routes_dir, function_name, lazy=True)
+
+        result = subprocess.run(
+            [sys.executable, "-c", SHARED_ROUTER_SCRIPT],
+            cwd=self.temp_dir,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "ok"
+
+
+class TestRoutePrefix:
+    """Tests pour la fonction route_prefix."""
+
+    @staticmethod
+    def _routes(*paths):
+        return [Route("GET", path, "view", "routes.py", 1) for path in paths]
+
+    def test_common_segment(self):
+        """Test du premier segment commun des chemins."""
+        assert route_prefix(self._routes("/orders", "/orders/{id}")) == "orders"
+
+    def test_no_common_segment(self):
+        """Test des chemins sans préfixe commun ou paramétrés."""
+        assert route_prefix(self._routes("/orders", "/users")) == ""
+        assert route_prefix(self._routes("/{slug}/items")) == ""
+        assert route_prefix([]) == ""
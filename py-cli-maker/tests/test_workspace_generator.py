@@ -0,0 +1,138 @@
+"""Tests pour le générateur de workspace Python."""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from pyfastcli.generators.workspace_generator import (
+    _normalize_members,
+    _workspace_sources,
+    generate_workspace_structure,
+)
+
+
+class TestNormalizeMembers:
+    """Tests pour la fonction _normalize_members."""
+
+    def test_names_and_dicts(self):
+        """Test avec des noms simples et des dictionnaires."""
+        members = _normalize_members(
+            ["core-lib", {"name": "API Client", "version": "1.0.0"}],
+            "0.1.0",
+            "Plateforme",
+        )
+
+        assert members[0]["project_name"] == "core-lib"
+        assert members[0]["package_name"] == "core_lib"
+        assert members[0]["version"] == "0.1.0"
+        assert members[1]["project_name"] == "api-client"
+        assert members[1]["version"] == "1.0.0"
+
+    def test_empty(self):
+        """Test sans package."""
+        with pytest.raises(ValueError, match="au moins un package"):
+            _normalize_members([], "0.1.0", "Plateforme")
+
+    def test_duplicate(self):
+        """Test avec un package dupliqué."""
+        with pytest.raises(ValueError, match="plusieurs fois"):
+            _normalize_members(["core-lib", "Core-Lib"], "0.1.0", "Plateforme")
+
+    def test_workspace_sources(self):
+        """Test de la détection des dépendances entre membres."""
+        members = _normalize_members(
+            [
+                "core-lib",
+                {"name": "api-client", "dependencies": ["core-lib>=0.1", "requests"]},
+            ],
+            "0.1.0",
+            "Plateforme",
+        )
+
+        assert _workspace_sources(members) == ["core-lib"]
+
+
+class TestGenerateWorkspaceStructure:
+    """Tests pour la fonction generate_workspace_structure."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _generate(self, **kwargs):
+        params = {
+            "workspace_name": "platform",
+            "packages": [
+                "core-lib",
+                {"name": "api-client", "dependencies": ["core-lib"]},
+            ],
+            "output_dir": str(self.output_dir),
+            "author_name": "Jane Doe",
+            "author_email": "jane@example.com",
+            "workers": 2,
+        }
+        params.update(kwargs)
+        return Path(generate_workspace_structure(**params))
+
+    def test_generate_root_files(self):
+        """Test des fichiers partagés à la racine."""
+        workspace_dir = self._generate()
+
+        for name in [
+            "pyproject.toml",
+            "README.md",
+            "Makefile",
+            "requirements-dev.txt",
+            ".python-version",
+            "LICENSE",
+            ".gitignore",
+        ]:
+            assert (workspace_dir / name).exists()
+
+        pyproject = (workspace_dir / "pyproject.toml").read_text()
+        assert "[tool.uv.workspace]" in pyproject
+        assert 'members = ["packages/*"]' in pyproject
+        assert "core-lib = { workspace = true }" in pyproject
+        assert "lock:\n\tuv lock" in (workspace_dir / "Makefile").read_text()
+        requirements = (workspace_dir / "requirements-dev.txt").read_text()
+        assert "-e ./packages/core-lib" in requirements
+        assert "-e ./packages/api-client" in requirements
+
+    def test_generate_members(self):
+        """Test de la génération des packages membres."""
+        workspace_dir = self._generate()
+
+        for project, package in [
+            ("core-lib", "core_lib"),
+            ("api-client", "api_client"),
+        ]:
+            member_dir = workspace_dir / "packages" / project
+            assert (member_dir / "pyproject.toml").exists()
+            assert (member_dir / package / "__init__.py").exists()
+            assert (member_dir / "tests" / f"test_{package}.py").exists()
+            # La configuration partagée (Makefile) reste à la racine
+            assert not (member_dir / "Makefile").exists()
+
+        api_pyproject = (
+            workspace_dir / "packages" / "api-client" / "pyproject.toml"
+        ).read_text()
+        assert '"core-lib",' in api_pyproject
+
+    def test_generate_existing_workspace(self):
+        """Test avec un workspace existant."""
+        (self.output_dir / "platform").mkdir()
+
+        with pytest.raises(FileExistsError):
+            self._generate()
+
+    def test_generate_invalid_email(self):
+        """Test avec un email invalide."""
+        with pytest.raises(ValueError, match="Email invalide"):
+            self._generate(author_email="invalide")